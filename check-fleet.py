@@ -0,0 +1,7 @@
+"""Estado de los pools de una flota (equivale a ``python -m truenas fleet``)"""
+import sys
+
+from truenas.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main(["fleet", *sys.argv[1:]]))
@@ -0,0 +1,103 @@
+import argparse
+from datetime import datetime
+from dotenv import load_dotenv
+from rich.console import Console
+from rich.table import Table
+
+from truenas.formato import formatear_tamano
+from truenas.historial import CONTADORES, RUTA_HISTORIAL, Historial
+from truenas.pantalla import formatear_crecimiento, formatear_dias
+from truenas.prevision import TOP_DATASETS, TendenciaLineal, prevision
+
+# Configuración
+load_dotenv()
+console = Console()
+
+
+def formatear_fecha(ts):
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M") if ts else "-"
+
+
+def mostrar_crecimiento(historial, pares, dias):
+    """Muestra cuánto creció el espacio usado de cada pool en los últimos días"""
+    tabla = Table(title=f"[bold green]CRECIMIENTO ({dias} días)[/bold green]", style="green", header_style="bold green")
+    for columna in ("Host", "Pool", "Desde", "Usado inicial", "Usado actual", "Crecimiento", "Por día"):
+        tabla.add_column(columna)
+    for host, pool in pares:
+        crecimiento = historial.crecimiento(host, pool, dias)
+        if crecimiento is None:
+            tabla.add_row(host, pool, "-", "-", "-", "[yellow]Sin datos suficientes[/yellow]", "-")
+            continue
+        (ts0, usado0, _), (ts1, usado1, _) = crecimiento
+        delta = usado1 - usado0
+        por_dia = delta / ((ts1 - ts0) / 86400)
+        signo = "" if delta >= 0 else "-"
+        tabla.add_row(host, pool, formatear_fecha(ts0), formatear_tamano(usado0), formatear_tamano(usado1),
+                      f"{signo}{formatear_tamano(abs(delta))}", f"{signo}{formatear_tamano(abs(por_dia))}")
+    console.print(tabla)
+
+
+def mostrar_primer_error(historial, pares, contador):
+    """Muestra cuándo empezó a ser distinto de cero un contador de errores"""
+    tabla = Table(title=f"[bold green]PRIMER {contador.upper()} > 0[/bold green]", style="green", header_style="bold green")
+    for columna in ("Host", "Pool", "Primera vez"):
+        tabla.add_column(columna)
+    for host, pool in pares:
+        ts = historial.primer_error(host, pool, contador)
+        tabla.add_row(host, pool, f"[red]{formatear_fecha(ts)}[/red]" if ts else "[green]Nunca[/green]")
+    console.print(tabla)
+
+
+def mostrar_prevision(historial, pares):
+    """Muestra la previsión de llenado de cada pool y de sus datasets con más uso"""
+    tabla = Table(title="[bold green]PREVISIÓN DE LLENADO[/bold green]", style="green", header_style="bold green")
+    for columna in ("Host", "Pool / dataset", "Usado", "Crecimiento", "80%", "90%", "Lleno"):
+        tabla.add_column(columna)
+    for host, pool in pares:
+        filas = historial.capacidad(host, pool)
+        if not filas:
+            continue
+        tendencia = TendenciaLineal()
+        tendencia.agregar_lote([f[0] for f in filas], [f[1] for f in filas])
+        resultado = prevision(tendencia, filas[-1][2])
+        tabla.add_row(host, f"[bold]{pool}[/bold]", formatear_tamano(filas[-1][1]),
+                      formatear_crecimiento(resultado["growth_per_day"]),
+                      formatear_dias(resultado["days_to_80"]), formatear_dias(resultado["days_to_90"]),
+                      formatear_dias(resultado["days_to_100"]))
+
+        datasets = []
+        for dataset in historial.datasets(host, pool):
+            filas = historial.uso_dataset(host, dataset)
+            tendencia = TendenciaLineal()
+            tendencia.agregar_lote([f[0] for f in filas], [f[1] for f in filas])
+            datasets.append((filas[-1][1], dataset, prevision(tendencia, filas[-1][1] + filas[-1][2])))
+        for usado, dataset, resultado in sorted(datasets, reverse=True)[:TOP_DATASETS]:
+            tabla.add_row("", f"  {dataset}", formatear_tamano(usado),
+                          formatear_crecimiento(resultado["growth_per_day"]), "", "",
+                          formatear_dias(resultado["days_to_100"]))
+    console.print(tabla)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Consultas sobre el historial local de sondeos")
+    parser.add_argument("--historial", default=RUTA_HISTORIAL or "historial.db", metavar="RUTA",
+                        help="Base de datos SQLite con el historial")
+    parser.add_argument("--host", help="Limitar la consulta a un host")
+    parser.add_argument("--pool", help="Limitar la consulta a un pool")
+    subparsers = parser.add_subparsers(dest="consulta", required=True)
+    parser_crecimiento = subparsers.add_parser("crecimiento", help="Crecimiento del espacio usado")
+    parser_crecimiento.add_argument("--dias", type=int, default=30)
+    parser_error = subparsers.add_parser("primer-error", help="Primer sondeo con errores")
+    parser_error.add_argument("--contador", choices=CONTADORES, default="checksum_errors")
+    subparsers.add_parser("prevision", help="Días hasta 80%%/90%%/lleno por pool y dataset")
+    args = parser.parse_args()
+
+    historial = Historial(args.historial)
+    pares = [(h, p) for h, p in historial.pools(args.host) if args.pool in (None, p)]
+
+    if args.consulta == "crecimiento":
+        mostrar_crecimiento(historial, pares, args.dias)
+    elif args.consulta == "prevision":
+        mostrar_prevision(historial, pares)
+    else:
+        mostrar_primer_error(historial, pares, args.contador)
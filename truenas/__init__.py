@@ -0,0 +1,5 @@
+"""Utilidades compartidas para interactuar con la API de TrueNAS"""
+
+from truenas.cliente import ClienteTrueNAS, cliente_desde_entorno
+
+__all__ = ["ClienteTrueNAS", "cliente_desde_entorno"]
@@ -0,0 +1,5 @@
+import sys
+
+from truenas.cli import main
+
+sys.exit(main())
@@ -0,0 +1,334 @@
+"""Motor de alertas: reglas con umbral, histéresis y enfriamiento
+
+Las reglas se compilan una vez y se indexan por ámbito (``pool`` o
+``disco``) y métrica, de modo que cada sondeo lee cada métrica una sola
+vez y solo evalúa las reglas que la usan. El estado de cada alerta
+(activa, último aviso, último valor) se conserva entre sondeos y, si se
+indica un archivo, entre ejecuciones: una alerta solo se notifica al
+dispararse y al resolverse, no en cada sondeo. Las alertas del propio NAS
+(``/alert/list``) se incorporan con el mismo estado.
+
+Configuración (JSON)::
+
+    {
+      "reglas": [{"nombre": "pool-lleno", "metrica": "used_percent", "operador": ">",
+                  "umbral": 85, "despeje": 80, "severidad": "warning", "enfriamiento": 3600}],
+      "destinos": [{"tipo": "webhook", "url": "http://..."}, {"tipo": "archivo", "ruta": "alertas.ndjson"}],
+      "estado": "alertas-estado.json"
+    }
+
+Los destinos se pueden ampliar con ``@destino("nombre")``.
+"""
+import json
+import operator
+import os
+import sys
+import tempfile
+import time
+
+# Configuración de alertas por defecto (sin ella no se evalúan reglas)
+ALERTAS = os.getenv('TRUENAS_ALERTAS')
+# Enfriamiento por defecto entre avisos de una misma alerta (segundos)
+ENFRIAMIENTO = 3600
+
+OPERADORES = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+# Métricas derivadas; el resto se lee directamente del pool o del disco
+METRICAS_POOL = {
+    "errores": lambda pool: sum(pool.get(campo) or 0 for campo in ("read_errors", "write_errors", "checksum_errors")),
+    "days_to_full": lambda pool: (pool.get("forecast") or {}).get("days_to_100"),
+    "days_to_90": lambda pool: (pool.get("forecast") or {}).get("days_to_90"),
+    "days_to_80": lambda pool: (pool.get("forecast") or {}).get("days_to_80"),
+}
+METRICAS_DISCO = {
+    "errores": METRICAS_POOL["errores"],
+}
+
+REGLAS_POR_DEFECTO = [
+    {"nombre": "pool-uso", "metrica": "used_percent", "operador": ">", "umbral": 85, "despeje": 80,
+     "severidad": "warning"},
+    {"nombre": "pool-uso-critico", "metrica": "used_percent", "operador": ">", "umbral": 95, "despeje": 92,
+     "severidad": "critical"},
+    {"nombre": "pool-estado", "metrica": "status", "operador": "!=", "umbral": "ONLINE", "severidad": "critical"},
+    {"nombre": "pool-errores", "metrica": "errores", "operador": "aumenta", "severidad": "critical"},
+    {"nombre": "pool-resilver", "metrica": "resilvering", "operador": "==", "umbral": True, "severidad": "info"},
+    {"nombre": "pool-llenado", "metrica": "days_to_full", "operador": "<", "umbral": 30, "despeje": 45,
+     "severidad": "warning"},
+    {"nombre": "disco-temperatura", "ambito": "disco", "metrica": "temperature", "operador": ">", "umbral": 50,
+     "despeje": 45, "severidad": "warning"},
+    {"nombre": "disco-smart", "ambito": "disco", "metrica": "smart_status", "operador": "==", "umbral": False,
+     "severidad": "critical"},
+]
+
+DESTINOS = {}
+
+
+def destino(nombre):
+    """Registra una clase como destino de alertas ``nombre``"""
+    def registrar(clase):
+        DESTINOS[nombre] = clase
+        return clase
+    return registrar
+
+
+@destino("webhook")
+class DestinoWebhook:
+    """Envía los eventos de cada sondeo en un único POST JSON"""
+
+    def __init__(self, url, timeout=5, cabeceras=None):
+        self.url = url
+        self.timeout = timeout
+        self.cabeceras = cabeceras or {}
+
+    def enviar(self, eventos):
+        import requests
+
+        response = requests.post(self.url, json={"alertas": eventos}, headers=self.cabeceras, timeout=self.timeout)
+        response.raise_for_status()
+
+
+@destino("archivo")
+class DestinoArchivo:
+    """Añade cada evento como una línea JSON a un archivo"""
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+
+    def enviar(self, eventos):
+        with open(self.ruta, "a", encoding="utf-8") as f:
+            for evento in eventos:
+                f.write(json.dumps(evento, ensure_ascii=False, default=str) + "\n")
+
+
+@destino("stderr")
+class DestinoStderr:
+    """Muestra cada evento en una línea de stderr"""
+
+    def enviar(self, eventos):
+        for evento in eventos:
+            icono = "✅" if evento["estado"] == "resuelta" else "🔔"
+            print(f"{icono} [{evento['severidad']}] {evento['host']} {evento['objeto']}: {evento['mensaje']}",
+                  file=sys.stderr)
+
+
+class Regla:
+    """Regla compilada: comparador, umbral de disparo y umbral de despeje"""
+
+    def __init__(self, nombre, metrica, operador=">", umbral=None, despeje=None, ambito="pool",
+                 severidad="warning", enfriamiento=ENFRIAMIENTO, repetir=None):
+        if operador != "aumenta" and operador not in OPERADORES:
+            raise ValueError(f"Operador desconocido en la regla {nombre}: {operador}")
+        if ambito not in ("pool", "disco"):
+            raise ValueError(f"Ámbito desconocido en la regla {nombre}: {ambito}")
+        self.nombre = nombre
+        self.metrica = metrica
+        self.operador = operador
+        self.umbral = umbral
+        self.despeje = umbral if despeje is None else despeje
+        self.ambito = ambito
+        self.severidad = severidad
+        self.enfriamiento = enfriamiento
+        self.repetir = repetir
+        self.comparar = OPERADORES.get(operador)
+
+    def activa(self, valor, anterior, estaba_activa):
+        """Indica si la condición se cumple, aplicando la histéresis si ya estaba activa"""
+        if self.operador == "aumenta":
+            return isinstance(anterior, (int, float)) and valor > anterior
+        try:
+            return self.comparar(valor, self.despeje if estaba_activa else self.umbral)
+        except TypeError:
+            return False
+
+    def mensaje(self, valor):
+        if self.operador == "aumenta":
+            return f"{self.metrica} ha aumentado a {valor}"
+        return f"{self.metrica} = {valor} ({self.operador} {self.umbral})"
+
+
+def compilar_reglas(reglas):
+    """Indexa las reglas por ámbito y métrica: ``{ambito: {metrica: [Regla, ...]}}``"""
+    indice = {"pool": {}, "disco": {}}
+    for regla in reglas:
+        compilada = regla if isinstance(regla, Regla) else Regla(**regla)
+        indice[compilada.ambito].setdefault(compilada.metrica, []).append(compilada)
+    return indice
+
+
+def crear_destinos(configuracion):
+    destinos = []
+    for config in configuracion:
+        config = {k: os.path.expandvars(v) if isinstance(v, str) else v for k, v in config.items()}
+        tipo = config.pop("tipo")
+        try:
+            destinos.append(DESTINOS[tipo](**config))
+        except KeyError:
+            raise ValueError(f"Destino de alertas desconocido: {tipo}") from None
+    return destinos
+
+
+class MotorAlertas:
+    """Evalúa las reglas sobre cada instantánea y notifica los cambios de estado
+
+    ``estado`` es la ruta del archivo JSON donde se conserva el estado
+    entre ejecuciones (None: solo en memoria).
+    """
+
+    def __init__(self, reglas=None, destinos=None, estado=None, avisar=None):
+        self.indice = compilar_reglas(REGLAS_POR_DEFECTO if reglas is None else reglas)
+        self.destinos = [DestinoStderr()] if destinos is None else destinos
+        self.ruta_estado = estado
+        self.avisar = avisar or (lambda mensaje: None)
+        self.estado = {}  # "regla|host|objeto" -> {"activa", "desde", "aviso", "valor"}
+        if estado and os.path.exists(estado):
+            with open(estado, encoding="utf-8") as f:
+                self.estado = json.load(f)
+
+    def _transicion(self, clave, activa, valor, ts, enfriamiento, repetir, evento):
+        """Actualiza el estado de una alerta; devuelve el evento si hay que notificarlo"""
+        estado = self.estado.get(clave)
+        if estado is None:
+            if not activa:
+                return None
+            estado = self.estado[clave] = {"activa": False, "desde": None, "aviso": None, "valor": None}
+        anterior = estado["activa"]
+        estado["activa"] = activa
+        estado["valor"] = valor
+        aviso = estado["aviso"]
+        if activa and not anterior:
+            estado["desde"] = ts
+            if aviso is None or ts - aviso >= (enfriamiento or 0):
+                estado["aviso"] = ts
+                return dict(evento, estado="disparada", desde=ts)
+            return None
+        if activa and repetir and aviso is not None and ts - aviso >= repetir:
+            estado["aviso"] = ts
+            return dict(evento, estado="disparada", desde=estado["desde"])
+        if not activa and anterior:
+            desde = estado["desde"]
+            estado["desde"] = None
+            # Solo se anuncia la resolución de lo que se llegó a notificar
+            if aviso is not None and desde is not None and aviso >= desde:
+                return dict(evento, estado="resuelta", desde=desde)
+        return None
+
+    def _evaluar_objetos(self, host, ambito, objetos, metricas_derivadas, ts, eventos):
+        reglas_por_metrica = self.indice[ambito]
+        if not reglas_por_metrica:
+            return
+        for objeto in objetos:
+            nombre = objeto.get("name")
+            for metrica, reglas in reglas_por_metrica.items():
+                extraer = metricas_derivadas.get(metrica)
+                valor = extraer(objeto) if extraer else objeto.get(metrica)
+                if valor is None:
+                    continue
+                for regla in reglas:
+                    clave = f"{regla.nombre}|{host}|{nombre}"
+                    estado = self.estado.get(clave)
+                    activa = regla.activa(valor, estado["valor"] if estado else None,
+                                          estado["activa"] if estado else False)
+                    if estado is None and regla.operador == "aumenta":
+                        # Primera muestra: se guarda como referencia sin disparar
+                        self.estado[clave] = {"activa": False, "desde": None, "aviso": None, "valor": valor}
+                        continue
+                    evento = self._transicion(clave, activa, valor, ts, regla.enfriamiento, regla.repetir, {
+                        "origen": "regla", "regla": regla.nombre, "severidad": regla.severidad,
+                        "host": host, "objeto": nombre, "metrica": metrica, "valor": valor,
+                        "umbral": regla.umbral, "mensaje": regla.mensaje(valor), "ts": ts,
+                    })
+                    if evento is not None:
+                        eventos.append(evento)
+
+    def _evaluar_nas(self, host, alertas_nas, ts, eventos):
+        """Incorpora ``/alert/list``: las nuevas se disparan y las que desaparecen se resuelven"""
+        prefijo = f"nas|{host}|"
+        vistas = set()
+        for alerta in alertas_nas:
+            if alerta.get("dismissed"):
+                continue
+            clave = prefijo + str(alerta.get("uuid") or alerta.get("id"))
+            vistas.add(clave)
+            evento = self._transicion(clave, True, alerta.get("klass"), ts, 0, None, {
+                "origen": "nas", "regla": alerta.get("klass"), "severidad": str(alerta.get("level", "")).lower(),
+                "host": host, "objeto": alerta.get("source") or alerta.get("klass"), "metrica": None,
+                "valor": None, "umbral": None, "mensaje": alerta.get("formatted") or alerta.get("text"), "ts": ts,
+            })
+            if evento is not None:
+                eventos.append(evento)
+        for clave, estado in list(self.estado.items()):
+            if clave.startswith(prefijo) and clave not in vistas and estado["activa"]:
+                evento = self._transicion(clave, False, None, ts, 0, None, {
+                    "origen": "nas", "regla": estado["valor"], "severidad": "info", "host": host,
+                    "objeto": estado["valor"], "metrica": None, "valor": None, "umbral": None,
+                    "mensaje": "Alerta del NAS resuelta", "ts": ts,
+                })
+                del self.estado[clave]
+                if evento is not None:
+                    eventos.append(evento)
+
+    def evaluar(self, host, pools, alertas_nas=None, ts=None):
+        """Evalúa un host y devuelve los eventos a notificar (sin enviarlos)"""
+        ts = time.time() if ts is None else ts
+        eventos = []
+        self._evaluar_objetos(host, "pool", pools, METRICAS_POOL, ts, eventos)
+        if self.indice["disco"]:
+            discos = [disco for pool in pools for disco in pool.get("disks") or []]
+            self._evaluar_objetos(host, "disco", discos, METRICAS_DISCO, ts, eventos)
+        if alertas_nas is not None:
+            self._evaluar_nas(host, alertas_nas, ts, eventos)
+        return eventos
+
+    def notificar(self, eventos):
+        """Envía los eventos a todos los destinos; un destino que falla no afecta al resto"""
+        if not eventos:
+            return
+        for destino_alertas in self.destinos:
+            try:
+                destino_alertas.enviar(eventos)
+            except Exception as e:
+                self.avisar(f"No se pudieron enviar las alertas a {type(destino_alertas).__name__}: {e}")
+
+    def guardar(self):
+        """Escribe el estado en su archivo de forma atómica"""
+        if not self.ruta_estado:
+            return
+        directorio = os.path.dirname(os.path.abspath(self.ruta_estado))
+        fd, temporal = tempfile.mkstemp(prefix=".", suffix=".part", dir=directorio)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.estado, f, default=str)
+            os.replace(temporal, self.ruta_estado)
+        except OSError:
+            if os.path.exists(temporal):
+                os.unlink(temporal)
+
+    def procesar(self, host, pools, alertas_nas=None, ts=None):
+        """Evalúa, notifica y guarda el estado; devuelve los eventos"""
+        eventos = self.evaluar(host, pools, alertas_nas, ts)
+        self.notificar(eventos)
+        self.guardar()
+        return eventos
+
+
+def cargar_motor(ruta, avisar=None):
+    """Crea el motor a partir de un archivo de configuración JSON
+
+    Sin ``reglas`` se usan las reglas por defecto; sin ``destinos``, stderr.
+    El estado se guarda en ``estado`` o, si no se indica, junto a la
+    configuración (``<ruta>.estado``).
+    """
+    with open(ruta, encoding="utf-8") as f:
+        config = json.load(f)
+    if isinstance(config, list):
+        config = {"reglas": config}
+    destinos = crear_destinos(config["destinos"]) if "destinos" in config else None
+    return MotorAlertas(config.get("reglas"), destinos, estado=config.get("estado", ruta + ".estado"),
+                        avisar=avisar)
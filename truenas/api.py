@@ -0,0 +1,10342 @@
+"""Cliente tipado de la API de TrueNAS
+
+GENERADO AUTOMÁTICAMENTE por ``python -m truenas.generador`` a partir de
+api-doc.json. No editar a mano: regenerar cuando cambie la especificación.
+"""
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional, Union
+
+from truenas.decodificacion import cargar
+
+# Tamaño de página por defecto de los iteradores paginados
+TAMANO_PAGINA = 500
+
+
+def _convertir(datos, cls):
+    """Convierte la respuesta JSON en instancias de ``cls`` (listas incluidas)"""
+    if cls is None:
+        return datos
+    if isinstance(datos, list):
+        return [cls.desde_dict(d) if isinstance(d, dict) else d for d in datos]
+    if isinstance(datos, dict):
+        return cls.desde_dict(datos)
+    return datos
+
+
+class _Modelo:
+    """Base de los modelos generados: construcción desde dict ignorando campos extra"""
+
+    __slots__ = ()
+    _claves = ()
+
+    @classmethod
+    def desde_dict(cls, datos):
+        return cls(*(datos.get(clave) for clave in cls._claves))
+
+    def a_dict(self):
+        return {clave: getattr(self, campo) for campo, clave in zip(self.__slots__, self._claves)}
+
+
+@dataclass
+class AcmeDnsAuthenticatorGet(_Modelo):
+    __slots__ = ('id', 'attributes', 'name')
+    _claves = ('id', 'attributes', 'name')
+
+    id: int
+    attributes: Any
+    name: str
+
+
+@dataclass
+class AcmeDnsAuthenticatorPost(_Modelo):
+    __slots__ = ('id', 'attributes', 'name')
+    _claves = ('id', 'attributes', 'name')
+
+    id: int
+    attributes: Any
+    name: str
+
+
+@dataclass
+class AcmeDnsAuthenticatorAuthenticatorSchemasGet(_Modelo):
+    __slots__ = ('key', 'schema')
+    _claves = ('key', 'schema')
+
+    key: str
+    schema: Any
+
+
+@dataclass
+class AcmeDnsAuthenticatorGetInstancePost(_Modelo):
+    __slots__ = ('id', 'attributes', 'name')
+    _claves = ('id', 'attributes', 'name')
+
+    id: int
+    attributes: Any
+    name: str
+
+
+@dataclass
+class AcmeDnsAuthenticatorIdGet(_Modelo):
+    __slots__ = ('id', 'attributes', 'name')
+    _claves = ('id', 'attributes', 'name')
+
+    id: int
+    attributes: Any
+    name: str
+
+
+@dataclass
+class AcmeDnsAuthenticatorIdPut(_Modelo):
+    __slots__ = ('id', 'attributes', 'name')
+    _claves = ('id', 'attributes', 'name')
+
+    id: int
+    attributes: Any
+    name: str
+
+
+@dataclass
+class ActivedirectoryGet(_Modelo):
+    __slots__ = ('domainname', 'bindname', 'bindpw', 'verbose_logging', 'use_default_domain', 'allow_trusted_doms', 'allow_dns_updates', 'disable_freenas_cache', 'restrict_pam', 'site', 'kerberos_realm', 'kerberos_principal', 'timeout', 'dns_timeout', 'nss_info', 'createcomputer', 'netbiosname', 'netbiosalias', 'enable')
+    _claves = ('domainname', 'bindname', 'bindpw', 'verbose_logging', 'use_default_domain', 'allow_trusted_doms', 'allow_dns_updates', 'disable_freenas_cache', 'restrict_pam', 'site', 'kerberos_realm', 'kerberos_principal', 'timeout', 'dns_timeout', 'nss_info', 'createcomputer', 'netbiosname', 'netbiosalias', 'enable')
+
+    domainname: str
+    bindname: str
+    bindpw: str
+    verbose_logging: bool
+    use_default_domain: bool
+    allow_trusted_doms: bool
+    allow_dns_updates: bool
+    disable_freenas_cache: bool
+    restrict_pam: bool
+    site: str
+    kerberos_realm: int
+    kerberos_principal: str
+    timeout: int
+    dns_timeout: int
+    nss_info: str
+    createcomputer: str
+    netbiosname: str
+    netbiosalias: list
+    enable: bool
+
+
+@dataclass
+class ActivedirectoryPut(_Modelo):
+    __slots__ = ('domainname', 'bindname', 'bindpw', 'verbose_logging', 'use_default_domain', 'allow_trusted_doms', 'allow_dns_updates', 'disable_freenas_cache', 'restrict_pam', 'site', 'kerberos_realm', 'kerberos_principal', 'timeout', 'dns_timeout', 'nss_info', 'createcomputer', 'netbiosname', 'netbiosalias', 'enable')
+    _claves = ('domainname', 'bindname', 'bindpw', 'verbose_logging', 'use_default_domain', 'allow_trusted_doms', 'allow_dns_updates', 'disable_freenas_cache', 'restrict_pam', 'site', 'kerberos_realm', 'kerberos_principal', 'timeout', 'dns_timeout', 'nss_info', 'createcomputer', 'netbiosname', 'netbiosalias', 'enable')
+
+    domainname: str
+    bindname: str
+    bindpw: str
+    verbose_logging: bool
+    use_default_domain: bool
+    allow_trusted_doms: bool
+    allow_dns_updates: bool
+    disable_freenas_cache: bool
+    restrict_pam: bool
+    site: str
+    kerberos_realm: int
+    kerberos_principal: str
+    timeout: int
+    dns_timeout: int
+    nss_info: str
+    createcomputer: str
+    netbiosname: str
+    netbiosalias: list
+    enable: bool
+
+
+@dataclass
+class ActivedirectoryDomainInfoPost(_Modelo):
+    __slots__ = ('LDAP_server', 'LDAP_server_name', 'Realm', 'Bind_Path', 'LDAP_port', 'Server_time', 'KDC_server', 'Server_time_offset', 'Last_machine_account_password_change')
+    _claves = ('LDAP server', 'LDAP server name', 'Realm', 'Bind Path', 'LDAP port', 'Server time', 'KDC server', 'Server time offset', 'Last machine account password change')
+
+    LDAP_server: str
+    LDAP_server_name: str
+    Realm: str
+    Bind_Path: str
+    LDAP_port: int
+    Server_time: int
+    KDC_server: str
+    Server_time_offset: int
+    Last_machine_account_password_change: int
+
+
+@dataclass
+class AlertListGet(_Modelo):
+    __slots__ = ('uuid', 'source', 'klass', 'args', 'node', 'key', 'datetime', 'last_occurrence', 'dismissed', 'mail', 'text', 'id', 'level', 'formatted', 'one_shot')
+    _claves = ('uuid', 'source', 'klass', 'args', 'node', 'key', 'datetime', 'last_occurrence', 'dismissed', 'mail', 'text', 'id', 'level', 'formatted', 'one_shot')
+
+    uuid: str
+    source: str
+    klass: str
+    args: Any
+    node: str
+    key: str
+    datetime: str
+    last_occurrence: str
+    dismissed: bool
+    mail: Any
+    text: str
+    id: str
+    level: str
+    formatted: Union[None, str]
+    one_shot: bool
+
+
+@dataclass
+class AlertListCategoriesGet(_Modelo):
+    __slots__ = ('id', 'classes')
+    _claves = ('id', 'classes')
+
+    id: str
+    classes: list
+
+
+@dataclass
+class AlertclassesGet(_Modelo):
+    __slots__ = ('id', 'classes')
+    _claves = ('id', 'classes')
+
+    id: int
+    classes: dict
+
+
+@dataclass
+class AlertclassesPut(_Modelo):
+    __slots__ = ('id', 'classes')
+    _claves = ('id', 'classes')
+
+    id: int
+    classes: dict
+
+
+@dataclass
+class AlertserviceGet(_Modelo):
+    __slots__ = ('name', 'type', 'attributes', 'level', 'enabled', 'id', 'type__title')
+    _claves = ('name', 'type', 'attributes', 'level', 'enabled', 'id', 'type__title')
+
+    name: str
+    type: str
+    attributes: dict
+    level: str
+    enabled: bool
+    id: int
+    type__title: str
+
+
+@dataclass
+class AlertservicePost(_Modelo):
+    __slots__ = ('name', 'type', 'attributes', 'level', 'enabled', 'id', 'type__title')
+    _claves = ('name', 'type', 'attributes', 'level', 'enabled', 'id', 'type__title')
+
+    name: str
+    type: str
+    attributes: dict
+    level: str
+    enabled: bool
+    id: int
+    type__title: str
+
+
+@dataclass
+class AlertserviceGetInstancePost(_Modelo):
+    __slots__ = ('name', 'type', 'attributes', 'level', 'enabled', 'id', 'type__title')
+    _claves = ('name', 'type', 'attributes', 'level', 'enabled', 'id', 'type__title')
+
+    name: str
+    type: str
+    attributes: dict
+    level: str
+    enabled: bool
+    id: int
+    type__title: str
+
+
+@dataclass
+class AlertserviceIdGet(_Modelo):
+    __slots__ = ('name', 'type', 'attributes', 'level', 'enabled', 'id', 'type__title')
+    _claves = ('name', 'type', 'attributes', 'level', 'enabled', 'id', 'type__title')
+
+    name: str
+    type: str
+    attributes: dict
+    level: str
+    enabled: bool
+    id: int
+    type__title: str
+
+
+@dataclass
+class AlertserviceIdPut(_Modelo):
+    __slots__ = ('name', 'type', 'attributes', 'level', 'enabled', 'id', 'type__title')
+    _claves = ('name', 'type', 'attributes', 'level', 'enabled', 'id', 'type__title')
+
+    name: str
+    type: str
+    attributes: dict
+    level: str
+    enabled: bool
+    id: int
+    type__title: str
+
+
+@dataclass
+class ApiKeyGet(_Modelo):
+    __slots__ = ('id', 'name', 'username', 'user_identifier', 'keyhash', 'created_at', 'expires_at', 'local', 'revoked')
+    _claves = ('id', 'name', 'username', 'user_identifier', 'keyhash', 'created_at', 'expires_at', 'local', 'revoked')
+
+    id: int
+    name: str
+    username: str
+    user_identifier: Union[int, str]
+    keyhash: str
+    created_at: str
+    expires_at: Union[None, str]
+    local: bool
+    revoked: bool
+
+
+@dataclass
+class ApiKeyPost(_Modelo):
+    __slots__ = ('id', 'name', 'username', 'user_identifier', 'keyhash', 'created_at', 'expires_at', 'local', 'revoked', 'key')
+    _claves = ('id', 'name', 'username', 'user_identifier', 'keyhash', 'created_at', 'expires_at', 'local', 'revoked', 'key')
+
+    id: int
+    name: str
+    username: str
+    user_identifier: Union[int, str]
+    keyhash: str
+    created_at: str
+    expires_at: Union[None, str]
+    local: bool
+    revoked: bool
+    key: str
+
+
+@dataclass
+class ApiKeyGetInstancePost(_Modelo):
+    __slots__ = ('id', 'name', 'username', 'user_identifier', 'keyhash', 'created_at', 'expires_at', 'local', 'revoked')
+    _claves = ('id', 'name', 'username', 'user_identifier', 'keyhash', 'created_at', 'expires_at', 'local', 'revoked')
+
+    id: int
+    name: str
+    username: str
+    user_identifier: Union[int, str]
+    keyhash: str
+    created_at: str
+    expires_at: Union[None, str]
+    local: bool
+    revoked: bool
+
+
+@dataclass
+class ApiKeyIdGet(_Modelo):
+    __slots__ = ('id', 'name', 'username', 'user_identifier', 'keyhash', 'created_at', 'expires_at', 'local', 'revoked')
+    _claves = ('id', 'name', 'username', 'user_identifier', 'keyhash', 'created_at', 'expires_at', 'local', 'revoked')
+
+    id: int
+    name: str
+    username: str
+    user_identifier: Union[int, str]
+    keyhash: str
+    created_at: str
+    expires_at: Union[None, str]
+    local: bool
+    revoked: bool
+
+
+@dataclass
+class ApiKeyIdPut(_Modelo):
+    __slots__ = ('id', 'name', 'username', 'user_identifier', 'keyhash', 'created_at', 'expires_at', 'local', 'revoked', 'key')
+    _claves = ('id', 'name', 'username', 'user_identifier', 'keyhash', 'created_at', 'expires_at', 'local', 'revoked', 'key')
+
+    id: int
+    name: str
+    username: str
+    user_identifier: Union[int, str]
+    keyhash: str
+    created_at: str
+    expires_at: Union[None, str]
+    local: bool
+    revoked: bool
+    key: str
+
+
+@dataclass
+class AppGet(_Modelo):
+    __slots__ = ('name', 'id', 'state', 'upgrade_available', 'latest_version', 'image_updates_available', 'custom_app', 'migrated', 'human_version', 'version', 'metadata', 'active_workloads', 'notes', 'portals', 'version_details', 'config')
+    _claves = ('name', 'id', 'state', 'upgrade_available', 'latest_version', 'image_updates_available', 'custom_app', 'migrated', 'human_version', 'version', 'metadata', 'active_workloads', 'notes', 'portals', 'version_details', 'config')
+
+    name: str
+    id: str
+    state: str
+    upgrade_available: bool
+    latest_version: Union[None, str]
+    image_updates_available: bool
+    custom_app: bool
+    migrated: bool
+    human_version: str
+    version: str
+    metadata: dict
+    active_workloads: Any
+    notes: Union[None, str]
+    portals: dict
+    version_details: Union[None, dict]
+    config: Union[None, dict]
+
+
+@dataclass
+class AppPost(_Modelo):
+    __slots__ = ('name', 'id', 'state', 'upgrade_available', 'latest_version', 'image_updates_available', 'custom_app', 'migrated', 'human_version', 'version', 'metadata', 'active_workloads', 'notes', 'portals', 'version_details', 'config')
+    _claves = ('name', 'id', 'state', 'upgrade_available', 'latest_version', 'image_updates_available', 'custom_app', 'migrated', 'human_version', 'version', 'metadata', 'active_workloads', 'notes', 'portals', 'version_details', 'config')
+
+    name: str
+    id: str
+    state: str
+    upgrade_available: bool
+    latest_version: Union[None, str]
+    image_updates_available: bool
+    custom_app: bool
+    migrated: bool
+    human_version: str
+    version: str
+    metadata: dict
+    active_workloads: Any
+    notes: Union[None, str]
+    portals: dict
+    version_details: Union[None, dict]
+    config: Union[None, dict]
+
+
+@dataclass
+class AppAvailableGet(_Modelo):
+    __slots__ = ('app_readme', 'categories', 'healthy', 'healthy_error', 'home', 'location', 'latest_version', 'latest_app_version', 'latest_human_version', 'last_update', 'name', 'recommended', 'maintainers', 'tags', 'screenshots', 'sources', 'icon_url', 'catalog', 'installed', 'train')
+    _claves = ('app_readme', 'categories', 'healthy', 'healthy_error', 'home', 'location', 'latest_version', 'latest_app_version', 'latest_human_version', 'last_update', 'name', 'recommended', 'maintainers', 'tags', 'screenshots', 'sources', 'icon_url', 'catalog', 'installed', 'train')
+
+    app_readme: Union[None, str]
+    categories: list
+    healthy: bool
+    healthy_error: Union[None, str]
+    home: str
+    location: str
+    latest_version: Union[None, str]
+    latest_app_version: Union[None, str]
+    latest_human_version: Union[None, str]
+    last_update: Union[None, str]
+    name: str
+    recommended: bool
+    maintainers: list
+    tags: list
+    screenshots: list
+    sources: list
+    icon_url: Union[None, str]
+    catalog: str
+    installed: bool
+    train: str
+
+
+@dataclass
+class AppCertificateAuthorityChoicesGet(_Modelo):
+    __slots__ = ('id', 'name')
+    _claves = ('id', 'name')
+
+    id: int
+    name: str
+
+
+@dataclass
+class AppCertificateChoicesGet(_Modelo):
+    __slots__ = ('id', 'name')
+    _claves = ('id', 'name')
+
+    id: int
+    name: str
+
+
+@dataclass
+class AppConvertToCustomPost(_Modelo):
+    __slots__ = ('name', 'id', 'state', 'upgrade_available', 'latest_version', 'image_updates_available', 'custom_app', 'migrated', 'human_version', 'version', 'metadata', 'active_workloads', 'notes', 'portals', 'version_details', 'config')
+    _claves = ('name', 'id', 'state', 'upgrade_available', 'latest_version', 'image_updates_available', 'custom_app', 'migrated', 'human_version', 'version', 'metadata', 'active_workloads', 'notes', 'portals', 'version_details', 'config')
+
+    name: str
+    id: str
+    state: str
+    upgrade_available: bool
+    latest_version: Union[None, str]
+    image_updates_available: bool
+    custom_app: bool
+    migrated: bool
+    human_version: str
+    version: str
+    metadata: dict
+    active_workloads: Any
+    notes: Union[None, str]
+    portals: dict
+    version_details: Union[None, dict]
+    config: Union[None, dict]
+
+
+@dataclass
+class AppGetInstancePost(_Modelo):
+    __slots__ = ('name', 'id', 'state', 'upgrade_available', 'latest_version', 'image_updates_available', 'custom_app', 'migrated', 'human_version', 'version', 'metadata', 'active_workloads', 'notes', 'portals', 'version_details', 'config')
+    _claves = ('name', 'id', 'state', 'upgrade_available', 'latest_version', 'image_updates_available', 'custom_app', 'migrated', 'human_version', 'version', 'metadata', 'active_workloads', 'notes', 'portals', 'version_details', 'config')
+
+    name: str
+    id: str
+    state: str
+    upgrade_available: bool
+    latest_version: Union[None, str]
+    image_updates_available: bool
+    custom_app: bool
+    migrated: bool
+    human_version: str
+    version: str
+    metadata: dict
+    active_workloads: Any
+    notes: Union[None, str]
+    portals: dict
+    version_details: Union[None, dict]
+    config: Union[None, dict]
+
+
+@dataclass
+class AppIdGet(_Modelo):
+    __slots__ = ('name', 'id', 'state', 'upgrade_available', 'latest_version', 'image_updates_available', 'custom_app', 'migrated', 'human_version', 'version', 'metadata', 'active_workloads', 'notes', 'portals', 'version_details', 'config')
+    _claves = ('name', 'id', 'state', 'upgrade_available', 'latest_version', 'image_updates_available', 'custom_app', 'migrated', 'human_version', 'version', 'metadata', 'active_workloads', 'notes', 'portals', 'version_details', 'config')
+
+    name: str
+    id: str
+    state: str
+    upgrade_available: bool
+    latest_version: Union[None, str]
+    image_updates_available: bool
+    custom_app: bool
+    migrated: bool
+    human_version: str
+    version: str
+    metadata: dict
+    active_workloads: Any
+    notes: Union[None, str]
+    portals: dict
+    version_details: Union[None, dict]
+    config: Union[None, dict]
+
+
+@dataclass
+class AppIdPut(_Modelo):
+    __slots__ = ('name', 'id', 'state', 'upgrade_available', 'latest_version', 'image_updates_available', 'custom_app', 'migrated', 'human_version', 'version', 'metadata', 'active_workloads', 'notes', 'portals', 'version_details', 'config')
+    _claves = ('name', 'id', 'state', 'upgrade_available', 'latest_version', 'image_updates_available', 'custom_app', 'migrated', 'human_version', 'version', 'metadata', 'active_workloads', 'notes', 'portals', 'version_details', 'config')
+
+    name: str
+    id: str
+    state: str
+    upgrade_available: bool
+    latest_version: Union[None, str]
+    image_updates_available: bool
+    custom_app: bool
+    migrated: bool
+    human_version: str
+    version: str
+    metadata: dict
+    active_workloads: Any
+    notes: Union[None, str]
+    portals: dict
+    version_details: Union[None, dict]
+    config: Union[None, dict]
+
+
+@dataclass
+class AppImageGet(_Modelo):
+    __slots__ = ('id', 'repo_tags', 'repo_digests', 'size', 'dangling', 'update_available', 'created', 'author', 'comment', 'parsed_repo_tags')
+    _claves = ('id', 'repo_tags', 'repo_digests', 'size', 'dangling', 'update_available', 'created', 'author', 'comment', 'parsed_repo_tags')
+
+    id: str
+    repo_tags: list
+    repo_digests: list
+    size: int
+    dangling: bool
+    update_available: bool
+    created: str
+    author: str
+    comment: str
+    parsed_repo_tags: Union[None, list]
+
+
+@dataclass
+class AppImageDockerhubRateLimitGet(_Modelo):
+    __slots__ = ('total_pull_limit', 'total_time_limit_in_secs', 'remaining_pull_limit', 'remaining_time_limit_in_secs', 'error')
+    _claves = ('total_pull_limit', 'total_time_limit_in_secs', 'remaining_pull_limit', 'remaining_time_limit_in_secs', 'error')
+
+    total_pull_limit: Union[None, int]
+    total_time_limit_in_secs: Union[None, int]
+    remaining_pull_limit: Union[None, int]
+    remaining_time_limit_in_secs: Union[None, int]
+    error: Union[None, str]
+
+
+@dataclass
+class AppImageGetInstancePost(_Modelo):
+    __slots__ = ('id', 'repo_tags', 'repo_digests', 'size', 'dangling', 'update_available', 'created', 'author', 'comment', 'parsed_repo_tags')
+    _claves = ('id', 'repo_tags', 'repo_digests', 'size', 'dangling', 'update_available', 'created', 'author', 'comment', 'parsed_repo_tags')
+
+    id: str
+    repo_tags: list
+    repo_digests: list
+    size: int
+    dangling: bool
+    update_available: bool
+    created: str
+    author: str
+    comment: str
+    parsed_repo_tags: Union[None, list]
+
+
+@dataclass
+class AppImageIdGet(_Modelo):
+    __slots__ = ('id', 'repo_tags', 'repo_digests', 'size', 'dangling', 'update_available', 'created', 'author', 'comment', 'parsed_repo_tags')
+    _claves = ('id', 'repo_tags', 'repo_digests', 'size', 'dangling', 'update_available', 'created', 'author', 'comment', 'parsed_repo_tags')
+
+    id: str
+    repo_tags: list
+    repo_digests: list
+    size: int
+    dangling: bool
+    update_available: bool
+    created: str
+    author: str
+    comment: str
+    parsed_repo_tags: Union[None, list]
+
+
+@dataclass
+class AppIxVolumeQueryGet(_Modelo):
+    __slots__ = ('app_name', 'name')
+    _claves = ('app_name', 'name')
+
+    app_name: str
+    name: str
+
+
+@dataclass
+class AppLatestGet(_Modelo):
+    __slots__ = ('app_readme', 'categories', 'healthy', 'healthy_error', 'home', 'location', 'latest_version', 'latest_app_version', 'latest_human_version', 'last_update', 'name', 'recommended', 'maintainers', 'tags', 'screenshots', 'sources', 'icon_url', 'catalog', 'installed', 'train')
+    _claves = ('app_readme', 'categories', 'healthy', 'healthy_error', 'home', 'location', 'latest_version', 'latest_app_version', 'latest_human_version', 'last_update', 'name', 'recommended', 'maintainers', 'tags', 'screenshots', 'sources', 'icon_url', 'catalog', 'installed', 'train')
+
+    app_readme: Union[None, str]
+    categories: list
+    healthy: bool
+    healthy_error: Union[None, str]
+    home: str
+    location: str
+    latest_version: Union[None, str]
+    latest_app_version: Union[None, str]
+    latest_human_version: Union[None, str]
+    last_update: Union[None, str]
+    name: str
+    recommended: bool
+    maintainers: list
+    tags: list
+    screenshots: list
+    sources: list
+    icon_url: Union[None, str]
+    catalog: str
+    installed: bool
+    train: str
+
+
+@dataclass
+class AppRedeployPost(_Modelo):
+    __slots__ = ('name', 'id', 'state', 'upgrade_available', 'latest_version', 'image_updates_available', 'custom_app', 'migrated', 'human_version', 'version', 'metadata', 'active_workloads', 'notes', 'portals', 'version_details', 'config')
+    _claves = ('name', 'id', 'state', 'upgrade_available', 'latest_version', 'image_updates_available', 'custom_app', 'migrated', 'human_version', 'version', 'metadata', 'active_workloads', 'notes', 'portals', 'version_details', 'config')
+
+    name: str
+    id: str
+    state: str
+    upgrade_available: bool
+    latest_version: Union[None, str]
+    image_updates_available: bool
+    custom_app: bool
+    migrated: bool
+    human_version: str
+    version: str
+    metadata: dict
+    active_workloads: Any
+    notes: Union[None, str]
+    portals: dict
+    version_details: Union[None, dict]
+    config: Union[None, dict]
+
+
+@dataclass
+class AppRegistryGet(_Modelo):
+    __slots__ = ('id', 'name', 'username', 'password', 'uri')
+    _claves = ('id', 'name', 'username', 'password', 'uri')
+
+    id: int
+    name: str
+    username: str
+    password: str
+    uri: str
+
+
+@dataclass
+class AppRegistryPost(_Modelo):
+    __slots__ = ('id', 'name', 'username', 'password', 'uri')
+    _claves = ('id', 'name', 'username', 'password', 'uri')
+
+    id: int
+    name: str
+    username: str
+    password: str
+    uri: str
+
+
+@dataclass
+class AppRegistryGetInstancePost(_Modelo):
+    __slots__ = ('id', 'name', 'username', 'password', 'uri')
+    _claves = ('id', 'name', 'username', 'password', 'uri')
+
+    id: int
+    name: str
+    username: str
+    password: str
+    uri: str
+
+
+@dataclass
+class AppRegistryIdGet(_Modelo):
+    __slots__ = ('id', 'name', 'username', 'password', 'uri')
+    _claves = ('id', 'name', 'username', 'password', 'uri')
+
+    id: int
+    name: str
+    username: str
+    password: str
+    uri: str
+
+
+@dataclass
+class AppRegistryIdPut(_Modelo):
+    __slots__ = ('id', 'name', 'username', 'password', 'uri')
+    _claves = ('id', 'name', 'username', 'password', 'uri')
+
+    id: int
+    name: str
+    username: str
+    password: str
+    uri: str
+
+
+@dataclass
+class AppRollbackPost(_Modelo):
+    __slots__ = ('name', 'id', 'state', 'upgrade_available', 'latest_version', 'image_updates_available', 'custom_app', 'migrated', 'human_version', 'version', 'metadata', 'active_workloads', 'notes', 'portals', 'version_details', 'config')
+    _claves = ('name', 'id', 'state', 'upgrade_available', 'latest_version', 'image_updates_available', 'custom_app', 'migrated', 'human_version', 'version', 'metadata', 'active_workloads', 'notes', 'portals', 'version_details', 'config')
+
+    name: str
+    id: str
+    state: str
+    upgrade_available: bool
+    latest_version: Union[None, str]
+    image_updates_available: bool
+    custom_app: bool
+    migrated: bool
+    human_version: str
+    version: str
+    metadata: dict
+    active_workloads: Any
+    notes: Union[None, str]
+    portals: dict
+    version_details: Union[None, dict]
+    config: Union[None, dict]
+
+
+@dataclass
+class AppSimilarPost(_Modelo):
+    __slots__ = ('app_readme', 'categories', 'healthy', 'healthy_error', 'home', 'location', 'latest_version', 'latest_app_version', 'latest_human_version', 'last_update', 'name', 'recommended', 'maintainers', 'tags', 'screenshots', 'sources', 'icon_url', 'catalog', 'installed', 'train')
+    _claves = ('app_readme', 'categories', 'healthy', 'healthy_error', 'home', 'location', 'latest_version', 'latest_app_version', 'latest_human_version', 'last_update', 'name', 'recommended', 'maintainers', 'tags', 'screenshots', 'sources', 'icon_url', 'catalog', 'installed', 'train')
+
+    app_readme: Union[None, str]
+    categories: list
+    healthy: bool
+    healthy_error: Union[None, str]
+    home: str
+    location: str
+    latest_version: Union[None, str]
+    latest_app_version: Union[None, str]
+    latest_human_version: Union[None, str]
+    last_update: Union[None, str]
+    name: str
+    recommended: bool
+    maintainers: list
+    tags: list
+    screenshots: list
+    sources: list
+    icon_url: Union[None, str]
+    catalog: str
+    installed: bool
+    train: str
+
+
+@dataclass
+class AppUpgradePost(_Modelo):
+    __slots__ = ('name', 'id', 'state', 'upgrade_available', 'latest_version', 'image_updates_available', 'custom_app', 'migrated', 'human_version', 'version', 'metadata', 'active_workloads', 'notes', 'portals', 'version_details', 'config')
+    _claves = ('name', 'id', 'state', 'upgrade_available', 'latest_version', 'image_updates_available', 'custom_app', 'migrated', 'human_version', 'version', 'metadata', 'active_workloads', 'notes', 'portals', 'version_details', 'config')
+
+    name: str
+    id: str
+    state: str
+    upgrade_available: bool
+    latest_version: Union[None, str]
+    image_updates_available: bool
+    custom_app: bool
+    migrated: bool
+    human_version: str
+    version: str
+    metadata: dict
+    active_workloads: Any
+    notes: Union[None, str]
+    portals: dict
+    version_details: Union[None, dict]
+    config: Union[None, dict]
+
+
+@dataclass
+class AppUpgradeSummaryPost(_Modelo):
+    __slots__ = ('latest_version', 'latest_human_version', 'upgrade_version', 'upgrade_human_version', 'available_versions_for_upgrade', 'changelog')
+    _claves = ('latest_version', 'latest_human_version', 'upgrade_version', 'upgrade_human_version', 'available_versions_for_upgrade', 'changelog')
+
+    latest_version: str
+    latest_human_version: str
+    upgrade_version: str
+    upgrade_human_version: str
+    available_versions_for_upgrade: list
+    changelog: Union[None, str]
+
+
+@dataclass
+class AuditGet(_Modelo):
+    __slots__ = ('retention', 'reservation', 'quota', 'quota_fill_warning', 'quota_fill_critical', 'available', 'space', 'remote_logging_enabled', 'enabled_services')
+    _claves = ('retention', 'reservation', 'quota', 'quota_fill_warning', 'quota_fill_critical', 'available', 'space', 'remote_logging_enabled', 'enabled_services')
+
+    retention: int
+    reservation: int
+    quota: int
+    quota_fill_warning: int
+    quota_fill_critical: int
+    available: int
+    space: dict
+    remote_logging_enabled: bool
+    enabled_services: list
+
+
+@dataclass
+class AuditQueryPost(_Modelo):
+    __slots__ = ('audit_id', 'message_timestamp', 'timestamp', 'address', 'username', 'session', 'service', 'service_data', 'event', 'event_data', 'success')
+    _claves = ('audit_id', 'message_timestamp', 'timestamp', 'address', 'username', 'session', 'service', 'service_data', 'event', 'event_data', 'success')
+
+    audit_id: str
+    message_timestamp: int
+    timestamp: str
+    address: str
+    username: str
+    session: str
+    service: str
+    service_data: dict
+    event: str
+    event_data: dict
+    success: bool
+
+
+@dataclass
+class AuthTwofactorGet(_Modelo):
+    __slots__ = ('enabled', 'services', 'window', 'id')
+    _claves = ('enabled', 'services', 'window', 'id')
+
+    enabled: bool
+    services: dict
+    window: int
+    id: int
+
+
+@dataclass
+class AuthTwofactorPut(_Modelo):
+    __slots__ = ('enabled', 'services', 'window', 'id')
+    _claves = ('enabled', 'services', 'window', 'id')
+
+    enabled: bool
+    services: dict
+    window: int
+    id: int
+
+
+@dataclass
+class BootEnvironmentActivatePost(_Modelo):
+    __slots__ = ('id', 'dataset', 'active', 'activated', 'created', 'used_bytes', 'used', 'keep', 'can_activate')
+    _claves = ('id', 'dataset', 'active', 'activated', 'created', 'used_bytes', 'used', 'keep', 'can_activate')
+
+    id: str
+    dataset: str
+    active: bool
+    activated: bool
+    created: str
+    used_bytes: int
+    used: str
+    keep: bool
+    can_activate: bool
+
+
+@dataclass
+class BootEnvironmentClonePost(_Modelo):
+    __slots__ = ('id', 'dataset', 'active', 'activated', 'created', 'used_bytes', 'used', 'keep', 'can_activate')
+    _claves = ('id', 'dataset', 'active', 'activated', 'created', 'used_bytes', 'used', 'keep', 'can_activate')
+
+    id: str
+    dataset: str
+    active: bool
+    activated: bool
+    created: str
+    used_bytes: int
+    used: str
+    keep: bool
+    can_activate: bool
+
+
+@dataclass
+class BootEnvironmentKeepPost(_Modelo):
+    __slots__ = ('id', 'dataset', 'active', 'activated', 'created', 'used_bytes', 'used', 'keep', 'can_activate')
+    _claves = ('id', 'dataset', 'active', 'activated', 'created', 'used_bytes', 'used', 'keep', 'can_activate')
+
+    id: str
+    dataset: str
+    active: bool
+    activated: bool
+    created: str
+    used_bytes: int
+    used: str
+    keep: bool
+    can_activate: bool
+
+
+@dataclass
+class BootEnvironmentQueryGet(_Modelo):
+    __slots__ = ('id', 'dataset', 'active', 'activated', 'created', 'used_bytes', 'used', 'keep', 'can_activate')
+    _claves = ('id', 'dataset', 'active', 'activated', 'created', 'used_bytes', 'used', 'keep', 'can_activate')
+
+    id: str
+    dataset: str
+    active: bool
+    activated: bool
+    created: str
+    used_bytes: int
+    used: str
+    keep: bool
+    can_activate: bool
+
+
+@dataclass
+class BootGetStateGet(_Modelo):
+    __slots__ = ('name', 'status', 'path', 'scan', 'expand', 'is_upgraded', 'healthy', 'warning', 'status_code', 'status_detail', 'size', 'allocated', 'free', 'freeing', 'dedup_table_size', 'dedup_table_quota', 'fragmentation', 'size_str', 'allocated_str', 'free_str', 'freeing_str', 'autotrim', 'topology')
+    _claves = ('name', 'status', 'path', 'scan', 'expand', 'is_upgraded', 'healthy', 'warning', 'status_code', 'status_detail', 'size', 'allocated', 'free', 'freeing', 'dedup_table_size', 'dedup_table_quota', 'fragmentation', 'size_str', 'allocated_str', 'free_str', 'freeing_str', 'autotrim', 'topology')
+
+    name: str
+    status: str
+    path: str
+    scan: dict
+    expand: dict
+    is_upgraded: bool
+    healthy: bool
+    warning: bool
+    status_code: str
+    status_detail: str
+    size: int
+    allocated: int
+    free: int
+    freeing: int
+    dedup_table_size: int
+    dedup_table_quota: str
+    fragmentation: str
+    size_str: str
+    allocated_str: str
+    free_str: str
+    freeing_str: str
+    autotrim: dict
+    topology: dict
+
+
+@dataclass
+class CatalogGet(_Modelo):
+    __slots__ = ('id', 'label', 'preferred_trains', 'location')
+    _claves = ('id', 'label', 'preferred_trains', 'location')
+
+    id: str
+    label: str
+    preferred_trains: list
+    location: str
+
+
+@dataclass
+class CatalogPut(_Modelo):
+    __slots__ = ('id', 'label', 'preferred_trains', 'location')
+    _claves = ('id', 'label', 'preferred_trains', 'location')
+
+    id: str
+    label: str
+    preferred_trains: list
+    location: str
+
+
+@dataclass
+class CatalogGetAppDetailsPost(_Modelo):
+    __slots__ = ('app_readme', 'categories', 'healthy', 'healthy_error', 'home', 'location', 'latest_version', 'latest_app_version', 'latest_human_version', 'last_update', 'name', 'recommended', 'maintainers', 'tags', 'screenshots', 'sources', 'icon_url')
+    _claves = ('app_readme', 'categories', 'healthy', 'healthy_error', 'home', 'location', 'latest_version', 'latest_app_version', 'latest_human_version', 'last_update', 'name', 'recommended', 'maintainers', 'tags', 'screenshots', 'sources', 'icon_url')
+
+    app_readme: Union[None, str]
+    categories: list
+    healthy: bool
+    healthy_error: Union[None, str]
+    home: str
+    location: str
+    latest_version: Union[None, str]
+    latest_app_version: Union[None, str]
+    latest_human_version: Union[None, str]
+    last_update: Union[None, str]
+    name: str
+    recommended: bool
+    maintainers: list
+    tags: list
+    screenshots: list
+    sources: list
+    icon_url: Union[None, str]
+
+
+@dataclass
+class CertificateGet(_Modelo):
+    __slots__ = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from_', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+    _claves = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+
+    id: int
+    type: int
+    name: str
+    certificate: Optional[str]
+    privatekey: Optional[str]
+    CSR: Optional[str]
+    acme_uri: Optional[str]
+    domains_authenticators: dict
+    renew_days: int
+    revoked_date: Optional[str]
+    signedby: dict
+    root_path: str
+    acme: dict
+    certificate_path: Optional[str]
+    privatekey_path: Optional[str]
+    csr_path: Optional[str]
+    cert_type: str
+    revoked: bool
+    expired: Optional[bool]
+    issuer: Union[Optional[str], dict]
+    chain_list: list
+    country: Optional[str]
+    state: Optional[str]
+    city: Optional[str]
+    organization: Optional[str]
+    organizational_unit: Optional[str]
+    san: Optional[list]
+    email: Optional[str]
+    DN: Optional[str]
+    subject_name_hash: Optional[str]
+    digest_algorithm: Optional[str]
+    from_: Optional[str]
+    common: Optional[str]
+    until: Optional[str]
+    fingerprint: Optional[str]
+    key_type: Optional[str]
+    internal: Optional[str]
+    lifetime: Optional[int]
+    serial: Optional[int]
+    key_length: Optional[int]
+    add_to_trusted_store: bool
+    chain: Optional[bool]
+    CA_type_existing: bool
+    CA_type_internal: bool
+    CA_type_intermediate: bool
+    cert_type_existing: bool
+    cert_type_internal: bool
+    cert_type_CSR: bool
+    parsed: bool
+    can_be_revoked: bool
+    extensions: dict
+    revoked_certs: list
+    crl_path: str
+    signed_certificates: int
+
+
+@dataclass
+class CertificatePost(_Modelo):
+    __slots__ = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from_', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+    _claves = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+
+    id: int
+    type: int
+    name: str
+    certificate: str
+    privatekey: str
+    CSR: str
+    acme_uri: str
+    domains_authenticators: dict
+    renew_days: int
+    revoked_date: str
+    signedby: dict
+    root_path: str
+    acme: dict
+    certificate_path: str
+    privatekey_path: str
+    csr_path: str
+    cert_type: str
+    revoked: bool
+    expired: bool
+    issuer: Union[Optional[str], dict]
+    chain_list: list
+    country: str
+    state: str
+    city: str
+    organization: str
+    organizational_unit: str
+    san: list
+    email: str
+    DN: str
+    subject_name_hash: str
+    digest_algorithm: str
+    from_: str
+    common: str
+    until: str
+    fingerprint: str
+    key_type: str
+    internal: str
+    lifetime: int
+    serial: int
+    key_length: int
+    add_to_trusted_store: bool
+    chain: bool
+    CA_type_existing: bool
+    CA_type_internal: bool
+    CA_type_intermediate: bool
+    cert_type_existing: bool
+    cert_type_internal: bool
+    cert_type_CSR: bool
+    parsed: bool
+    can_be_revoked: bool
+    extensions: dict
+    revoked_certs: list
+    crl_path: str
+    signed_certificates: int
+
+
+@dataclass
+class CertificateGetInstancePost(_Modelo):
+    __slots__ = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from_', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+    _claves = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+
+    id: int
+    type: int
+    name: str
+    certificate: str
+    privatekey: str
+    CSR: str
+    acme_uri: str
+    domains_authenticators: dict
+    renew_days: int
+    revoked_date: str
+    signedby: dict
+    root_path: str
+    acme: dict
+    certificate_path: str
+    privatekey_path: str
+    csr_path: str
+    cert_type: str
+    revoked: bool
+    expired: bool
+    issuer: Union[Optional[str], dict]
+    chain_list: list
+    country: str
+    state: str
+    city: str
+    organization: str
+    organizational_unit: str
+    san: list
+    email: str
+    DN: str
+    subject_name_hash: str
+    digest_algorithm: str
+    from_: str
+    common: str
+    until: str
+    fingerprint: str
+    key_type: str
+    internal: str
+    lifetime: int
+    serial: int
+    key_length: int
+    add_to_trusted_store: bool
+    chain: bool
+    CA_type_existing: bool
+    CA_type_internal: bool
+    CA_type_intermediate: bool
+    cert_type_existing: bool
+    cert_type_internal: bool
+    cert_type_CSR: bool
+    parsed: bool
+    can_be_revoked: bool
+    extensions: dict
+    revoked_certs: list
+    crl_path: str
+    signed_certificates: int
+
+
+@dataclass
+class CertificateIdGet(_Modelo):
+    __slots__ = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from_', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+    _claves = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+
+    id: int
+    type: int
+    name: str
+    certificate: Optional[str]
+    privatekey: Optional[str]
+    CSR: Optional[str]
+    acme_uri: Optional[str]
+    domains_authenticators: dict
+    renew_days: int
+    revoked_date: Optional[str]
+    signedby: dict
+    root_path: str
+    acme: dict
+    certificate_path: Optional[str]
+    privatekey_path: Optional[str]
+    csr_path: Optional[str]
+    cert_type: str
+    revoked: bool
+    expired: Optional[bool]
+    issuer: Union[Optional[str], dict]
+    chain_list: list
+    country: Optional[str]
+    state: Optional[str]
+    city: Optional[str]
+    organization: Optional[str]
+    organizational_unit: Optional[str]
+    san: Optional[list]
+    email: Optional[str]
+    DN: Optional[str]
+    subject_name_hash: Optional[str]
+    digest_algorithm: Optional[str]
+    from_: Optional[str]
+    common: Optional[str]
+    until: Optional[str]
+    fingerprint: Optional[str]
+    key_type: Optional[str]
+    internal: Optional[str]
+    lifetime: Optional[int]
+    serial: Optional[int]
+    key_length: Optional[int]
+    add_to_trusted_store: bool
+    chain: Optional[bool]
+    CA_type_existing: bool
+    CA_type_internal: bool
+    CA_type_intermediate: bool
+    cert_type_existing: bool
+    cert_type_internal: bool
+    cert_type_CSR: bool
+    parsed: bool
+    can_be_revoked: bool
+    extensions: dict
+    revoked_certs: list
+    crl_path: str
+    signed_certificates: int
+
+
+@dataclass
+class CertificateIdPut(_Modelo):
+    __slots__ = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from_', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+    _claves = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+
+    id: int
+    type: int
+    name: str
+    certificate: str
+    privatekey: str
+    CSR: str
+    acme_uri: str
+    domains_authenticators: dict
+    renew_days: int
+    revoked_date: str
+    signedby: dict
+    root_path: str
+    acme: dict
+    certificate_path: str
+    privatekey_path: str
+    csr_path: str
+    cert_type: str
+    revoked: bool
+    expired: bool
+    issuer: Union[Optional[str], dict]
+    chain_list: list
+    country: str
+    state: str
+    city: str
+    organization: str
+    organizational_unit: str
+    san: list
+    email: str
+    DN: str
+    subject_name_hash: str
+    digest_algorithm: str
+    from_: str
+    common: str
+    until: str
+    fingerprint: str
+    key_type: str
+    internal: str
+    lifetime: int
+    serial: int
+    key_length: int
+    add_to_trusted_store: bool
+    chain: bool
+    CA_type_existing: bool
+    CA_type_internal: bool
+    CA_type_intermediate: bool
+    cert_type_existing: bool
+    cert_type_internal: bool
+    cert_type_CSR: bool
+    parsed: bool
+    can_be_revoked: bool
+    extensions: dict
+    revoked_certs: list
+    crl_path: str
+    signed_certificates: int
+
+
+@dataclass
+class CertificateauthorityGet(_Modelo):
+    __slots__ = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from_', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+    _claves = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+
+    id: int
+    type: int
+    name: str
+    certificate: Optional[str]
+    privatekey: Optional[str]
+    CSR: Optional[str]
+    acme_uri: Optional[str]
+    domains_authenticators: dict
+    renew_days: int
+    revoked_date: Optional[str]
+    signedby: dict
+    root_path: str
+    acme: dict
+    certificate_path: Optional[str]
+    privatekey_path: Optional[str]
+    csr_path: Optional[str]
+    cert_type: str
+    revoked: bool
+    expired: Optional[bool]
+    issuer: Union[Optional[str], dict]
+    chain_list: list
+    country: Optional[str]
+    state: Optional[str]
+    city: Optional[str]
+    organization: Optional[str]
+    organizational_unit: Optional[str]
+    san: Optional[list]
+    email: Optional[str]
+    DN: Optional[str]
+    subject_name_hash: Optional[str]
+    digest_algorithm: Optional[str]
+    from_: Optional[str]
+    common: Optional[str]
+    until: Optional[str]
+    fingerprint: Optional[str]
+    key_type: Optional[str]
+    internal: Optional[str]
+    lifetime: Optional[int]
+    serial: Optional[int]
+    key_length: Optional[int]
+    add_to_trusted_store: bool
+    chain: Optional[bool]
+    CA_type_existing: bool
+    CA_type_internal: bool
+    CA_type_intermediate: bool
+    cert_type_existing: bool
+    cert_type_internal: bool
+    cert_type_CSR: bool
+    parsed: bool
+    can_be_revoked: bool
+    extensions: dict
+    revoked_certs: list
+    crl_path: str
+    signed_certificates: int
+
+
+@dataclass
+class CertificateauthorityPost(_Modelo):
+    __slots__ = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from_', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+    _claves = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+
+    id: int
+    type: int
+    name: str
+    certificate: str
+    privatekey: str
+    CSR: str
+    acme_uri: str
+    domains_authenticators: dict
+    renew_days: int
+    revoked_date: str
+    signedby: dict
+    root_path: str
+    acme: dict
+    certificate_path: str
+    privatekey_path: str
+    csr_path: str
+    cert_type: str
+    revoked: bool
+    expired: bool
+    issuer: Union[Optional[str], dict]
+    chain_list: list
+    country: str
+    state: str
+    city: str
+    organization: str
+    organizational_unit: str
+    san: list
+    email: str
+    DN: str
+    subject_name_hash: str
+    digest_algorithm: str
+    from_: str
+    common: str
+    until: str
+    fingerprint: str
+    key_type: str
+    internal: str
+    lifetime: int
+    serial: int
+    key_length: int
+    add_to_trusted_store: bool
+    chain: bool
+    CA_type_existing: bool
+    CA_type_internal: bool
+    CA_type_intermediate: bool
+    cert_type_existing: bool
+    cert_type_internal: bool
+    cert_type_CSR: bool
+    parsed: bool
+    can_be_revoked: bool
+    extensions: dict
+    revoked_certs: list
+    crl_path: str
+    signed_certificates: int
+
+
+@dataclass
+class CertificateauthorityCaSignCsrPost(_Modelo):
+    __slots__ = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from_', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+    _claves = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+
+    id: int
+    type: int
+    name: str
+    certificate: str
+    privatekey: str
+    CSR: str
+    acme_uri: str
+    domains_authenticators: dict
+    renew_days: int
+    revoked_date: str
+    signedby: dict
+    root_path: str
+    acme: dict
+    certificate_path: str
+    privatekey_path: str
+    csr_path: str
+    cert_type: str
+    revoked: bool
+    expired: bool
+    issuer: Union[Optional[str], dict]
+    chain_list: list
+    country: str
+    state: str
+    city: str
+    organization: str
+    organizational_unit: str
+    san: list
+    email: str
+    DN: str
+    subject_name_hash: str
+    digest_algorithm: str
+    from_: str
+    common: str
+    until: str
+    fingerprint: str
+    key_type: str
+    internal: str
+    lifetime: int
+    serial: int
+    key_length: int
+    add_to_trusted_store: bool
+    chain: bool
+    CA_type_existing: bool
+    CA_type_internal: bool
+    CA_type_intermediate: bool
+    cert_type_existing: bool
+    cert_type_internal: bool
+    cert_type_CSR: bool
+    parsed: bool
+    can_be_revoked: bool
+    extensions: dict
+    revoked_certs: list
+    crl_path: str
+    signed_certificates: int
+
+
+@dataclass
+class CertificateauthorityGetInstancePost(_Modelo):
+    __slots__ = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from_', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+    _claves = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+
+    id: int
+    type: int
+    name: str
+    certificate: str
+    privatekey: str
+    CSR: str
+    acme_uri: str
+    domains_authenticators: dict
+    renew_days: int
+    revoked_date: str
+    signedby: dict
+    root_path: str
+    acme: dict
+    certificate_path: str
+    privatekey_path: str
+    csr_path: str
+    cert_type: str
+    revoked: bool
+    expired: bool
+    issuer: Union[Optional[str], dict]
+    chain_list: list
+    country: str
+    state: str
+    city: str
+    organization: str
+    organizational_unit: str
+    san: list
+    email: str
+    DN: str
+    subject_name_hash: str
+    digest_algorithm: str
+    from_: str
+    common: str
+    until: str
+    fingerprint: str
+    key_type: str
+    internal: str
+    lifetime: int
+    serial: int
+    key_length: int
+    add_to_trusted_store: bool
+    chain: bool
+    CA_type_existing: bool
+    CA_type_internal: bool
+    CA_type_intermediate: bool
+    cert_type_existing: bool
+    cert_type_internal: bool
+    cert_type_CSR: bool
+    parsed: bool
+    can_be_revoked: bool
+    extensions: dict
+    revoked_certs: list
+    crl_path: str
+    signed_certificates: int
+
+
+@dataclass
+class CertificateauthorityIdGet(_Modelo):
+    __slots__ = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from_', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+    _claves = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+
+    id: int
+    type: int
+    name: str
+    certificate: Optional[str]
+    privatekey: Optional[str]
+    CSR: Optional[str]
+    acme_uri: Optional[str]
+    domains_authenticators: dict
+    renew_days: int
+    revoked_date: Optional[str]
+    signedby: dict
+    root_path: str
+    acme: dict
+    certificate_path: Optional[str]
+    privatekey_path: Optional[str]
+    csr_path: Optional[str]
+    cert_type: str
+    revoked: bool
+    expired: Optional[bool]
+    issuer: Union[Optional[str], dict]
+    chain_list: list
+    country: Optional[str]
+    state: Optional[str]
+    city: Optional[str]
+    organization: Optional[str]
+    organizational_unit: Optional[str]
+    san: Optional[list]
+    email: Optional[str]
+    DN: Optional[str]
+    subject_name_hash: Optional[str]
+    digest_algorithm: Optional[str]
+    from_: Optional[str]
+    common: Optional[str]
+    until: Optional[str]
+    fingerprint: Optional[str]
+    key_type: Optional[str]
+    internal: Optional[str]
+    lifetime: Optional[int]
+    serial: Optional[int]
+    key_length: Optional[int]
+    add_to_trusted_store: bool
+    chain: Optional[bool]
+    CA_type_existing: bool
+    CA_type_internal: bool
+    CA_type_intermediate: bool
+    cert_type_existing: bool
+    cert_type_internal: bool
+    cert_type_CSR: bool
+    parsed: bool
+    can_be_revoked: bool
+    extensions: dict
+    revoked_certs: list
+    crl_path: str
+    signed_certificates: int
+
+
+@dataclass
+class CertificateauthorityIdPut(_Modelo):
+    __slots__ = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from_', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+    _claves = ('id', 'type', 'name', 'certificate', 'privatekey', 'CSR', 'acme_uri', 'domains_authenticators', 'renew_days', 'revoked_date', 'signedby', 'root_path', 'acme', 'certificate_path', 'privatekey_path', 'csr_path', 'cert_type', 'revoked', 'expired', 'issuer', 'chain_list', 'country', 'state', 'city', 'organization', 'organizational_unit', 'san', 'email', 'DN', 'subject_name_hash', 'digest_algorithm', 'from', 'common', 'until', 'fingerprint', 'key_type', 'internal', 'lifetime', 'serial', 'key_length', 'add_to_trusted_store', 'chain', 'CA_type_existing', 'CA_type_internal', 'CA_type_intermediate', 'cert_type_existing', 'cert_type_internal', 'cert_type_CSR', 'parsed', 'can_be_revoked', 'extensions', 'revoked_certs', 'crl_path', 'signed_certificates')
+
+    id: int
+    type: int
+    name: str
+    certificate: str
+    privatekey: str
+    CSR: str
+    acme_uri: str
+    domains_authenticators: dict
+    renew_days: int
+    revoked_date: str
+    signedby: dict
+    root_path: str
+    acme: dict
+    certificate_path: str
+    privatekey_path: str
+    csr_path: str
+    cert_type: str
+    revoked: bool
+    expired: bool
+    issuer: Union[Optional[str], dict]
+    chain_list: list
+    country: str
+    state: str
+    city: str
+    organization: str
+    organizational_unit: str
+    san: list
+    email: str
+    DN: str
+    subject_name_hash: str
+    digest_algorithm: str
+    from_: str
+    common: str
+    until: str
+    fingerprint: str
+    key_type: str
+    internal: str
+    lifetime: int
+    serial: int
+    key_length: int
+    add_to_trusted_store: bool
+    chain: bool
+    CA_type_existing: bool
+    CA_type_internal: bool
+    CA_type_intermediate: bool
+    cert_type_existing: bool
+    cert_type_internal: bool
+    cert_type_CSR: bool
+    parsed: bool
+    can_be_revoked: bool
+    extensions: dict
+    revoked_certs: list
+    crl_path: str
+    signed_certificates: int
+
+
+@dataclass
+class CloudBackupGet(_Modelo):
+    __slots__ = ('path', 'credentials', 'attributes', 'schedule', 'pre_script', 'post_script', 'snapshot', 'include', 'exclude', 'args', 'enabled', 'password', 'keep_last', 'transfer_setting', 'absolute_paths', 'id', 'job', 'locked')
+    _claves = ('path', 'credentials', 'attributes', 'schedule', 'pre_script', 'post_script', 'snapshot', 'include', 'exclude', 'args', 'enabled', 'password', 'keep_last', 'transfer_setting', 'absolute_paths', 'id', 'job', 'locked')
+
+    path: str
+    credentials: Any
+    attributes: dict
+    schedule: Any
+    pre_script: str
+    post_script: str
+    snapshot: bool
+    include: list
+    exclude: list
+    args: str
+    enabled: bool
+    password: str
+    keep_last: int
+    transfer_setting: str
+    absolute_paths: bool
+    id: int
+    job: Union[None, dict]
+    locked: bool
+
+
+@dataclass
+class CloudBackupPost(_Modelo):
+    __slots__ = ('path', 'credentials', 'attributes', 'schedule', 'pre_script', 'post_script', 'snapshot', 'include', 'exclude', 'args', 'enabled', 'password', 'keep_last', 'transfer_setting', 'absolute_paths', 'id', 'job', 'locked')
+    _claves = ('path', 'credentials', 'attributes', 'schedule', 'pre_script', 'post_script', 'snapshot', 'include', 'exclude', 'args', 'enabled', 'password', 'keep_last', 'transfer_setting', 'absolute_paths', 'id', 'job', 'locked')
+
+    path: str
+    credentials: Any
+    attributes: dict
+    schedule: Any
+    pre_script: str
+    post_script: str
+    snapshot: bool
+    include: list
+    exclude: list
+    args: str
+    enabled: bool
+    password: str
+    keep_last: int
+    transfer_setting: str
+    absolute_paths: bool
+    id: int
+    job: Union[None, dict]
+    locked: bool
+
+
+@dataclass
+class CloudBackupGetInstancePost(_Modelo):
+    __slots__ = ('path', 'credentials', 'attributes', 'schedule', 'pre_script', 'post_script', 'snapshot', 'include', 'exclude', 'args', 'enabled', 'password', 'keep_last', 'transfer_setting', 'absolute_paths', 'id', 'job', 'locked')
+    _claves = ('path', 'credentials', 'attributes', 'schedule', 'pre_script', 'post_script', 'snapshot', 'include', 'exclude', 'args', 'enabled', 'password', 'keep_last', 'transfer_setting', 'absolute_paths', 'id', 'job', 'locked')
+
+    path: str
+    credentials: Any
+    attributes: dict
+    schedule: Any
+    pre_script: str
+    post_script: str
+    snapshot: bool
+    include: list
+    exclude: list
+    args: str
+    enabled: bool
+    password: str
+    keep_last: int
+    transfer_setting: str
+    absolute_paths: bool
+    id: int
+    job: Union[None, dict]
+    locked: bool
+
+
+@dataclass
+class CloudBackupIdGet(_Modelo):
+    __slots__ = ('path', 'credentials', 'attributes', 'schedule', 'pre_script', 'post_script', 'snapshot', 'include', 'exclude', 'args', 'enabled', 'password', 'keep_last', 'transfer_setting', 'absolute_paths', 'id', 'job', 'locked')
+    _claves = ('path', 'credentials', 'attributes', 'schedule', 'pre_script', 'post_script', 'snapshot', 'include', 'exclude', 'args', 'enabled', 'password', 'keep_last', 'transfer_setting', 'absolute_paths', 'id', 'job', 'locked')
+
+    path: str
+    credentials: Any
+    attributes: dict
+    schedule: Any
+    pre_script: str
+    post_script: str
+    snapshot: bool
+    include: list
+    exclude: list
+    args: str
+    enabled: bool
+    password: str
+    keep_last: int
+    transfer_setting: str
+    absolute_paths: bool
+    id: int
+    job: Union[None, dict]
+    locked: bool
+
+
+@dataclass
+class CloudBackupIdPut(_Modelo):
+    __slots__ = ('path', 'credentials', 'attributes', 'schedule', 'pre_script', 'post_script', 'snapshot', 'include', 'exclude', 'args', 'enabled', 'password', 'keep_last', 'transfer_setting', 'absolute_paths', 'id', 'job', 'locked')
+    _claves = ('path', 'credentials', 'attributes', 'schedule', 'pre_script', 'post_script', 'snapshot', 'include', 'exclude', 'args', 'enabled', 'password', 'keep_last', 'transfer_setting', 'absolute_paths', 'id', 'job', 'locked')
+
+    path: str
+    credentials: Any
+    attributes: dict
+    schedule: Any
+    pre_script: str
+    post_script: str
+    snapshot: bool
+    include: list
+    exclude: list
+    args: str
+    enabled: bool
+    password: str
+    keep_last: int
+    transfer_setting: str
+    absolute_paths: bool
+    id: int
+    job: Union[None, dict]
+    locked: bool
+
+
+@dataclass
+class CloudBackupListSnapshotDirectoryPost(_Modelo):
+    __slots__ = ('name', 'path', 'type', 'size', 'mtime')
+    _claves = ('name', 'path', 'type', 'size', 'mtime')
+
+    name: str
+    path: str
+    type: str
+    size: Union[None, int]
+    mtime: str
+
+
+@dataclass
+class CloudBackupListSnapshotsPost(_Modelo):
+    __slots__ = ('id', 'hostname', 'time', 'paths')
+    _claves = ('id', 'hostname', 'time', 'paths')
+
+    id: str
+    hostname: str
+    time: str
+    paths: list
+
+
+@dataclass
+class CloudsyncGet(_Modelo):
+    __slots__ = ('path', 'attributes', 'schedule', 'pre_script', 'post_script', 'snapshot', 'include', 'exclude', 'args', 'enabled', 'bwlimit', 'transfers', 'direction', 'transfer_mode', 'encryption', 'filename_encryption', 'encryption_password', 'encryption_salt', 'create_empty_src_dirs', 'follow_symlinks', 'id', 'credentials', 'job', 'locked')
+    _claves = ('path', 'attributes', 'schedule', 'pre_script', 'post_script', 'snapshot', 'include', 'exclude', 'args', 'enabled', 'bwlimit', 'transfers', 'direction', 'transfer_mode', 'encryption', 'filename_encryption', 'encryption_password', 'encryption_salt', 'create_empty_src_dirs', 'follow_symlinks', 'id', 'credentials', 'job', 'locked')
+
+    path: str
+    attributes: dict
+    schedule: dict
+    pre_script: str
+    post_script: str
+    snapshot: bool
+    include: list
+    exclude: list
+    args: str
+    enabled: bool
+    bwlimit: list
+    transfers: Optional[int]
+    direction: str
+    transfer_mode: str
+    encryption: bool
+    filename_encryption: bool
+    encryption_password: str
+    encryption_salt: str
+    create_empty_src_dirs: bool
+    follow_symlinks: bool
+    id: int
+    credentials: dict
+    job: dict
+    locked: bool
+
+
+@dataclass
+class CloudsyncPost(_Modelo):
+    __slots__ = ('path', 'attributes', 'schedule', 'pre_script', 'post_script', 'snapshot', 'include', 'exclude', 'args', 'enabled', 'bwlimit', 'transfers', 'direction', 'transfer_mode', 'encryption', 'filename_encryption', 'encryption_password', 'encryption_salt', 'create_empty_src_dirs', 'follow_symlinks', 'id', 'credentials', 'job', 'locked')
+    _claves = ('path', 'attributes', 'schedule', 'pre_script', 'post_script', 'snapshot', 'include', 'exclude', 'args', 'enabled', 'bwlimit', 'transfers', 'direction', 'transfer_mode', 'encryption', 'filename_encryption', 'encryption_password', 'encryption_salt', 'create_empty_src_dirs', 'follow_symlinks', 'id', 'credentials', 'job', 'locked')
+
+    path: str
+    attributes: dict
+    schedule: dict
+    pre_script: str
+    post_script: str
+    snapshot: bool
+    include: list
+    exclude: list
+    args: str
+    enabled: bool
+    bwlimit: list
+    transfers: int
+    direction: str
+    transfer_mode: str
+    encryption: bool
+    filename_encryption: bool
+    encryption_password: str
+    encryption_salt: str
+    create_empty_src_dirs: bool
+    follow_symlinks: bool
+    id: int
+    credentials: dict
+    job: dict
+    locked: bool
+
+
+@dataclass
+class CloudsyncCredentialsGet(_Modelo):
+    __slots__ = ('id', 'name', 'provider')
+    _claves = ('id', 'name', 'provider')
+
+    id: int
+    name: str
+    provider: Any
+
+
+@dataclass
+class CloudsyncCredentialsPost(_Modelo):
+    __slots__ = ('id', 'name', 'provider')
+    _claves = ('id', 'name', 'provider')
+
+    id: int
+    name: str
+    provider: Any
+
+
+@dataclass
+class CloudsyncCredentialsGetInstancePost(_Modelo):
+    __slots__ = ('id', 'name', 'provider')
+    _claves = ('id', 'name', 'provider')
+
+    id: int
+    name: str
+    provider: Any
+
+
+@dataclass
+class CloudsyncCredentialsIdGet(_Modelo):
+    __slots__ = ('id', 'name', 'provider')
+    _claves = ('id', 'name', 'provider')
+
+    id: int
+    name: str
+    provider: Any
+
+
+@dataclass
+class CloudsyncCredentialsIdPut(_Modelo):
+    __slots__ = ('id', 'name', 'provider')
+    _claves = ('id', 'name', 'provider')
+
+    id: int
+    name: str
+    provider: Any
+
+
+@dataclass
+class CloudsyncCredentialsVerifyPost(_Modelo):
+    __slots__ = ('valid', 'error', 'excerpt')
+    _claves = ('valid', 'error', 'excerpt')
+
+    valid: bool
+    error: Union[None, str]
+    excerpt: Union[None, str]
+
+
+@dataclass
+class CloudsyncGetInstancePost(_Modelo):
+    __slots__ = ('path', 'attributes', 'schedule', 'pre_script', 'post_script', 'snapshot', 'include', 'exclude', 'args', 'enabled', 'bwlimit', 'transfers', 'direction', 'transfer_mode', 'encryption', 'filename_encryption', 'encryption_password', 'encryption_salt', 'create_empty_src_dirs', 'follow_symlinks', 'id', 'credentials', 'job', 'locked')
+    _claves = ('path', 'attributes', 'schedule', 'pre_script', 'post_script', 'snapshot', 'include', 'exclude', 'args', 'enabled', 'bwlimit', 'transfers', 'direction', 'transfer_mode', 'encryption', 'filename_encryption', 'encryption_password', 'encryption_salt', 'create_empty_src_dirs', 'follow_symlinks', 'id', 'credentials', 'job', 'locked')
+
+    path: str
+    attributes: dict
+    schedule: dict
+    pre_script: str
+    post_script: str
+    snapshot: bool
+    include: list
+    exclude: list
+    args: str
+    enabled: bool
+    bwlimit: list
+    transfers: int
+    direction: str
+    transfer_mode: str
+    encryption: bool
+    filename_encryption: bool
+    encryption_password: str
+    encryption_salt: str
+    create_empty_src_dirs: bool
+    follow_symlinks: bool
+    id: int
+    credentials: dict
+    job: dict
+    locked: bool
+
+
+@dataclass
+class CloudsyncIdGet(_Modelo):
+    __slots__ = ('path', 'attributes', 'schedule', 'pre_script', 'post_script', 'snapshot', 'include', 'exclude', 'args', 'enabled', 'bwlimit', 'transfers', 'direction', 'transfer_mode', 'encryption', 'filename_encryption', 'encryption_password', 'encryption_salt', 'create_empty_src_dirs', 'follow_symlinks', 'id', 'credentials', 'job', 'locked')
+    _claves = ('path', 'attributes', 'schedule', 'pre_script', 'post_script', 'snapshot', 'include', 'exclude', 'args', 'enabled', 'bwlimit', 'transfers', 'direction', 'transfer_mode', 'encryption', 'filename_encryption', 'encryption_password', 'encryption_salt', 'create_empty_src_dirs', 'follow_symlinks', 'id', 'credentials', 'job', 'locked')
+
+    path: str
+    attributes: dict
+    schedule: dict
+    pre_script: str
+    post_script: str
+    snapshot: bool
+    include: list
+    exclude: list
+    args: str
+    enabled: bool
+    bwlimit: list
+    transfers: Optional[int]
+    direction: str
+    transfer_mode: str
+    encryption: bool
+    filename_encryption: bool
+    encryption_password: str
+    encryption_salt: str
+    create_empty_src_dirs: bool
+    follow_symlinks: bool
+    id: int
+    credentials: dict
+    job: dict
+    locked: bool
+
+
+@dataclass
+class CloudsyncIdPut(_Modelo):
+    __slots__ = ('path', 'attributes', 'schedule', 'pre_script', 'post_script', 'snapshot', 'include', 'exclude', 'args', 'enabled', 'bwlimit', 'transfers', 'direction', 'transfer_mode', 'encryption', 'filename_encryption', 'encryption_password', 'encryption_salt', 'create_empty_src_dirs', 'follow_symlinks', 'id', 'credentials', 'job', 'locked')
+    _claves = ('path', 'attributes', 'schedule', 'pre_script', 'post_script', 'snapshot', 'include', 'exclude', 'args', 'enabled', 'bwlimit', 'transfers', 'direction', 'transfer_mode', 'encryption', 'filename_encryption', 'encryption_password', 'encryption_salt', 'create_empty_src_dirs', 'follow_symlinks', 'id', 'credentials', 'job', 'locked')
+
+    path: str
+    attributes: dict
+    schedule: dict
+    pre_script: str
+    post_script: str
+    snapshot: bool
+    include: list
+    exclude: list
+    args: str
+    enabled: bool
+    bwlimit: list
+    transfers: int
+    direction: str
+    transfer_mode: str
+    encryption: bool
+    filename_encryption: bool
+    encryption_password: str
+    encryption_salt: str
+    create_empty_src_dirs: bool
+    follow_symlinks: bool
+    id: int
+    credentials: dict
+    job: dict
+    locked: bool
+
+
+@dataclass
+class CloudsyncOnedriveListDrivesPost(_Modelo):
+    __slots__ = ('drive_id', 'drive_type', 'name')
+    _claves = ('drive_id', 'drive_type', 'name')
+
+    drive_id: str
+    drive_type: str
+    name: str
+
+
+@dataclass
+class CoreGetJobsGet(_Modelo):
+    __slots__ = ('id', 'method', 'arguments', 'transient', 'abortable', 'logs_path', 'logs_excerpt', 'progress', 'result', 'result_encoding_error', 'error', 'exception', 'exc_info', 'state', 'time_started', 'time_finished', 'credentials')
+    _claves = ('id', 'method', 'arguments', 'transient', 'abortable', 'logs_path', 'logs_excerpt', 'progress', 'result', 'result_encoding_error', 'error', 'exception', 'exc_info', 'state', 'time_started', 'time_finished', 'credentials')
+
+    id: int
+    method: str
+    arguments: list
+    transient: bool
+    abortable: bool
+    logs_path: Optional[str]
+    logs_excerpt: Optional[str]
+    progress: dict
+    result: Union[bool, dict, int, list, str]
+    result_encoding_error: Union[bool, dict, int, list, str]
+    error: Optional[str]
+    exception: Optional[str]
+    exc_info: dict
+    state: str
+    time_started: Optional[str]
+    time_finished: Optional[str]
+    credentials: dict
+
+
+@dataclass
+class CronjobGet(_Modelo):
+    __slots__ = ('enabled', 'stderr', 'stdout', 'schedule', 'command', 'user', 'id')
+    _claves = ('enabled', 'stderr', 'stdout', 'schedule', 'command', 'user', 'id')
+
+    enabled: bool
+    stderr: bool
+    stdout: bool
+    schedule: Any
+    command: str
+    user: str
+    id: int
+
+
+@dataclass
+class CronjobPost(_Modelo):
+    __slots__ = ('enabled', 'stderr', 'stdout', 'schedule', 'command', 'user', 'id')
+    _claves = ('enabled', 'stderr', 'stdout', 'schedule', 'command', 'user', 'id')
+
+    enabled: bool
+    stderr: bool
+    stdout: bool
+    schedule: Any
+    command: str
+    user: str
+    id: int
+
+
+@dataclass
+class CronjobGetInstancePost(_Modelo):
+    __slots__ = ('enabled', 'stderr', 'stdout', 'schedule', 'command', 'user', 'id')
+    _claves = ('enabled', 'stderr', 'stdout', 'schedule', 'command', 'user', 'id')
+
+    enabled: bool
+    stderr: bool
+    stdout: bool
+    schedule: Any
+    command: str
+    user: str
+    id: int
+
+
+@dataclass
+class CronjobIdGet(_Modelo):
+    __slots__ = ('enabled', 'stderr', 'stdout', 'schedule', 'command', 'user', 'id')
+    _claves = ('enabled', 'stderr', 'stdout', 'schedule', 'command', 'user', 'id')
+
+    enabled: bool
+    stderr: bool
+    stdout: bool
+    schedule: Any
+    command: str
+    user: str
+    id: int
+
+
+@dataclass
+class CronjobIdPut(_Modelo):
+    __slots__ = ('enabled', 'stderr', 'stdout', 'schedule', 'command', 'user', 'id')
+    _claves = ('enabled', 'stderr', 'stdout', 'schedule', 'command', 'user', 'id')
+
+    enabled: bool
+    stderr: bool
+    stdout: bool
+    schedule: Any
+    command: str
+    user: str
+    id: int
+
+
+@dataclass
+class DeviceGetInfoPost(_Modelo):
+    __slots__ = ('name', 'location', 'drivername', 'start', 'size')
+    _claves = ('name', 'location', 'drivername', 'start', 'size')
+
+    name: str
+    location: str
+    drivername: str
+    start: str
+    size: int
+
+
+@dataclass
+class DirectoryservicesGetStateGet(_Modelo):
+    __slots__ = ('activedirectory', 'ldap')
+    _claves = ('activedirectory', 'ldap')
+
+    activedirectory: str
+    ldap: str
+
+
+@dataclass
+class DirectoryservicesStatusGet(_Modelo):
+    __slots__ = ('type', 'status', 'status_msg')
+    _claves = ('type', 'status', 'status_msg')
+
+    type: str
+    status: str
+    status_msg: str
+
+
+@dataclass
+class DiskGet(_Modelo):
+    __slots__ = ('identifier', 'name', 'subsystem', 'number', 'serial', 'lunid', 'size', 'transfermode', 'hddstandby', 'togglesmart', 'advpowermgmt', 'smartoptions', 'expiretime', 'critical', 'difference', 'informational', 'model', 'rotationrate', 'type', 'zfs_guid', 'bus', 'devname', 'enclosure', 'pool', 'passwd', 'kmip_uid', 'supports_smart')
+    _claves = ('identifier', 'name', 'subsystem', 'number', 'serial', 'lunid', 'size', 'transfermode', 'hddstandby', 'togglesmart', 'advpowermgmt', 'smartoptions', 'expiretime', 'critical', 'difference', 'informational', 'model', 'rotationrate', 'type', 'zfs_guid', 'bus', 'devname', 'enclosure', 'pool', 'passwd', 'kmip_uid', 'supports_smart')
+
+    identifier: str
+    name: str
+    subsystem: str
+    number: int
+    serial: str
+    lunid: Optional[str]
+    size: int
+    transfermode: str
+    hddstandby: str
+    togglesmart: bool
+    advpowermgmt: str
+    smartoptions: str
+    expiretime: Optional[str]
+    critical: Optional[int]
+    difference: Optional[int]
+    informational: Optional[int]
+    model: Optional[str]
+    rotationrate: Optional[int]
+    type: Optional[str]
+    zfs_guid: Optional[str]
+    bus: str
+    devname: str
+    enclosure: dict
+    pool: Optional[str]
+    passwd: str
+    kmip_uid: Optional[str]
+    supports_smart: Optional[bool]
+
+
+@dataclass
+class DiskGetInstancePost(_Modelo):
+    __slots__ = ('identifier', 'name', 'subsystem', 'number', 'serial', 'lunid', 'size', 'transfermode', 'hddstandby', 'togglesmart', 'advpowermgmt', 'smartoptions', 'expiretime', 'critical', 'difference', 'informational', 'model', 'rotationrate', 'type', 'zfs_guid', 'bus', 'devname', 'enclosure', 'pool', 'passwd', 'kmip_uid', 'supports_smart')
+    _claves = ('identifier', 'name', 'subsystem', 'number', 'serial', 'lunid', 'size', 'transfermode', 'hddstandby', 'togglesmart', 'advpowermgmt', 'smartoptions', 'expiretime', 'critical', 'difference', 'informational', 'model', 'rotationrate', 'type', 'zfs_guid', 'bus', 'devname', 'enclosure', 'pool', 'passwd', 'kmip_uid', 'supports_smart')
+
+    identifier: str
+    name: str
+    subsystem: str
+    number: int
+    serial: str
+    lunid: str
+    size: int
+    transfermode: str
+    hddstandby: str
+    togglesmart: bool
+    advpowermgmt: str
+    smartoptions: str
+    expiretime: str
+    critical: int
+    difference: int
+    informational: int
+    model: str
+    rotationrate: int
+    type: str
+    zfs_guid: str
+    bus: str
+    devname: str
+    enclosure: dict
+    pool: str
+    passwd: str
+    kmip_uid: str
+    supports_smart: bool
+
+
+@dataclass
+class DiskIdGet(_Modelo):
+    __slots__ = ('identifier', 'name', 'subsystem', 'number', 'serial', 'lunid', 'size', 'transfermode', 'hddstandby', 'togglesmart', 'advpowermgmt', 'smartoptions', 'expiretime', 'critical', 'difference', 'informational', 'model', 'rotationrate', 'type', 'zfs_guid', 'bus', 'devname', 'enclosure', 'pool', 'passwd', 'kmip_uid', 'supports_smart')
+    _claves = ('identifier', 'name', 'subsystem', 'number', 'serial', 'lunid', 'size', 'transfermode', 'hddstandby', 'togglesmart', 'advpowermgmt', 'smartoptions', 'expiretime', 'critical', 'difference', 'informational', 'model', 'rotationrate', 'type', 'zfs_guid', 'bus', 'devname', 'enclosure', 'pool', 'passwd', 'kmip_uid', 'supports_smart')
+
+    identifier: str
+    name: str
+    subsystem: str
+    number: int
+    serial: str
+    lunid: Optional[str]
+    size: int
+    transfermode: str
+    hddstandby: str
+    togglesmart: bool
+    advpowermgmt: str
+    smartoptions: str
+    expiretime: Optional[str]
+    critical: Optional[int]
+    difference: Optional[int]
+    informational: Optional[int]
+    model: Optional[str]
+    rotationrate: Optional[int]
+    type: Optional[str]
+    zfs_guid: Optional[str]
+    bus: str
+    devname: str
+    enclosure: dict
+    pool: Optional[str]
+    passwd: str
+    kmip_uid: Optional[str]
+    supports_smart: Optional[bool]
+
+
+@dataclass
+class DiskIdPut(_Modelo):
+    __slots__ = ('identifier', 'name', 'subsystem', 'number', 'serial', 'lunid', 'size', 'transfermode', 'hddstandby', 'togglesmart', 'advpowermgmt', 'smartoptions', 'expiretime', 'critical', 'difference', 'informational', 'model', 'rotationrate', 'type', 'zfs_guid', 'bus', 'devname', 'enclosure', 'pool', 'passwd', 'kmip_uid', 'supports_smart')
+    _claves = ('identifier', 'name', 'subsystem', 'number', 'serial', 'lunid', 'size', 'transfermode', 'hddstandby', 'togglesmart', 'advpowermgmt', 'smartoptions', 'expiretime', 'critical', 'difference', 'informational', 'model', 'rotationrate', 'type', 'zfs_guid', 'bus', 'devname', 'enclosure', 'pool', 'passwd', 'kmip_uid', 'supports_smart')
+
+    identifier: str
+    name: str
+    subsystem: str
+    number: int
+    serial: str
+    lunid: str
+    size: int
+    transfermode: str
+    hddstandby: str
+    togglesmart: bool
+    advpowermgmt: str
+    smartoptions: str
+    expiretime: str
+    critical: int
+    difference: int
+    informational: int
+    model: str
+    rotationrate: int
+    type: str
+    zfs_guid: str
+    bus: str
+    devname: str
+    enclosure: dict
+    pool: str
+    passwd: str
+    kmip_uid: str
+    supports_smart: bool
+
+
+@dataclass
+class DiskSmartAttributesPost(_Modelo):
+    __slots__ = ('id', 'value', 'worst', 'thresh', 'name', 'when_failed', 'flags', 'raw')
+    _claves = ('id', 'value', 'worst', 'thresh', 'name', 'when_failed', 'flags', 'raw')
+
+    id: int
+    value: int
+    worst: int
+    thresh: int
+    name: str
+    when_failed: str
+    flags: dict
+    raw: dict
+
+
+@dataclass
+class DiskTemperatureAlertsPost(_Modelo):
+    __slots__ = ('uuid', 'source', 'klass', 'args', 'node', 'key', 'datetime', 'last_occurrence', 'dismissed', 'mail', 'text', 'id', 'level', 'formatted', 'one_shot')
+    _claves = ('uuid', 'source', 'klass', 'args', 'node', 'key', 'datetime', 'last_occurrence', 'dismissed', 'mail', 'text', 'id', 'level', 'formatted', 'one_shot')
+
+    uuid: str
+    source: str
+    klass: str
+    args: Any
+    node: str
+    key: str
+    datetime: str
+    last_occurrence: str
+    dismissed: bool
+    mail: Any
+    text: str
+    id: str
+    level: str
+    formatted: Union[None, str]
+    one_shot: bool
+
+
+@dataclass
+class DnsQueryGet(_Modelo):
+    __slots__ = ('nameserver',)
+    _claves = ('nameserver',)
+
+    nameserver: str
+
+
+@dataclass
+class DockerGet(_Modelo):
+    __slots__ = ('id', 'enable_image_updates', 'dataset', 'pool', 'nvidia', 'address_pools', 'cidr_v6')
+    _claves = ('id', 'enable_image_updates', 'dataset', 'pool', 'nvidia', 'address_pools', 'cidr_v6')
+
+    id: int
+    enable_image_updates: bool
+    dataset: Union[None, str]
+    pool: Union[None, str]
+    nvidia: bool
+    address_pools: list
+    cidr_v6: str
+
+
+@dataclass
+class DockerPut(_Modelo):
+    __slots__ = ('id', 'enable_image_updates', 'dataset', 'pool', 'nvidia', 'address_pools', 'cidr_v6')
+    _claves = ('id', 'enable_image_updates', 'dataset', 'pool', 'nvidia', 'address_pools', 'cidr_v6')
+
+    id: int
+    enable_image_updates: bool
+    dataset: Union[None, str]
+    pool: Union[None, str]
+    nvidia: bool
+    address_pools: list
+    cidr_v6: str
+
+
+@dataclass
+class DockerNetworkGet(_Modelo):
+    __slots__ = ('ipam', 'labels', 'created', 'driver', 'id', 'name', 'scope', 'short_id')
+    _claves = ('ipam', 'labels', 'created', 'driver', 'id', 'name', 'scope', 'short_id')
+
+    ipam: Union[None, dict]
+    labels: Union[None, dict]
+    created: Union[None, str]
+    driver: Union[None, str]
+    id: Union[None, str]
+    name: Union[None, str]
+    scope: Union[None, str]
+    short_id: Union[None, str]
+
+
+@dataclass
+class DockerNetworkGetInstancePost(_Modelo):
+    __slots__ = ('ipam', 'labels', 'created', 'driver', 'id', 'name', 'scope', 'short_id')
+    _claves = ('ipam', 'labels', 'created', 'driver', 'id', 'name', 'scope', 'short_id')
+
+    ipam: Union[None, dict]
+    labels: Union[None, dict]
+    created: Union[None, str]
+    driver: Union[None, str]
+    id: Union[None, str]
+    name: Union[None, str]
+    scope: Union[None, str]
+    short_id: Union[None, str]
+
+
+@dataclass
+class DockerNetworkIdGet(_Modelo):
+    __slots__ = ('ipam', 'labels', 'created', 'driver', 'id', 'name', 'scope', 'short_id')
+    _claves = ('ipam', 'labels', 'created', 'driver', 'id', 'name', 'scope', 'short_id')
+
+    ipam: Union[None, dict]
+    labels: Union[None, dict]
+    created: Union[None, str]
+    driver: Union[None, str]
+    id: Union[None, str]
+    name: Union[None, str]
+    scope: Union[None, str]
+    short_id: Union[None, str]
+
+
+@dataclass
+class DockerStatusGet(_Modelo):
+    __slots__ = ('status',)
+    _claves = ('status',)
+
+    status: str
+
+
+@dataclass
+class FailoverGet(_Modelo):
+    __slots__ = ('id', 'disabled', 'timeout', 'master')
+    _claves = ('id', 'disabled', 'timeout', 'master')
+
+    id: int
+    disabled: bool
+    timeout: int
+    master: bool
+
+
+@dataclass
+class FailoverPut(_Modelo):
+    __slots__ = ('id', 'disabled', 'timeout', 'master')
+    _claves = ('id', 'disabled', 'timeout', 'master')
+
+    id: int
+    disabled: bool
+    timeout: int
+    master: bool
+
+
+@dataclass
+class FailoverRebootInfoGet(_Modelo):
+    __slots__ = ('this_node', 'other_node')
+    _claves = ('this_node', 'other_node')
+
+    this_node: Any
+    other_node: Any
+
+
+@dataclass
+class FilesystemAcltemplateGet(_Modelo):
+    __slots__ = ('id', 'builtin', 'name', 'acltype', 'acl', 'comment')
+    _claves = ('id', 'builtin', 'name', 'acltype', 'acl', 'comment')
+
+    id: int
+    builtin: bool
+    name: str
+    acltype: str
+    acl: list
+    comment: str
+
+
+@dataclass
+class FilesystemAcltemplatePost(_Modelo):
+    __slots__ = ('id', 'builtin', 'name', 'acltype', 'acl', 'comment')
+    _claves = ('id', 'builtin', 'name', 'acltype', 'acl', 'comment')
+
+    id: int
+    builtin: bool
+    name: str
+    acltype: str
+    acl: list
+    comment: str
+
+
+@dataclass
+class FilesystemAcltemplateByPathPost(_Modelo):
+    __slots__ = ('id', 'builtin', 'name', 'acltype', 'acl', 'comment')
+    _claves = ('id', 'builtin', 'name', 'acltype', 'acl', 'comment')
+
+    id: int
+    builtin: bool
+    name: str
+    acltype: str
+    acl: list
+    comment: str
+
+
+@dataclass
+class FilesystemAcltemplateGetInstancePost(_Modelo):
+    __slots__ = ('id', 'builtin', 'name', 'acltype', 'acl', 'comment')
+    _claves = ('id', 'builtin', 'name', 'acltype', 'acl', 'comment')
+
+    id: int
+    builtin: bool
+    name: str
+    acltype: str
+    acl: list
+    comment: str
+
+
+@dataclass
+class FilesystemAcltemplateIdGet(_Modelo):
+    __slots__ = ('id', 'builtin', 'name', 'acltype', 'acl', 'comment')
+    _claves = ('id', 'builtin', 'name', 'acltype', 'acl', 'comment')
+
+    id: int
+    builtin: bool
+    name: str
+    acltype: str
+    acl: list
+    comment: str
+
+
+@dataclass
+class FilesystemAcltemplateIdPut(_Modelo):
+    __slots__ = ('id', 'builtin', 'name', 'acltype', 'acl', 'comment')
+    _claves = ('id', 'builtin', 'name', 'acltype', 'acl', 'comment')
+
+    id: int
+    builtin: bool
+    name: str
+    acltype: str
+    acl: list
+    comment: str
+
+
+@dataclass
+class FilesystemGetZfsAttributesPost(_Modelo):
+    __slots__ = ('readonly', 'hidden', 'system', 'archive', 'immutable', 'nounlink', 'appendonly', 'offline', 'sparse')
+    _claves = ('readonly', 'hidden', 'system', 'archive', 'immutable', 'nounlink', 'appendonly', 'offline', 'sparse')
+
+    readonly: Union[None, bool]
+    hidden: Union[None, bool]
+    system: Union[None, bool]
+    archive: Union[None, bool]
+    immutable: Union[None, bool]
+    nounlink: Union[None, bool]
+    appendonly: Union[None, bool]
+    offline: Union[None, bool]
+    sparse: Union[None, bool]
+
+
+@dataclass
+class FilesystemGetaclPost(_Modelo):
+    __slots__ = ('path', 'user', 'group', 'uid', 'gid', 'acltype', 'acl', 'aclflags', 'trivial')
+    _claves = ('path', 'user', 'group', 'uid', 'gid', 'acltype', 'acl', 'aclflags', 'trivial')
+
+    path: str
+    user: Union[None, str]
+    group: Union[None, str]
+    uid: Union[None, int]
+    gid: Union[None, int]
+    acltype: str
+    acl: list
+    aclflags: Any
+    trivial: bool
+
+
+@dataclass
+class FilesystemListdirPost(_Modelo):
+    __slots__ = ('name', 'path', 'realpath', 'type', 'size', 'allocation_size', 'mode', 'mount_id', 'acl', 'uid', 'gid', 'is_mountpoint', 'is_ctldir', 'attributes', 'xattrs', 'zfs_attrs')
+    _claves = ('name', 'path', 'realpath', 'type', 'size', 'allocation_size', 'mode', 'mount_id', 'acl', 'uid', 'gid', 'is_mountpoint', 'is_ctldir', 'attributes', 'xattrs', 'zfs_attrs')
+
+    name: str
+    path: str
+    realpath: str
+    type: str
+    size: int
+    allocation_size: int
+    mode: int
+    mount_id: int
+    acl: bool
+    uid: int
+    gid: int
+    is_mountpoint: bool
+    is_ctldir: bool
+    attributes: list
+    xattrs: list
+    zfs_attrs: Union[None, list]
+
+
+@dataclass
+class FilesystemMkdirPost(_Modelo):
+    __slots__ = ('name', 'path', 'realpath', 'type', 'size', 'allocation_size', 'mode', 'mount_id', 'acl', 'uid', 'gid', 'is_mountpoint', 'is_ctldir', 'attributes', 'xattrs', 'zfs_attrs')
+    _claves = ('name', 'path', 'realpath', 'type', 'size', 'allocation_size', 'mode', 'mount_id', 'acl', 'uid', 'gid', 'is_mountpoint', 'is_ctldir', 'attributes', 'xattrs', 'zfs_attrs')
+
+    name: str
+    path: str
+    realpath: str
+    type: str
+    size: int
+    allocation_size: int
+    mode: int
+    mount_id: int
+    acl: bool
+    uid: int
+    gid: int
+    is_mountpoint: bool
+    is_ctldir: bool
+    attributes: list
+    xattrs: list
+    zfs_attrs: Union[None, list]
+
+
+@dataclass
+class FilesystemSetZfsAttributesPost(_Modelo):
+    __slots__ = ('readonly', 'hidden', 'system', 'archive', 'immutable', 'nounlink', 'appendonly', 'offline', 'sparse')
+    _claves = ('readonly', 'hidden', 'system', 'archive', 'immutable', 'nounlink', 'appendonly', 'offline', 'sparse')
+
+    readonly: Union[None, bool]
+    hidden: Union[None, bool]
+    system: Union[None, bool]
+    archive: Union[None, bool]
+    immutable: Union[None, bool]
+    nounlink: Union[None, bool]
+    appendonly: Union[None, bool]
+    offline: Union[None, bool]
+    sparse: Union[None, bool]
+
+
+@dataclass
+class FilesystemSetaclPost(_Modelo):
+    __slots__ = ('path', 'user', 'group', 'uid', 'gid', 'acltype', 'acl', 'aclflags', 'trivial')
+    _claves = ('path', 'user', 'group', 'uid', 'gid', 'acltype', 'acl', 'aclflags', 'trivial')
+
+    path: str
+    user: Union[None, str]
+    group: Union[None, str]
+    uid: Union[None, int]
+    gid: Union[None, int]
+    acltype: str
+    acl: list
+    aclflags: Any
+    trivial: bool
+
+
+@dataclass
+class FilesystemStatPost(_Modelo):
+    __slots__ = ('realpath', 'type', 'size', 'allocation_size', 'mode', 'mount_id', 'uid', 'gid', 'atime', 'mtime', 'ctime', 'btime', 'dev', 'inode', 'nlink', 'acl', 'is_mountpoint', 'is_ctldir', 'attributes', 'user', 'group')
+    _claves = ('realpath', 'type', 'size', 'allocation_size', 'mode', 'mount_id', 'uid', 'gid', 'atime', 'mtime', 'ctime', 'btime', 'dev', 'inode', 'nlink', 'acl', 'is_mountpoint', 'is_ctldir', 'attributes', 'user', 'group')
+
+    realpath: str
+    type: str
+    size: int
+    allocation_size: int
+    mode: int
+    mount_id: int
+    uid: int
+    gid: int
+    atime: float
+    mtime: float
+    ctime: float
+    btime: float
+    dev: int
+    inode: int
+    nlink: int
+    acl: bool
+    is_mountpoint: bool
+    is_ctldir: bool
+    attributes: list
+    user: Union[None, str]
+    group: Union[None, str]
+
+
+@dataclass
+class FilesystemStatfsPost(_Modelo):
+    __slots__ = ('flags', 'fsid', 'fstype', 'source', 'dest', 'blocksize', 'total_blocks', 'free_blocks', 'avail_blocks', 'total_blocks_str', 'free_blocks_str', 'avail_blocks_str', 'files', 'free_files', 'name_max', 'total_bytes', 'free_bytes', 'avail_bytes', 'total_bytes_str', 'free_bytes_str', 'avail_bytes_str')
+    _claves = ('flags', 'fsid', 'fstype', 'source', 'dest', 'blocksize', 'total_blocks', 'free_blocks', 'avail_blocks', 'total_blocks_str', 'free_blocks_str', 'avail_blocks_str', 'files', 'free_files', 'name_max', 'total_bytes', 'free_bytes', 'avail_bytes', 'total_bytes_str', 'free_bytes_str', 'avail_bytes_str')
+
+    flags: list
+    fsid: str
+    fstype: Any
+    source: str
+    dest: str
+    blocksize: int
+    total_blocks: int
+    free_blocks: int
+    avail_blocks: int
+    total_blocks_str: str
+    free_blocks_str: str
+    avail_blocks_str: str
+    files: int
+    free_files: int
+    name_max: int
+    total_bytes: int
+    free_bytes: int
+    avail_bytes: int
+    total_bytes_str: str
+    free_bytes_str: str
+    avail_bytes_str: str
+
+
+@dataclass
+class FtpGet(_Modelo):
+    __slots__ = ('id', 'port', 'clients', 'ipconnections', 'loginattempt', 'timeout', 'timeout_notransfer', 'onlyanonymous', 'anonpath', 'onlylocal', 'banner', 'filemask', 'dirmask', 'fxp', 'resume', 'defaultroot', 'ident', 'reversedns', 'masqaddress', 'passiveportsmin', 'passiveportsmax', 'localuserbw', 'localuserdlbw', 'anonuserbw', 'anonuserdlbw', 'tls', 'tls_policy', 'tls_opt_allow_client_renegotiations', 'tls_opt_allow_dot_login', 'tls_opt_allow_per_user', 'tls_opt_common_name_required', 'tls_opt_enable_diags', 'tls_opt_export_cert_data', 'tls_opt_no_empty_fragments', 'tls_opt_no_session_reuse_required', 'tls_opt_stdenvvars', 'tls_opt_dns_name_required', 'tls_opt_ip_address_required', 'ssltls_certificate', 'options')
+    _claves = ('id', 'port', 'clients', 'ipconnections', 'loginattempt', 'timeout', 'timeout_notransfer', 'onlyanonymous', 'anonpath', 'onlylocal', 'banner', 'filemask', 'dirmask', 'fxp', 'resume', 'defaultroot', 'ident', 'reversedns', 'masqaddress', 'passiveportsmin', 'passiveportsmax', 'localuserbw', 'localuserdlbw', 'anonuserbw', 'anonuserdlbw', 'tls', 'tls_policy', 'tls_opt_allow_client_renegotiations', 'tls_opt_allow_dot_login', 'tls_opt_allow_per_user', 'tls_opt_common_name_required', 'tls_opt_enable_diags', 'tls_opt_export_cert_data', 'tls_opt_no_empty_fragments', 'tls_opt_no_session_reuse_required', 'tls_opt_stdenvvars', 'tls_opt_dns_name_required', 'tls_opt_ip_address_required', 'ssltls_certificate', 'options')
+
+    id: int
+    port: int
+    clients: int
+    ipconnections: int
+    loginattempt: int
+    timeout: int
+    timeout_notransfer: int
+    onlyanonymous: bool
+    anonpath: Union[None, str]
+    onlylocal: bool
+    banner: str
+    filemask: str
+    dirmask: str
+    fxp: bool
+    resume: bool
+    defaultroot: bool
+    ident: bool
+    reversedns: bool
+    masqaddress: str
+    passiveportsmin: int
+    passiveportsmax: int
+    localuserbw: int
+    localuserdlbw: int
+    anonuserbw: int
+    anonuserdlbw: int
+    tls: bool
+    tls_policy: str
+    tls_opt_allow_client_renegotiations: bool
+    tls_opt_allow_dot_login: bool
+    tls_opt_allow_per_user: bool
+    tls_opt_common_name_required: bool
+    tls_opt_enable_diags: bool
+    tls_opt_export_cert_data: bool
+    tls_opt_no_empty_fragments: bool
+    tls_opt_no_session_reuse_required: bool
+    tls_opt_stdenvvars: bool
+    tls_opt_dns_name_required: bool
+    tls_opt_ip_address_required: bool
+    ssltls_certificate: Union[None, int]
+    options: str
+
+
+@dataclass
+class FtpPut(_Modelo):
+    __slots__ = ('id', 'port', 'clients', 'ipconnections', 'loginattempt', 'timeout', 'timeout_notransfer', 'onlyanonymous', 'anonpath', 'onlylocal', 'banner', 'filemask', 'dirmask', 'fxp', 'resume', 'defaultroot', 'ident', 'reversedns', 'masqaddress', 'passiveportsmin', 'passiveportsmax', 'localuserbw', 'localuserdlbw', 'anonuserbw', 'anonuserdlbw', 'tls', 'tls_policy', 'tls_opt_allow_client_renegotiations', 'tls_opt_allow_dot_login', 'tls_opt_allow_per_user', 'tls_opt_common_name_required', 'tls_opt_enable_diags', 'tls_opt_export_cert_data', 'tls_opt_no_empty_fragments', 'tls_opt_no_session_reuse_required', 'tls_opt_stdenvvars', 'tls_opt_dns_name_required', 'tls_opt_ip_address_required', 'ssltls_certificate', 'options')
+    _claves = ('id', 'port', 'clients', 'ipconnections', 'loginattempt', 'timeout', 'timeout_notransfer', 'onlyanonymous', 'anonpath', 'onlylocal', 'banner', 'filemask', 'dirmask', 'fxp', 'resume', 'defaultroot', 'ident', 'reversedns', 'masqaddress', 'passiveportsmin', 'passiveportsmax', 'localuserbw', 'localuserdlbw', 'anonuserbw', 'anonuserdlbw', 'tls', 'tls_policy', 'tls_opt_allow_client_renegotiations', 'tls_opt_allow_dot_login', 'tls_opt_allow_per_user', 'tls_opt_common_name_required', 'tls_opt_enable_diags', 'tls_opt_export_cert_data', 'tls_opt_no_empty_fragments', 'tls_opt_no_session_reuse_required', 'tls_opt_stdenvvars', 'tls_opt_dns_name_required', 'tls_opt_ip_address_required', 'ssltls_certificate', 'options')
+
+    id: int
+    port: int
+    clients: int
+    ipconnections: int
+    loginattempt: int
+    timeout: int
+    timeout_notransfer: int
+    onlyanonymous: bool
+    anonpath: Union[None, str]
+    onlylocal: bool
+    banner: str
+    filemask: str
+    dirmask: str
+    fxp: bool
+    resume: bool
+    defaultroot: bool
+    ident: bool
+    reversedns: bool
+    masqaddress: str
+    passiveportsmin: int
+    passiveportsmax: int
+    localuserbw: int
+    localuserdlbw: int
+    anonuserbw: int
+    anonuserdlbw: int
+    tls: bool
+    tls_policy: str
+    tls_opt_allow_client_renegotiations: bool
+    tls_opt_allow_dot_login: bool
+    tls_opt_allow_per_user: bool
+    tls_opt_common_name_required: bool
+    tls_opt_enable_diags: bool
+    tls_opt_export_cert_data: bool
+    tls_opt_no_empty_fragments: bool
+    tls_opt_no_session_reuse_required: bool
+    tls_opt_stdenvvars: bool
+    tls_opt_dns_name_required: bool
+    tls_opt_ip_address_required: bool
+    ssltls_certificate: Union[None, int]
+    options: str
+
+
+@dataclass
+class GroupGet(_Modelo):
+    __slots__ = ('id', 'gid', 'name', 'builtin', 'sudo_commands', 'sudo_commands_nopasswd', 'smb', 'userns_idmap', 'group', 'id_type_both', 'local', 'sid', 'roles', 'users')
+    _claves = ('id', 'gid', 'name', 'builtin', 'sudo_commands', 'sudo_commands_nopasswd', 'smb', 'userns_idmap', 'group', 'id_type_both', 'local', 'sid', 'roles', 'users')
+
+    id: int
+    gid: int
+    name: str
+    builtin: bool
+    sudo_commands: list
+    sudo_commands_nopasswd: list
+    smb: bool
+    userns_idmap: Union[None, int, str]
+    group: str
+    id_type_both: bool
+    local: bool
+    sid: Union[None, str]
+    roles: list
+    users: list
+
+
+@dataclass
+class GroupGetGroupObjPost(_Modelo):
+    __slots__ = ('gr_name', 'gr_gid', 'gr_mem', 'sid', 'source', 'local')
+    _claves = ('gr_name', 'gr_gid', 'gr_mem', 'sid', 'source', 'local')
+
+    gr_name: str
+    gr_gid: int
+    gr_mem: list
+    sid: Union[None, str]
+    source: str
+    local: bool
+
+
+@dataclass
+class GroupGetInstancePost(_Modelo):
+    __slots__ = ('id', 'gid', 'name', 'builtin', 'sudo_commands', 'sudo_commands_nopasswd', 'smb', 'userns_idmap', 'group', 'id_type_both', 'local', 'sid', 'roles', 'users')
+    _claves = ('id', 'gid', 'name', 'builtin', 'sudo_commands', 'sudo_commands_nopasswd', 'smb', 'userns_idmap', 'group', 'id_type_both', 'local', 'sid', 'roles', 'users')
+
+    id: int
+    gid: int
+    name: str
+    builtin: bool
+    sudo_commands: list
+    sudo_commands_nopasswd: list
+    smb: bool
+    userns_idmap: Union[None, int, str]
+    group: str
+    id_type_both: bool
+    local: bool
+    sid: Union[None, str]
+    roles: list
+    users: list
+
+
+@dataclass
+class GroupIdGet(_Modelo):
+    __slots__ = ('id', 'gid', 'name', 'builtin', 'sudo_commands', 'sudo_commands_nopasswd', 'smb', 'userns_idmap', 'group', 'id_type_both', 'local', 'sid', 'roles', 'users')
+    _claves = ('id', 'gid', 'name', 'builtin', 'sudo_commands', 'sudo_commands_nopasswd', 'smb', 'userns_idmap', 'group', 'id_type_both', 'local', 'sid', 'roles', 'users')
+
+    id: int
+    gid: int
+    name: str
+    builtin: bool
+    sudo_commands: list
+    sudo_commands_nopasswd: list
+    smb: bool
+    userns_idmap: Union[None, int, str]
+    group: str
+    id_type_both: bool
+    local: bool
+    sid: Union[None, str]
+    roles: list
+    users: list
+
+
+@dataclass
+class IdmapGet(_Modelo):
+    __slots__ = ('name', 'dns_domain_name', 'range_low', 'range_high', 'idmap_backend', 'certificate', 'options', 'id')
+    _claves = ('name', 'dns_domain_name', 'range_low', 'range_high', 'idmap_backend', 'certificate', 'options', 'id')
+
+    name: str
+    dns_domain_name: Optional[str]
+    range_low: int
+    range_high: int
+    idmap_backend: str
+    certificate: Optional[int]
+    options: dict
+    id: int
+
+
+@dataclass
+class IdmapPost(_Modelo):
+    __slots__ = ('name', 'dns_domain_name', 'range_low', 'range_high', 'idmap_backend', 'certificate', 'options', 'id')
+    _claves = ('name', 'dns_domain_name', 'range_low', 'range_high', 'idmap_backend', 'certificate', 'options', 'id')
+
+    name: str
+    dns_domain_name: str
+    range_low: int
+    range_high: int
+    idmap_backend: str
+    certificate: int
+    options: dict
+    id: int
+
+
+@dataclass
+class IdmapGetInstancePost(_Modelo):
+    __slots__ = ('name', 'dns_domain_name', 'range_low', 'range_high', 'idmap_backend', 'certificate', 'options', 'id')
+    _claves = ('name', 'dns_domain_name', 'range_low', 'range_high', 'idmap_backend', 'certificate', 'options', 'id')
+
+    name: str
+    dns_domain_name: str
+    range_low: int
+    range_high: int
+    idmap_backend: str
+    certificate: int
+    options: dict
+    id: int
+
+
+@dataclass
+class IdmapIdGet(_Modelo):
+    __slots__ = ('name', 'dns_domain_name', 'range_low', 'range_high', 'idmap_backend', 'certificate', 'options', 'id')
+    _claves = ('name', 'dns_domain_name', 'range_low', 'range_high', 'idmap_backend', 'certificate', 'options', 'id')
+
+    name: str
+    dns_domain_name: Optional[str]
+    range_low: int
+    range_high: int
+    idmap_backend: str
+    certificate: Optional[int]
+    options: dict
+    id: int
+
+
+@dataclass
+class IdmapIdPut(_Modelo):
+    __slots__ = ('name', 'dns_domain_name', 'range_low', 'range_high', 'idmap_backend', 'certificate', 'options', 'id')
+    _claves = ('name', 'dns_domain_name', 'range_low', 'range_high', 'idmap_backend', 'certificate', 'options', 'id')
+
+    name: str
+    dns_domain_name: str
+    range_low: int
+    range_high: int
+    idmap_backend: str
+    certificate: int
+    options: dict
+    id: int
+
+
+@dataclass
+class InitshutdownscriptGet(_Modelo):
+    __slots__ = ('type', 'command', 'script', 'when', 'enabled', 'timeout', 'comment', 'id')
+    _claves = ('type', 'command', 'script', 'when', 'enabled', 'timeout', 'comment', 'id')
+
+    type: str
+    command: Union[None, str]
+    script: Union[None, str]
+    when: str
+    enabled: bool
+    timeout: int
+    comment: str
+    id: int
+
+
+@dataclass
+class InitshutdownscriptPost(_Modelo):
+    __slots__ = ('type', 'command', 'script', 'when', 'enabled', 'timeout', 'comment', 'id')
+    _claves = ('type', 'command', 'script', 'when', 'enabled', 'timeout', 'comment', 'id')
+
+    type: str
+    command: Union[None, str]
+    script: Union[None, str]
+    when: str
+    enabled: bool
+    timeout: int
+    comment: str
+    id: int
+
+
+@dataclass
+class InitshutdownscriptGetInstancePost(_Modelo):
+    __slots__ = ('type', 'command', 'script', 'when', 'enabled', 'timeout', 'comment', 'id')
+    _claves = ('type', 'command', 'script', 'when', 'enabled', 'timeout', 'comment', 'id')
+
+    type: str
+    command: Union[None, str]
+    script: Union[None, str]
+    when: str
+    enabled: bool
+    timeout: int
+    comment: str
+    id: int
+
+
+@dataclass
+class InitshutdownscriptIdGet(_Modelo):
+    __slots__ = ('type', 'command', 'script', 'when', 'enabled', 'timeout', 'comment', 'id')
+    _claves = ('type', 'command', 'script', 'when', 'enabled', 'timeout', 'comment', 'id')
+
+    type: str
+    command: Union[None, str]
+    script: Union[None, str]
+    when: str
+    enabled: bool
+    timeout: int
+    comment: str
+    id: int
+
+
+@dataclass
+class InitshutdownscriptIdPut(_Modelo):
+    __slots__ = ('type', 'command', 'script', 'when', 'enabled', 'timeout', 'comment', 'id')
+    _claves = ('type', 'command', 'script', 'when', 'enabled', 'timeout', 'comment', 'id')
+
+    type: str
+    command: Union[None, str]
+    script: Union[None, str]
+    when: str
+    enabled: bool
+    timeout: int
+    comment: str
+    id: int
+
+
+@dataclass
+class InterfaceGet(_Modelo):
+    __slots__ = ('id', 'name', 'fake', 'type', 'state', 'aliases', 'ipv4_dhcp', 'ipv6_auto', 'mtu', 'vlan_parent_interface', 'vlan_tag', 'vlan_pcp', 'lag_protocol', 'lag_ports', 'bridge_members', 'enable_learning')
+    _claves = ('id', 'name', 'fake', 'type', 'state', 'aliases', 'ipv4_dhcp', 'ipv6_auto', 'mtu', 'vlan_parent_interface', 'vlan_tag', 'vlan_pcp', 'lag_protocol', 'lag_ports', 'bridge_members', 'enable_learning')
+
+    id: str
+    name: str
+    fake: bool
+    type: str
+    state: dict
+    aliases: list
+    ipv4_dhcp: bool
+    ipv6_auto: bool
+    mtu: Optional[int]
+    vlan_parent_interface: Optional[str]
+    vlan_tag: Optional[int]
+    vlan_pcp: Optional[int]
+    lag_protocol: str
+    lag_ports: list
+    bridge_members: list
+    enable_learning: bool
+
+
+@dataclass
+class InterfacePost(_Modelo):
+    __slots__ = ('id', 'name', 'fake', 'type', 'state', 'aliases', 'ipv4_dhcp', 'ipv6_auto', 'mtu', 'vlan_parent_interface', 'vlan_tag', 'vlan_pcp', 'lag_protocol', 'lag_ports', 'bridge_members', 'enable_learning')
+    _claves = ('id', 'name', 'fake', 'type', 'state', 'aliases', 'ipv4_dhcp', 'ipv6_auto', 'mtu', 'vlan_parent_interface', 'vlan_tag', 'vlan_pcp', 'lag_protocol', 'lag_ports', 'bridge_members', 'enable_learning')
+
+    id: str
+    name: str
+    fake: bool
+    type: str
+    state: dict
+    aliases: list
+    ipv4_dhcp: bool
+    ipv6_auto: bool
+    mtu: int
+    vlan_parent_interface: str
+    vlan_tag: int
+    vlan_pcp: int
+    lag_protocol: str
+    lag_ports: list
+    bridge_members: list
+    enable_learning: bool
+
+
+@dataclass
+class InterfaceCapabilitiesGetPost(_Modelo):
+    __slots__ = ('enabled', 'disabled', 'supported')
+    _claves = ('enabled', 'disabled', 'supported')
+
+    enabled: list
+    disabled: list
+    supported: list
+
+
+@dataclass
+class InterfaceGetInstancePost(_Modelo):
+    __slots__ = ('id', 'name', 'fake', 'type', 'state', 'aliases', 'ipv4_dhcp', 'ipv6_auto', 'mtu', 'vlan_parent_interface', 'vlan_tag', 'vlan_pcp', 'lag_protocol', 'lag_ports', 'bridge_members', 'enable_learning')
+    _claves = ('id', 'name', 'fake', 'type', 'state', 'aliases', 'ipv4_dhcp', 'ipv6_auto', 'mtu', 'vlan_parent_interface', 'vlan_tag', 'vlan_pcp', 'lag_protocol', 'lag_ports', 'bridge_members', 'enable_learning')
+
+    id: str
+    name: str
+    fake: bool
+    type: str
+    state: dict
+    aliases: list
+    ipv4_dhcp: bool
+    ipv6_auto: bool
+    mtu: int
+    vlan_parent_interface: str
+    vlan_tag: int
+    vlan_pcp: int
+    lag_protocol: str
+    lag_ports: list
+    bridge_members: list
+    enable_learning: bool
+
+
+@dataclass
+class InterfaceIdGet(_Modelo):
+    __slots__ = ('id', 'name', 'fake', 'type', 'state', 'aliases', 'ipv4_dhcp', 'ipv6_auto', 'mtu', 'vlan_parent_interface', 'vlan_tag', 'vlan_pcp', 'lag_protocol', 'lag_ports', 'bridge_members', 'enable_learning')
+    _claves = ('id', 'name', 'fake', 'type', 'state', 'aliases', 'ipv4_dhcp', 'ipv6_auto', 'mtu', 'vlan_parent_interface', 'vlan_tag', 'vlan_pcp', 'lag_protocol', 'lag_ports', 'bridge_members', 'enable_learning')
+
+    id: str
+    name: str
+    fake: bool
+    type: str
+    state: dict
+    aliases: list
+    ipv4_dhcp: bool
+    ipv6_auto: bool
+    mtu: Optional[int]
+    vlan_parent_interface: Optional[str]
+    vlan_tag: Optional[int]
+    vlan_pcp: Optional[int]
+    lag_protocol: str
+    lag_ports: list
+    bridge_members: list
+    enable_learning: bool
+
+
+@dataclass
+class InterfaceIdPut(_Modelo):
+    __slots__ = ('id', 'name', 'fake', 'type', 'state', 'aliases', 'ipv4_dhcp', 'ipv6_auto', 'mtu', 'vlan_parent_interface', 'vlan_tag', 'vlan_pcp', 'lag_protocol', 'lag_ports', 'bridge_members', 'enable_learning')
+    _claves = ('id', 'name', 'fake', 'type', 'state', 'aliases', 'ipv4_dhcp', 'ipv6_auto', 'mtu', 'vlan_parent_interface', 'vlan_tag', 'vlan_pcp', 'lag_protocol', 'lag_ports', 'bridge_members', 'enable_learning')
+
+    id: str
+    name: str
+    fake: bool
+    type: str
+    state: dict
+    aliases: list
+    ipv4_dhcp: bool
+    ipv6_auto: bool
+    mtu: int
+    vlan_parent_interface: str
+    vlan_tag: int
+    vlan_pcp: int
+    lag_protocol: str
+    lag_ports: list
+    bridge_members: list
+    enable_learning: bool
+
+
+@dataclass
+class InterfaceIpInUsePost(_Modelo):
+    __slots__ = ('type', 'address', 'netmask', 'broadcast')
+    _claves = ('type', 'address', 'netmask', 'broadcast')
+
+    type: str
+    address: str
+    netmask: int
+    broadcast: str
+
+
+@dataclass
+class InterfaceLacpduRateChoicesGet(_Modelo):
+    __slots__ = ('SLOW', 'FAST')
+    _claves = ('SLOW', 'FAST')
+
+    SLOW: str
+    FAST: str
+
+
+@dataclass
+class InterfaceServicesRestartedOnSyncGet(_Modelo):
+    __slots__ = ('type', 'service', 'ips')
+    _claves = ('type', 'service', 'ips')
+
+    type: str
+    service: str
+    ips: list
+
+
+@dataclass
+class InterfaceXmitHashPolicyChoicesGet(_Modelo):
+    __slots__ = ('LAYER2', 'LAYER2_3', 'LAYER3_4')
+    _claves = ('LAYER2', 'LAYER2+3', 'LAYER3+4')
+
+    LAYER2: str
+    LAYER2_3: str
+    LAYER3_4: str
+
+
+@dataclass
+class IpmiLanGet(_Modelo):
+    __slots__ = ('channel', 'id', 'ip_address_source', 'ip_address', 'mac_address', 'subnet_mask', 'default_gateway_ip_address', 'default_gateway_mac_address', 'backup_gateway_ip_address', 'backup_gateway_mac_address', 'vlan_id', 'vlan_id_enable', 'vlan_priority')
+    _claves = ('channel', 'id', 'ip_address_source', 'ip_address', 'mac_address', 'subnet_mask', 'default_gateway_ip_address', 'default_gateway_mac_address', 'backup_gateway_ip_address', 'backup_gateway_mac_address', 'vlan_id', 'vlan_id_enable', 'vlan_priority')
+
+    channel: int
+    id: int
+    ip_address_source: str
+    ip_address: str
+    mac_address: str
+    subnet_mask: str
+    default_gateway_ip_address: str
+    default_gateway_mac_address: str
+    backup_gateway_ip_address: str
+    backup_gateway_mac_address: str
+    vlan_id: Optional[int]
+    vlan_id_enable: bool
+    vlan_priority: int
+
+
+@dataclass
+class IpmiLanGetInstancePost(_Modelo):
+    __slots__ = ('channel', 'id', 'ip_address_source', 'ip_address', 'mac_address', 'subnet_mask', 'default_gateway_ip_address', 'default_gateway_mac_address', 'backup_gateway_ip_address', 'backup_gateway_mac_address', 'vlan_id', 'vlan_id_enable', 'vlan_priority')
+    _claves = ('channel', 'id', 'ip_address_source', 'ip_address', 'mac_address', 'subnet_mask', 'default_gateway_ip_address', 'default_gateway_mac_address', 'backup_gateway_ip_address', 'backup_gateway_mac_address', 'vlan_id', 'vlan_id_enable', 'vlan_priority')
+
+    channel: int
+    id: int
+    ip_address_source: str
+    ip_address: str
+    mac_address: str
+    subnet_mask: str
+    default_gateway_ip_address: str
+    default_gateway_mac_address: str
+    backup_gateway_ip_address: str
+    backup_gateway_mac_address: str
+    vlan_id: int
+    vlan_id_enable: bool
+    vlan_priority: int
+
+
+@dataclass
+class IpmiLanIdGet(_Modelo):
+    __slots__ = ('channel', 'id', 'ip_address_source', 'ip_address', 'mac_address', 'subnet_mask', 'default_gateway_ip_address', 'default_gateway_mac_address', 'backup_gateway_ip_address', 'backup_gateway_mac_address', 'vlan_id', 'vlan_id_enable', 'vlan_priority')
+    _claves = ('channel', 'id', 'ip_address_source', 'ip_address', 'mac_address', 'subnet_mask', 'default_gateway_ip_address', 'default_gateway_mac_address', 'backup_gateway_ip_address', 'backup_gateway_mac_address', 'vlan_id', 'vlan_id_enable', 'vlan_priority')
+
+    channel: int
+    id: int
+    ip_address_source: str
+    ip_address: str
+    mac_address: str
+    subnet_mask: str
+    default_gateway_ip_address: str
+    default_gateway_mac_address: str
+    backup_gateway_ip_address: str
+    backup_gateway_mac_address: str
+    vlan_id: Optional[int]
+    vlan_id_enable: bool
+    vlan_priority: int
+
+
+@dataclass
+class IpmiLanIdPut(_Modelo):
+    __slots__ = ('channel', 'id', 'ip_address_source', 'ip_address', 'mac_address', 'subnet_mask', 'default_gateway_ip_address', 'default_gateway_mac_address', 'backup_gateway_ip_address', 'backup_gateway_mac_address', 'vlan_id', 'vlan_id_enable', 'vlan_priority')
+    _claves = ('channel', 'id', 'ip_address_source', 'ip_address', 'mac_address', 'subnet_mask', 'default_gateway_ip_address', 'default_gateway_mac_address', 'backup_gateway_ip_address', 'backup_gateway_mac_address', 'vlan_id', 'vlan_id_enable', 'vlan_priority')
+
+    channel: int
+    id: int
+    ip_address_source: str
+    ip_address: str
+    mac_address: str
+    subnet_mask: str
+    default_gateway_ip_address: str
+    default_gateway_mac_address: str
+    backup_gateway_ip_address: str
+    backup_gateway_mac_address: str
+    vlan_id: int
+    vlan_id_enable: bool
+    vlan_priority: int
+
+
+@dataclass
+class IscsiAuthGet(_Modelo):
+    __slots__ = ('id', 'tag', 'user', 'secret', 'peeruser', 'peersecret', 'discovery_auth')
+    _claves = ('id', 'tag', 'user', 'secret', 'peeruser', 'peersecret', 'discovery_auth')
+
+    id: int
+    tag: int
+    user: str
+    secret: str
+    peeruser: str
+    peersecret: str
+    discovery_auth: str
+
+
+@dataclass
+class IscsiAuthPost(_Modelo):
+    __slots__ = ('id', 'tag', 'user', 'secret', 'peeruser', 'peersecret', 'discovery_auth')
+    _claves = ('id', 'tag', 'user', 'secret', 'peeruser', 'peersecret', 'discovery_auth')
+
+    id: int
+    tag: int
+    user: str
+    secret: str
+    peeruser: str
+    peersecret: str
+    discovery_auth: str
+
+
+@dataclass
+class IscsiAuthGetInstancePost(_Modelo):
+    __slots__ = ('id', 'tag', 'user', 'secret', 'peeruser', 'peersecret', 'discovery_auth')
+    _claves = ('id', 'tag', 'user', 'secret', 'peeruser', 'peersecret', 'discovery_auth')
+
+    id: int
+    tag: int
+    user: str
+    secret: str
+    peeruser: str
+    peersecret: str
+    discovery_auth: str
+
+
+@dataclass
+class IscsiAuthIdGet(_Modelo):
+    __slots__ = ('id', 'tag', 'user', 'secret', 'peeruser', 'peersecret', 'discovery_auth')
+    _claves = ('id', 'tag', 'user', 'secret', 'peeruser', 'peersecret', 'discovery_auth')
+
+    id: int
+    tag: int
+    user: str
+    secret: str
+    peeruser: str
+    peersecret: str
+    discovery_auth: str
+
+
+@dataclass
+class IscsiAuthIdPut(_Modelo):
+    __slots__ = ('id', 'tag', 'user', 'secret', 'peeruser', 'peersecret', 'discovery_auth')
+    _claves = ('id', 'tag', 'user', 'secret', 'peeruser', 'peersecret', 'discovery_auth')
+
+    id: int
+    tag: int
+    user: str
+    secret: str
+    peeruser: str
+    peersecret: str
+    discovery_auth: str
+
+
+@dataclass
+class IscsiExtentGet(_Modelo):
+    __slots__ = ('id', 'name', 'type', 'disk', 'serial', 'path', 'filesize', 'blocksize', 'pblocksize', 'avail_threshold', 'comment', 'naa', 'insecure_tpc', 'xen', 'rpm', 'ro', 'enabled', 'vendor', 'locked')
+    _claves = ('id', 'name', 'type', 'disk', 'serial', 'path', 'filesize', 'blocksize', 'pblocksize', 'avail_threshold', 'comment', 'naa', 'insecure_tpc', 'xen', 'rpm', 'ro', 'enabled', 'vendor', 'locked')
+
+    id: int
+    name: str
+    type: str
+    disk: Union[None, str]
+    serial: Union[None, str]
+    path: Union[None, str]
+    filesize: Union[int, str]
+    blocksize: int
+    pblocksize: bool
+    avail_threshold: Union[None, int]
+    comment: str
+    naa: str
+    insecure_tpc: bool
+    xen: bool
+    rpm: str
+    ro: bool
+    enabled: bool
+    vendor: str
+    locked: Union[None, bool]
+
+
+@dataclass
+class IscsiExtentPost(_Modelo):
+    __slots__ = ('id', 'name', 'type', 'disk', 'serial', 'path', 'filesize', 'blocksize', 'pblocksize', 'avail_threshold', 'comment', 'naa', 'insecure_tpc', 'xen', 'rpm', 'ro', 'enabled', 'vendor', 'locked')
+    _claves = ('id', 'name', 'type', 'disk', 'serial', 'path', 'filesize', 'blocksize', 'pblocksize', 'avail_threshold', 'comment', 'naa', 'insecure_tpc', 'xen', 'rpm', 'ro', 'enabled', 'vendor', 'locked')
+
+    id: int
+    name: str
+    type: str
+    disk: Union[None, str]
+    serial: Union[None, str]
+    path: Union[None, str]
+    filesize: Union[int, str]
+    blocksize: int
+    pblocksize: bool
+    avail_threshold: Union[None, int]
+    comment: str
+    naa: str
+    insecure_tpc: bool
+    xen: bool
+    rpm: str
+    ro: bool
+    enabled: bool
+    vendor: str
+    locked: Union[None, bool]
+
+
+@dataclass
+class IscsiExtentGetInstancePost(_Modelo):
+    __slots__ = ('id', 'name', 'type', 'disk', 'serial', 'path', 'filesize', 'blocksize', 'pblocksize', 'avail_threshold', 'comment', 'naa', 'insecure_tpc', 'xen', 'rpm', 'ro', 'enabled', 'vendor', 'locked')
+    _claves = ('id', 'name', 'type', 'disk', 'serial', 'path', 'filesize', 'blocksize', 'pblocksize', 'avail_threshold', 'comment', 'naa', 'insecure_tpc', 'xen', 'rpm', 'ro', 'enabled', 'vendor', 'locked')
+
+    id: int
+    name: str
+    type: str
+    disk: Union[None, str]
+    serial: Union[None, str]
+    path: Union[None, str]
+    filesize: Union[int, str]
+    blocksize: int
+    pblocksize: bool
+    avail_threshold: Union[None, int]
+    comment: str
+    naa: str
+    insecure_tpc: bool
+    xen: bool
+    rpm: str
+    ro: bool
+    enabled: bool
+    vendor: str
+    locked: Union[None, bool]
+
+
+@dataclass
+class IscsiExtentIdGet(_Modelo):
+    __slots__ = ('id', 'name', 'type', 'disk', 'serial', 'path', 'filesize', 'blocksize', 'pblocksize', 'avail_threshold', 'comment', 'naa', 'insecure_tpc', 'xen', 'rpm', 'ro', 'enabled', 'vendor', 'locked')
+    _claves = ('id', 'name', 'type', 'disk', 'serial', 'path', 'filesize', 'blocksize', 'pblocksize', 'avail_threshold', 'comment', 'naa', 'insecure_tpc', 'xen', 'rpm', 'ro', 'enabled', 'vendor', 'locked')
+
+    id: int
+    name: str
+    type: str
+    disk: Union[None, str]
+    serial: Union[None, str]
+    path: Union[None, str]
+    filesize: Union[int, str]
+    blocksize: int
+    pblocksize: bool
+    avail_threshold: Union[None, int]
+    comment: str
+    naa: str
+    insecure_tpc: bool
+    xen: bool
+    rpm: str
+    ro: bool
+    enabled: bool
+    vendor: str
+    locked: Union[None, bool]
+
+
+@dataclass
+class IscsiExtentIdPut(_Modelo):
+    __slots__ = ('id', 'name', 'type', 'disk', 'serial', 'path', 'filesize', 'blocksize', 'pblocksize', 'avail_threshold', 'comment', 'naa', 'insecure_tpc', 'xen', 'rpm', 'ro', 'enabled', 'vendor', 'locked')
+    _claves = ('id', 'name', 'type', 'disk', 'serial', 'path', 'filesize', 'blocksize', 'pblocksize', 'avail_threshold', 'comment', 'naa', 'insecure_tpc', 'xen', 'rpm', 'ro', 'enabled', 'vendor', 'locked')
+
+    id: int
+    name: str
+    type: str
+    disk: Union[None, str]
+    serial: Union[None, str]
+    path: Union[None, str]
+    filesize: Union[int, str]
+    blocksize: int
+    pblocksize: bool
+    avail_threshold: Union[None, int]
+    comment: str
+    naa: str
+    insecure_tpc: bool
+    xen: bool
+    rpm: str
+    ro: bool
+    enabled: bool
+    vendor: str
+    locked: Union[None, bool]
+
+
+@dataclass
+class IscsiGlobalGet(_Modelo):
+    __slots__ = ('id', 'basename', 'isns_servers', 'listen_port', 'pool_avail_threshold', 'alua', 'iser')
+    _claves = ('id', 'basename', 'isns_servers', 'listen_port', 'pool_avail_threshold', 'alua', 'iser')
+
+    id: int
+    basename: str
+    isns_servers: list
+    listen_port: int
+    pool_avail_threshold: Union[None, int]
+    alua: bool
+    iser: bool
+
+
+@dataclass
+class IscsiGlobalPut(_Modelo):
+    __slots__ = ('id', 'basename', 'isns_servers', 'listen_port', 'pool_avail_threshold', 'alua', 'iser')
+    _claves = ('id', 'basename', 'isns_servers', 'listen_port', 'pool_avail_threshold', 'alua', 'iser')
+
+    id: int
+    basename: str
+    isns_servers: list
+    listen_port: int
+    pool_avail_threshold: Union[None, int]
+    alua: bool
+    iser: bool
+
+
+@dataclass
+class IscsiGlobalSessionsPost(_Modelo):
+    __slots__ = ('initiator', 'initiator_addr', 'initiator_alias', 'target', 'target_alias', 'header_digest', 'data_digest', 'max_data_segment_length', 'max_receive_data_segment_length', 'max_xmit_data_segment_length', 'max_burst_length', 'first_burst_length', 'immediate_data', 'iser', 'offload')
+    _claves = ('initiator', 'initiator_addr', 'initiator_alias', 'target', 'target_alias', 'header_digest', 'data_digest', 'max_data_segment_length', 'max_receive_data_segment_length', 'max_xmit_data_segment_length', 'max_burst_length', 'first_burst_length', 'immediate_data', 'iser', 'offload')
+
+    initiator: str
+    initiator_addr: str
+    initiator_alias: Union[None, str]
+    target: str
+    target_alias: str
+    header_digest: Union[None, str]
+    data_digest: Union[None, str]
+    max_data_segment_length: Union[None, int]
+    max_receive_data_segment_length: Union[None, int]
+    max_xmit_data_segment_length: Union[None, int]
+    max_burst_length: Union[None, int]
+    first_burst_length: Union[None, int]
+    immediate_data: bool
+    iser: bool
+    offload: bool
+
+
+@dataclass
+class IscsiInitiatorGet(_Modelo):
+    __slots__ = ('id', 'initiators', 'comment')
+    _claves = ('id', 'initiators', 'comment')
+
+    id: int
+    initiators: list
+    comment: str
+
+
+@dataclass
+class IscsiInitiatorPost(_Modelo):
+    __slots__ = ('id', 'initiators', 'comment')
+    _claves = ('id', 'initiators', 'comment')
+
+    id: int
+    initiators: list
+    comment: str
+
+
+@dataclass
+class IscsiInitiatorGetInstancePost(_Modelo):
+    __slots__ = ('id', 'initiators', 'comment')
+    _claves = ('id', 'initiators', 'comment')
+
+    id: int
+    initiators: list
+    comment: str
+
+
+@dataclass
+class IscsiInitiatorIdGet(_Modelo):
+    __slots__ = ('id', 'initiators', 'comment')
+    _claves = ('id', 'initiators', 'comment')
+
+    id: int
+    initiators: list
+    comment: str
+
+
+@dataclass
+class IscsiInitiatorIdPut(_Modelo):
+    __slots__ = ('id', 'initiators', 'comment')
+    _claves = ('id', 'initiators', 'comment')
+
+    id: int
+    initiators: list
+    comment: str
+
+
+@dataclass
+class IscsiPortalGet(_Modelo):
+    __slots__ = ('id', 'listen', 'tag', 'comment')
+    _claves = ('id', 'listen', 'tag', 'comment')
+
+    id: int
+    listen: list
+    tag: int
+    comment: str
+
+
+@dataclass
+class IscsiPortalPost(_Modelo):
+    __slots__ = ('id', 'listen', 'tag', 'comment')
+    _claves = ('id', 'listen', 'tag', 'comment')
+
+    id: int
+    listen: list
+    tag: int
+    comment: str
+
+
+@dataclass
+class IscsiPortalGetInstancePost(_Modelo):
+    __slots__ = ('id', 'listen', 'tag', 'comment')
+    _claves = ('id', 'listen', 'tag', 'comment')
+
+    id: int
+    listen: list
+    tag: int
+    comment: str
+
+
+@dataclass
+class IscsiPortalIdGet(_Modelo):
+    __slots__ = ('id', 'listen', 'tag', 'comment')
+    _claves = ('id', 'listen', 'tag', 'comment')
+
+    id: int
+    listen: list
+    tag: int
+    comment: str
+
+
+@dataclass
+class IscsiPortalIdPut(_Modelo):
+    __slots__ = ('id', 'listen', 'tag', 'comment')
+    _claves = ('id', 'listen', 'tag', 'comment')
+
+    id: int
+    listen: list
+    tag: int
+    comment: str
+
+
+@dataclass
+class IscsiTargetGet(_Modelo):
+    __slots__ = ('id', 'name', 'alias', 'mode', 'groups', 'auth_networks', 'rel_tgt_id', 'iscsi_parameters')
+    _claves = ('id', 'name', 'alias', 'mode', 'groups', 'auth_networks', 'rel_tgt_id', 'iscsi_parameters')
+
+    id: int
+    name: str
+    alias: Union[None, str]
+    mode: str
+    groups: list
+    auth_networks: list
+    rel_tgt_id: int
+    iscsi_parameters: Any
+
+
+@dataclass
+class IscsiTargetPost(_Modelo):
+    __slots__ = ('id', 'name', 'alias', 'mode', 'groups', 'auth_networks', 'rel_tgt_id', 'iscsi_parameters')
+    _claves = ('id', 'name', 'alias', 'mode', 'groups', 'auth_networks', 'rel_tgt_id', 'iscsi_parameters')
+
+    id: int
+    name: str
+    alias: Union[None, str]
+    mode: str
+    groups: list
+    auth_networks: list
+    rel_tgt_id: int
+    iscsi_parameters: Any
+
+
+@dataclass
+class IscsiTargetGetInstancePost(_Modelo):
+    __slots__ = ('id', 'name', 'alias', 'mode', 'groups', 'auth_networks', 'rel_tgt_id', 'iscsi_parameters')
+    _claves = ('id', 'name', 'alias', 'mode', 'groups', 'auth_networks', 'rel_tgt_id', 'iscsi_parameters')
+
+    id: int
+    name: str
+    alias: Union[None, str]
+    mode: str
+    groups: list
+    auth_networks: list
+    rel_tgt_id: int
+    iscsi_parameters: Any
+
+
+@dataclass
+class IscsiTargetIdGet(_Modelo):
+    __slots__ = ('id', 'name', 'alias', 'mode', 'groups', 'auth_networks', 'rel_tgt_id', 'iscsi_parameters')
+    _claves = ('id', 'name', 'alias', 'mode', 'groups', 'auth_networks', 'rel_tgt_id', 'iscsi_parameters')
+
+    id: int
+    name: str
+    alias: Union[None, str]
+    mode: str
+    groups: list
+    auth_networks: list
+    rel_tgt_id: int
+    iscsi_parameters: Any
+
+
+@dataclass
+class IscsiTargetIdPut(_Modelo):
+    __slots__ = ('id', 'name', 'alias', 'mode', 'groups', 'auth_networks', 'rel_tgt_id', 'iscsi_parameters')
+    _claves = ('id', 'name', 'alias', 'mode', 'groups', 'auth_networks', 'rel_tgt_id', 'iscsi_parameters')
+
+    id: int
+    name: str
+    alias: Union[None, str]
+    mode: str
+    groups: list
+    auth_networks: list
+    rel_tgt_id: int
+    iscsi_parameters: Any
+
+
+@dataclass
+class IscsiTargetextentGet(_Modelo):
+    __slots__ = ('id', 'target', 'lunid', 'extent')
+    _claves = ('id', 'target', 'lunid', 'extent')
+
+    id: int
+    target: int
+    lunid: int
+    extent: int
+
+
+@dataclass
+class IscsiTargetextentPost(_Modelo):
+    __slots__ = ('id', 'target', 'lunid', 'extent')
+    _claves = ('id', 'target', 'lunid', 'extent')
+
+    id: int
+    target: int
+    lunid: int
+    extent: int
+
+
+@dataclass
+class IscsiTargetextentGetInstancePost(_Modelo):
+    __slots__ = ('id', 'target', 'lunid', 'extent')
+    _claves = ('id', 'target', 'lunid', 'extent')
+
+    id: int
+    target: int
+    lunid: int
+    extent: int
+
+
+@dataclass
+class IscsiTargetextentIdGet(_Modelo):
+    __slots__ = ('id', 'target', 'lunid', 'extent')
+    _claves = ('id', 'target', 'lunid', 'extent')
+
+    id: int
+    target: int
+    lunid: int
+    extent: int
+
+
+@dataclass
+class IscsiTargetextentIdPut(_Modelo):
+    __slots__ = ('id', 'target', 'lunid', 'extent')
+    _claves = ('id', 'target', 'lunid', 'extent')
+
+    id: int
+    target: int
+    lunid: int
+    extent: int
+
+
+@dataclass
+class JbofGet(_Modelo):
+    __slots__ = ('id', 'mgmt_ip1', 'mgmt_ip2', 'mgmt_username', 'mgmt_password')
+    _claves = ('id', 'mgmt_ip1', 'mgmt_ip2', 'mgmt_username', 'mgmt_password')
+
+    id: int
+    mgmt_ip1: str
+    mgmt_ip2: str
+    mgmt_username: str
+    mgmt_password: str
+
+
+@dataclass
+class JbofPost(_Modelo):
+    __slots__ = ('id', 'mgmt_ip1', 'mgmt_ip2', 'mgmt_username', 'mgmt_password')
+    _claves = ('id', 'mgmt_ip1', 'mgmt_ip2', 'mgmt_username', 'mgmt_password')
+
+    id: int
+    mgmt_ip1: str
+    mgmt_ip2: str
+    mgmt_username: str
+    mgmt_password: str
+
+
+@dataclass
+class JbofGetInstancePost(_Modelo):
+    __slots__ = ('id', 'mgmt_ip1', 'mgmt_ip2', 'mgmt_username', 'mgmt_password')
+    _claves = ('id', 'mgmt_ip1', 'mgmt_ip2', 'mgmt_username', 'mgmt_password')
+
+    id: int
+    mgmt_ip1: str
+    mgmt_ip2: str
+    mgmt_username: str
+    mgmt_password: str
+
+
+@dataclass
+class JbofIdGet(_Modelo):
+    __slots__ = ('id', 'mgmt_ip1', 'mgmt_ip2', 'mgmt_username', 'mgmt_password')
+    _claves = ('id', 'mgmt_ip1', 'mgmt_ip2', 'mgmt_username', 'mgmt_password')
+
+    id: int
+    mgmt_ip1: str
+    mgmt_ip2: str
+    mgmt_username: str
+    mgmt_password: str
+
+
+@dataclass
+class JbofIdPut(_Modelo):
+    __slots__ = ('id', 'mgmt_ip1', 'mgmt_ip2', 'mgmt_username', 'mgmt_password')
+    _claves = ('id', 'mgmt_ip1', 'mgmt_ip2', 'mgmt_username', 'mgmt_password')
+
+    id: int
+    mgmt_ip1: str
+    mgmt_ip2: str
+    mgmt_username: str
+    mgmt_password: str
+
+
+@dataclass
+class K8sToDockerListBackupsPost(_Modelo):
+    __slots__ = ('error', 'backups')
+    _claves = ('error', 'backups')
+
+    error: Union[None, str]
+    backups: Any
+
+
+@dataclass
+class K8sToDockerMigratePost(_Modelo):
+    __slots__ = ('name', 'successfully_migrated', 'error')
+    _claves = ('name', 'successfully_migrated', 'error')
+
+    name: str
+    successfully_migrated: bool
+    error: Union[None, str]
+
+
+@dataclass
+class KerberosKeytabGet(_Modelo):
+    __slots__ = ('file', 'name', 'id')
+    _claves = ('file', 'name', 'id')
+
+    file: str
+    name: str
+    id: int
+
+
+@dataclass
+class KerberosKeytabPost(_Modelo):
+    __slots__ = ('file', 'name', 'id')
+    _claves = ('file', 'name', 'id')
+
+    file: str
+    name: str
+    id: int
+
+
+@dataclass
+class KerberosKeytabGetInstancePost(_Modelo):
+    __slots__ = ('file', 'name', 'id')
+    _claves = ('file', 'name', 'id')
+
+    file: str
+    name: str
+    id: int
+
+
+@dataclass
+class KerberosKeytabIdGet(_Modelo):
+    __slots__ = ('file', 'name', 'id')
+    _claves = ('file', 'name', 'id')
+
+    file: str
+    name: str
+    id: int
+
+
+@dataclass
+class KerberosKeytabIdPut(_Modelo):
+    __slots__ = ('file', 'name', 'id')
+    _claves = ('file', 'name', 'id')
+
+    file: str
+    name: str
+    id: int
+
+
+@dataclass
+class KerberosRealmGet(_Modelo):
+    __slots__ = ('realm', 'kdc', 'admin_server', 'kpasswd_server', 'id')
+    _claves = ('realm', 'kdc', 'admin_server', 'kpasswd_server', 'id')
+
+    realm: str
+    kdc: list
+    admin_server: list
+    kpasswd_server: list
+    id: int
+
+
+@dataclass
+class KerberosRealmPost(_Modelo):
+    __slots__ = ('realm', 'kdc', 'admin_server', 'kpasswd_server', 'id')
+    _claves = ('realm', 'kdc', 'admin_server', 'kpasswd_server', 'id')
+
+    realm: str
+    kdc: list
+    admin_server: list
+    kpasswd_server: list
+    id: int
+
+
+@dataclass
+class KerberosRealmGetInstancePost(_Modelo):
+    __slots__ = ('realm', 'kdc', 'admin_server', 'kpasswd_server', 'id')
+    _claves = ('realm', 'kdc', 'admin_server', 'kpasswd_server', 'id')
+
+    realm: str
+    kdc: list
+    admin_server: list
+    kpasswd_server: list
+    id: int
+
+
+@dataclass
+class KerberosRealmIdGet(_Modelo):
+    __slots__ = ('realm', 'kdc', 'admin_server', 'kpasswd_server', 'id')
+    _claves = ('realm', 'kdc', 'admin_server', 'kpasswd_server', 'id')
+
+    realm: str
+    kdc: list
+    admin_server: list
+    kpasswd_server: list
+    id: int
+
+
+@dataclass
+class KerberosRealmIdPut(_Modelo):
+    __slots__ = ('realm', 'kdc', 'admin_server', 'kpasswd_server', 'id')
+    _claves = ('realm', 'kdc', 'admin_server', 'kpasswd_server', 'id')
+
+    realm: str
+    kdc: list
+    admin_server: list
+    kpasswd_server: list
+    id: int
+
+
+@dataclass
+class KeychaincredentialGet(_Modelo):
+    __slots__ = ('id', 'name', 'type', 'attributes')
+    _claves = ('id', 'name', 'type', 'attributes')
+
+    id: int
+    name: str
+    type: str
+    attributes: Any
+
+
+@dataclass
+class KeychaincredentialPost(_Modelo):
+    __slots__ = ('id', 'name', 'type', 'attributes')
+    _claves = ('id', 'name', 'type', 'attributes')
+
+    id: int
+    name: str
+    type: str
+    attributes: Any
+
+
+@dataclass
+class KeychaincredentialGenerateSshKeyPairGet(_Modelo):
+    __slots__ = ('private_key', 'public_key')
+    _claves = ('private_key', 'public_key')
+
+    private_key: str
+    public_key: str
+
+
+@dataclass
+class KeychaincredentialGetInstancePost(_Modelo):
+    __slots__ = ('id', 'name', 'type', 'attributes')
+    _claves = ('id', 'name', 'type', 'attributes')
+
+    id: int
+    name: str
+    type: str
+    attributes: Any
+
+
+@dataclass
+class KeychaincredentialIdGet(_Modelo):
+    __slots__ = ('id', 'name', 'type', 'attributes')
+    _claves = ('id', 'name', 'type', 'attributes')
+
+    id: int
+    name: str
+    type: str
+    attributes: Any
+
+
+@dataclass
+class KeychaincredentialIdPut(_Modelo):
+    __slots__ = ('id', 'name', 'type', 'attributes')
+    _claves = ('id', 'name', 'type', 'attributes')
+
+    id: int
+    name: str
+    type: str
+    attributes: Any
+
+
+@dataclass
+class KeychaincredentialRemoteSshSemiautomaticSetupPost(_Modelo):
+    __slots__ = ('id', 'name', 'type', 'attributes')
+    _claves = ('id', 'name', 'type', 'attributes')
+
+    id: int
+    name: str
+    type: str
+    attributes: Any
+
+
+@dataclass
+class KeychaincredentialSetupSshConnectionPost(_Modelo):
+    __slots__ = ('id', 'name', 'type', 'attributes')
+    _claves = ('id', 'name', 'type', 'attributes')
+
+    id: int
+    name: str
+    type: str
+    attributes: Any
+
+
+@dataclass
+class KeychaincredentialUsedByPost(_Modelo):
+    __slots__ = ('unbind_method',)
+    _claves = ('unbind_method',)
+
+    unbind_method: str
+
+
+@dataclass
+class KmipGet(_Modelo):
+    __slots__ = ('id', 'enabled', 'manage_sed_disks', 'manage_zfs_keys', 'certificate', 'certificate_authority', 'port', 'server', 'ssl_version')
+    _claves = ('id', 'enabled', 'manage_sed_disks', 'manage_zfs_keys', 'certificate', 'certificate_authority', 'port', 'server', 'ssl_version')
+
+    id: int
+    enabled: bool
+    manage_sed_disks: bool
+    manage_zfs_keys: bool
+    certificate: int
+    certificate_authority: int
+    port: int
+    server: str
+    ssl_version: str
+
+
+@dataclass
+class KmipPut(_Modelo):
+    __slots__ = ('id', 'enabled', 'manage_sed_disks', 'manage_zfs_keys', 'certificate', 'certificate_authority', 'port', 'server', 'ssl_version')
+    _claves = ('id', 'enabled', 'manage_sed_disks', 'manage_zfs_keys', 'certificate', 'certificate_authority', 'port', 'server', 'ssl_version')
+
+    id: int
+    enabled: bool
+    manage_sed_disks: bool
+    manage_zfs_keys: bool
+    certificate: int
+    certificate_authority: int
+    port: int
+    server: str
+    ssl_version: str
+
+
+@dataclass
+class LdapGet(_Modelo):
+    __slots__ = ('hostname', 'basedn', 'binddn', 'bindpw', 'anonbind', 'ssl', 'certificate', 'validate_certificates', 'disable_freenas_cache', 'timeout', 'dns_timeout', 'kerberos_realm', 'kerberos_principal', 'auxiliary_parameters', 'schema', 'enable', 'search_bases', 'attribute_maps')
+    _claves = ('hostname', 'basedn', 'binddn', 'bindpw', 'anonbind', 'ssl', 'certificate', 'validate_certificates', 'disable_freenas_cache', 'timeout', 'dns_timeout', 'kerberos_realm', 'kerberos_principal', 'auxiliary_parameters', 'schema', 'enable', 'search_bases', 'attribute_maps')
+
+    hostname: list
+    basedn: str
+    binddn: str
+    bindpw: str
+    anonbind: bool
+    ssl: str
+    certificate: int
+    validate_certificates: bool
+    disable_freenas_cache: bool
+    timeout: int
+    dns_timeout: int
+    kerberos_realm: int
+    kerberos_principal: str
+    auxiliary_parameters: str
+    schema: str
+    enable: bool
+    search_bases: dict
+    attribute_maps: dict
+
+
+@dataclass
+class LdapPut(_Modelo):
+    __slots__ = ('hostname', 'basedn', 'binddn', 'bindpw', 'anonbind', 'ssl', 'certificate', 'validate_certificates', 'disable_freenas_cache', 'timeout', 'dns_timeout', 'kerberos_realm', 'kerberos_principal', 'auxiliary_parameters', 'schema', 'enable', 'search_bases', 'attribute_maps')
+    _claves = ('hostname', 'basedn', 'binddn', 'bindpw', 'anonbind', 'ssl', 'certificate', 'validate_certificates', 'disable_freenas_cache', 'timeout', 'dns_timeout', 'kerberos_realm', 'kerberos_principal', 'auxiliary_parameters', 'schema', 'enable', 'search_bases', 'attribute_maps')
+
+    hostname: list
+    basedn: str
+    binddn: str
+    bindpw: str
+    anonbind: bool
+    ssl: str
+    certificate: int
+    validate_certificates: bool
+    disable_freenas_cache: bool
+    timeout: int
+    dns_timeout: int
+    kerberos_realm: int
+    kerberos_principal: str
+    auxiliary_parameters: str
+    schema: str
+    enable: bool
+    search_bases: dict
+    attribute_maps: dict
+
+
+@dataclass
+class MailGet(_Modelo):
+    __slots__ = ('fromemail', 'fromname', 'outgoingserver', 'port', 'security', 'smtp', 'user', 'pass_', 'oauth', 'id')
+    _claves = ('fromemail', 'fromname', 'outgoingserver', 'port', 'security', 'smtp', 'user', 'pass', 'oauth', 'id')
+
+    fromemail: str
+    fromname: str
+    outgoingserver: str
+    port: int
+    security: str
+    smtp: bool
+    user: str
+    pass_: str
+    oauth: dict
+    id: int
+
+
+@dataclass
+class MailPut(_Modelo):
+    __slots__ = ('fromemail', 'fromname', 'outgoingserver', 'port', 'security', 'smtp', 'user', 'pass_', 'oauth', 'id')
+    _claves = ('fromemail', 'fromname', 'outgoingserver', 'port', 'security', 'smtp', 'user', 'pass', 'oauth', 'id')
+
+    fromemail: str
+    fromname: str
+    outgoingserver: str
+    port: int
+    security: str
+    smtp: bool
+    user: str
+    pass_: str
+    oauth: dict
+    id: int
+
+
+@dataclass
+class NetworkConfigurationGet(_Modelo):
+    __slots__ = ('id', 'hostname', 'domain', 'ipv4gateway', 'ipv6gateway', 'nameserver1', 'nameserver2', 'nameserver3', 'httpproxy', 'hosts', 'domains', 'service_announcement', 'activity', 'hostname_local', 'hostname_b', 'hostname_virtual', 'state')
+    _claves = ('id', 'hostname', 'domain', 'ipv4gateway', 'ipv6gateway', 'nameserver1', 'nameserver2', 'nameserver3', 'httpproxy', 'hosts', 'domains', 'service_announcement', 'activity', 'hostname_local', 'hostname_b', 'hostname_virtual', 'state')
+
+    id: int
+    hostname: str
+    domain: str
+    ipv4gateway: str
+    ipv6gateway: str
+    nameserver1: str
+    nameserver2: str
+    nameserver3: str
+    httpproxy: str
+    hosts: list
+    domains: list
+    service_announcement: dict
+    activity: dict
+    hostname_local: str
+    hostname_b: str
+    hostname_virtual: str
+    state: dict
+
+
+@dataclass
+class NetworkConfigurationPut(_Modelo):
+    __slots__ = ('id', 'hostname', 'domain', 'ipv4gateway', 'ipv6gateway', 'nameserver1', 'nameserver2', 'nameserver3', 'httpproxy', 'hosts', 'domains', 'service_announcement', 'activity', 'hostname_local', 'hostname_b', 'hostname_virtual', 'state')
+    _claves = ('id', 'hostname', 'domain', 'ipv4gateway', 'ipv6gateway', 'nameserver1', 'nameserver2', 'nameserver3', 'httpproxy', 'hosts', 'domains', 'service_announcement', 'activity', 'hostname_local', 'hostname_b', 'hostname_virtual', 'state')
+
+    id: int
+    hostname: str
+    domain: str
+    ipv4gateway: str
+    ipv6gateway: str
+    nameserver1: str
+    nameserver2: str
+    nameserver3: str
+    httpproxy: str
+    hosts: list
+    domains: list
+    service_announcement: dict
+    activity: dict
+    hostname_local: str
+    hostname_b: str
+    hostname_virtual: str
+    state: dict
+
+
+@dataclass
+class NetworkGeneralSummaryGet(_Modelo):
+    __slots__ = ('ips', 'default_routes', 'nameservers')
+    _claves = ('ips', 'default_routes', 'nameservers')
+
+    ips: dict
+    default_routes: list
+    nameservers: list
+
+
+@dataclass
+class NfsGet(_Modelo):
+    __slots__ = ('id', 'servers', 'allow_nonroot', 'protocols', 'v4_krb', 'v4_domain', 'bindip', 'mountd_port', 'rpcstatd_port', 'rpclockd_port', 'mountd_log', 'statd_lockd_log', 'v4_krb_enabled', 'userd_manage_gids', 'keytab_has_nfs_spn', 'managed_nfsd', 'rdma')
+    _claves = ('id', 'servers', 'allow_nonroot', 'protocols', 'v4_krb', 'v4_domain', 'bindip', 'mountd_port', 'rpcstatd_port', 'rpclockd_port', 'mountd_log', 'statd_lockd_log', 'v4_krb_enabled', 'userd_manage_gids', 'keytab_has_nfs_spn', 'managed_nfsd', 'rdma')
+
+    id: int
+    servers: Union[None, int]
+    allow_nonroot: bool
+    protocols: list
+    v4_krb: bool
+    v4_domain: str
+    bindip: list
+    mountd_port: Union[None, int]
+    rpcstatd_port: Union[None, int]
+    rpclockd_port: Union[None, int]
+    mountd_log: bool
+    statd_lockd_log: bool
+    v4_krb_enabled: bool
+    userd_manage_gids: bool
+    keytab_has_nfs_spn: bool
+    managed_nfsd: bool
+    rdma: bool
+
+
+@dataclass
+class NfsPut(_Modelo):
+    __slots__ = ('id', 'servers', 'allow_nonroot', 'protocols', 'v4_krb', 'v4_domain', 'bindip', 'mountd_port', 'rpcstatd_port', 'rpclockd_port', 'mountd_log', 'statd_lockd_log', 'v4_krb_enabled', 'userd_manage_gids', 'keytab_has_nfs_spn', 'managed_nfsd', 'rdma')
+    _claves = ('id', 'servers', 'allow_nonroot', 'protocols', 'v4_krb', 'v4_domain', 'bindip', 'mountd_port', 'rpcstatd_port', 'rpclockd_port', 'mountd_log', 'statd_lockd_log', 'v4_krb_enabled', 'userd_manage_gids', 'keytab_has_nfs_spn', 'managed_nfsd', 'rdma')
+
+    id: int
+    servers: Union[None, int]
+    allow_nonroot: bool
+    protocols: list
+    v4_krb: bool
+    v4_domain: str
+    bindip: list
+    mountd_port: Union[None, int]
+    rpcstatd_port: Union[None, int]
+    rpclockd_port: Union[None, int]
+    mountd_log: bool
+    statd_lockd_log: bool
+    v4_krb_enabled: bool
+    userd_manage_gids: bool
+    keytab_has_nfs_spn: bool
+    managed_nfsd: bool
+    rdma: bool
+
+
+@dataclass
+class NfsGetNfs4ClientsGet(_Modelo):
+    __slots__ = ('id', 'info', 'state')
+    _claves = ('id', 'info', 'state')
+
+    id: str
+    info: dict
+    state: dict
+
+
+@dataclass
+class PoolGet(_Modelo):
+    __slots__ = ('id', 'name', 'guid', 'status', 'path', 'scan', 'expand', 'is_upgraded', 'healthy', 'warning', 'status_code', 'status_detail', 'size', 'allocated', 'free', 'freeing', 'dedup_table_size', 'dedup_table_quota', 'fragmentation', 'size_str', 'allocated_str', 'free_str', 'freeing_str', 'autotrim', 'topology')
+    _claves = ('id', 'name', 'guid', 'status', 'path', 'scan', 'expand', 'is_upgraded', 'healthy', 'warning', 'status_code', 'status_detail', 'size', 'allocated', 'free', 'freeing', 'dedup_table_size', 'dedup_table_quota', 'fragmentation', 'size_str', 'allocated_str', 'free_str', 'freeing_str', 'autotrim', 'topology')
+
+    id: int
+    name: str
+    guid: str
+    status: str
+    path: str
+    scan: dict
+    expand: dict
+    is_upgraded: bool
+    healthy: bool
+    warning: bool
+    status_code: Optional[str]
+    status_detail: Optional[str]
+    size: Optional[int]
+    allocated: Optional[int]
+    free: Optional[int]
+    freeing: Optional[int]
+    dedup_table_size: Optional[int]
+    dedup_table_quota: Optional[str]
+    fragmentation: Optional[str]
+    size_str: Optional[str]
+    allocated_str: Optional[str]
+    free_str: Optional[str]
+    freeing_str: Optional[str]
+    autotrim: dict
+    topology: dict
+
+
+@dataclass
+class PoolPost(_Modelo):
+    __slots__ = ('id', 'name', 'guid', 'status', 'path', 'scan', 'expand', 'is_upgraded', 'healthy', 'warning', 'status_code', 'status_detail', 'size', 'allocated', 'free', 'freeing', 'dedup_table_size', 'dedup_table_quota', 'fragmentation', 'size_str', 'allocated_str', 'free_str', 'freeing_str', 'autotrim', 'topology')
+    _claves = ('id', 'name', 'guid', 'status', 'path', 'scan', 'expand', 'is_upgraded', 'healthy', 'warning', 'status_code', 'status_detail', 'size', 'allocated', 'free', 'freeing', 'dedup_table_size', 'dedup_table_quota', 'fragmentation', 'size_str', 'allocated_str', 'free_str', 'freeing_str', 'autotrim', 'topology')
+
+    id: int
+    name: str
+    guid: str
+    status: str
+    path: str
+    scan: dict
+    expand: dict
+    is_upgraded: bool
+    healthy: bool
+    warning: bool
+    status_code: str
+    status_detail: str
+    size: int
+    allocated: int
+    free: int
+    freeing: int
+    dedup_table_size: int
+    dedup_table_quota: str
+    fragmentation: str
+    size_str: str
+    allocated_str: str
+    free_str: str
+    freeing_str: str
+    autotrim: dict
+    topology: dict
+
+
+@dataclass
+class PoolDatasetGet(_Modelo):
+    __slots__ = ('id', 'type', 'name', 'pool', 'encrypted', 'encryption_root', 'key_loaded', 'children', 'user_properties', 'locked', 'comments', 'quota_warning', 'quota_critical', 'refquota_warning', 'refquota_critical', 'managedby', 'deduplication', 'aclmode', 'acltype', 'xattr', 'atime', 'casesensitivity', 'checksum', 'exec', 'sync', 'compression', 'compressratio', 'origin', 'quota', 'refquota', 'reservation', 'refreservation', 'copies', 'snapdir', 'readonly', 'recordsize', 'sparse', 'volsize', 'volblocksize', 'key_format', 'encryption_algorithm', 'used', 'usedbychildren', 'usedbydataset', 'usedbyrefreservation', 'usedbysnapshots', 'available', 'special_small_block_size', 'pbkdf2iters', 'creation', 'snapdev', 'mountpoint')
+    _claves = ('id', 'type', 'name', 'pool', 'encrypted', 'encryption_root', 'key_loaded', 'children', 'user_properties', 'locked', 'comments', 'quota_warning', 'quota_critical', 'refquota_warning', 'refquota_critical', 'managedby', 'deduplication', 'aclmode', 'acltype', 'xattr', 'atime', 'casesensitivity', 'checksum', 'exec', 'sync', 'compression', 'compressratio', 'origin', 'quota', 'refquota', 'reservation', 'refreservation', 'copies', 'snapdir', 'readonly', 'recordsize', 'sparse', 'volsize', 'volblocksize', 'key_format', 'encryption_algorithm', 'used', 'usedbychildren', 'usedbydataset', 'usedbyrefreservation', 'usedbysnapshots', 'available', 'special_small_block_size', 'pbkdf2iters', 'creation', 'snapdev', 'mountpoint')
+
+    id: str
+    type: str
+    name: str
+    pool: str
+    encrypted: bool
+    encryption_root: Optional[str]
+    key_loaded: Optional[bool]
+    children: list
+    user_properties: dict
+    locked: bool
+    comments: dict
+    quota_warning: dict
+    quota_critical: dict
+    refquota_warning: dict
+    refquota_critical: dict
+    managedby: dict
+    deduplication: dict
+    aclmode: dict
+    acltype: dict
+    xattr: dict
+    atime: dict
+    casesensitivity: dict
+    checksum: dict
+    exec: dict
+    sync: dict
+    compression: dict
+    compressratio: dict
+    origin: dict
+    quota: dict
+    refquota: dict
+    reservation: dict
+    refreservation: dict
+    copies: dict
+    snapdir: dict
+    readonly: dict
+    recordsize: dict
+    sparse: dict
+    volsize: dict
+    volblocksize: dict
+    key_format: dict
+    encryption_algorithm: dict
+    used: dict
+    usedbychildren: dict
+    usedbydataset: dict
+    usedbyrefreservation: dict
+    usedbysnapshots: dict
+    available: dict
+    special_small_block_size: dict
+    pbkdf2iters: dict
+    creation: dict
+    snapdev: dict
+    mountpoint: Optional[str]
+
+
+@dataclass
+class PoolDatasetPost(_Modelo):
+    __slots__ = ('id', 'type', 'name', 'pool', 'encrypted', 'encryption_root', 'key_loaded', 'children', 'user_properties', 'locked', 'comments', 'quota_warning', 'quota_critical', 'refquota_warning', 'refquota_critical', 'managedby', 'deduplication', 'aclmode', 'acltype', 'xattr', 'atime', 'casesensitivity', 'checksum', 'exec', 'sync', 'compression', 'compressratio', 'origin', 'quota', 'refquota', 'reservation', 'refreservation', 'copies', 'snapdir', 'readonly', 'recordsize', 'sparse', 'volsize', 'volblocksize', 'key_format', 'encryption_algorithm', 'used', 'usedbychildren', 'usedbydataset', 'usedbyrefreservation', 'usedbysnapshots', 'available', 'special_small_block_size', 'pbkdf2iters', 'creation', 'snapdev', 'mountpoint')
+    _claves = ('id', 'type', 'name', 'pool', 'encrypted', 'encryption_root', 'key_loaded', 'children', 'user_properties', 'locked', 'comments', 'quota_warning', 'quota_critical', 'refquota_warning', 'refquota_critical', 'managedby', 'deduplication', 'aclmode', 'acltype', 'xattr', 'atime', 'casesensitivity', 'checksum', 'exec', 'sync', 'compression', 'compressratio', 'origin', 'quota', 'refquota', 'reservation', 'refreservation', 'copies', 'snapdir', 'readonly', 'recordsize', 'sparse', 'volsize', 'volblocksize', 'key_format', 'encryption_algorithm', 'used', 'usedbychildren', 'usedbydataset', 'usedbyrefreservation', 'usedbysnapshots', 'available', 'special_small_block_size', 'pbkdf2iters', 'creation', 'snapdev', 'mountpoint')
+
+    id: str
+    type: str
+    name: str
+    pool: str
+    encrypted: bool
+    encryption_root: str
+    key_loaded: bool
+    children: list
+    user_properties: dict
+    locked: bool
+    comments: dict
+    quota_warning: dict
+    quota_critical: dict
+    refquota_warning: dict
+    refquota_critical: dict
+    managedby: dict
+    deduplication: dict
+    aclmode: dict
+    acltype: dict
+    xattr: dict
+    atime: dict
+    casesensitivity: dict
+    checksum: dict
+    exec: dict
+    sync: dict
+    compression: dict
+    compressratio: dict
+    origin: dict
+    quota: dict
+    refquota: dict
+    reservation: dict
+    refreservation: dict
+    copies: dict
+    snapdir: dict
+    readonly: dict
+    recordsize: dict
+    sparse: dict
+    volsize: dict
+    volblocksize: dict
+    key_format: dict
+    encryption_algorithm: dict
+    used: dict
+    usedbychildren: dict
+    usedbydataset: dict
+    usedbyrefreservation: dict
+    usedbysnapshots: dict
+    available: dict
+    special_small_block_size: dict
+    pbkdf2iters: dict
+    creation: dict
+    snapdev: dict
+    mountpoint: str
+
+
+@dataclass
+class PoolDatasetChecksumChoicesGet(_Modelo):
+    __slots__ = ('ON', 'FLETCHER2', 'FLETCHER4', 'SHA256', 'SHA512', 'SKEIN', 'EDONR', 'BLAKE3')
+    _claves = ('ON', 'FLETCHER2', 'FLETCHER4', 'SHA256', 'SHA512', 'SKEIN', 'EDONR', 'BLAKE3')
+
+    ON: str
+    FLETCHER2: str
+    FLETCHER4: str
+    SHA256: str
+    SHA512: str
+    SKEIN: str
+    EDONR: str
+    BLAKE3: str
+
+
+@dataclass
+class PoolDatasetCompressionChoicesGet(_Modelo):
+    __slots__ = ('ON', 'OFF', 'LZ4', 'GZIP', 'GZIP_1', 'GZIP_9', 'ZSTD', 'ZSTD_FAST', 'ZLE', 'LZJB', 'ZSTD_1', 'ZSTD_2', 'ZSTD_3', 'ZSTD_4', 'ZSTD_5', 'ZSTD_6', 'ZSTD_7', 'ZSTD_8', 'ZSTD_9', 'ZSTD_10', 'ZSTD_11', 'ZSTD_12', 'ZSTD_13', 'ZSTD_14', 'ZSTD_15', 'ZSTD_16', 'ZSTD_17', 'ZSTD_18', 'ZSTD_19', 'ZSTD_FAST_1', 'ZSTD_FAST_2', 'ZSTD_FAST_3', 'ZSTD_FAST_4', 'ZSTD_FAST_5', 'ZSTD_FAST_6', 'ZSTD_FAST_7', 'ZSTD_FAST_8', 'ZSTD_FAST_9', 'ZSTD_FAST_10', 'ZSTD_FAST_20', 'ZSTD_FAST_30', 'ZSTD_FAST_40', 'ZSTD_FAST_50', 'ZSTD_FAST_60', 'ZSTD_FAST_70', 'ZSTD_FAST_80', 'ZSTD_FAST_90', 'ZSTD_FAST_100', 'ZSTD_FAST_500', 'ZSTD_FAST_1000')
+    _claves = ('ON', 'OFF', 'LZ4', 'GZIP', 'GZIP-1', 'GZIP-9', 'ZSTD', 'ZSTD-FAST', 'ZLE', 'LZJB', 'ZSTD-1', 'ZSTD-2', 'ZSTD-3', 'ZSTD-4', 'ZSTD-5', 'ZSTD-6', 'ZSTD-7', 'ZSTD-8', 'ZSTD-9', 'ZSTD-10', 'ZSTD-11', 'ZSTD-12', 'ZSTD-13', 'ZSTD-14', 'ZSTD-15', 'ZSTD-16', 'ZSTD-17', 'ZSTD-18', 'ZSTD-19', 'ZSTD-FAST-1', 'ZSTD-FAST-2', 'ZSTD-FAST-3', 'ZSTD-FAST-4', 'ZSTD-FAST-5', 'ZSTD-FAST-6', 'ZSTD-FAST-7', 'ZSTD-FAST-8', 'ZSTD-FAST-9', 'ZSTD-FAST-10', 'ZSTD-FAST-20', 'ZSTD-FAST-30', 'ZSTD-FAST-40', 'ZSTD-FAST-50', 'ZSTD-FAST-60', 'ZSTD-FAST-70', 'ZSTD-FAST-80', 'ZSTD-FAST-90', 'ZSTD-FAST-100', 'ZSTD-FAST-500', 'ZSTD-FAST-1000')
+
+    ON: str
+    OFF: str
+    LZ4: str
+    GZIP: str
+    GZIP_1: str
+    GZIP_9: str
+    ZSTD: str
+    ZSTD_FAST: str
+    ZLE: str
+    LZJB: str
+    ZSTD_1: str
+    ZSTD_2: str
+    ZSTD_3: str
+    ZSTD_4: str
+    ZSTD_5: str
+    ZSTD_6: str
+    ZSTD_7: str
+    ZSTD_8: str
+    ZSTD_9: str
+    ZSTD_10: str
+    ZSTD_11: str
+    ZSTD_12: str
+    ZSTD_13: str
+    ZSTD_14: str
+    ZSTD_15: str
+    ZSTD_16: str
+    ZSTD_17: str
+    ZSTD_18: str
+    ZSTD_19: str
+    ZSTD_FAST_1: str
+    ZSTD_FAST_2: str
+    ZSTD_FAST_3: str
+    ZSTD_FAST_4: str
+    ZSTD_FAST_5: str
+    ZSTD_FAST_6: str
+    ZSTD_FAST_7: str
+    ZSTD_FAST_8: str
+    ZSTD_FAST_9: str
+    ZSTD_FAST_10: str
+    ZSTD_FAST_20: str
+    ZSTD_FAST_30: str
+    ZSTD_FAST_40: str
+    ZSTD_FAST_50: str
+    ZSTD_FAST_60: str
+    ZSTD_FAST_70: str
+    ZSTD_FAST_80: str
+    ZSTD_FAST_90: str
+    ZSTD_FAST_100: str
+    ZSTD_FAST_500: str
+    ZSTD_FAST_1000: str
+
+
+@dataclass
+class PoolDatasetEncryptionAlgorithmChoicesGet(_Modelo):
+    __slots__ = ('AES_128_CCM', 'AES_192_CCM', 'AES_256_CCM', 'AES_128_GCM', 'AES_192_GCM', 'AES_256_GCM')
+    _claves = ('AES-128-CCM', 'AES-192-CCM', 'AES-256-CCM', 'AES-128-GCM', 'AES-192-GCM', 'AES-256-GCM')
+
+    AES_128_CCM: str
+    AES_192_CCM: str
+    AES_256_CCM: str
+    AES_128_GCM: str
+    AES_192_GCM: str
+    AES_256_GCM: str
+
+
+@dataclass
+class PoolDatasetEncryptionSummaryPost(_Modelo):
+    __slots__ = ('name', 'key_format', 'key_present_in_database', 'valid_key', 'locked', 'unlock_error', 'unlock_successful')
+    _claves = ('name', 'key_format', 'key_present_in_database', 'valid_key', 'locked', 'unlock_error', 'unlock_successful')
+
+    name: str
+    key_format: str
+    key_present_in_database: bool
+    valid_key: bool
+    locked: bool
+    unlock_error: Optional[str]
+    unlock_successful: bool
+
+
+@dataclass
+class PoolDatasetGetInstancePost(_Modelo):
+    __slots__ = ('id', 'type', 'name', 'pool', 'encrypted', 'encryption_root', 'key_loaded', 'children', 'user_properties', 'locked', 'comments', 'quota_warning', 'quota_critical', 'refquota_warning', 'refquota_critical', 'managedby', 'deduplication', 'aclmode', 'acltype', 'xattr', 'atime', 'casesensitivity', 'checksum', 'exec', 'sync', 'compression', 'compressratio', 'origin', 'quota', 'refquota', 'reservation', 'refreservation', 'copies', 'snapdir', 'readonly', 'recordsize', 'sparse', 'volsize', 'volblocksize', 'key_format', 'encryption_algorithm', 'used', 'usedbychildren', 'usedbydataset', 'usedbyrefreservation', 'usedbysnapshots', 'available', 'special_small_block_size', 'pbkdf2iters', 'creation', 'snapdev', 'mountpoint')
+    _claves = ('id', 'type', 'name', 'pool', 'encrypted', 'encryption_root', 'key_loaded', 'children', 'user_properties', 'locked', 'comments', 'quota_warning', 'quota_critical', 'refquota_warning', 'refquota_critical', 'managedby', 'deduplication', 'aclmode', 'acltype', 'xattr', 'atime', 'casesensitivity', 'checksum', 'exec', 'sync', 'compression', 'compressratio', 'origin', 'quota', 'refquota', 'reservation', 'refreservation', 'copies', 'snapdir', 'readonly', 'recordsize', 'sparse', 'volsize', 'volblocksize', 'key_format', 'encryption_algorithm', 'used', 'usedbychildren', 'usedbydataset', 'usedbyrefreservation', 'usedbysnapshots', 'available', 'special_small_block_size', 'pbkdf2iters', 'creation', 'snapdev', 'mountpoint')
+
+    id: str
+    type: str
+    name: str
+    pool: str
+    encrypted: bool
+    encryption_root: str
+    key_loaded: bool
+    children: list
+    user_properties: dict
+    locked: bool
+    comments: dict
+    quota_warning: dict
+    quota_critical: dict
+    refquota_warning: dict
+    refquota_critical: dict
+    managedby: dict
+    deduplication: dict
+    aclmode: dict
+    acltype: dict
+    xattr: dict
+    atime: dict
+    casesensitivity: dict
+    checksum: dict
+    exec: dict
+    sync: dict
+    compression: dict
+    compressratio: dict
+    origin: dict
+    quota: dict
+    refquota: dict
+    reservation: dict
+    refreservation: dict
+    copies: dict
+    snapdir: dict
+    readonly: dict
+    recordsize: dict
+    sparse: dict
+    volsize: dict
+    volblocksize: dict
+    key_format: dict
+    encryption_algorithm: dict
+    used: dict
+    usedbychildren: dict
+    usedbydataset: dict
+    usedbyrefreservation: dict
+    usedbysnapshots: dict
+    available: dict
+    special_small_block_size: dict
+    pbkdf2iters: dict
+    creation: dict
+    snapdev: dict
+    mountpoint: str
+
+
+@dataclass
+class PoolDatasetIdGet(_Modelo):
+    __slots__ = ('id', 'type', 'name', 'pool', 'encrypted', 'encryption_root', 'key_loaded', 'children', 'user_properties', 'locked', 'comments', 'quota_warning', 'quota_critical', 'refquota_warning', 'refquota_critical', 'managedby', 'deduplication', 'aclmode', 'acltype', 'xattr', 'atime', 'casesensitivity', 'checksum', 'exec', 'sync', 'compression', 'compressratio', 'origin', 'quota', 'refquota', 'reservation', 'refreservation', 'copies', 'snapdir', 'readonly', 'recordsize', 'sparse', 'volsize', 'volblocksize', 'key_format', 'encryption_algorithm', 'used', 'usedbychildren', 'usedbydataset', 'usedbyrefreservation', 'usedbysnapshots', 'available', 'special_small_block_size', 'pbkdf2iters', 'creation', 'snapdev', 'mountpoint')
+    _claves = ('id', 'type', 'name', 'pool', 'encrypted', 'encryption_root', 'key_loaded', 'children', 'user_properties', 'locked', 'comments', 'quota_warning', 'quota_critical', 'refquota_warning', 'refquota_critical', 'managedby', 'deduplication', 'aclmode', 'acltype', 'xattr', 'atime', 'casesensitivity', 'checksum', 'exec', 'sync', 'compression', 'compressratio', 'origin', 'quota', 'refquota', 'reservation', 'refreservation', 'copies', 'snapdir', 'readonly', 'recordsize', 'sparse', 'volsize', 'volblocksize', 'key_format', 'encryption_algorithm', 'used', 'usedbychildren', 'usedbydataset', 'usedbyrefreservation', 'usedbysnapshots', 'available', 'special_small_block_size', 'pbkdf2iters', 'creation', 'snapdev', 'mountpoint')
+
+    id: str
+    type: str
+    name: str
+    pool: str
+    encrypted: bool
+    encryption_root: Optional[str]
+    key_loaded: Optional[bool]
+    children: list
+    user_properties: dict
+    locked: bool
+    comments: dict
+    quota_warning: dict
+    quota_critical: dict
+    refquota_warning: dict
+    refquota_critical: dict
+    managedby: dict
+    deduplication: dict
+    aclmode: dict
+    acltype: dict
+    xattr: dict
+    atime: dict
+    casesensitivity: dict
+    checksum: dict
+    exec: dict
+    sync: dict
+    compression: dict
+    compressratio: dict
+    origin: dict
+    quota: dict
+    refquota: dict
+    reservation: dict
+    refreservation: dict
+    copies: dict
+    snapdir: dict
+    readonly: dict
+    recordsize: dict
+    sparse: dict
+    volsize: dict
+    volblocksize: dict
+    key_format: dict
+    encryption_algorithm: dict
+    used: dict
+    usedbychildren: dict
+    usedbydataset: dict
+    usedbyrefreservation: dict
+    usedbysnapshots: dict
+    available: dict
+    special_small_block_size: dict
+    pbkdf2iters: dict
+    creation: dict
+    snapdev: dict
+    mountpoint: Optional[str]
+
+
+@dataclass
+class PoolDatasetIdPut(_Modelo):
+    __slots__ = ('id', 'type', 'name', 'pool', 'encrypted', 'encryption_root', 'key_loaded', 'children', 'user_properties', 'locked', 'comments', 'quota_warning', 'quota_critical', 'refquota_warning', 'refquota_critical', 'managedby', 'deduplication', 'aclmode', 'acltype', 'xattr', 'atime', 'casesensitivity', 'checksum', 'exec', 'sync', 'compression', 'compressratio', 'origin', 'quota', 'refquota', 'reservation', 'refreservation', 'copies', 'snapdir', 'readonly', 'recordsize', 'sparse', 'volsize', 'volblocksize', 'key_format', 'encryption_algorithm', 'used', 'usedbychildren', 'usedbydataset', 'usedbyrefreservation', 'usedbysnapshots', 'available', 'special_small_block_size', 'pbkdf2iters', 'creation', 'snapdev', 'mountpoint')
+    _claves = ('id', 'type', 'name', 'pool', 'encrypted', 'encryption_root', 'key_loaded', 'children', 'user_properties', 'locked', 'comments', 'quota_warning', 'quota_critical', 'refquota_warning', 'refquota_critical', 'managedby', 'deduplication', 'aclmode', 'acltype', 'xattr', 'atime', 'casesensitivity', 'checksum', 'exec', 'sync', 'compression', 'compressratio', 'origin', 'quota', 'refquota', 'reservation', 'refreservation', 'copies', 'snapdir', 'readonly', 'recordsize', 'sparse', 'volsize', 'volblocksize', 'key_format', 'encryption_algorithm', 'used', 'usedbychildren', 'usedbydataset', 'usedbyrefreservation', 'usedbysnapshots', 'available', 'special_small_block_size', 'pbkdf2iters', 'creation', 'snapdev', 'mountpoint')
+
+    id: str
+    type: str
+    name: str
+    pool: str
+    encrypted: bool
+    encryption_root: str
+    key_loaded: bool
+    children: list
+    user_properties: dict
+    locked: bool
+    comments: dict
+    quota_warning: dict
+    quota_critical: dict
+    refquota_warning: dict
+    refquota_critical: dict
+    managedby: dict
+    deduplication: dict
+    aclmode: dict
+    acltype: dict
+    xattr: dict
+    atime: dict
+    casesensitivity: dict
+    checksum: dict
+    exec: dict
+    sync: dict
+    compression: dict
+    compressratio: dict
+    origin: dict
+    quota: dict
+    refquota: dict
+    reservation: dict
+    refreservation: dict
+    copies: dict
+    snapdir: dict
+    readonly: dict
+    recordsize: dict
+    sparse: dict
+    volsize: dict
+    volblocksize: dict
+    key_format: dict
+    encryption_algorithm: dict
+    used: dict
+    usedbychildren: dict
+    usedbydataset: dict
+    usedbyrefreservation: dict
+    usedbysnapshots: dict
+    available: dict
+    special_small_block_size: dict
+    pbkdf2iters: dict
+    creation: dict
+    snapdev: dict
+    mountpoint: str
+
+
+@dataclass
+class PoolDatasetIdAttachmentsPost(_Modelo):
+    __slots__ = ('type', 'service', 'attachments')
+    _claves = ('type', 'service', 'attachments')
+
+    type: str
+    service: Optional[str]
+    attachments: list
+
+
+@dataclass
+class PoolDatasetIdProcessesPost(_Modelo):
+    __slots__ = ('pid', 'name', 'service', 'cmdline')
+    _claves = ('pid', 'name', 'service', 'cmdline')
+
+    pid: int
+    name: str
+    service: str
+    cmdline: str
+
+
+@dataclass
+class PoolDatasetUnlockPost(_Modelo):
+    __slots__ = ('unlocked', 'failed')
+    _claves = ('unlocked', 'failed')
+
+    unlocked: list
+    failed: dict
+
+
+@dataclass
+class PoolGetInstancePost(_Modelo):
+    __slots__ = ('id', 'name', 'guid', 'status', 'path', 'scan', 'expand', 'is_upgraded', 'healthy', 'warning', 'status_code', 'status_detail', 'size', 'allocated', 'free', 'freeing', 'dedup_table_size', 'dedup_table_quota', 'fragmentation', 'size_str', 'allocated_str', 'free_str', 'freeing_str', 'autotrim', 'topology')
+    _claves = ('id', 'name', 'guid', 'status', 'path', 'scan', 'expand', 'is_upgraded', 'healthy', 'warning', 'status_code', 'status_detail', 'size', 'allocated', 'free', 'freeing', 'dedup_table_size', 'dedup_table_quota', 'fragmentation', 'size_str', 'allocated_str', 'free_str', 'freeing_str', 'autotrim', 'topology')
+
+    id: int
+    name: str
+    guid: str
+    status: str
+    path: str
+    scan: dict
+    expand: dict
+    is_upgraded: bool
+    healthy: bool
+    warning: bool
+    status_code: str
+    status_detail: str
+    size: int
+    allocated: int
+    free: int
+    freeing: int
+    dedup_table_size: int
+    dedup_table_quota: str
+    fragmentation: str
+    size_str: str
+    allocated_str: str
+    free_str: str
+    freeing_str: str
+    autotrim: dict
+    topology: dict
+
+
+@dataclass
+class PoolIdGet(_Modelo):
+    __slots__ = ('id', 'name', 'guid', 'status', 'path', 'scan', 'expand', 'is_upgraded', 'healthy', 'warning', 'status_code', 'status_detail', 'size', 'allocated', 'free', 'freeing', 'dedup_table_size', 'dedup_table_quota', 'fragmentation', 'size_str', 'allocated_str', 'free_str', 'freeing_str', 'autotrim', 'topology')
+    _claves = ('id', 'name', 'guid', 'status', 'path', 'scan', 'expand', 'is_upgraded', 'healthy', 'warning', 'status_code', 'status_detail', 'size', 'allocated', 'free', 'freeing', 'dedup_table_size', 'dedup_table_quota', 'fragmentation', 'size_str', 'allocated_str', 'free_str', 'freeing_str', 'autotrim', 'topology')
+
+    id: int
+    name: str
+    guid: str
+    status: str
+    path: str
+    scan: dict
+    expand: dict
+    is_upgraded: bool
+    healthy: bool
+    warning: bool
+    status_code: Optional[str]
+    status_detail: Optional[str]
+    size: Optional[int]
+    allocated: Optional[int]
+    free: Optional[int]
+    freeing: Optional[int]
+    dedup_table_size: Optional[int]
+    dedup_table_quota: Optional[str]
+    fragmentation: Optional[str]
+    size_str: Optional[str]
+    allocated_str: Optional[str]
+    free_str: Optional[str]
+    freeing_str: Optional[str]
+    autotrim: dict
+    topology: dict
+
+
+@dataclass
+class PoolIdPut(_Modelo):
+    __slots__ = ('id', 'name', 'guid', 'status', 'path', 'scan', 'expand', 'is_upgraded', 'healthy', 'warning', 'status_code', 'status_detail', 'size', 'allocated', 'free', 'freeing', 'dedup_table_size', 'dedup_table_quota', 'fragmentation', 'size_str', 'allocated_str', 'free_str', 'freeing_str', 'autotrim', 'topology')
+    _claves = ('id', 'name', 'guid', 'status', 'path', 'scan', 'expand', 'is_upgraded', 'healthy', 'warning', 'status_code', 'status_detail', 'size', 'allocated', 'free', 'freeing', 'dedup_table_size', 'dedup_table_quota', 'fragmentation', 'size_str', 'allocated_str', 'free_str', 'freeing_str', 'autotrim', 'topology')
+
+    id: int
+    name: str
+    guid: str
+    status: str
+    path: str
+    scan: dict
+    expand: dict
+    is_upgraded: bool
+    healthy: bool
+    warning: bool
+    status_code: str
+    status_detail: str
+    size: int
+    allocated: int
+    free: int
+    freeing: int
+    dedup_table_size: int
+    dedup_table_quota: str
+    fragmentation: str
+    size_str: str
+    allocated_str: str
+    free_str: str
+    freeing_str: str
+    autotrim: dict
+    topology: dict
+
+
+@dataclass
+class PoolIdAttachmentsPost(_Modelo):
+    __slots__ = ('type', 'service', 'attachments')
+    _claves = ('type', 'service', 'attachments')
+
+    type: str
+    service: Optional[str]
+    attachments: list
+
+
+@dataclass
+class PoolIdProcessesPost(_Modelo):
+    __slots__ = ('pid', 'name', 'service', 'cmdline')
+    _claves = ('pid', 'name', 'service', 'cmdline')
+
+    pid: int
+    name: str
+    service: str
+    cmdline: str
+
+
+@dataclass
+class PoolImportFindGet(_Modelo):
+    __slots__ = ('name', 'guid', 'status', 'hostname')
+    _claves = ('name', 'guid', 'status', 'hostname')
+
+    name: str
+    guid: str
+    status: str
+    hostname: str
+
+
+@dataclass
+class PoolResilverGet(_Modelo):
+    __slots__ = ('id', 'begin', 'end', 'enabled', 'weekday')
+    _claves = ('id', 'begin', 'end', 'enabled', 'weekday')
+
+    id: int
+    begin: str
+    end: str
+    enabled: bool
+    weekday: list
+
+
+@dataclass
+class PoolResilverPut(_Modelo):
+    __slots__ = ('id', 'begin', 'end', 'enabled', 'weekday')
+    _claves = ('id', 'begin', 'end', 'enabled', 'weekday')
+
+    id: int
+    begin: str
+    end: str
+    enabled: bool
+    weekday: list
+
+
+@dataclass
+class PoolScrubGet(_Modelo):
+    __slots__ = ('pool', 'threshold', 'schedule', 'enabled', 'id', 'pool_name')
+    _claves = ('pool', 'threshold', 'schedule', 'enabled', 'id', 'pool_name')
+
+    pool: int
+    threshold: int
+    schedule: Any
+    enabled: bool
+    id: int
+    pool_name: str
+
+
+@dataclass
+class PoolScrubPost(_Modelo):
+    __slots__ = ('pool', 'threshold', 'schedule', 'enabled', 'id', 'pool_name')
+    _claves = ('pool', 'threshold', 'schedule', 'enabled', 'id', 'pool_name')
+
+    pool: int
+    threshold: int
+    schedule: Any
+    enabled: bool
+    id: int
+    pool_name: str
+
+
+@dataclass
+class PoolScrubGetInstancePost(_Modelo):
+    __slots__ = ('pool', 'threshold', 'schedule', 'enabled', 'id', 'pool_name')
+    _claves = ('pool', 'threshold', 'schedule', 'enabled', 'id', 'pool_name')
+
+    pool: int
+    threshold: int
+    schedule: Any
+    enabled: bool
+    id: int
+    pool_name: str
+
+
+@dataclass
+class PoolScrubIdGet(_Modelo):
+    __slots__ = ('pool', 'threshold', 'schedule', 'enabled', 'id', 'pool_name')
+    _claves = ('pool', 'threshold', 'schedule', 'enabled', 'id', 'pool_name')
+
+    pool: int
+    threshold: int
+    schedule: Any
+    enabled: bool
+    id: int
+    pool_name: str
+
+
+@dataclass
+class PoolScrubIdPut(_Modelo):
+    __slots__ = ('pool', 'threshold', 'schedule', 'enabled', 'id', 'pool_name')
+    _claves = ('pool', 'threshold', 'schedule', 'enabled', 'id', 'pool_name')
+
+    pool: int
+    threshold: int
+    schedule: Any
+    enabled: bool
+    id: int
+    pool_name: str
+
+
+@dataclass
+class PoolSnapshottaskGet(_Modelo):
+    __slots__ = ('dataset', 'recursive', 'lifetime_value', 'lifetime_unit', 'enabled', 'exclude', 'naming_schema', 'allow_empty', 'schedule', 'id', 'vmware_sync', 'state')
+    _claves = ('dataset', 'recursive', 'lifetime_value', 'lifetime_unit', 'enabled', 'exclude', 'naming_schema', 'allow_empty', 'schedule', 'id', 'vmware_sync', 'state')
+
+    dataset: str
+    recursive: bool
+    lifetime_value: int
+    lifetime_unit: str
+    enabled: bool
+    exclude: list
+    naming_schema: str
+    allow_empty: bool
+    schedule: Any
+    id: int
+    vmware_sync: bool
+    state: Any
+
+
+@dataclass
+class PoolSnapshottaskPost(_Modelo):
+    __slots__ = ('dataset', 'recursive', 'lifetime_value', 'lifetime_unit', 'enabled', 'exclude', 'naming_schema', 'allow_empty', 'schedule', 'id', 'vmware_sync', 'state')
+    _claves = ('dataset', 'recursive', 'lifetime_value', 'lifetime_unit', 'enabled', 'exclude', 'naming_schema', 'allow_empty', 'schedule', 'id', 'vmware_sync', 'state')
+
+    dataset: str
+    recursive: bool
+    lifetime_value: int
+    lifetime_unit: str
+    enabled: bool
+    exclude: list
+    naming_schema: str
+    allow_empty: bool
+    schedule: Any
+    id: int
+    vmware_sync: bool
+    state: Any
+
+
+@dataclass
+class PoolSnapshottaskGetInstancePost(_Modelo):
+    __slots__ = ('dataset', 'recursive', 'lifetime_value', 'lifetime_unit', 'enabled', 'exclude', 'naming_schema', 'allow_empty', 'schedule', 'id', 'vmware_sync', 'state')
+    _claves = ('dataset', 'recursive', 'lifetime_value', 'lifetime_unit', 'enabled', 'exclude', 'naming_schema', 'allow_empty', 'schedule', 'id', 'vmware_sync', 'state')
+
+    dataset: str
+    recursive: bool
+    lifetime_value: int
+    lifetime_unit: str
+    enabled: bool
+    exclude: list
+    naming_schema: str
+    allow_empty: bool
+    schedule: Any
+    id: int
+    vmware_sync: bool
+    state: Any
+
+
+@dataclass
+class PoolSnapshottaskIdGet(_Modelo):
+    __slots__ = ('dataset', 'recursive', 'lifetime_value', 'lifetime_unit', 'enabled', 'exclude', 'naming_schema', 'allow_empty', 'schedule', 'id', 'vmware_sync', 'state')
+    _claves = ('dataset', 'recursive', 'lifetime_value', 'lifetime_unit', 'enabled', 'exclude', 'naming_schema', 'allow_empty', 'schedule', 'id', 'vmware_sync', 'state')
+
+    dataset: str
+    recursive: bool
+    lifetime_value: int
+    lifetime_unit: str
+    enabled: bool
+    exclude: list
+    naming_schema: str
+    allow_empty: bool
+    schedule: Any
+    id: int
+    vmware_sync: bool
+    state: Any
+
+
+@dataclass
+class PoolSnapshottaskIdPut(_Modelo):
+    __slots__ = ('dataset', 'recursive', 'lifetime_value', 'lifetime_unit', 'enabled', 'exclude', 'naming_schema', 'allow_empty', 'schedule', 'id', 'vmware_sync', 'state')
+    _claves = ('dataset', 'recursive', 'lifetime_value', 'lifetime_unit', 'enabled', 'exclude', 'naming_schema', 'allow_empty', 'schedule', 'id', 'vmware_sync', 'state')
+
+    dataset: str
+    recursive: bool
+    lifetime_value: int
+    lifetime_unit: str
+    enabled: bool
+    exclude: list
+    naming_schema: str
+    allow_empty: bool
+    schedule: Any
+    id: int
+    vmware_sync: bool
+    state: Any
+
+
+@dataclass
+class PrivilegeGet(_Modelo):
+    __slots__ = ('id', 'builtin_name', 'name', 'local_groups', 'ds_groups', 'roles', 'web_shell')
+    _claves = ('id', 'builtin_name', 'name', 'local_groups', 'ds_groups', 'roles', 'web_shell')
+
+    id: int
+    builtin_name: Union[None, str]
+    name: str
+    local_groups: list
+    ds_groups: list
+    roles: list
+    web_shell: bool
+
+
+@dataclass
+class PrivilegePost(_Modelo):
+    __slots__ = ('id', 'builtin_name', 'name', 'local_groups', 'ds_groups', 'roles', 'web_shell')
+    _claves = ('id', 'builtin_name', 'name', 'local_groups', 'ds_groups', 'roles', 'web_shell')
+
+    id: int
+    builtin_name: Union[None, str]
+    name: str
+    local_groups: list
+    ds_groups: list
+    roles: list
+    web_shell: bool
+
+
+@dataclass
+class PrivilegeGetInstancePost(_Modelo):
+    __slots__ = ('id', 'builtin_name', 'name', 'local_groups', 'ds_groups', 'roles', 'web_shell')
+    _claves = ('id', 'builtin_name', 'name', 'local_groups', 'ds_groups', 'roles', 'web_shell')
+
+    id: int
+    builtin_name: Union[None, str]
+    name: str
+    local_groups: list
+    ds_groups: list
+    roles: list
+    web_shell: bool
+
+
+@dataclass
+class PrivilegeIdGet(_Modelo):
+    __slots__ = ('id', 'builtin_name', 'name', 'local_groups', 'ds_groups', 'roles', 'web_shell')
+    _claves = ('id', 'builtin_name', 'name', 'local_groups', 'ds_groups', 'roles', 'web_shell')
+
+    id: int
+    builtin_name: Union[None, str]
+    name: str
+    local_groups: list
+    ds_groups: list
+    roles: list
+    web_shell: bool
+
+
+@dataclass
+class PrivilegeIdPut(_Modelo):
+    __slots__ = ('id', 'builtin_name', 'name', 'local_groups', 'ds_groups', 'roles', 'web_shell')
+    _claves = ('id', 'builtin_name', 'name', 'local_groups', 'ds_groups', 'roles', 'web_shell')
+
+    id: int
+    builtin_name: Union[None, str]
+    name: str
+    local_groups: list
+    ds_groups: list
+    roles: list
+    web_shell: bool
+
+
+@dataclass
+class PrivilegeRolesGet(_Modelo):
+    __slots__ = ('name', 'includes', 'builtin', 'stig')
+    _claves = ('name', 'includes', 'builtin', 'stig')
+
+    name: str
+    includes: list
+    builtin: bool
+    stig: Any
+
+
+@dataclass
+class ReplicationCountEligibleManualSnapshotsPost(_Modelo):
+    __slots__ = ('total', 'eligible')
+    _claves = ('total', 'eligible')
+
+    total: int
+    eligible: int
+
+
+@dataclass
+class ReportingGet(_Modelo):
+    __slots__ = ('id', 'tier0_days', 'tier1_days', 'tier1_update_interval')
+    _claves = ('id', 'tier0_days', 'tier1_days', 'tier1_update_interval')
+
+    id: int
+    tier0_days: int
+    tier1_days: int
+    tier1_update_interval: int
+
+
+@dataclass
+class ReportingPut(_Modelo):
+    __slots__ = ('id', 'tier0_days', 'tier1_days', 'tier1_update_interval')
+    _claves = ('id', 'tier0_days', 'tier1_days', 'tier1_update_interval')
+
+    id: int
+    tier0_days: int
+    tier1_days: int
+    tier1_update_interval: int
+
+
+@dataclass
+class ReportingExportersGet(_Modelo):
+    __slots__ = ('id', 'enabled', 'attributes', 'name')
+    _claves = ('id', 'enabled', 'attributes', 'name')
+
+    id: int
+    enabled: bool
+    attributes: Any
+    name: str
+
+
+@dataclass
+class ReportingExportersPost(_Modelo):
+    __slots__ = ('id', 'enabled', 'attributes', 'name')
+    _claves = ('id', 'enabled', 'attributes', 'name')
+
+    id: int
+    enabled: bool
+    attributes: Any
+    name: str
+
+
+@dataclass
+class ReportingExportersExporterSchemasGet(_Modelo):
+    __slots__ = ('key', 'schema')
+    _claves = ('key', 'schema')
+
+    key: str
+    schema: list
+
+
+@dataclass
+class ReportingExportersGetInstancePost(_Modelo):
+    __slots__ = ('id', 'enabled', 'attributes', 'name')
+    _claves = ('id', 'enabled', 'attributes', 'name')
+
+    id: int
+    enabled: bool
+    attributes: Any
+    name: str
+
+
+@dataclass
+class ReportingExportersIdGet(_Modelo):
+    __slots__ = ('id', 'enabled', 'attributes', 'name')
+    _claves = ('id', 'enabled', 'attributes', 'name')
+
+    id: int
+    enabled: bool
+    attributes: Any
+    name: str
+
+
+@dataclass
+class ReportingExportersIdPut(_Modelo):
+    __slots__ = ('id', 'enabled', 'attributes', 'name')
+    _claves = ('id', 'enabled', 'attributes', 'name')
+
+    id: int
+    enabled: bool
+    attributes: Any
+    name: str
+
+
+@dataclass
+class ReportingGetDataPost(_Modelo):
+    __slots__ = ('name', 'identifier', 'data', 'aggregations', 'start', 'end', 'legend')
+    _claves = ('name', 'identifier', 'data', 'aggregations', 'start', 'end', 'legend')
+
+    name: str
+    identifier: Union[None, str]
+    data: list
+    aggregations: Any
+    start: int
+    end: int
+    legend: list
+
+
+@dataclass
+class ReportingGraphPost(_Modelo):
+    __slots__ = ('name', 'identifier', 'data', 'aggregations', 'start', 'end', 'legend')
+    _claves = ('name', 'identifier', 'data', 'aggregations', 'start', 'end', 'legend')
+
+    name: str
+    identifier: Union[None, str]
+    data: list
+    aggregations: Any
+    start: int
+    end: int
+    legend: list
+
+
+@dataclass
+class ReportingGraphsGet(_Modelo):
+    __slots__ = ('name', 'vertical_label', 'identifiers')
+    _claves = ('name', 'vertical_label', 'identifiers')
+
+    name: str
+    vertical_label: str
+    identifiers: Union[None, list]
+
+
+@dataclass
+class ReportingNetdataGetDataPost(_Modelo):
+    __slots__ = ('name', 'identifier', 'data', 'aggregations', 'start', 'end', 'legend')
+    _claves = ('name', 'identifier', 'data', 'aggregations', 'start', 'end', 'legend')
+
+    name: str
+    identifier: Union[None, str]
+    data: list
+    aggregations: Any
+    start: int
+    end: int
+    legend: list
+
+
+@dataclass
+class ReportingNetdataGraphPost(_Modelo):
+    __slots__ = ('name', 'identifier', 'data', 'aggregations', 'start', 'end', 'legend')
+    _claves = ('name', 'identifier', 'data', 'aggregations', 'start', 'end', 'legend')
+
+    name: str
+    identifier: Union[None, str]
+    data: list
+    aggregations: Any
+    start: int
+    end: int
+    legend: list
+
+
+@dataclass
+class ReportingNetdataGraphsGet(_Modelo):
+    __slots__ = ('name', 'vertical_label', 'identifiers')
+    _claves = ('name', 'vertical_label', 'identifiers')
+
+    name: str
+    vertical_label: str
+    identifiers: Union[None, list]
+
+
+@dataclass
+class RouteSystemRoutesGet(_Modelo):
+    __slots__ = ('network', 'netmask', 'gateway', 'interface', 'flags', 'table_id', 'scope', 'preferred_source')
+    _claves = ('network', 'netmask', 'gateway', 'interface', 'flags', 'table_id', 'scope', 'preferred_source')
+
+    network: str
+    netmask: str
+    gateway: Optional[str]
+    interface: str
+    flags: list
+    table_id: int
+    scope: int
+    preferred_source: Optional[str]
+
+
+@dataclass
+class RsynctaskGet(_Modelo):
+    __slots__ = ('path', 'user', 'mode', 'remotehost', 'remoteport', 'remotemodule', 'remotepath', 'direction', 'desc', 'schedule', 'recursive', 'times', 'compress', 'archive', 'delete', 'quiet', 'preserveperm', 'preserveattr', 'delayupdates', 'extra', 'enabled', 'id', 'ssh_credentials', 'locked', 'job')
+    _claves = ('path', 'user', 'mode', 'remotehost', 'remoteport', 'remotemodule', 'remotepath', 'direction', 'desc', 'schedule', 'recursive', 'times', 'compress', 'archive', 'delete', 'quiet', 'preserveperm', 'preserveattr', 'delayupdates', 'extra', 'enabled', 'id', 'ssh_credentials', 'locked', 'job')
+
+    path: str
+    user: str
+    mode: str
+    remotehost: Optional[str]
+    remoteport: Optional[int]
+    remotemodule: Optional[str]
+    remotepath: str
+    direction: str
+    desc: str
+    schedule: dict
+    recursive: bool
+    times: bool
+    compress: bool
+    archive: bool
+    delete: bool
+    quiet: bool
+    preserveperm: bool
+    preserveattr: bool
+    delayupdates: bool
+    extra: list
+    enabled: bool
+    id: int
+    ssh_credentials: dict
+    locked: bool
+    job: dict
+
+
+@dataclass
+class RsynctaskPost(_Modelo):
+    __slots__ = ('path', 'user', 'mode', 'remotehost', 'remoteport', 'remotemodule', 'remotepath', 'direction', 'desc', 'schedule', 'recursive', 'times', 'compress', 'archive', 'delete', 'quiet', 'preserveperm', 'preserveattr', 'delayupdates', 'extra', 'enabled', 'id', 'ssh_credentials', 'locked', 'job')
+    _claves = ('path', 'user', 'mode', 'remotehost', 'remoteport', 'remotemodule', 'remotepath', 'direction', 'desc', 'schedule', 'recursive', 'times', 'compress', 'archive', 'delete', 'quiet', 'preserveperm', 'preserveattr', 'delayupdates', 'extra', 'enabled', 'id', 'ssh_credentials', 'locked', 'job')
+
+    path: str
+    user: str
+    mode: str
+    remotehost: str
+    remoteport: int
+    remotemodule: str
+    remotepath: str
+    direction: str
+    desc: str
+    schedule: dict
+    recursive: bool
+    times: bool
+    compress: bool
+    archive: bool
+    delete: bool
+    quiet: bool
+    preserveperm: bool
+    preserveattr: bool
+    delayupdates: bool
+    extra: list
+    enabled: bool
+    id: int
+    ssh_credentials: dict
+    locked: bool
+    job: dict
+
+
+@dataclass
+class RsynctaskGetInstancePost(_Modelo):
+    __slots__ = ('path', 'user', 'mode', 'remotehost', 'remoteport', 'remotemodule', 'remotepath', 'direction', 'desc', 'schedule', 'recursive', 'times', 'compress', 'archive', 'delete', 'quiet', 'preserveperm', 'preserveattr', 'delayupdates', 'extra', 'enabled', 'id', 'ssh_credentials', 'locked', 'job')
+    _claves = ('path', 'user', 'mode', 'remotehost', 'remoteport', 'remotemodule', 'remotepath', 'direction', 'desc', 'schedule', 'recursive', 'times', 'compress', 'archive', 'delete', 'quiet', 'preserveperm', 'preserveattr', 'delayupdates', 'extra', 'enabled', 'id', 'ssh_credentials', 'locked', 'job')
+
+    path: str
+    user: str
+    mode: str
+    remotehost: str
+    remoteport: int
+    remotemodule: str
+    remotepath: str
+    direction: str
+    desc: str
+    schedule: dict
+    recursive: bool
+    times: bool
+    compress: bool
+    archive: bool
+    delete: bool
+    quiet: bool
+    preserveperm: bool
+    preserveattr: bool
+    delayupdates: bool
+    extra: list
+    enabled: bool
+    id: int
+    ssh_credentials: dict
+    locked: bool
+    job: dict
+
+
+@dataclass
+class RsynctaskIdGet(_Modelo):
+    __slots__ = ('path', 'user', 'mode', 'remotehost', 'remoteport', 'remotemodule', 'remotepath', 'direction', 'desc', 'schedule', 'recursive', 'times', 'compress', 'archive', 'delete', 'quiet', 'preserveperm', 'preserveattr', 'delayupdates', 'extra', 'enabled', 'id', 'ssh_credentials', 'locked', 'job')
+    _claves = ('path', 'user', 'mode', 'remotehost', 'remoteport', 'remotemodule', 'remotepath', 'direction', 'desc', 'schedule', 'recursive', 'times', 'compress', 'archive', 'delete', 'quiet', 'preserveperm', 'preserveattr', 'delayupdates', 'extra', 'enabled', 'id', 'ssh_credentials', 'locked', 'job')
+
+    path: str
+    user: str
+    mode: str
+    remotehost: Optional[str]
+    remoteport: Optional[int]
+    remotemodule: Optional[str]
+    remotepath: str
+    direction: str
+    desc: str
+    schedule: dict
+    recursive: bool
+    times: bool
+    compress: bool
+    archive: bool
+    delete: bool
+    quiet: bool
+    preserveperm: bool
+    preserveattr: bool
+    delayupdates: bool
+    extra: list
+    enabled: bool
+    id: int
+    ssh_credentials: dict
+    locked: bool
+    job: dict
+
+
+@dataclass
+class RsynctaskIdPut(_Modelo):
+    __slots__ = ('path', 'user', 'mode', 'remotehost', 'remoteport', 'remotemodule', 'remotepath', 'direction', 'desc', 'schedule', 'recursive', 'times', 'compress', 'archive', 'delete', 'quiet', 'preserveperm', 'preserveattr', 'delayupdates', 'extra', 'enabled', 'id', 'ssh_credentials', 'locked', 'job')
+    _claves = ('path', 'user', 'mode', 'remotehost', 'remoteport', 'remotemodule', 'remotepath', 'direction', 'desc', 'schedule', 'recursive', 'times', 'compress', 'archive', 'delete', 'quiet', 'preserveperm', 'preserveattr', 'delayupdates', 'extra', 'enabled', 'id', 'ssh_credentials', 'locked', 'job')
+
+    path: str
+    user: str
+    mode: str
+    remotehost: str
+    remoteport: int
+    remotemodule: str
+    remotepath: str
+    direction: str
+    desc: str
+    schedule: dict
+    recursive: bool
+    times: bool
+    compress: bool
+    archive: bool
+    delete: bool
+    quiet: bool
+    preserveperm: bool
+    preserveattr: bool
+    delayupdates: bool
+    extra: list
+    enabled: bool
+    id: int
+    ssh_credentials: dict
+    locked: bool
+    job: dict
+
+
+@dataclass
+class ServiceGet(_Modelo):
+    __slots__ = ('id', 'service', 'enable', 'state', 'pids')
+    _claves = ('id', 'service', 'enable', 'state', 'pids')
+
+    id: int
+    service: str
+    enable: bool
+    state: str
+    pids: list
+
+
+@dataclass
+class ServiceGetInstancePost(_Modelo):
+    __slots__ = ('id', 'service', 'enable', 'state', 'pids')
+    _claves = ('id', 'service', 'enable', 'state', 'pids')
+
+    id: int
+    service: str
+    enable: bool
+    state: str
+    pids: list
+
+
+@dataclass
+class ServiceIdGet(_Modelo):
+    __slots__ = ('id', 'service', 'enable', 'state', 'pids')
+    _claves = ('id', 'service', 'enable', 'state', 'pids')
+
+    id: int
+    service: str
+    enable: bool
+    state: str
+    pids: list
+
+
+@dataclass
+class SharingNfsGet(_Modelo):
+    __slots__ = ('id', 'path', 'aliases', 'comment', 'networks', 'hosts', 'ro', 'maproot_user', 'maproot_group', 'mapall_user', 'mapall_group', 'security', 'enabled', 'locked', 'expose_snapshots')
+    _claves = ('id', 'path', 'aliases', 'comment', 'networks', 'hosts', 'ro', 'maproot_user', 'maproot_group', 'mapall_user', 'mapall_group', 'security', 'enabled', 'locked', 'expose_snapshots')
+
+    id: int
+    path: str
+    aliases: list
+    comment: str
+    networks: list
+    hosts: list
+    ro: bool
+    maproot_user: Union[None, str]
+    maproot_group: Union[None, str]
+    mapall_user: Union[None, str]
+    mapall_group: Union[None, str]
+    security: list
+    enabled: bool
+    locked: Union[None, bool]
+    expose_snapshots: bool
+
+
+@dataclass
+class SharingNfsPost(_Modelo):
+    __slots__ = ('id', 'path', 'aliases', 'comment', 'networks', 'hosts', 'ro', 'maproot_user', 'maproot_group', 'mapall_user', 'mapall_group', 'security', 'enabled', 'locked', 'expose_snapshots')
+    _claves = ('id', 'path', 'aliases', 'comment', 'networks', 'hosts', 'ro', 'maproot_user', 'maproot_group', 'mapall_user', 'mapall_group', 'security', 'enabled', 'locked', 'expose_snapshots')
+
+    id: int
+    path: str
+    aliases: list
+    comment: str
+    networks: list
+    hosts: list
+    ro: bool
+    maproot_user: Union[None, str]
+    maproot_group: Union[None, str]
+    mapall_user: Union[None, str]
+    mapall_group: Union[None, str]
+    security: list
+    enabled: bool
+    locked: Union[None, bool]
+    expose_snapshots: bool
+
+
+@dataclass
+class SharingNfsGetInstancePost(_Modelo):
+    __slots__ = ('id', 'path', 'aliases', 'comment', 'networks', 'hosts', 'ro', 'maproot_user', 'maproot_group', 'mapall_user', 'mapall_group', 'security', 'enabled', 'locked', 'expose_snapshots')
+    _claves = ('id', 'path', 'aliases', 'comment', 'networks', 'hosts', 'ro', 'maproot_user', 'maproot_group', 'mapall_user', 'mapall_group', 'security', 'enabled', 'locked', 'expose_snapshots')
+
+    id: int
+    path: str
+    aliases: list
+    comment: str
+    networks: list
+    hosts: list
+    ro: bool
+    maproot_user: Union[None, str]
+    maproot_group: Union[None, str]
+    mapall_user: Union[None, str]
+    mapall_group: Union[None, str]
+    security: list
+    enabled: bool
+    locked: Union[None, bool]
+    expose_snapshots: bool
+
+
+@dataclass
+class SharingNfsIdGet(_Modelo):
+    __slots__ = ('id', 'path', 'aliases', 'comment', 'networks', 'hosts', 'ro', 'maproot_user', 'maproot_group', 'mapall_user', 'mapall_group', 'security', 'enabled', 'locked', 'expose_snapshots')
+    _claves = ('id', 'path', 'aliases', 'comment', 'networks', 'hosts', 'ro', 'maproot_user', 'maproot_group', 'mapall_user', 'mapall_group', 'security', 'enabled', 'locked', 'expose_snapshots')
+
+    id: int
+    path: str
+    aliases: list
+    comment: str
+    networks: list
+    hosts: list
+    ro: bool
+    maproot_user: Union[None, str]
+    maproot_group: Union[None, str]
+    mapall_user: Union[None, str]
+    mapall_group: Union[None, str]
+    security: list
+    enabled: bool
+    locked: Union[None, bool]
+    expose_snapshots: bool
+
+
+@dataclass
+class SharingNfsIdPut(_Modelo):
+    __slots__ = ('id', 'path', 'aliases', 'comment', 'networks', 'hosts', 'ro', 'maproot_user', 'maproot_group', 'mapall_user', 'mapall_group', 'security', 'enabled', 'locked', 'expose_snapshots')
+    _claves = ('id', 'path', 'aliases', 'comment', 'networks', 'hosts', 'ro', 'maproot_user', 'maproot_group', 'mapall_user', 'mapall_group', 'security', 'enabled', 'locked', 'expose_snapshots')
+
+    id: int
+    path: str
+    aliases: list
+    comment: str
+    networks: list
+    hosts: list
+    ro: bool
+    maproot_user: Union[None, str]
+    maproot_group: Union[None, str]
+    mapall_user: Union[None, str]
+    mapall_group: Union[None, str]
+    security: list
+    enabled: bool
+    locked: Union[None, bool]
+    expose_snapshots: bool
+
+
+@dataclass
+class SharingSmbGetaclPost(_Modelo):
+    __slots__ = ('share_name', 'share_acl')
+    _claves = ('share_name', 'share_acl')
+
+    share_name: str
+    share_acl: list
+
+
+@dataclass
+class SharingSmbSetaclPost(_Modelo):
+    __slots__ = ('share_name', 'share_acl')
+    _claves = ('share_name', 'share_acl')
+
+    share_name: str
+    share_acl: list
+
+
+@dataclass
+class SmartGet(_Modelo):
+    __slots__ = ('interval', 'id', 'powermode', 'difference', 'informational', 'critical')
+    _claves = ('interval', 'id', 'powermode', 'difference', 'informational', 'critical')
+
+    interval: int
+    id: int
+    powermode: str
+    difference: int
+    informational: int
+    critical: int
+
+
+@dataclass
+class SmartPut(_Modelo):
+    __slots__ = ('interval', 'id', 'powermode', 'difference', 'informational', 'critical')
+    _claves = ('interval', 'id', 'powermode', 'difference', 'informational', 'critical')
+
+    interval: int
+    id: int
+    powermode: str
+    difference: int
+    informational: int
+    critical: int
+
+
+@dataclass
+class SmartTestGet(_Modelo):
+    __slots__ = ('schedule', 'desc', 'all_disks', 'disks', 'type', 'id')
+    _claves = ('schedule', 'desc', 'all_disks', 'disks', 'type', 'id')
+
+    schedule: dict
+    desc: str
+    all_disks: bool
+    disks: list
+    type: str
+    id: int
+
+
+@dataclass
+class SmartTestPost(_Modelo):
+    __slots__ = ('schedule', 'desc', 'all_disks', 'disks', 'type', 'id')
+    _claves = ('schedule', 'desc', 'all_disks', 'disks', 'type', 'id')
+
+    schedule: dict
+    desc: str
+    all_disks: bool
+    disks: list
+    type: str
+    id: int
+
+
+@dataclass
+class SmartTestGetInstancePost(_Modelo):
+    __slots__ = ('schedule', 'desc', 'all_disks', 'disks', 'type', 'id')
+    _claves = ('schedule', 'desc', 'all_disks', 'disks', 'type', 'id')
+
+    schedule: dict
+    desc: str
+    all_disks: bool
+    disks: list
+    type: str
+    id: int
+
+
+@dataclass
+class SmartTestIdGet(_Modelo):
+    __slots__ = ('schedule', 'desc', 'all_disks', 'disks', 'type', 'id')
+    _claves = ('schedule', 'desc', 'all_disks', 'disks', 'type', 'id')
+
+    schedule: dict
+    desc: str
+    all_disks: bool
+    disks: list
+    type: str
+    id: int
+
+
+@dataclass
+class SmartTestIdPut(_Modelo):
+    __slots__ = ('schedule', 'desc', 'all_disks', 'disks', 'type', 'id')
+    _claves = ('schedule', 'desc', 'all_disks', 'disks', 'type', 'id')
+
+    schedule: dict
+    desc: str
+    all_disks: bool
+    disks: list
+    type: str
+    id: int
+
+
+@dataclass
+class SmartTestManualTestPost(_Modelo):
+    __slots__ = ('disk', 'identifier', 'error', 'expected_result_time', 'job')
+    _claves = ('disk', 'identifier', 'error', 'expected_result_time', 'job')
+
+    disk: str
+    identifier: str
+    error: Optional[str]
+    expected_result_time: str
+    job: int
+
+
+@dataclass
+class SmartTestResultsGet(_Modelo):
+    __slots__ = ('disk', 'tests', 'current_test')
+    _claves = ('disk', 'tests', 'current_test')
+
+    disk: str
+    tests: list
+    current_test: dict
+
+
+@dataclass
+class SmbGet(_Modelo):
+    __slots__ = ('id', 'netbiosname', 'netbiosalias', 'workgroup', 'enable_smb1', 'unixcharset', 'localmaster', 'syslog', 'aapl_extensions', 'admin_group', 'guest', 'filemask', 'dirmask', 'ntlmv1_auth', 'multichannel', 'encryption', 'bindip', 'server_sid', 'smb_options', 'debug')
+    _claves = ('id', 'netbiosname', 'netbiosalias', 'workgroup', 'enable_smb1', 'unixcharset', 'localmaster', 'syslog', 'aapl_extensions', 'admin_group', 'guest', 'filemask', 'dirmask', 'ntlmv1_auth', 'multichannel', 'encryption', 'bindip', 'server_sid', 'smb_options', 'debug')
+
+    id: int
+    netbiosname: str
+    netbiosalias: list
+    workgroup: str
+    enable_smb1: bool
+    unixcharset: str
+    localmaster: bool
+    syslog: bool
+    aapl_extensions: bool
+    admin_group: Union[None, str]
+    guest: str
+    filemask: str
+    dirmask: str
+    ntlmv1_auth: bool
+    multichannel: bool
+    encryption: str
+    bindip: list
+    server_sid: Union[None, str]
+    smb_options: str
+    debug: bool
+
+
+@dataclass
+class SmbPut(_Modelo):
+    __slots__ = ('id', 'netbiosname', 'netbiosalias', 'workgroup', 'enable_smb1', 'unixcharset', 'localmaster', 'syslog', 'aapl_extensions', 'admin_group', 'guest', 'filemask', 'dirmask', 'ntlmv1_auth', 'multichannel', 'encryption', 'bindip', 'server_sid', 'smb_options', 'debug')
+    _claves = ('id', 'netbiosname', 'netbiosalias', 'workgroup', 'enable_smb1', 'unixcharset', 'localmaster', 'syslog', 'aapl_extensions', 'admin_group', 'guest', 'filemask', 'dirmask', 'ntlmv1_auth', 'multichannel', 'encryption', 'bindip', 'server_sid', 'smb_options', 'debug')
+
+    id: int
+    netbiosname: str
+    netbiosalias: list
+    workgroup: str
+    enable_smb1: bool
+    unixcharset: str
+    localmaster: bool
+    syslog: bool
+    aapl_extensions: bool
+    admin_group: Union[None, str]
+    guest: str
+    filemask: str
+    dirmask: str
+    ntlmv1_auth: bool
+    multichannel: bool
+    encryption: str
+    bindip: list
+    server_sid: Union[None, str]
+    smb_options: str
+    debug: bool
+
+
+@dataclass
+class SnmpGet(_Modelo):
+    __slots__ = ('location', 'contact', 'traps', 'v3', 'community', 'v3_username', 'v3_authtype', 'v3_password', 'v3_privproto', 'v3_privpassphrase', 'loglevel', 'options', 'zilstat', 'id')
+    _claves = ('location', 'contact', 'traps', 'v3', 'community', 'v3_username', 'v3_authtype', 'v3_password', 'v3_privproto', 'v3_privpassphrase', 'loglevel', 'options', 'zilstat', 'id')
+
+    location: str
+    contact: str
+    traps: bool
+    v3: bool
+    community: str
+    v3_username: str
+    v3_authtype: str
+    v3_password: str
+    v3_privproto: Any
+    v3_privpassphrase: Union[None, str]
+    loglevel: int
+    options: str
+    zilstat: bool
+    id: int
+
+
+@dataclass
+class SnmpPut(_Modelo):
+    __slots__ = ('location', 'contact', 'traps', 'v3', 'community', 'v3_username', 'v3_authtype', 'v3_password', 'v3_privproto', 'v3_privpassphrase', 'loglevel', 'options', 'zilstat', 'id')
+    _claves = ('location', 'contact', 'traps', 'v3', 'community', 'v3_username', 'v3_authtype', 'v3_password', 'v3_privproto', 'v3_privpassphrase', 'loglevel', 'options', 'zilstat', 'id')
+
+    location: str
+    contact: str
+    traps: bool
+    v3: bool
+    community: str
+    v3_username: str
+    v3_authtype: str
+    v3_password: str
+    v3_privproto: Any
+    v3_privpassphrase: Union[None, str]
+    loglevel: int
+    options: str
+    zilstat: bool
+    id: int
+
+
+@dataclass
+class SshGet(_Modelo):
+    __slots__ = ('bindiface', 'tcpport', 'password_login_groups', 'passwordauth', 'kerberosauth', 'tcpfwd', 'compression', 'sftp_log_level', 'sftp_log_facility', 'weak_ciphers', 'options', 'privatekey', 'host_dsa_key', 'host_dsa_key_pub', 'host_dsa_key_cert_pub', 'host_ecdsa_key', 'host_ecdsa_key_pub', 'host_ecdsa_key_cert_pub', 'host_ed25519_key', 'host_ed25519_key_pub', 'host_ed25519_key_cert_pub', 'host_key', 'host_key_pub', 'host_rsa_key', 'host_rsa_key_pub', 'host_rsa_key_cert_pub', 'id')
+    _claves = ('bindiface', 'tcpport', 'password_login_groups', 'passwordauth', 'kerberosauth', 'tcpfwd', 'compression', 'sftp_log_level', 'sftp_log_facility', 'weak_ciphers', 'options', 'privatekey', 'host_dsa_key', 'host_dsa_key_pub', 'host_dsa_key_cert_pub', 'host_ecdsa_key', 'host_ecdsa_key_pub', 'host_ecdsa_key_cert_pub', 'host_ed25519_key', 'host_ed25519_key_pub', 'host_ed25519_key_cert_pub', 'host_key', 'host_key_pub', 'host_rsa_key', 'host_rsa_key_pub', 'host_rsa_key_cert_pub', 'id')
+
+    bindiface: list
+    tcpport: int
+    password_login_groups: list
+    passwordauth: bool
+    kerberosauth: bool
+    tcpfwd: bool
+    compression: bool
+    sftp_log_level: str
+    sftp_log_facility: str
+    weak_ciphers: list
+    options: str
+    privatekey: str
+    host_dsa_key: str
+    host_dsa_key_pub: str
+    host_dsa_key_cert_pub: str
+    host_ecdsa_key: str
+    host_ecdsa_key_pub: str
+    host_ecdsa_key_cert_pub: str
+    host_ed25519_key: str
+    host_ed25519_key_pub: str
+    host_ed25519_key_cert_pub: str
+    host_key: str
+    host_key_pub: str
+    host_rsa_key: str
+    host_rsa_key_pub: str
+    host_rsa_key_cert_pub: str
+    id: int
+
+
+@dataclass
+class SshPut(_Modelo):
+    __slots__ = ('bindiface', 'tcpport', 'password_login_groups', 'passwordauth', 'kerberosauth', 'tcpfwd', 'compression', 'sftp_log_level', 'sftp_log_facility', 'weak_ciphers', 'options', 'privatekey', 'host_dsa_key', 'host_dsa_key_pub', 'host_dsa_key_cert_pub', 'host_ecdsa_key', 'host_ecdsa_key_pub', 'host_ecdsa_key_cert_pub', 'host_ed25519_key', 'host_ed25519_key_pub', 'host_ed25519_key_cert_pub', 'host_key', 'host_key_pub', 'host_rsa_key', 'host_rsa_key_pub', 'host_rsa_key_cert_pub', 'id')
+    _claves = ('bindiface', 'tcpport', 'password_login_groups', 'passwordauth', 'kerberosauth', 'tcpfwd', 'compression', 'sftp_log_level', 'sftp_log_facility', 'weak_ciphers', 'options', 'privatekey', 'host_dsa_key', 'host_dsa_key_pub', 'host_dsa_key_cert_pub', 'host_ecdsa_key', 'host_ecdsa_key_pub', 'host_ecdsa_key_cert_pub', 'host_ed25519_key', 'host_ed25519_key_pub', 'host_ed25519_key_cert_pub', 'host_key', 'host_key_pub', 'host_rsa_key', 'host_rsa_key_pub', 'host_rsa_key_cert_pub', 'id')
+
+    bindiface: list
+    tcpport: int
+    password_login_groups: list
+    passwordauth: bool
+    kerberosauth: bool
+    tcpfwd: bool
+    compression: bool
+    sftp_log_level: str
+    sftp_log_facility: str
+    weak_ciphers: list
+    options: str
+    privatekey: str
+    host_dsa_key: str
+    host_dsa_key_pub: str
+    host_dsa_key_cert_pub: str
+    host_ecdsa_key: str
+    host_ecdsa_key_pub: str
+    host_ecdsa_key_cert_pub: str
+    host_ed25519_key: str
+    host_ed25519_key_pub: str
+    host_ed25519_key_cert_pub: str
+    host_key: str
+    host_key_pub: str
+    host_rsa_key: str
+    host_rsa_key_pub: str
+    host_rsa_key_cert_pub: str
+    id: int
+
+
+@dataclass
+class StaticrouteGet(_Modelo):
+    __slots__ = ('destination', 'gateway', 'id')
+    _claves = ('destination', 'gateway', 'id')
+
+    destination: str
+    gateway: str
+    id: int
+
+
+@dataclass
+class StaticroutePost(_Modelo):
+    __slots__ = ('destination', 'gateway', 'id')
+    _claves = ('destination', 'gateway', 'id')
+
+    destination: str
+    gateway: str
+    id: int
+
+
+@dataclass
+class StaticrouteGetInstancePost(_Modelo):
+    __slots__ = ('destination', 'gateway', 'id')
+    _claves = ('destination', 'gateway', 'id')
+
+    destination: str
+    gateway: str
+    id: int
+
+
+@dataclass
+class StaticrouteIdGet(_Modelo):
+    __slots__ = ('destination', 'gateway', 'id')
+    _claves = ('destination', 'gateway', 'id')
+
+    destination: str
+    gateway: str
+    id: int
+
+
+@dataclass
+class StaticrouteIdPut(_Modelo):
+    __slots__ = ('destination', 'gateway', 'id')
+    _claves = ('destination', 'gateway', 'id')
+
+    destination: str
+    gateway: str
+    id: int
+
+
+@dataclass
+class SupportGet(_Modelo):
+    __slots__ = ('enabled', 'name', 'email', 'phone', 'secondary_name', 'secondary_title', 'secondary_email', 'secondary_phone', 'id')
+    _claves = ('enabled', 'name', 'email', 'phone', 'secondary_name', 'secondary_title', 'secondary_email', 'secondary_phone', 'id')
+
+    enabled: bool
+    name: str
+    email: str
+    phone: str
+    secondary_name: str
+    secondary_title: str
+    secondary_email: str
+    secondary_phone: str
+    id: int
+
+
+@dataclass
+class SupportPut(_Modelo):
+    __slots__ = ('enabled', 'name', 'email', 'phone', 'secondary_name', 'secondary_title', 'secondary_email', 'secondary_phone', 'id')
+    _claves = ('enabled', 'name', 'email', 'phone', 'secondary_name', 'secondary_title', 'secondary_email', 'secondary_phone', 'id')
+
+    enabled: bool
+    name: str
+    email: str
+    phone: str
+    secondary_name: str
+    secondary_title: str
+    secondary_email: str
+    secondary_phone: str
+    id: int
+
+
+@dataclass
+class SupportNewTicketPost(_Modelo):
+    __slots__ = ('ticket', 'url', 'has_debug')
+    _claves = ('ticket', 'url', 'has_debug')
+
+    ticket: int
+    url: str
+    has_debug: bool
+
+
+@dataclass
+class SupportSimilarIssuesPost(_Modelo):
+    __slots__ = ('url', 'summary')
+    _claves = ('url', 'summary')
+
+    url: str
+    summary: str
+
+
+@dataclass
+class SystemAdvancedGet(_Modelo):
+    __slots__ = ('advancedmode', 'autotune', 'kdump_enabled', 'boot_scrub', 'consolemenu', 'consolemsg', 'debugkernel', 'fqdn_syslog', 'motd', 'login_banner', 'powerdaemon', 'serialconsole', 'serialport', 'anonstats_token', 'serialspeed', 'overprovision', 'traceback', 'uploadcrash', 'anonstats', 'sed_user', 'sysloglevel', 'syslogserver', 'syslog_transport', 'syslog_tls_certificate', 'syslog_tls_certificate_authority', 'syslog_audit', 'isolated_gpu_pci_ids', 'kernel_extra_options', 'id')
+    _claves = ('advancedmode', 'autotune', 'kdump_enabled', 'boot_scrub', 'consolemenu', 'consolemsg', 'debugkernel', 'fqdn_syslog', 'motd', 'login_banner', 'powerdaemon', 'serialconsole', 'serialport', 'anonstats_token', 'serialspeed', 'overprovision', 'traceback', 'uploadcrash', 'anonstats', 'sed_user', 'sysloglevel', 'syslogserver', 'syslog_transport', 'syslog_tls_certificate', 'syslog_tls_certificate_authority', 'syslog_audit', 'isolated_gpu_pci_ids', 'kernel_extra_options', 'id')
+
+    advancedmode: bool
+    autotune: bool
+    kdump_enabled: bool
+    boot_scrub: int
+    consolemenu: bool
+    consolemsg: bool
+    debugkernel: bool
+    fqdn_syslog: bool
+    motd: str
+    login_banner: str
+    powerdaemon: bool
+    serialconsole: bool
+    serialport: str
+    anonstats_token: str
+    serialspeed: str
+    overprovision: int
+    traceback: bool
+    uploadcrash: bool
+    anonstats: bool
+    sed_user: str
+    sysloglevel: str
+    syslogserver: str
+    syslog_transport: str
+    syslog_tls_certificate: int
+    syslog_tls_certificate_authority: int
+    syslog_audit: bool
+    isolated_gpu_pci_ids: list
+    kernel_extra_options: str
+    id: int
+
+
+@dataclass
+class SystemAdvancedPut(_Modelo):
+    __slots__ = ('advancedmode', 'autotune', 'kdump_enabled', 'boot_scrub', 'consolemenu', 'consolemsg', 'debugkernel', 'fqdn_syslog', 'motd', 'login_banner', 'powerdaemon', 'serialconsole', 'serialport', 'anonstats_token', 'serialspeed', 'overprovision', 'traceback', 'uploadcrash', 'anonstats', 'sed_user', 'sysloglevel', 'syslogserver', 'syslog_transport', 'syslog_tls_certificate', 'syslog_tls_certificate_authority', 'syslog_audit', 'isolated_gpu_pci_ids', 'kernel_extra_options', 'id')
+    _claves = ('advancedmode', 'autotune', 'kdump_enabled', 'boot_scrub', 'consolemenu', 'consolemsg', 'debugkernel', 'fqdn_syslog', 'motd', 'login_banner', 'powerdaemon', 'serialconsole', 'serialport', 'anonstats_token', 'serialspeed', 'overprovision', 'traceback', 'uploadcrash', 'anonstats', 'sed_user', 'sysloglevel', 'syslogserver', 'syslog_transport', 'syslog_tls_certificate', 'syslog_tls_certificate_authority', 'syslog_audit', 'isolated_gpu_pci_ids', 'kernel_extra_options', 'id')
+
+    advancedmode: bool
+    autotune: bool
+    kdump_enabled: bool
+    boot_scrub: int
+    consolemenu: bool
+    consolemsg: bool
+    debugkernel: bool
+    fqdn_syslog: bool
+    motd: str
+    login_banner: str
+    powerdaemon: bool
+    serialconsole: bool
+    serialport: str
+    anonstats_token: str
+    serialspeed: str
+    overprovision: int
+    traceback: bool
+    uploadcrash: bool
+    anonstats: bool
+    sed_user: str
+    sysloglevel: str
+    syslogserver: str
+    syslog_transport: str
+    syslog_tls_certificate: int
+    syslog_tls_certificate_authority: int
+    syslog_audit: bool
+    isolated_gpu_pci_ids: list
+    kernel_extra_options: str
+    id: int
+
+
+@dataclass
+class SystemGeneralGet(_Modelo):
+    __slots__ = ('ui_certificate', 'ui_httpsport', 'ui_httpsredirect', 'ui_httpsprotocols', 'ui_port', 'ui_address', 'ui_v6address', 'ui_allowlist', 'ui_consolemsg', 'ui_x_frame_options', 'kbdmap', 'language', 'timezone', 'usage_collection', 'wizardshown', 'usage_collection_is_set', 'ds_auth', 'id')
+    _claves = ('ui_certificate', 'ui_httpsport', 'ui_httpsredirect', 'ui_httpsprotocols', 'ui_port', 'ui_address', 'ui_v6address', 'ui_allowlist', 'ui_consolemsg', 'ui_x_frame_options', 'kbdmap', 'language', 'timezone', 'usage_collection', 'wizardshown', 'usage_collection_is_set', 'ds_auth', 'id')
+
+    ui_certificate: dict
+    ui_httpsport: int
+    ui_httpsredirect: bool
+    ui_httpsprotocols: list
+    ui_port: int
+    ui_address: list
+    ui_v6address: list
+    ui_allowlist: list
+    ui_consolemsg: bool
+    ui_x_frame_options: str
+    kbdmap: str
+    language: str
+    timezone: str
+    usage_collection: bool
+    wizardshown: bool
+    usage_collection_is_set: bool
+    ds_auth: bool
+    id: int
+
+
+@dataclass
+class SystemGeneralPut(_Modelo):
+    __slots__ = ('ui_certificate', 'ui_httpsport', 'ui_httpsredirect', 'ui_httpsprotocols', 'ui_port', 'ui_address', 'ui_v6address', 'ui_allowlist', 'ui_consolemsg', 'ui_x_frame_options', 'kbdmap', 'language', 'timezone', 'usage_collection', 'wizardshown', 'usage_collection_is_set', 'ds_auth', 'id')
+    _claves = ('ui_certificate', 'ui_httpsport', 'ui_httpsredirect', 'ui_httpsprotocols', 'ui_port', 'ui_address', 'ui_v6address', 'ui_allowlist', 'ui_consolemsg', 'ui_x_frame_options', 'kbdmap', 'language', 'timezone', 'usage_collection', 'wizardshown', 'usage_collection_is_set', 'ds_auth', 'id')
+
+    ui_certificate: dict
+    ui_httpsport: int
+    ui_httpsredirect: bool
+    ui_httpsprotocols: list
+    ui_port: int
+    ui_address: list
+    ui_v6address: list
+    ui_allowlist: list
+    ui_consolemsg: bool
+    ui_x_frame_options: str
+    kbdmap: str
+    language: str
+    timezone: str
+    usage_collection: bool
+    wizardshown: bool
+    usage_collection_is_set: bool
+    ds_auth: bool
+    id: int
+
+
+@dataclass
+class SystemGeneralUiHttpsprotocolsChoicesGet(_Modelo):
+    __slots__ = ('TLSv1', 'TLSv1_1', 'TLSv1_2', 'TLSv1_3')
+    _claves = ('TLSv1', 'TLSv1.1', 'TLSv1.2', 'TLSv1.3')
+
+    TLSv1: str
+    TLSv1_1: str
+    TLSv1_2: str
+    TLSv1_3: str
+
+
+@dataclass
+class SystemInfoGet(_Modelo):
+    __slots__ = ('version', 'buildtime', 'hostname', 'physmem', 'model', 'cores', 'physical_cores', 'loadavg', 'uptime', 'uptime_seconds', 'system_serial', 'system_product', 'system_product_version', 'license', 'boottime', 'datetime', 'timezone', 'system_manufacturer', 'ecc_memory')
+    _claves = ('version', 'buildtime', 'hostname', 'physmem', 'model', 'cores', 'physical_cores', 'loadavg', 'uptime', 'uptime_seconds', 'system_serial', 'system_product', 'system_product_version', 'license', 'boottime', 'datetime', 'timezone', 'system_manufacturer', 'ecc_memory')
+
+    version: str
+    buildtime: str
+    hostname: str
+    physmem: int
+    model: str
+    cores: int
+    physical_cores: int
+    loadavg: list
+    uptime: str
+    uptime_seconds: Any
+    system_serial: str
+    system_product: str
+    system_product_version: str
+    license: dict
+    boottime: str
+    datetime: str
+    timezone: str
+    system_manufacturer: str
+    ecc_memory: bool
+
+
+@dataclass
+class SystemNtpserverGet(_Modelo):
+    __slots__ = ('id', 'address', 'burst', 'iburst', 'prefer', 'minpoll', 'maxpoll')
+    _claves = ('id', 'address', 'burst', 'iburst', 'prefer', 'minpoll', 'maxpoll')
+
+    id: int
+    address: str
+    burst: bool
+    iburst: bool
+    prefer: bool
+    minpoll: int
+    maxpoll: int
+
+
+@dataclass
+class SystemNtpserverPost(_Modelo):
+    __slots__ = ('id', 'address', 'burst', 'iburst', 'prefer', 'minpoll', 'maxpoll')
+    _claves = ('id', 'address', 'burst', 'iburst', 'prefer', 'minpoll', 'maxpoll')
+
+    id: int
+    address: str
+    burst: bool
+    iburst: bool
+    prefer: bool
+    minpoll: int
+    maxpoll: int
+
+
+@dataclass
+class SystemNtpserverGetInstancePost(_Modelo):
+    __slots__ = ('id', 'address', 'burst', 'iburst', 'prefer', 'minpoll', 'maxpoll')
+    _claves = ('id', 'address', 'burst', 'iburst', 'prefer', 'minpoll', 'maxpoll')
+
+    id: int
+    address: str
+    burst: bool
+    iburst: bool
+    prefer: bool
+    minpoll: int
+    maxpoll: int
+
+
+@dataclass
+class SystemNtpserverIdGet(_Modelo):
+    __slots__ = ('id', 'address', 'burst', 'iburst', 'prefer', 'minpoll', 'maxpoll')
+    _claves = ('id', 'address', 'burst', 'iburst', 'prefer', 'minpoll', 'maxpoll')
+
+    id: int
+    address: str
+    burst: bool
+    iburst: bool
+    prefer: bool
+    minpoll: int
+    maxpoll: int
+
+
+@dataclass
+class SystemNtpserverIdPut(_Modelo):
+    __slots__ = ('id', 'address', 'burst', 'iburst', 'prefer', 'minpoll', 'maxpoll')
+    _claves = ('id', 'address', 'burst', 'iburst', 'prefer', 'minpoll', 'maxpoll')
+
+    id: int
+    address: str
+    burst: bool
+    iburst: bool
+    prefer: bool
+    minpoll: int
+    maxpoll: int
+
+
+@dataclass
+class SystemRebootInfoGet(_Modelo):
+    __slots__ = ('boot_id', 'reboot_required_reasons')
+    _claves = ('boot_id', 'reboot_required_reasons')
+
+    boot_id: str
+    reboot_required_reasons: list
+
+
+@dataclass
+class SystemSecurityGet(_Modelo):
+    __slots__ = ('id', 'enable_fips', 'enable_gpos_stig')
+    _claves = ('id', 'enable_fips', 'enable_gpos_stig')
+
+    id: int
+    enable_fips: bool
+    enable_gpos_stig: bool
+
+
+@dataclass
+class SystemSecurityPut(_Modelo):
+    __slots__ = ('id', 'enable_fips', 'enable_gpos_stig')
+    _claves = ('id', 'enable_fips', 'enable_gpos_stig')
+
+    id: int
+    enable_fips: bool
+    enable_gpos_stig: bool
+
+
+@dataclass
+class SystemdatasetGet(_Modelo):
+    __slots__ = ('id', 'pool', 'pool_set', 'uuid', 'basename', 'path')
+    _claves = ('id', 'pool', 'pool_set', 'uuid', 'basename', 'path')
+
+    id: int
+    pool: str
+    pool_set: bool
+    uuid: str
+    basename: str
+    path: str
+
+
+@dataclass
+class SystemdatasetPut(_Modelo):
+    __slots__ = ('id', 'pool', 'pool_set', 'uuid', 'basename', 'path')
+    _claves = ('id', 'pool', 'pool_set', 'uuid', 'basename', 'path')
+
+    id: int
+    pool: str
+    pool_set: bool
+    uuid: str
+    basename: str
+    path: str
+
+
+@dataclass
+class TnConnectGet(_Modelo):
+    __slots__ = ('id', 'enabled', 'registration_details', 'ips', 'status', 'status_reason', 'certificate', 'account_service_base_url', 'leca_service_base_url', 'tnc_base_url', 'heartbeat_url')
+    _claves = ('id', 'enabled', 'registration_details', 'ips', 'status', 'status_reason', 'certificate', 'account_service_base_url', 'leca_service_base_url', 'tnc_base_url', 'heartbeat_url')
+
+    id: int
+    enabled: bool
+    registration_details: dict
+    ips: list
+    status: str
+    status_reason: str
+    certificate: Union[None, int]
+    account_service_base_url: str
+    leca_service_base_url: str
+    tnc_base_url: str
+    heartbeat_url: str
+
+
+@dataclass
+class TnConnectPut(_Modelo):
+    __slots__ = ('id', 'enabled', 'registration_details', 'ips', 'status', 'status_reason', 'certificate', 'account_service_base_url', 'leca_service_base_url', 'tnc_base_url', 'heartbeat_url')
+    _claves = ('id', 'enabled', 'registration_details', 'ips', 'status', 'status_reason', 'certificate', 'account_service_base_url', 'leca_service_base_url', 'tnc_base_url', 'heartbeat_url')
+
+    id: int
+    enabled: bool
+    registration_details: dict
+    ips: list
+    status: str
+    status_reason: str
+    certificate: Union[None, int]
+    account_service_base_url: str
+    leca_service_base_url: str
+    tnc_base_url: str
+    heartbeat_url: str
+
+
+@dataclass
+class TruecommandGet(_Modelo):
+    __slots__ = ('id', 'api_key', 'status', 'status_reason', 'remote_url', 'remote_ip_address', 'enabled')
+    _claves = ('id', 'api_key', 'status', 'status_reason', 'remote_url', 'remote_ip_address', 'enabled')
+
+    id: int
+    api_key: str
+    status: str
+    status_reason: str
+    remote_url: str
+    remote_ip_address: str
+    enabled: bool
+
+
+@dataclass
+class TruecommandPut(_Modelo):
+    __slots__ = ('id', 'api_key', 'status', 'status_reason', 'remote_url', 'remote_ip_address', 'enabled')
+    _claves = ('id', 'api_key', 'status', 'status_reason', 'remote_url', 'remote_ip_address', 'enabled')
+
+    id: int
+    api_key: str
+    status: str
+    status_reason: str
+    remote_url: str
+    remote_ip_address: str
+    enabled: bool
+
+
+@dataclass
+class TunableGet(_Modelo):
+    __slots__ = ('type', 'var', 'value', 'comment', 'enabled', 'update_initramfs', 'id', 'orig_value')
+    _claves = ('type', 'var', 'value', 'comment', 'enabled', 'update_initramfs', 'id', 'orig_value')
+
+    type: str
+    var: str
+    value: str
+    comment: str
+    enabled: bool
+    update_initramfs: bool
+    id: int
+    orig_value: str
+
+
+@dataclass
+class TunablePost(_Modelo):
+    __slots__ = ('type', 'var', 'value', 'comment', 'enabled', 'update_initramfs', 'id', 'orig_value')
+    _claves = ('type', 'var', 'value', 'comment', 'enabled', 'update_initramfs', 'id', 'orig_value')
+
+    type: str
+    var: str
+    value: str
+    comment: str
+    enabled: bool
+    update_initramfs: bool
+    id: int
+    orig_value: str
+
+
+@dataclass
+class TunableGetInstancePost(_Modelo):
+    __slots__ = ('type', 'var', 'value', 'comment', 'enabled', 'update_initramfs', 'id', 'orig_value')
+    _claves = ('type', 'var', 'value', 'comment', 'enabled', 'update_initramfs', 'id', 'orig_value')
+
+    type: str
+    var: str
+    value: str
+    comment: str
+    enabled: bool
+    update_initramfs: bool
+    id: int
+    orig_value: str
+
+
+@dataclass
+class TunableIdGet(_Modelo):
+    __slots__ = ('type', 'var', 'value', 'comment', 'enabled', 'update_initramfs', 'id', 'orig_value')
+    _claves = ('type', 'var', 'value', 'comment', 'enabled', 'update_initramfs', 'id', 'orig_value')
+
+    type: str
+    var: str
+    value: str
+    comment: str
+    enabled: bool
+    update_initramfs: bool
+    id: int
+    orig_value: str
+
+
+@dataclass
+class TunableIdPut(_Modelo):
+    __slots__ = ('type', 'var', 'value', 'comment', 'enabled', 'update_initramfs', 'id', 'orig_value')
+    _claves = ('type', 'var', 'value', 'comment', 'enabled', 'update_initramfs', 'id', 'orig_value')
+
+    type: str
+    var: str
+    value: str
+    comment: str
+    enabled: bool
+    update_initramfs: bool
+    id: int
+    orig_value: str
+
+
+@dataclass
+class TunableTunableTypeChoicesGet(_Modelo):
+    __slots__ = ('SYSCTL', 'UDEV', 'ZFS')
+    _claves = ('SYSCTL', 'UDEV', 'ZFS')
+
+    SYSCTL: str
+    UDEV: str
+    ZFS: str
+
+
+@dataclass
+class UpsGet(_Modelo):
+    __slots__ = ('powerdown', 'rmonitor', 'id', 'nocommwarntime', 'remoteport', 'shutdowntimer', 'hostsync', 'driver', 'extrausers', 'identifier', 'mode', 'monpwd', 'monuser', 'options', 'optionsupsd', 'port', 'remotehost', 'shutdown', 'shutdowncmd', 'complete_identifier')
+    _claves = ('powerdown', 'rmonitor', 'id', 'nocommwarntime', 'remoteport', 'shutdowntimer', 'hostsync', 'driver', 'extrausers', 'identifier', 'mode', 'monpwd', 'monuser', 'options', 'optionsupsd', 'port', 'remotehost', 'shutdown', 'shutdowncmd', 'complete_identifier')
+
+    powerdown: bool
+    rmonitor: bool
+    id: int
+    nocommwarntime: int
+    remoteport: int
+    shutdowntimer: int
+    hostsync: int
+    driver: str
+    extrausers: str
+    identifier: str
+    mode: str
+    monpwd: str
+    monuser: str
+    options: str
+    optionsupsd: str
+    port: str
+    remotehost: str
+    shutdown: str
+    shutdowncmd: str
+    complete_identifier: str
+
+
+@dataclass
+class UpsPut(_Modelo):
+    __slots__ = ('powerdown', 'rmonitor', 'id', 'nocommwarntime', 'remoteport', 'shutdowntimer', 'hostsync', 'driver', 'extrausers', 'identifier', 'mode', 'monpwd', 'monuser', 'options', 'optionsupsd', 'port', 'remotehost', 'shutdown', 'shutdowncmd', 'complete_identifier')
+    _claves = ('powerdown', 'rmonitor', 'id', 'nocommwarntime', 'remoteport', 'shutdowntimer', 'hostsync', 'driver', 'extrausers', 'identifier', 'mode', 'monpwd', 'monuser', 'options', 'optionsupsd', 'port', 'remotehost', 'shutdown', 'shutdowncmd', 'complete_identifier')
+
+    powerdown: bool
+    rmonitor: bool
+    id: int
+    nocommwarntime: int
+    remoteport: int
+    shutdowntimer: int
+    hostsync: int
+    driver: str
+    extrausers: str
+    identifier: str
+    mode: str
+    monpwd: str
+    monuser: str
+    options: str
+    optionsupsd: str
+    port: str
+    remotehost: str
+    shutdown: str
+    shutdowncmd: str
+    complete_identifier: str
+
+
+@dataclass
+class UserGet(_Modelo):
+    __slots__ = ('id', 'uid', 'username', 'unixhash', 'smbhash', 'home', 'shell', 'full_name', 'builtin', 'smb', 'userns_idmap', 'group', 'groups', 'password_disabled', 'ssh_password_enabled', 'sshpubkey', 'locked', 'sudo_commands', 'sudo_commands_nopasswd', 'email', 'id_type_both', 'local', 'immutable', 'twofactor_auth_configured', 'sid', 'roles', 'api_keys')
+    _claves = ('id', 'uid', 'username', 'unixhash', 'smbhash', 'home', 'shell', 'full_name', 'builtin', 'smb', 'userns_idmap', 'group', 'groups', 'password_disabled', 'ssh_password_enabled', 'sshpubkey', 'locked', 'sudo_commands', 'sudo_commands_nopasswd', 'email', 'id_type_both', 'local', 'immutable', 'twofactor_auth_configured', 'sid', 'roles', 'api_keys')
+
+    id: int
+    uid: int
+    username: str
+    unixhash: Union[None, str]
+    smbhash: Union[None, str]
+    home: str
+    shell: str
+    full_name: str
+    builtin: bool
+    smb: bool
+    userns_idmap: Union[None, int, str]
+    group: dict
+    groups: list
+    password_disabled: bool
+    ssh_password_enabled: bool
+    sshpubkey: Union[None, str]
+    locked: bool
+    sudo_commands: list
+    sudo_commands_nopasswd: list
+    email: Union[None, str]
+    id_type_both: bool
+    local: bool
+    immutable: bool
+    twofactor_auth_configured: bool
+    sid: Union[None, str]
+    roles: list
+    api_keys: list
+
+
+@dataclass
+class UserPost(_Modelo):
+    __slots__ = ('id', 'uid', 'username', 'unixhash', 'smbhash', 'home', 'shell', 'full_name', 'builtin', 'smb', 'userns_idmap', 'group', 'groups', 'password_disabled', 'ssh_password_enabled', 'sshpubkey', 'locked', 'sudo_commands', 'sudo_commands_nopasswd', 'email', 'id_type_both', 'local', 'immutable', 'twofactor_auth_configured', 'sid', 'roles', 'api_keys', 'password')
+    _claves = ('id', 'uid', 'username', 'unixhash', 'smbhash', 'home', 'shell', 'full_name', 'builtin', 'smb', 'userns_idmap', 'group', 'groups', 'password_disabled', 'ssh_password_enabled', 'sshpubkey', 'locked', 'sudo_commands', 'sudo_commands_nopasswd', 'email', 'id_type_both', 'local', 'immutable', 'twofactor_auth_configured', 'sid', 'roles', 'api_keys', 'password')
+
+    id: int
+    uid: int
+    username: str
+    unixhash: Union[None, str]
+    smbhash: Union[None, str]
+    home: str
+    shell: str
+    full_name: str
+    builtin: bool
+    smb: bool
+    userns_idmap: Union[None, int, str]
+    group: dict
+    groups: list
+    password_disabled: bool
+    ssh_password_enabled: bool
+    sshpubkey: Union[None, str]
+    locked: bool
+    sudo_commands: list
+    sudo_commands_nopasswd: list
+    email: Union[None, str]
+    id_type_both: bool
+    local: bool
+    immutable: bool
+    twofactor_auth_configured: bool
+    sid: Union[None, str]
+    roles: list
+    api_keys: list
+    password: Union[None, str]
+
+
+@dataclass
+class UserGetInstancePost(_Modelo):
+    __slots__ = ('id', 'uid', 'username', 'unixhash', 'smbhash', 'home', 'shell', 'full_name', 'builtin', 'smb', 'userns_idmap', 'group', 'groups', 'password_disabled', 'ssh_password_enabled', 'sshpubkey', 'locked', 'sudo_commands', 'sudo_commands_nopasswd', 'email', 'id_type_both', 'local', 'immutable', 'twofactor_auth_configured', 'sid', 'roles', 'api_keys')
+    _claves = ('id', 'uid', 'username', 'unixhash', 'smbhash', 'home', 'shell', 'full_name', 'builtin', 'smb', 'userns_idmap', 'group', 'groups', 'password_disabled', 'ssh_password_enabled', 'sshpubkey', 'locked', 'sudo_commands', 'sudo_commands_nopasswd', 'email', 'id_type_both', 'local', 'immutable', 'twofactor_auth_configured', 'sid', 'roles', 'api_keys')
+
+    id: int
+    uid: int
+    username: str
+    unixhash: Union[None, str]
+    smbhash: Union[None, str]
+    home: str
+    shell: str
+    full_name: str
+    builtin: bool
+    smb: bool
+    userns_idmap: Union[None, int, str]
+    group: dict
+    groups: list
+    password_disabled: bool
+    ssh_password_enabled: bool
+    sshpubkey: Union[None, str]
+    locked: bool
+    sudo_commands: list
+    sudo_commands_nopasswd: list
+    email: Union[None, str]
+    id_type_both: bool
+    local: bool
+    immutable: bool
+    twofactor_auth_configured: bool
+    sid: Union[None, str]
+    roles: list
+    api_keys: list
+
+
+@dataclass
+class UserGetUserObjPost(_Modelo):
+    __slots__ = ('pw_name', 'pw_gecos', 'pw_dir', 'pw_shell', 'pw_uid', 'pw_gid', 'grouplist', 'sid', 'source', 'local')
+    _claves = ('pw_name', 'pw_gecos', 'pw_dir', 'pw_shell', 'pw_uid', 'pw_gid', 'grouplist', 'sid', 'source', 'local')
+
+    pw_name: str
+    pw_gecos: str
+    pw_dir: str
+    pw_shell: str
+    pw_uid: int
+    pw_gid: int
+    grouplist: Union[None, list]
+    sid: Union[None, str]
+    source: str
+    local: bool
+
+
+@dataclass
+class UserIdGet(_Modelo):
+    __slots__ = ('id', 'uid', 'username', 'unixhash', 'smbhash', 'home', 'shell', 'full_name', 'builtin', 'smb', 'userns_idmap', 'group', 'groups', 'password_disabled', 'ssh_password_enabled', 'sshpubkey', 'locked', 'sudo_commands', 'sudo_commands_nopasswd', 'email', 'id_type_both', 'local', 'immutable', 'twofactor_auth_configured', 'sid', 'roles', 'api_keys')
+    _claves = ('id', 'uid', 'username', 'unixhash', 'smbhash', 'home', 'shell', 'full_name', 'builtin', 'smb', 'userns_idmap', 'group', 'groups', 'password_disabled', 'ssh_password_enabled', 'sshpubkey', 'locked', 'sudo_commands', 'sudo_commands_nopasswd', 'email', 'id_type_both', 'local', 'immutable', 'twofactor_auth_configured', 'sid', 'roles', 'api_keys')
+
+    id: int
+    uid: int
+    username: str
+    unixhash: Union[None, str]
+    smbhash: Union[None, str]
+    home: str
+    shell: str
+    full_name: str
+    builtin: bool
+    smb: bool
+    userns_idmap: Union[None, int, str]
+    group: dict
+    groups: list
+    password_disabled: bool
+    ssh_password_enabled: bool
+    sshpubkey: Union[None, str]
+    locked: bool
+    sudo_commands: list
+    sudo_commands_nopasswd: list
+    email: Union[None, str]
+    id_type_both: bool
+    local: bool
+    immutable: bool
+    twofactor_auth_configured: bool
+    sid: Union[None, str]
+    roles: list
+    api_keys: list
+
+
+@dataclass
+class UserIdPut(_Modelo):
+    __slots__ = ('id', 'uid', 'username', 'unixhash', 'smbhash', 'home', 'shell', 'full_name', 'builtin', 'smb', 'userns_idmap', 'group', 'groups', 'password_disabled', 'ssh_password_enabled', 'sshpubkey', 'locked', 'sudo_commands', 'sudo_commands_nopasswd', 'email', 'id_type_both', 'local', 'immutable', 'twofactor_auth_configured', 'sid', 'roles', 'api_keys', 'password')
+    _claves = ('id', 'uid', 'username', 'unixhash', 'smbhash', 'home', 'shell', 'full_name', 'builtin', 'smb', 'userns_idmap', 'group', 'groups', 'password_disabled', 'ssh_password_enabled', 'sshpubkey', 'locked', 'sudo_commands', 'sudo_commands_nopasswd', 'email', 'id_type_both', 'local', 'immutable', 'twofactor_auth_configured', 'sid', 'roles', 'api_keys', 'password')
+
+    id: int
+    uid: int
+    username: str
+    unixhash: Union[None, str]
+    smbhash: Union[None, str]
+    home: str
+    shell: str
+    full_name: str
+    builtin: bool
+    smb: bool
+    userns_idmap: Union[None, int, str]
+    group: dict
+    groups: list
+    password_disabled: bool
+    ssh_password_enabled: bool
+    sshpubkey: Union[None, str]
+    locked: bool
+    sudo_commands: list
+    sudo_commands_nopasswd: list
+    email: Union[None, str]
+    id_type_both: bool
+    local: bool
+    immutable: bool
+    twofactor_auth_configured: bool
+    sid: Union[None, str]
+    roles: list
+    api_keys: list
+    password: Union[None, str]
+
+
+@dataclass
+class VirtGlobalGet(_Modelo):
+    __slots__ = ('id', 'pool', 'dataset', 'storage_pools', 'bridge', 'v4_network', 'v6_network', 'state')
+    _claves = ('id', 'pool', 'dataset', 'storage_pools', 'bridge', 'v4_network', 'v6_network', 'state')
+
+    id: int
+    pool: Union[None, str]
+    dataset: Union[None, str]
+    storage_pools: Union[None, list]
+    bridge: Union[None, str]
+    v4_network: Union[None, str]
+    v6_network: Union[None, str]
+    state: Union[None, str]
+
+
+@dataclass
+class VirtGlobalPut(_Modelo):
+    __slots__ = ('id', 'pool', 'dataset', 'storage_pools', 'bridge', 'v4_network', 'v6_network', 'state')
+    _claves = ('id', 'pool', 'dataset', 'storage_pools', 'bridge', 'v4_network', 'v6_network', 'state')
+
+    id: int
+    pool: Union[None, str]
+    dataset: Union[None, str]
+    storage_pools: Union[None, list]
+    bridge: Union[None, str]
+    v4_network: Union[None, str]
+    v6_network: Union[None, str]
+    state: Union[None, str]
+
+
+@dataclass
+class VirtGlobalGetNetworkPost(_Modelo):
+    __slots__ = ('type', 'managed', 'ipv4_address', 'ipv4_nat', 'ipv6_address', 'ipv6_nat')
+    _claves = ('type', 'managed', 'ipv4_address', 'ipv4_nat', 'ipv6_address', 'ipv6_nat')
+
+    type: str
+    managed: bool
+    ipv4_address: str
+    ipv4_nat: bool
+    ipv6_address: str
+    ipv6_nat: bool
+
+
+@dataclass
+class VirtInstanceGet(_Modelo):
+    __slots__ = ('id', 'name', 'type', 'status', 'cpu', 'memory', 'autostart', 'environment', 'aliases', 'image', 'userns_idmap', 'raw', 'vnc_enabled', 'vnc_port', 'vnc_password', 'secure_boot', 'root_disk_size', 'root_disk_io_bus', 'storage_pool')
+    _claves = ('id', 'name', 'type', 'status', 'cpu', 'memory', 'autostart', 'environment', 'aliases', 'image', 'userns_idmap', 'raw', 'vnc_enabled', 'vnc_port', 'vnc_password', 'secure_boot', 'root_disk_size', 'root_disk_io_bus', 'storage_pool')
+
+    id: str
+    name: str
+    type: str
+    status: str
+    cpu: Union[None, str]
+    memory: Union[None, int]
+    autostart: bool
+    environment: dict
+    aliases: list
+    image: Any
+    userns_idmap: Any
+    raw: Union[None, dict]
+    vnc_enabled: bool
+    vnc_port: Union[None, int]
+    vnc_password: Union[None, str]
+    secure_boot: Union[None, bool]
+    root_disk_size: Union[None, int]
+    root_disk_io_bus: Any
+    storage_pool: str
+
+
+@dataclass
+class VirtInstancePost(_Modelo):
+    __slots__ = ('id', 'name', 'type', 'status', 'cpu', 'memory', 'autostart', 'environment', 'aliases', 'image', 'userns_idmap', 'raw', 'vnc_enabled', 'vnc_port', 'vnc_password', 'secure_boot', 'root_disk_size', 'root_disk_io_bus', 'storage_pool')
+    _claves = ('id', 'name', 'type', 'status', 'cpu', 'memory', 'autostart', 'environment', 'aliases', 'image', 'userns_idmap', 'raw', 'vnc_enabled', 'vnc_port', 'vnc_password', 'secure_boot', 'root_disk_size', 'root_disk_io_bus', 'storage_pool')
+
+    id: str
+    name: str
+    type: str
+    status: str
+    cpu: Union[None, str]
+    memory: Union[None, int]
+    autostart: bool
+    environment: dict
+    aliases: list
+    image: Any
+    userns_idmap: Any
+    raw: Union[None, dict]
+    vnc_enabled: bool
+    vnc_port: Union[None, int]
+    vnc_password: Union[None, str]
+    secure_boot: Union[None, bool]
+    root_disk_size: Union[None, int]
+    root_disk_io_bus: Any
+    storage_pool: str
+
+
+@dataclass
+class VirtInstanceGetInstancePost(_Modelo):
+    __slots__ = ('id', 'name', 'type', 'status', 'cpu', 'memory', 'autostart', 'environment', 'aliases', 'image', 'userns_idmap', 'raw', 'vnc_enabled', 'vnc_port', 'vnc_password', 'secure_boot', 'root_disk_size', 'root_disk_io_bus', 'storage_pool')
+    _claves = ('id', 'name', 'type', 'status', 'cpu', 'memory', 'autostart', 'environment', 'aliases', 'image', 'userns_idmap', 'raw', 'vnc_enabled', 'vnc_port', 'vnc_password', 'secure_boot', 'root_disk_size', 'root_disk_io_bus', 'storage_pool')
+
+    id: str
+    name: str
+    type: str
+    status: str
+    cpu: Union[None, str]
+    memory: Union[None, int]
+    autostart: bool
+    environment: dict
+    aliases: list
+    image: Any
+    userns_idmap: Any
+    raw: Union[None, dict]
+    vnc_enabled: bool
+    vnc_port: Union[None, int]
+    vnc_password: Union[None, str]
+    secure_boot: Union[None, bool]
+    root_disk_size: Union[None, int]
+    root_disk_io_bus: Any
+    storage_pool: str
+
+
+@dataclass
+class VirtInstanceIdGet(_Modelo):
+    __slots__ = ('id', 'name', 'type', 'status', 'cpu', 'memory', 'autostart', 'environment', 'aliases', 'image', 'userns_idmap', 'raw', 'vnc_enabled', 'vnc_port', 'vnc_password', 'secure_boot', 'root_disk_size', 'root_disk_io_bus', 'storage_pool')
+    _claves = ('id', 'name', 'type', 'status', 'cpu', 'memory', 'autostart', 'environment', 'aliases', 'image', 'userns_idmap', 'raw', 'vnc_enabled', 'vnc_port', 'vnc_password', 'secure_boot', 'root_disk_size', 'root_disk_io_bus', 'storage_pool')
+
+    id: str
+    name: str
+    type: str
+    status: str
+    cpu: Union[None, str]
+    memory: Union[None, int]
+    autostart: bool
+    environment: dict
+    aliases: list
+    image: Any
+    userns_idmap: Any
+    raw: Union[None, dict]
+    vnc_enabled: bool
+    vnc_port: Union[None, int]
+    vnc_password: Union[None, str]
+    secure_boot: Union[None, bool]
+    root_disk_size: Union[None, int]
+    root_disk_io_bus: Any
+    storage_pool: str
+
+
+@dataclass
+class VirtInstanceIdPut(_Modelo):
+    __slots__ = ('id', 'name', 'type', 'status', 'cpu', 'memory', 'autostart', 'environment', 'aliases', 'image', 'userns_idmap', 'raw', 'vnc_enabled', 'vnc_port', 'vnc_password', 'secure_boot', 'root_disk_size', 'root_disk_io_bus', 'storage_pool')
+    _claves = ('id', 'name', 'type', 'status', 'cpu', 'memory', 'autostart', 'environment', 'aliases', 'image', 'userns_idmap', 'raw', 'vnc_enabled', 'vnc_port', 'vnc_password', 'secure_boot', 'root_disk_size', 'root_disk_io_bus', 'storage_pool')
+
+    id: str
+    name: str
+    type: str
+    status: str
+    cpu: Union[None, str]
+    memory: Union[None, int]
+    autostart: bool
+    environment: dict
+    aliases: list
+    image: Any
+    userns_idmap: Any
+    raw: Union[None, dict]
+    vnc_enabled: bool
+    vnc_port: Union[None, int]
+    vnc_password: Union[None, str]
+    secure_boot: Union[None, bool]
+    root_disk_size: Union[None, int]
+    root_disk_io_bus: Any
+    storage_pool: str
+
+
+@dataclass
+class VirtVolumeGet(_Modelo):
+    __slots__ = ('id', 'name', 'storage_pool', 'content_type', 'created_at', 'type', 'config', 'used_by')
+    _claves = ('id', 'name', 'storage_pool', 'content_type', 'created_at', 'type', 'config', 'used_by')
+
+    id: str
+    name: str
+    storage_pool: str
+    content_type: str
+    created_at: str
+    type: str
+    config: dict
+    used_by: list
+
+
+@dataclass
+class VirtVolumePost(_Modelo):
+    __slots__ = ('id', 'name', 'storage_pool', 'content_type', 'created_at', 'type', 'config', 'used_by')
+    _claves = ('id', 'name', 'storage_pool', 'content_type', 'created_at', 'type', 'config', 'used_by')
+
+    id: str
+    name: str
+    storage_pool: str
+    content_type: str
+    created_at: str
+    type: str
+    config: dict
+    used_by: list
+
+
+@dataclass
+class VirtVolumeGetInstancePost(_Modelo):
+    __slots__ = ('id', 'name', 'storage_pool', 'content_type', 'created_at', 'type', 'config', 'used_by')
+    _claves = ('id', 'name', 'storage_pool', 'content_type', 'created_at', 'type', 'config', 'used_by')
+
+    id: str
+    name: str
+    storage_pool: str
+    content_type: str
+    created_at: str
+    type: str
+    config: dict
+    used_by: list
+
+
+@dataclass
+class VirtVolumeIdGet(_Modelo):
+    __slots__ = ('id', 'name', 'storage_pool', 'content_type', 'created_at', 'type', 'config', 'used_by')
+    _claves = ('id', 'name', 'storage_pool', 'content_type', 'created_at', 'type', 'config', 'used_by')
+
+    id: str
+    name: str
+    storage_pool: str
+    content_type: str
+    created_at: str
+    type: str
+    config: dict
+    used_by: list
+
+
+@dataclass
+class VirtVolumeIdPut(_Modelo):
+    __slots__ = ('id', 'name', 'storage_pool', 'content_type', 'created_at', 'type', 'config', 'used_by')
+    _claves = ('id', 'name', 'storage_pool', 'content_type', 'created_at', 'type', 'config', 'used_by')
+
+    id: str
+    name: str
+    storage_pool: str
+    content_type: str
+    created_at: str
+    type: str
+    config: dict
+    used_by: list
+
+
+@dataclass
+class VirtVolumeImportIsoPost(_Modelo):
+    __slots__ = ('id', 'name', 'storage_pool', 'content_type', 'created_at', 'type', 'config', 'used_by')
+    _claves = ('id', 'name', 'storage_pool', 'content_type', 'created_at', 'type', 'config', 'used_by')
+
+    id: str
+    name: str
+    storage_pool: str
+    content_type: str
+    created_at: str
+    type: str
+    config: dict
+    used_by: list
+
+
+@dataclass
+class VirtVolumeImportZvolPost(_Modelo):
+    __slots__ = ('id', 'name', 'storage_pool', 'content_type', 'created_at', 'type', 'config', 'used_by')
+    _claves = ('id', 'name', 'storage_pool', 'content_type', 'created_at', 'type', 'config', 'used_by')
+
+    id: str
+    name: str
+    storage_pool: str
+    content_type: str
+    created_at: str
+    type: str
+    config: dict
+    used_by: list
+
+
+@dataclass
+class VmwareGet(_Modelo):
+    __slots__ = ('datastore', 'filesystem', 'hostname', 'password', 'username', 'id', 'state')
+    _claves = ('datastore', 'filesystem', 'hostname', 'password', 'username', 'id', 'state')
+
+    datastore: str
+    filesystem: str
+    hostname: str
+    password: str
+    username: str
+    id: int
+    state: dict
+
+
+@dataclass
+class VmwarePost(_Modelo):
+    __slots__ = ('datastore', 'filesystem', 'hostname', 'password', 'username', 'id', 'state')
+    _claves = ('datastore', 'filesystem', 'hostname', 'password', 'username', 'id', 'state')
+
+    datastore: str
+    filesystem: str
+    hostname: str
+    password: str
+    username: str
+    id: int
+    state: dict
+
+
+@dataclass
+class VmwareGetInstancePost(_Modelo):
+    __slots__ = ('datastore', 'filesystem', 'hostname', 'password', 'username', 'id', 'state')
+    _claves = ('datastore', 'filesystem', 'hostname', 'password', 'username', 'id', 'state')
+
+    datastore: str
+    filesystem: str
+    hostname: str
+    password: str
+    username: str
+    id: int
+    state: dict
+
+
+@dataclass
+class VmwareIdGet(_Modelo):
+    __slots__ = ('datastore', 'filesystem', 'hostname', 'password', 'username', 'id', 'state')
+    _claves = ('datastore', 'filesystem', 'hostname', 'password', 'username', 'id', 'state')
+
+    datastore: str
+    filesystem: str
+    hostname: str
+    password: str
+    username: str
+    id: int
+    state: dict
+
+
+@dataclass
+class VmwareIdPut(_Modelo):
+    __slots__ = ('datastore', 'filesystem', 'hostname', 'password', 'username', 'id', 'state')
+    _claves = ('datastore', 'filesystem', 'hostname', 'password', 'username', 'id', 'state')
+
+    datastore: str
+    filesystem: str
+    hostname: str
+    password: str
+    username: str
+    id: int
+    state: dict
+
+
+class ApiTrueNAS:
+    """Un método por ruta y verbo de api-doc.json sobre un ``ClienteTrueNAS``"""
+
+    def __init__(self, cliente):
+        self.cliente = cliente
+
+    def _llamar(self, metodo, ruta, **kwargs):
+        response = self.cliente.request(metodo, ruta, **kwargs)
+        response.raise_for_status()
+        return cargar(response.content) if response.content else None
+
+    def _paginar(self, ruta, modelo, tamano_pagina, params):
+        offset = params.pop("offset", 0)
+        while True:
+            pagina = self._llamar("GET", ruta, params=dict(params, limit=tamano_pagina, offset=offset))
+            for elemento in pagina or []:
+                yield _convertir(elemento, modelo)
+            if not pagina or len(pagina) < tamano_pagina:
+                return
+            offset += tamano_pagina
+
+    def acme_dns_authenticator_get(self, **params) -> Union[AcmeDnsAuthenticatorGet, List[AcmeDnsAuthenticatorGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'acme/dns/authenticator', params=params), AcmeDnsAuthenticatorGet)
+
+    def iter_acme_dns_authenticator_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[AcmeDnsAuthenticatorGet]:
+        """Itera todos los resultados de /acme/dns/authenticator paginando con limit/offset"""
+        return self._paginar('acme/dns/authenticator', AcmeDnsAuthenticatorGet, tamano_pagina, params)
+
+    def acme_dns_authenticator_post(self, cuerpo=None) -> AcmeDnsAuthenticatorPost:
+        """Create a DNS Authenticator"""
+        return _convertir(self._llamar('POST', 'acme/dns/authenticator', json=cuerpo), AcmeDnsAuthenticatorPost)
+
+    def acme_dns_authenticator_authenticator_schemas_get(self) -> List[AcmeDnsAuthenticatorAuthenticatorSchemasGet]:
+        """Get the schemas for all DNS providers we support for ACME DNS Challenge and the respective attributes"""
+        return _convertir(self._llamar('GET', 'acme/dns/authenticator/authenticator_schemas'), AcmeDnsAuthenticatorAuthenticatorSchemasGet)
+
+    def acme_dns_authenticator_get_instance_post(self, cuerpo=None) -> AcmeDnsAuthenticatorGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'acme/dns/authenticator/get_instance', json=cuerpo), AcmeDnsAuthenticatorGetInstancePost)
+
+    def acme_dns_authenticator_id_delete(self, id) -> Any:
+        """Delete DNS Authenticator of `id`"""
+        return _convertir(self._llamar('DELETE', f"acme/dns/authenticator/id/{id}"), None)
+
+    def acme_dns_authenticator_id_get(self, id) -> Union[AcmeDnsAuthenticatorIdGet, List[AcmeDnsAuthenticatorIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"acme/dns/authenticator/id/{id}"), AcmeDnsAuthenticatorIdGet)
+
+    def acme_dns_authenticator_id_put(self, id, cuerpo=None) -> AcmeDnsAuthenticatorIdPut:
+        """Update DNS Authenticator of `id`"""
+        return _convertir(self._llamar('PUT', f"acme/dns/authenticator/id/{id}", json=cuerpo), AcmeDnsAuthenticatorIdPut)
+
+    def activedirectory_get(self) -> ActivedirectoryGet:
+        """GET /activedirectory"""
+        return _convertir(self._llamar('GET', 'activedirectory'), ActivedirectoryGet)
+
+    def activedirectory_put(self, cuerpo=None) -> ActivedirectoryPut:
+        """Update active directory configuration."""
+        return _convertir(self._llamar('PUT', 'activedirectory', json=cuerpo), ActivedirectoryPut)
+
+    def activedirectory_domain_info_post(self, cuerpo=None) -> ActivedirectoryDomainInfoPost:
+        """Returns the following information about the currently joined domain:"""
+        return _convertir(self._llamar('POST', 'activedirectory/domain_info', json=cuerpo), ActivedirectoryDomainInfoPost)
+
+    def activedirectory_leave_post(self, cuerpo=None) -> Any:
+        """Leave Active Directory domain. This will remove computer"""
+        return _convertir(self._llamar('POST', 'activedirectory/leave', json=cuerpo), None)
+
+    def activedirectory_nss_info_choices_get(self) -> Any:
+        """Returns list of available LDAP schema choices."""
+        return _convertir(self._llamar('GET', 'activedirectory/nss_info_choices'), None)
+
+    def alert_dismiss_post(self, cuerpo=None) -> Any:
+        """Dismiss `id` alert."""
+        return _convertir(self._llamar('POST', 'alert/dismiss', json=cuerpo), None)
+
+    def alert_list_get(self) -> List[AlertListGet]:
+        """List all types of alerts including active/dismissed currently in the system."""
+        return _convertir(self._llamar('GET', 'alert/list'), AlertListGet)
+
+    def alert_list_categories_get(self) -> List[AlertListCategoriesGet]:
+        """List all types of alerts which the system can issue."""
+        return _convertir(self._llamar('GET', 'alert/list_categories'), AlertListCategoriesGet)
+
+    def alert_list_policies_get(self) -> Any:
+        """List all alert policies which indicate the frequency of the alerts."""
+        return _convertir(self._llamar('GET', 'alert/list_policies'), None)
+
+    def alert_restore_post(self, cuerpo=None) -> Any:
+        """Restore `id` alert which had been dismissed."""
+        return _convertir(self._llamar('POST', 'alert/restore', json=cuerpo), None)
+
+    def alertclasses_get(self) -> AlertclassesGet:
+        """GET /alertclasses"""
+        return _convertir(self._llamar('GET', 'alertclasses'), AlertclassesGet)
+
+    def alertclasses_put(self, cuerpo=None) -> AlertclassesPut:
+        """Update default Alert settings."""
+        return _convertir(self._llamar('PUT', 'alertclasses', json=cuerpo), AlertclassesPut)
+
+    def alertservice_get(self, **params) -> Union[AlertserviceGet, List[AlertserviceGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'alertservice', params=params), AlertserviceGet)
+
+    def iter_alertservice_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[AlertserviceGet]:
+        """Itera todos los resultados de /alertservice paginando con limit/offset"""
+        return self._paginar('alertservice', AlertserviceGet, tamano_pagina, params)
+
+    def alertservice_post(self, cuerpo=None) -> AlertservicePost:
+        """Create an Alert Service of specified `type`."""
+        return _convertir(self._llamar('POST', 'alertservice', json=cuerpo), AlertservicePost)
+
+    def alertservice_get_instance_post(self, cuerpo=None) -> AlertserviceGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'alertservice/get_instance', json=cuerpo), AlertserviceGetInstancePost)
+
+    def alertservice_id_delete(self, id) -> Any:
+        """Delete Alert Service of `id`."""
+        return _convertir(self._llamar('DELETE', f"alertservice/id/{id}"), None)
+
+    def alertservice_id_get(self, id) -> Union[AlertserviceIdGet, List[AlertserviceIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"alertservice/id/{id}"), AlertserviceIdGet)
+
+    def alertservice_id_put(self, id, cuerpo=None) -> AlertserviceIdPut:
+        """Update Alert Service of `id`."""
+        return _convertir(self._llamar('PUT', f"alertservice/id/{id}", json=cuerpo), AlertserviceIdPut)
+
+    def alertservice_test_post(self, cuerpo=None) -> Any:
+        """Send a test alert using `type` of Alert Service."""
+        return _convertir(self._llamar('POST', 'alertservice/test', json=cuerpo), None)
+
+    def api_key_get(self, **params) -> Union[ApiKeyGet, List[ApiKeyGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'api_key', params=params), ApiKeyGet)
+
+    def iter_api_key_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[ApiKeyGet]:
+        """Itera todos los resultados de /api_key paginando con limit/offset"""
+        return self._paginar('api_key', ApiKeyGet, tamano_pagina, params)
+
+    def api_key_post(self, cuerpo=None) -> ApiKeyPost:
+        """Creates API Key."""
+        return _convertir(self._llamar('POST', 'api_key', json=cuerpo), ApiKeyPost)
+
+    def api_key_get_instance_post(self, cuerpo=None) -> ApiKeyGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'api_key/get_instance', json=cuerpo), ApiKeyGetInstancePost)
+
+    def api_key_id_delete(self, id) -> Any:
+        """Delete API Key `id`."""
+        return _convertir(self._llamar('DELETE', f"api_key/id/{id}"), None)
+
+    def api_key_id_get(self, id) -> Union[ApiKeyIdGet, List[ApiKeyIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"api_key/id/{id}"), ApiKeyIdGet)
+
+    def api_key_id_put(self, id, cuerpo=None) -> Union[ApiKeyIdPut, List[ApiKeyIdPut], Any]:
+        """Update API Key `id`."""
+        return _convertir(self._llamar('PUT', f"api_key/id/{id}", json=cuerpo), ApiKeyIdPut)
+
+    def app_get(self, **params) -> Union[AppGet, List[AppGet], Any]:
+        """Query all apps with `query-filters` and `query-options`."""
+        return _convertir(self._llamar('GET', 'app', params=params), AppGet)
+
+    def iter_app_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[AppGet]:
+        """Itera todos los resultados de /app paginando con limit/offset"""
+        return self._paginar('app', AppGet, tamano_pagina, params)
+
+    def app_post(self, cuerpo=None) -> AppPost:
+        """Create an app with `app_name` using `catalog_app` with `train` and `version`."""
+        return _convertir(self._llamar('POST', 'app', json=cuerpo), AppPost)
+
+    def app_available_get(self, **params) -> Union[AppAvailableGet, List[AppAvailableGet], Any]:
+        """Retrieve all available applications from all configured catalogs."""
+        return _convertir(self._llamar('GET', 'app/available', params=params), AppAvailableGet)
+
+    def iter_app_available_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[AppAvailableGet]:
+        """Itera todos los resultados de /app/available paginando con limit/offset"""
+        return self._paginar('app/available', AppAvailableGet, tamano_pagina, params)
+
+    def app_available_space_get(self) -> Any:
+        """Returns space available in bytes in the configured apps pool which apps can consume"""
+        return _convertir(self._llamar('GET', 'app/available_space'), None)
+
+    def app_categories_get(self) -> Any:
+        """Retrieve list of valid categories which have associated applications."""
+        return _convertir(self._llamar('GET', 'app/categories'), None)
+
+    def app_certificate_authority_choices_get(self) -> List[AppCertificateAuthorityChoicesGet]:
+        """Returns certificate authorities which can be used by applications."""
+        return _convertir(self._llamar('GET', 'app/certificate_authority_choices'), AppCertificateAuthorityChoicesGet)
+
+    def app_certificate_choices_get(self) -> List[AppCertificateChoicesGet]:
+        """Returns certificates which can be used by applications."""
+        return _convertir(self._llamar('GET', 'app/certificate_choices'), AppCertificateChoicesGet)
+
+    def app_config_post(self, cuerpo=None) -> Any:
+        """Retrieve user specified configuration of `app_name`."""
+        return _convertir(self._llamar('POST', 'app/config', json=cuerpo), None)
+
+    def app_container_console_choices_post(self, cuerpo=None) -> Any:
+        """Returns container console choices for `app_name`."""
+        return _convertir(self._llamar('POST', 'app/container_console_choices', json=cuerpo), None)
+
+    def app_container_ids_post(self, cuerpo=None) -> Any:
+        """Returns container IDs for `app_name`."""
+        return _convertir(self._llamar('POST', 'app/container_ids', json=cuerpo), None)
+
+    def app_convert_to_custom_post(self, cuerpo=None) -> AppConvertToCustomPost:
+        """Convert `app_name` to a custom app."""
+        return _convertir(self._llamar('POST', 'app/convert_to_custom', json=cuerpo), AppConvertToCustomPost)
+
+    def app_get_instance_post(self, cuerpo=None) -> AppGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'app/get_instance', json=cuerpo), AppGetInstancePost)
+
+    def app_gpu_choices_get(self) -> Any:
+        """Returns GPU choices which can be used by applications."""
+        return _convertir(self._llamar('GET', 'app/gpu_choices'), None)
+
+    def app_id_delete(self, id, cuerpo=None) -> Any:
+        """Delete `app_name` app."""
+        return _convertir(self._llamar('DELETE', f"app/id/{id}", json=cuerpo), None)
+
+    def app_id_get(self, id) -> Union[AppIdGet, List[AppIdGet], Any]:
+        """Query all apps with `query-filters` and `query-options`."""
+        return _convertir(self._llamar('GET', f"app/id/{id}"), AppIdGet)
+
+    def app_id_put(self, id, cuerpo=None) -> AppIdPut:
+        """Update `app_name` app with new configuration."""
+        return _convertir(self._llamar('PUT', f"app/id/{id}", json=cuerpo), AppIdPut)
+
+    def app_image_get(self, **params) -> Union[AppImageGet, List[AppImageGet], Any]:
+        """Query all docker images with `query-filters` and `query-options`."""
+        return _convertir(self._llamar('GET', 'app/image', params=params), AppImageGet)
+
+    def iter_app_image_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[AppImageGet]:
+        """Itera todos los resultados de /app/image paginando con limit/offset"""
+        return self._paginar('app/image', AppImageGet, tamano_pagina, params)
+
+    def app_image_dockerhub_rate_limit_get(self) -> AppImageDockerhubRateLimitGet:
+        """Returns the current rate limit information for Docker Hub registry."""
+        return _convertir(self._llamar('GET', 'app/image/dockerhub_rate_limit'), AppImageDockerhubRateLimitGet)
+
+    def app_image_get_instance_post(self, cuerpo=None) -> AppImageGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'app/image/get_instance', json=cuerpo), AppImageGetInstancePost)
+
+    def app_image_id_delete(self, id, cuerpo=None) -> Any:
+        """Delete docker image `image_id`."""
+        return _convertir(self._llamar('DELETE', f"app/image/id/{id}", json=cuerpo), None)
+
+    def app_image_id_get(self, id) -> Union[AppImageIdGet, List[AppImageIdGet], Any]:
+        """Query all docker images with `query-filters` and `query-options`."""
+        return _convertir(self._llamar('GET', f"app/image/id/{id}"), AppImageIdGet)
+
+    def app_image_pull_post(self, cuerpo=None) -> Any:
+        """`image` is the name of the image to pull. Format for the name is 'registry/repo/image:v1.2.3' where"""
+        return _convertir(self._llamar('POST', 'app/image/pull', json=cuerpo), None)
+
+    def app_ip_choices_get(self) -> Any:
+        """Returns IP choices which can be used by applications."""
+        return _convertir(self._llamar('GET', 'app/ip_choices'), None)
+
+    def app_ix_volume_exists_post(self, cuerpo=None) -> Any:
+        """Check if ix-volumes exist for `app_name`."""
+        return _convertir(self._llamar('POST', 'app/ix_volume/exists', json=cuerpo), None)
+
+    def app_ix_volume_query_get(self, **params) -> Union[AppIxVolumeQueryGet, List[AppIxVolumeQueryGet], Any]:
+        """Query ix-volumes with `filters` and `options`."""
+        return _convertir(self._llamar('GET', 'app/ix_volume/query', params=params), AppIxVolumeQueryGet)
+
+    def iter_app_ix_volume_query_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[AppIxVolumeQueryGet]:
+        """Itera todos los resultados de /app/ix_volume/query paginando con limit/offset"""
+        return self._paginar('app/ix_volume/query', AppIxVolumeQueryGet, tamano_pagina, params)
+
+    def app_latest_get(self, **params) -> Union[AppLatestGet, List[AppLatestGet], Any]:
+        """Retrieve latest updated apps."""
+        return _convertir(self._llamar('GET', 'app/latest', params=params), AppLatestGet)
+
+    def iter_app_latest_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[AppLatestGet]:
+        """Itera todos los resultados de /app/latest paginando con limit/offset"""
+        return self._paginar('app/latest', AppLatestGet, tamano_pagina, params)
+
+    def app_outdated_docker_images_post(self, cuerpo=None) -> Any:
+        """Returns a list of outdated docker images for the specified app `name`."""
+        return _convertir(self._llamar('POST', 'app/outdated_docker_images', json=cuerpo), None)
+
+    def app_pull_images_post(self, cuerpo=None) -> Any:
+        """Pulls docker images for the specified app `name`."""
+        return _convertir(self._llamar('POST', 'app/pull_images', json=cuerpo), None)
+
+    def app_redeploy_post(self, cuerpo=None) -> AppRedeployPost:
+        """Redeploy `app_name` app."""
+        return _convertir(self._llamar('POST', 'app/redeploy', json=cuerpo), AppRedeployPost)
+
+    def app_registry_get(self, **params) -> Union[AppRegistryGet, List[AppRegistryGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'app/registry', params=params), AppRegistryGet)
+
+    def iter_app_registry_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[AppRegistryGet]:
+        """Itera todos los resultados de /app/registry paginando con limit/offset"""
+        return self._paginar('app/registry', AppRegistryGet, tamano_pagina, params)
+
+    def app_registry_post(self, cuerpo=None) -> AppRegistryPost:
+        """Create an app registry entry."""
+        return _convertir(self._llamar('POST', 'app/registry', json=cuerpo), AppRegistryPost)
+
+    def app_registry_get_instance_post(self, cuerpo=None) -> AppRegistryGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'app/registry/get_instance', json=cuerpo), AppRegistryGetInstancePost)
+
+    def app_registry_id_delete(self, id) -> Any:
+        """Delete an app registry entry."""
+        return _convertir(self._llamar('DELETE', f"app/registry/id/{id}"), None)
+
+    def app_registry_id_get(self, id) -> Union[AppRegistryIdGet, List[AppRegistryIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"app/registry/id/{id}"), AppRegistryIdGet)
+
+    def app_registry_id_put(self, id, cuerpo=None) -> AppRegistryIdPut:
+        """Update an app registry entry."""
+        return _convertir(self._llamar('PUT', f"app/registry/id/{id}", json=cuerpo), AppRegistryIdPut)
+
+    def app_rollback_post(self, cuerpo=None) -> AppRollbackPost:
+        """Rollback `app_name` app to previous version."""
+        return _convertir(self._llamar('POST', 'app/rollback', json=cuerpo), AppRollbackPost)
+
+    def app_rollback_versions_post(self, cuerpo=None) -> Any:
+        """Retrieve versions available for rollback for `app_name` app."""
+        return _convertir(self._llamar('POST', 'app/rollback_versions', json=cuerpo), None)
+
+    def app_similar_post(self, cuerpo=None) -> List[AppSimilarPost]:
+        """Retrieve applications which are similar to `app_name`."""
+        return _convertir(self._llamar('POST', 'app/similar', json=cuerpo), AppSimilarPost)
+
+    def app_start_post(self, cuerpo=None) -> Any:
+        """Start `app_name` app."""
+        return _convertir(self._llamar('POST', 'app/start', json=cuerpo), None)
+
+    def app_stop_post(self, cuerpo=None) -> Any:
+        """Stop `app_name` app."""
+        return _convertir(self._llamar('POST', 'app/stop', json=cuerpo), None)
+
+    def app_upgrade_post(self, cuerpo=None) -> AppUpgradePost:
+        """Upgrade `app_name` app to `app_version`."""
+        return _convertir(self._llamar('POST', 'app/upgrade', json=cuerpo), AppUpgradePost)
+
+    def app_upgrade_summary_post(self, cuerpo=None) -> AppUpgradeSummaryPost:
+        """Retrieve upgrade summary for `app_name`."""
+        return _convertir(self._llamar('POST', 'app/upgrade_summary', json=cuerpo), AppUpgradeSummaryPost)
+
+    def app_used_ports_get(self) -> Any:
+        """Returns ports in use by applications."""
+        return _convertir(self._llamar('GET', 'app/used_ports'), None)
+
+    def audit_get(self) -> AuditGet:
+        """GET /audit"""
+        return _convertir(self._llamar('GET', 'audit'), AuditGet)
+
+    def audit_put(self, cuerpo=None) -> Any:
+        """Update default audit settings."""
+        return _convertir(self._llamar('PUT', 'audit', json=cuerpo), None)
+
+    def audit_download_report_post(self, cuerpo=None) -> Any:
+        """Download the audit report with the specified name from the server."""
+        return _convertir(self._llamar('POST', 'audit/download_report', json=cuerpo), None)
+
+    def audit_export_post(self, cuerpo=None) -> Any:
+        """Generate an audit report based on the specified `query-filters` and"""
+        return _convertir(self._llamar('POST', 'audit/export', json=cuerpo), None)
+
+    def audit_query_post(self, cuerpo=None) -> Union[AuditQueryPost, List[AuditQueryPost], Any]:
+        """Query contents of audit databases specified by `services`."""
+        return _convertir(self._llamar('POST', 'audit/query', json=cuerpo), AuditQueryPost)
+
+    def auth_generate_onetime_password_post(self, cuerpo=None) -> Any:
+        """Generate a password for the specified username that may be used only a single time to authenticate"""
+        return _convertir(self._llamar('POST', 'auth/generate_onetime_password', json=cuerpo), None)
+
+    def auth_generate_token_post(self, cuerpo=None) -> Any:
+        """Generate a token to be used for authentication."""
+        return _convertir(self._llamar('POST', 'auth/generate_token', json=cuerpo), None)
+
+    def auth_mechanism_choices_get(self) -> Any:
+        """Get list of available authentication mechanisms available for auth.login_ex"""
+        return _convertir(self._llamar('GET', 'auth/mechanism_choices'), None)
+
+    def auth_terminate_session_post(self, cuerpo=None) -> Any:
+        """Terminates session `id`."""
+        return _convertir(self._llamar('POST', 'auth/terminate_session', json=cuerpo), None)
+
+    def auth_twofactor_get(self) -> AuthTwofactorGet:
+        """GET /auth/twofactor"""
+        return _convertir(self._llamar('GET', 'auth/twofactor'), AuthTwofactorGet)
+
+    def auth_twofactor_put(self, cuerpo=None) -> AuthTwofactorPut:
+        """`window` extends the validity to `window` many counter ticks before and after the current one."""
+        return _convertir(self._llamar('PUT', 'auth/twofactor', json=cuerpo), AuthTwofactorPut)
+
+    def boot_attach_post(self, cuerpo=None) -> Any:
+        """Attach a disk to the boot pool, turning a stripe into a mirror."""
+        return _convertir(self._llamar('POST', 'boot/attach', json=cuerpo), None)
+
+    def boot_detach_post(self, cuerpo=None) -> Any:
+        """Detach given `dev` from boot pool."""
+        return _convertir(self._llamar('POST', 'boot/detach', json=cuerpo), None)
+
+    def boot_environment_activate_post(self, cuerpo=None) -> BootEnvironmentActivatePost:
+        """POST /boot/environment/activate"""
+        return _convertir(self._llamar('POST', 'boot/environment/activate', json=cuerpo), BootEnvironmentActivatePost)
+
+    def boot_environment_clone_post(self, cuerpo=None) -> BootEnvironmentClonePost:
+        """POST /boot/environment/clone"""
+        return _convertir(self._llamar('POST', 'boot/environment/clone', json=cuerpo), BootEnvironmentClonePost)
+
+    def boot_environment_destroy_post(self, cuerpo=None) -> Any:
+        """POST /boot/environment/destroy"""
+        return _convertir(self._llamar('POST', 'boot/environment/destroy', json=cuerpo), None)
+
+    def boot_environment_keep_post(self, cuerpo=None) -> BootEnvironmentKeepPost:
+        """POST /boot/environment/keep"""
+        return _convertir(self._llamar('POST', 'boot/environment/keep', json=cuerpo), BootEnvironmentKeepPost)
+
+    def boot_environment_query_get(self, **params) -> Union[BootEnvironmentQueryGet, List[BootEnvironmentQueryGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'boot/environment/query', params=params), BootEnvironmentQueryGet)
+
+    def iter_boot_environment_query_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[BootEnvironmentQueryGet]:
+        """Itera todos los resultados de /boot/environment/query paginando con limit/offset"""
+        return self._paginar('boot/environment/query', BootEnvironmentQueryGet, tamano_pagina, params)
+
+    def boot_get_disks_get(self) -> Any:
+        """Returns disks of the boot pool."""
+        return _convertir(self._llamar('GET', 'boot/get_disks'), None)
+
+    def boot_get_state_get(self) -> BootGetStateGet:
+        """Returns the current state of the boot pool, including all vdevs, properties and datasets."""
+        return _convertir(self._llamar('GET', 'boot/get_state'), BootGetStateGet)
+
+    def boot_replace_post(self, cuerpo=None) -> Any:
+        """Replace device `label` on boot pool with `dev`."""
+        return _convertir(self._llamar('POST', 'boot/replace', json=cuerpo), None)
+
+    def boot_scrub_get(self) -> Any:
+        """Scrub on boot pool."""
+        return _convertir(self._llamar('GET', 'boot/scrub'), None)
+
+    def boot_set_scrub_interval_post(self, cuerpo=None) -> Any:
+        """Set Automatic Scrub Interval value in days."""
+        return _convertir(self._llamar('POST', 'boot/set_scrub_interval', json=cuerpo), None)
+
+    def catalog_get(self) -> CatalogGet:
+        """GET /catalog"""
+        return _convertir(self._llamar('GET', 'catalog'), CatalogGet)
+
+    def catalog_put(self, cuerpo=None) -> CatalogPut:
+        """Update catalog preferences."""
+        return _convertir(self._llamar('PUT', 'catalog', json=cuerpo), CatalogPut)
+
+    def catalog_apps_post(self, cuerpo=None) -> Any:
+        """Retrieve apps details for `label` catalog."""
+        return _convertir(self._llamar('POST', 'catalog/apps', json=cuerpo), None)
+
+    def catalog_get_app_details_post(self, cuerpo=None) -> CatalogGetAppDetailsPost:
+        """Retrieve information of `app_name` `app_version_details.catalog` catalog app."""
+        return _convertir(self._llamar('POST', 'catalog/get_app_details', json=cuerpo), CatalogGetAppDetailsPost)
+
+    def catalog_sync_get(self) -> Any:
+        """Sync truenas catalog to retrieve latest changes from upstream."""
+        return _convertir(self._llamar('GET', 'catalog/sync'), None)
+
+    def catalog_trains_get(self) -> Any:
+        """Retrieve available trains."""
+        return _convertir(self._llamar('GET', 'catalog/trains'), None)
+
+    def certificate_get(self, **params) -> Union[CertificateGet, List[CertificateGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'certificate', params=params), CertificateGet)
+
+    def iter_certificate_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[CertificateGet]:
+        """Itera todos los resultados de /certificate paginando con limit/offset"""
+        return self._paginar('certificate', CertificateGet, tamano_pagina, params)
+
+    def certificate_post(self, cuerpo=None) -> CertificatePost:
+        """Create a new Certificate"""
+        return _convertir(self._llamar('POST', 'certificate', json=cuerpo), CertificatePost)
+
+    def certificate_acme_server_choices_get(self) -> Any:
+        """Dictionary of popular ACME Servers with their directory URI"""
+        return _convertir(self._llamar('GET', 'certificate/acme_server_choices'), None)
+
+    def certificate_country_choices_get(self) -> Any:
+        """Returns country choices for creating a certificate/csr."""
+        return _convertir(self._llamar('GET', 'certificate/country_choices'), None)
+
+    def certificate_ec_curve_choices_get(self) -> Any:
+        """Dictionary of supported EC curves."""
+        return _convertir(self._llamar('GET', 'certificate/ec_curve_choices'), None)
+
+    def certificate_extended_key_usage_choices_get(self) -> Any:
+        """Dictionary of names that can be used in the"""
+        return _convertir(self._llamar('GET', 'certificate/extended_key_usage_choices'), None)
+
+    def certificate_get_instance_post(self, cuerpo=None) -> CertificateGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'certificate/get_instance', json=cuerpo), CertificateGetInstancePost)
+
+    def certificate_id_delete(self, id, cuerpo=None) -> Any:
+        """Delete certificate of `id`."""
+        return _convertir(self._llamar('DELETE', f"certificate/id/{id}", json=cuerpo), None)
+
+    def certificate_id_get(self, id) -> Union[CertificateIdGet, List[CertificateIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"certificate/id/{id}"), CertificateIdGet)
+
+    def certificate_id_put(self, id, cuerpo=None) -> CertificateIdPut:
+        """Update certificate of `id`"""
+        return _convertir(self._llamar('PUT', f"certificate/id/{id}", json=cuerpo), CertificateIdPut)
+
+    def certificateauthority_get(self, **params) -> Union[CertificateauthorityGet, List[CertificateauthorityGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'certificateauthority', params=params), CertificateauthorityGet)
+
+    def iter_certificateauthority_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[CertificateauthorityGet]:
+        """Itera todos los resultados de /certificateauthority paginando con limit/offset"""
+        return self._paginar('certificateauthority', CertificateauthorityGet, tamano_pagina, params)
+
+    def certificateauthority_post(self, cuerpo=None) -> CertificateauthorityPost:
+        """Create a new Certificate Authority"""
+        return _convertir(self._llamar('POST', 'certificateauthority', json=cuerpo), CertificateauthorityPost)
+
+    def certificateauthority_ca_sign_csr_post(self, cuerpo=None) -> CertificateauthorityCaSignCsrPost:
+        """Sign CSR by Certificate Authority of `ca_id`"""
+        return _convertir(self._llamar('POST', 'certificateauthority/ca_sign_csr', json=cuerpo), CertificateauthorityCaSignCsrPost)
+
+    def certificateauthority_get_instance_post(self, cuerpo=None) -> CertificateauthorityGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'certificateauthority/get_instance', json=cuerpo), CertificateauthorityGetInstancePost)
+
+    def certificateauthority_id_delete(self, id) -> Any:
+        """Delete a Certificate Authority of `id`"""
+        return _convertir(self._llamar('DELETE', f"certificateauthority/id/{id}"), None)
+
+    def certificateauthority_id_get(self, id) -> Union[CertificateauthorityIdGet, List[CertificateauthorityIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"certificateauthority/id/{id}"), CertificateauthorityIdGet)
+
+    def certificateauthority_id_put(self, id, cuerpo=None) -> CertificateauthorityIdPut:
+        """Update Certificate Authority of `id`"""
+        return _convertir(self._llamar('PUT', f"certificateauthority/id/{id}", json=cuerpo), CertificateauthorityIdPut)
+
+    def cloud_backup_get(self, **params) -> Union[CloudBackupGet, List[CloudBackupGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'cloud_backup', params=params), CloudBackupGet)
+
+    def iter_cloud_backup_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[CloudBackupGet]:
+        """Itera todos los resultados de /cloud_backup paginando con limit/offset"""
+        return self._paginar('cloud_backup', CloudBackupGet, tamano_pagina, params)
+
+    def cloud_backup_post(self, cuerpo=None) -> CloudBackupPost:
+        """Create a new cloud backup task"""
+        return _convertir(self._llamar('POST', 'cloud_backup', json=cuerpo), CloudBackupPost)
+
+    def cloud_backup_delete_snapshot_post(self, cuerpo=None) -> Any:
+        """Delete snapshot `snapshot_id` created by the cloud backup job `id`."""
+        return _convertir(self._llamar('POST', 'cloud_backup/delete_snapshot', json=cuerpo), None)
+
+    def cloud_backup_get_instance_post(self, cuerpo=None) -> CloudBackupGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'cloud_backup/get_instance', json=cuerpo), CloudBackupGetInstancePost)
+
+    def cloud_backup_id_delete(self, id) -> Any:
+        """Delete cloud backup entry `id`."""
+        return _convertir(self._llamar('DELETE', f"cloud_backup/id/{id}"), None)
+
+    def cloud_backup_id_get(self, id) -> Union[CloudBackupIdGet, List[CloudBackupIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"cloud_backup/id/{id}"), CloudBackupIdGet)
+
+    def cloud_backup_id_put(self, id, cuerpo=None) -> CloudBackupIdPut:
+        """Update the cloud backup entry `id` with `data`."""
+        return _convertir(self._llamar('PUT', f"cloud_backup/id/{id}", json=cuerpo), CloudBackupIdPut)
+
+    def cloud_backup_id_abort_post(self, id, cuerpo=None) -> Any:
+        """Abort a running cloud backup task."""
+        return _convertir(self._llamar('POST', f"cloud_backup/id/{id}/abort", json=cuerpo), None)
+
+    def cloud_backup_id_sync_post(self, id, cuerpo=None) -> Any:
+        """Run the cloud backup job `id`."""
+        return _convertir(self._llamar('POST', f"cloud_backup/id/{id}/sync", json=cuerpo), None)
+
+    def cloud_backup_list_snapshot_directory_post(self, cuerpo=None) -> List[CloudBackupListSnapshotDirectoryPost]:
+        """List files in the directory `path` of the `snapshot_id` created by the cloud backup job `id`."""
+        return _convertir(self._llamar('POST', 'cloud_backup/list_snapshot_directory', json=cuerpo), CloudBackupListSnapshotDirectoryPost)
+
+    def cloud_backup_list_snapshots_post(self, cuerpo=None) -> List[CloudBackupListSnapshotsPost]:
+        """List existing snapshots for the cloud backup job `id`."""
+        return _convertir(self._llamar('POST', 'cloud_backup/list_snapshots', json=cuerpo), CloudBackupListSnapshotsPost)
+
+    def cloud_backup_restore_post(self, cuerpo=None) -> Any:
+        """Restore files to the directory `destination_path` from the `snapshot_id` subfolder `subfolder`"""
+        return _convertir(self._llamar('POST', 'cloud_backup/restore', json=cuerpo), None)
+
+    def cloud_backup_transfer_setting_choices_get(self) -> Any:
+        """Return all possible choices for `cloud_backup.create.transfer_setting`."""
+        return _convertir(self._llamar('GET', 'cloud_backup/transfer_setting_choices'), None)
+
+    def cloudsync_get(self, **params) -> Union[CloudsyncGet, List[CloudsyncGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'cloudsync', params=params), CloudsyncGet)
+
+    def iter_cloudsync_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[CloudsyncGet]:
+        """Itera todos los resultados de /cloudsync paginando con limit/offset"""
+        return self._paginar('cloudsync', CloudsyncGet, tamano_pagina, params)
+
+    def cloudsync_post(self, cuerpo=None) -> CloudsyncPost:
+        """Creates a new cloud_sync entry."""
+        return _convertir(self._llamar('POST', 'cloudsync', json=cuerpo), CloudsyncPost)
+
+    def cloudsync_create_bucket_post(self, cuerpo=None) -> Any:
+        """Creates a new bucket `name` using ` credentials_id`."""
+        return _convertir(self._llamar('POST', 'cloudsync/create_bucket', json=cuerpo), None)
+
+    def cloudsync_credentials_get(self, **params) -> Union[CloudsyncCredentialsGet, List[CloudsyncCredentialsGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'cloudsync/credentials', params=params), CloudsyncCredentialsGet)
+
+    def iter_cloudsync_credentials_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[CloudsyncCredentialsGet]:
+        """Itera todos los resultados de /cloudsync/credentials paginando con limit/offset"""
+        return self._paginar('cloudsync/credentials', CloudsyncCredentialsGet, tamano_pagina, params)
+
+    def cloudsync_credentials_post(self, cuerpo=None) -> CloudsyncCredentialsPost:
+        """Create Cloud Sync Credentials."""
+        return _convertir(self._llamar('POST', 'cloudsync/credentials', json=cuerpo), CloudsyncCredentialsPost)
+
+    def cloudsync_credentials_get_instance_post(self, cuerpo=None) -> CloudsyncCredentialsGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'cloudsync/credentials/get_instance', json=cuerpo), CloudsyncCredentialsGetInstancePost)
+
+    def cloudsync_credentials_id_delete(self, id) -> Any:
+        """Delete Cloud Sync Credentials of `id`."""
+        return _convertir(self._llamar('DELETE', f"cloudsync/credentials/id/{id}"), None)
+
+    def cloudsync_credentials_id_get(self, id) -> Union[CloudsyncCredentialsIdGet, List[CloudsyncCredentialsIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"cloudsync/credentials/id/{id}"), CloudsyncCredentialsIdGet)
+
+    def cloudsync_credentials_id_put(self, id, cuerpo=None) -> CloudsyncCredentialsIdPut:
+        """Update Cloud Sync Credentials of `id`."""
+        return _convertir(self._llamar('PUT', f"cloudsync/credentials/id/{id}", json=cuerpo), CloudsyncCredentialsIdPut)
+
+    def cloudsync_credentials_verify_post(self, cuerpo=None) -> CloudsyncCredentialsVerifyPost:
+        """Verify if `attributes` provided for `provider` are authorized by the `provider`."""
+        return _convertir(self._llamar('POST', 'cloudsync/credentials/verify', json=cuerpo), CloudsyncCredentialsVerifyPost)
+
+    def cloudsync_get_instance_post(self, cuerpo=None) -> CloudsyncGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'cloudsync/get_instance', json=cuerpo), CloudsyncGetInstancePost)
+
+    def cloudsync_id_delete(self, id) -> Any:
+        """Deletes cloud_sync entry `id`."""
+        return _convertir(self._llamar('DELETE', f"cloudsync/id/{id}"), None)
+
+    def cloudsync_id_get(self, id) -> Union[CloudsyncIdGet, List[CloudsyncIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"cloudsync/id/{id}"), CloudsyncIdGet)
+
+    def cloudsync_id_put(self, id, cuerpo=None) -> CloudsyncIdPut:
+        """Updates the cloud_sync entry `id` with `data`."""
+        return _convertir(self._llamar('PUT', f"cloudsync/id/{id}", json=cuerpo), CloudsyncIdPut)
+
+    def cloudsync_id_abort_post(self, id, cuerpo=None) -> Any:
+        """Aborts cloud sync task."""
+        return _convertir(self._llamar('POST', f"cloudsync/id/{id}/abort", json=cuerpo), None)
+
+    def cloudsync_id_restore_post(self, id, cuerpo=None) -> Any:
+        """Create the opposite of cloud sync task `id` (PULL if it was PUSH and vice versa)."""
+        return _convertir(self._llamar('POST', f"cloudsync/id/{id}/restore", json=cuerpo), None)
+
+    def cloudsync_id_sync_post(self, id, cuerpo=None) -> Any:
+        """Run the cloud_sync job `id`, syncing the local data to remote."""
+        return _convertir(self._llamar('POST', f"cloudsync/id/{id}/sync", json=cuerpo), None)
+
+    def cloudsync_list_buckets_post(self, cuerpo=None) -> Any:
+        """POST /cloudsync/list_buckets"""
+        return _convertir(self._llamar('POST', 'cloudsync/list_buckets', json=cuerpo), None)
+
+    def cloudsync_list_directory_post(self, cuerpo=None) -> Any:
+        """List contents of a remote bucket / directory."""
+        return _convertir(self._llamar('POST', 'cloudsync/list_directory', json=cuerpo), None)
+
+    def cloudsync_onedrive_list_drives_post(self, cuerpo=None) -> List[CloudsyncOnedriveListDrivesPost]:
+        """Lists all available drives and their types for given Microsoft OneDrive credentials."""
+        return _convertir(self._llamar('POST', 'cloudsync/onedrive_list_drives', json=cuerpo), CloudsyncOnedriveListDrivesPost)
+
+    def cloudsync_providers_get(self) -> Any:
+        """Returns a list of dictionaries of supported providers for Cloud Sync Tasks."""
+        return _convertir(self._llamar('GET', 'cloudsync/providers'), None)
+
+    def cloudsync_sync_onetime_post(self, cuerpo=None) -> Any:
+        """Run cloud sync task without creating it."""
+        return _convertir(self._llamar('POST', 'cloudsync/sync_onetime', json=cuerpo), None)
+
+    def config_reset_post(self, cuerpo=None) -> Any:
+        """Reset database to configuration defaults."""
+        return _convertir(self._llamar('POST', 'config/reset', json=cuerpo), None)
+
+    def config_save_post(self, cuerpo=None) -> Any:
+        """Create a tar file of security-sensitive information. These options select which information"""
+        return _convertir(self._llamar('POST', 'config/save', json=cuerpo), None)
+
+    def config_upload_post(self) -> Any:
+        """Accepts a configuration file via job pipe."""
+        return _convertir(self._llamar('POST', 'config/upload'), None)
+
+    def core_arp_post(self, cuerpo=None) -> Any:
+        """POST /core/arp"""
+        return _convertir(self._llamar('POST', 'core/arp', json=cuerpo), None)
+
+    def core_debug_post(self, cuerpo=None) -> Any:
+        """Setup middlewared for remote debugging."""
+        return _convertir(self._llamar('POST', 'core/debug', json=cuerpo), None)
+
+    def core_download_post(self, cuerpo=None) -> Any:
+        """Core helper to call a job marked for download."""
+        return _convertir(self._llamar('POST', 'core/download', json=cuerpo), None)
+
+    def core_get_jobs_get(self, **params) -> Union[CoreGetJobsGet, List[CoreGetJobsGet], Any]:
+        """Get information about long-running jobs."""
+        return _convertir(self._llamar('GET', 'core/get_jobs', params=params), CoreGetJobsGet)
+
+    def iter_core_get_jobs_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[CoreGetJobsGet]:
+        """Itera todos los resultados de /core/get_jobs paginando con limit/offset"""
+        return self._paginar('core/get_jobs', CoreGetJobsGet, tamano_pagina, params)
+
+    def core_job_abort_post(self, cuerpo=None) -> Any:
+        """POST /core/job_abort"""
+        return _convertir(self._llamar('POST', 'core/job_abort', json=cuerpo), None)
+
+    def core_job_download_logs_post(self, cuerpo=None) -> Any:
+        """Download logs of the job `id`."""
+        return _convertir(self._llamar('POST', 'core/job_download_logs', json=cuerpo), None)
+
+    def core_job_wait_post(self, cuerpo=None) -> Any:
+        """POST /core/job_wait"""
+        return _convertir(self._llamar('POST', 'core/job_wait', json=cuerpo), None)
+
+    def core_ping_get(self) -> Any:
+        """Utility method which just returns 'pong'."""
+        return _convertir(self._llamar('GET', 'core/ping'), None)
+
+    def core_ping_remote_post(self, cuerpo=None) -> Any:
+        """Method that will send an ICMP echo request to 'hostname'"""
+        return _convertir(self._llamar('POST', 'core/ping_remote', json=cuerpo), None)
+
+    def core_resize_shell_post(self, cuerpo=None) -> Any:
+        """Resize terminal session (/websocket/shell) to cols x rows"""
+        return _convertir(self._llamar('POST', 'core/resize_shell', json=cuerpo), None)
+
+    def cronjob_get(self, **params) -> Union[CronjobGet, List[CronjobGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'cronjob', params=params), CronjobGet)
+
+    def iter_cronjob_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[CronjobGet]:
+        """Itera todos los resultados de /cronjob paginando con limit/offset"""
+        return self._paginar('cronjob', CronjobGet, tamano_pagina, params)
+
+    def cronjob_post(self, cuerpo=None) -> CronjobPost:
+        """Create a new cron job."""
+        return _convertir(self._llamar('POST', 'cronjob', json=cuerpo), CronjobPost)
+
+    def cronjob_get_instance_post(self, cuerpo=None) -> CronjobGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'cronjob/get_instance', json=cuerpo), CronjobGetInstancePost)
+
+    def cronjob_id_delete(self, id) -> Any:
+        """Delete cronjob of `id`."""
+        return _convertir(self._llamar('DELETE', f"cronjob/id/{id}"), None)
+
+    def cronjob_id_get(self, id) -> Union[CronjobIdGet, List[CronjobIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"cronjob/id/{id}"), CronjobIdGet)
+
+    def cronjob_id_put(self, id, cuerpo=None) -> CronjobIdPut:
+        """Update cronjob of `id`."""
+        return _convertir(self._llamar('PUT', f"cronjob/id/{id}", json=cuerpo), CronjobIdPut)
+
+    def cronjob_run_post(self, cuerpo=None) -> Any:
+        """Job to run cronjob task of `id`."""
+        return _convertir(self._llamar('POST', 'cronjob/run', json=cuerpo), None)
+
+    def device_get_info_post(self, cuerpo=None) -> Union[DeviceGetInfoPost, List[DeviceGetInfoPost], Any]:
+        """Get info for `type` device."""
+        return _convertir(self._llamar('POST', 'device/get_info', json=cuerpo), DeviceGetInfoPost)
+
+    def directoryservices_cache_refresh_get(self) -> Any:
+        """This method refreshes the directory services cache for users and groups that is"""
+        return _convertir(self._llamar('GET', 'directoryservices/cache_refresh'), None)
+
+    def directoryservices_get_state_get(self) -> DirectoryservicesGetStateGet:
+        """`DISABLED` Directory Service is disabled."""
+        return _convertir(self._llamar('GET', 'directoryservices/get_state'), DirectoryservicesGetStateGet)
+
+    def directoryservices_status_get(self) -> DirectoryservicesStatusGet:
+        """Provide the type and status of the currently-enabled directory service"""
+        return _convertir(self._llamar('GET', 'directoryservices/status'), DirectoryservicesStatusGet)
+
+    def disk_get(self, **params) -> Union[DiskGet, List[DiskGet], Any]:
+        """Query disks."""
+        return _convertir(self._llamar('GET', 'disk', params=params), DiskGet)
+
+    def iter_disk_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[DiskGet]:
+        """Itera todos los resultados de /disk paginando con limit/offset"""
+        return self._paginar('disk', DiskGet, tamano_pagina, params)
+
+    def disk_details_post(self, cuerpo=None) -> Any:
+        """Return detailed information for all disks on the system."""
+        return _convertir(self._llamar('POST', 'disk/details', json=cuerpo), None)
+
+    def disk_get_instance_post(self, cuerpo=None) -> DiskGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'disk/get_instance', json=cuerpo), DiskGetInstancePost)
+
+    def disk_get_used_post(self, cuerpo=None) -> Any:
+        """Return disks that are in use by any zpool that is currently imported. It will"""
+        return _convertir(self._llamar('POST', 'disk/get_used', json=cuerpo), None)
+
+    def disk_id_get(self, id) -> Union[DiskIdGet, List[DiskIdGet], Any]:
+        """Query disks."""
+        return _convertir(self._llamar('GET', f"disk/id/{id}"), DiskIdGet)
+
+    def disk_id_put(self, id, cuerpo=None) -> DiskIdPut:
+        """Update disk of `id`."""
+        return _convertir(self._llamar('PUT', f"disk/id/{id}", json=cuerpo), DiskIdPut)
+
+    def disk_resize_post(self, cuerpo=None) -> Any:
+        """Takes a list of disks. Each list entry is a dict that requires a key, value pair."""
+        return _convertir(self._llamar('POST', 'disk/resize', json=cuerpo), None)
+
+    def disk_retaste_post(self, cuerpo=None) -> Any:
+        """POST /disk/retaste"""
+        return _convertir(self._llamar('POST', 'disk/retaste', json=cuerpo), None)
+
+    def disk_smart_attributes_post(self, cuerpo=None) -> List[DiskSmartAttributesPost]:
+        """Returns S.M.A.R.T. attributes values for specified disk name."""
+        return _convertir(self._llamar('POST', 'disk/smart_attributes', json=cuerpo), DiskSmartAttributesPost)
+
+    def disk_temperature_post(self, cuerpo=None) -> Any:
+        """Returns temperature for device `name` using specified S.M.A.R.T. `powermode`. If `cache` is not null"""
+        return _convertir(self._llamar('POST', 'disk/temperature', json=cuerpo), None)
+
+    def disk_temperature_agg_post(self, cuerpo=None) -> Any:
+        """Returns min/max/avg temperature for `names` disks for the last `days` days"""
+        return _convertir(self._llamar('POST', 'disk/temperature_agg', json=cuerpo), None)
+
+    def disk_temperature_alerts_post(self, cuerpo=None) -> List[DiskTemperatureAlertsPost]:
+        """Returns existing temperature alerts for specified disk `names.`"""
+        return _convertir(self._llamar('POST', 'disk/temperature_alerts', json=cuerpo), DiskTemperatureAlertsPost)
+
+    def disk_temperatures_post(self, cuerpo=None) -> Any:
+        """Returns temperatures for a list of devices (runs in parallel)."""
+        return _convertir(self._llamar('POST', 'disk/temperatures', json=cuerpo), None)
+
+    def disk_wipe_post(self, cuerpo=None) -> Any:
+        """Performs a wipe of a disk `dev`."""
+        return _convertir(self._llamar('POST', 'disk/wipe', json=cuerpo), None)
+
+    def dns_query_get(self, **params) -> Union[DnsQueryGet, List[DnsQueryGet], Any]:
+        """Query Name Servers with `query-filters` and `query-options`."""
+        return _convertir(self._llamar('GET', 'dns/query', params=params), DnsQueryGet)
+
+    def iter_dns_query_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[DnsQueryGet]:
+        """Itera todos los resultados de /dns/query paginando con limit/offset"""
+        return self._paginar('dns/query', DnsQueryGet, tamano_pagina, params)
+
+    def docker_get(self) -> DockerGet:
+        """GET /docker"""
+        return _convertir(self._llamar('GET', 'docker'), DockerGet)
+
+    def docker_put(self, cuerpo=None) -> DockerPut:
+        """Update Docker service configuration."""
+        return _convertir(self._llamar('PUT', 'docker', json=cuerpo), DockerPut)
+
+    def docker_backup_post(self, cuerpo=None) -> Any:
+        """Create a backup of existing apps."""
+        return _convertir(self._llamar('POST', 'docker/backup', json=cuerpo), None)
+
+    def docker_delete_backup_post(self, cuerpo=None) -> Any:
+        """Delete `backup_name` app backup."""
+        return _convertir(self._llamar('POST', 'docker/delete_backup', json=cuerpo), None)
+
+    def docker_list_backups_get(self) -> Any:
+        """List existing app backups."""
+        return _convertir(self._llamar('GET', 'docker/list_backups'), None)
+
+    def docker_network_get(self, **params) -> Union[DockerNetworkGet, List[DockerNetworkGet], Any]:
+        """Query all docker networks"""
+        return _convertir(self._llamar('GET', 'docker/network', params=params), DockerNetworkGet)
+
+    def iter_docker_network_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[DockerNetworkGet]:
+        """Itera todos los resultados de /docker/network paginando con limit/offset"""
+        return self._paginar('docker/network', DockerNetworkGet, tamano_pagina, params)
+
+    def docker_network_get_instance_post(self, cuerpo=None) -> DockerNetworkGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'docker/network/get_instance', json=cuerpo), DockerNetworkGetInstancePost)
+
+    def docker_network_id_get(self, id) -> Union[DockerNetworkIdGet, List[DockerNetworkIdGet], Any]:
+        """Query all docker networks"""
+        return _convertir(self._llamar('GET', f"docker/network/id/{id}"), DockerNetworkIdGet)
+
+    def docker_nvidia_present_get(self) -> Any:
+        """GET /docker/nvidia_present"""
+        return _convertir(self._llamar('GET', 'docker/nvidia_present'), None)
+
+    def docker_restore_backup_post(self, cuerpo=None) -> Any:
+        """Restore a backup of existing apps."""
+        return _convertir(self._llamar('POST', 'docker/restore_backup', json=cuerpo), None)
+
+    def docker_status_get(self) -> DockerStatusGet:
+        """Returns the status of the docker service."""
+        return _convertir(self._llamar('GET', 'docker/status'), DockerStatusGet)
+
+    def enclosure_label_set_post(self, cuerpo=None) -> Any:
+        """POST /enclosure/label/set"""
+        return _convertir(self._llamar('POST', 'enclosure/label/set', json=cuerpo), None)
+
+    def failover_get(self) -> FailoverGet:
+        """GET /failover"""
+        return _convertir(self._llamar('GET', 'failover'), FailoverGet)
+
+    def failover_put(self, cuerpo=None) -> FailoverPut:
+        """Update failover state."""
+        return _convertir(self._llamar('PUT', 'failover', json=cuerpo), FailoverPut)
+
+    def failover_become_passive_get(self) -> Any:
+        """This method is only called manually by the end-user so we fully expect that they"""
+        return _convertir(self._llamar('GET', 'failover/become_passive'), None)
+
+    def failover_call_remote_post(self, cuerpo=None) -> Any:
+        """Call a method on the other node."""
+        return _convertir(self._llamar('POST', 'failover/call_remote', json=cuerpo), None)
+
+    def failover_control_post(self, cuerpo=None) -> Any:
+        """POST /failover/control"""
+        return _convertir(self._llamar('POST', 'failover/control', json=cuerpo), None)
+
+    def failover_force_master_get(self) -> Any:
+        """Force this controller to become MASTER, if it's not already."""
+        return _convertir(self._llamar('GET', 'failover/force_master'), None)
+
+    def failover_get_ips_get(self) -> Any:
+        """Get a list of IPs for which the webUI can be accessed."""
+        return _convertir(self._llamar('GET', 'failover/get_ips'), None)
+
+    def failover_hardware_get(self) -> Any:
+        """Returns the hardware type for an HA system."""
+        return _convertir(self._llamar('GET', 'failover/hardware'), None)
+
+    def failover_in_progress_get(self) -> Any:
+        """Returns True if there is an ongoing failover event."""
+        return _convertir(self._llamar('GET', 'failover/in_progress'), None)
+
+    def failover_licensed_get(self) -> Any:
+        """Checks whether this instance is licensed as a HA unit"""
+        return _convertir(self._llamar('GET', 'failover/licensed'), None)
+
+    def failover_node_get(self) -> Any:
+        """Returns the slot position in the chassis that"""
+        return _convertir(self._llamar('GET', 'failover/node'), None)
+
+    def failover_reboot_info_get(self) -> FailoverRebootInfoGet:
+        """GET /failover/reboot/info"""
+        return _convertir(self._llamar('GET', 'failover/reboot/info'), FailoverRebootInfoGet)
+
+    def failover_reboot_other_node_get(self) -> Any:
+        """Reboot the other node and wait for it to come back online."""
+        return _convertir(self._llamar('GET', 'failover/reboot/other_node'), None)
+
+    def failover_status_get(self) -> Any:
+        """Get the current HA status."""
+        return _convertir(self._llamar('GET', 'failover/status'), None)
+
+    def failover_sync_from_peer_get(self) -> Any:
+        """Sync database and files from the other controller."""
+        return _convertir(self._llamar('GET', 'failover/sync_from_peer'), None)
+
+    def failover_sync_to_peer_post(self, cuerpo=None) -> Any:
+        """Sync database and files to the other controller."""
+        return _convertir(self._llamar('POST', 'failover/sync_to_peer', json=cuerpo), None)
+
+    def failover_unlock_post(self, cuerpo=None) -> Any:
+        """Unlock datasets in HA, syncing passphrase between controllers and forcing this controller"""
+        return _convertir(self._llamar('POST', 'failover/unlock', json=cuerpo), None)
+
+    def failover_upgrade_post(self, cuerpo=None) -> Any:
+        """Upgrades both controllers."""
+        return _convertir(self._llamar('POST', 'failover/upgrade', json=cuerpo), None)
+
+    def filesystem_acltemplate_get(self, **params) -> Union[FilesystemAcltemplateGet, List[FilesystemAcltemplateGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'filesystem/acltemplate', params=params), FilesystemAcltemplateGet)
+
+    def iter_filesystem_acltemplate_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[FilesystemAcltemplateGet]:
+        """Itera todos los resultados de /filesystem/acltemplate paginando con limit/offset"""
+        return self._paginar('filesystem/acltemplate', FilesystemAcltemplateGet, tamano_pagina, params)
+
+    def filesystem_acltemplate_post(self, cuerpo=None) -> FilesystemAcltemplatePost:
+        """Create a new filesystem ACL template."""
+        return _convertir(self._llamar('POST', 'filesystem/acltemplate', json=cuerpo), FilesystemAcltemplatePost)
+
+    def filesystem_acltemplate_by_path_post(self, cuerpo=None) -> List[FilesystemAcltemplateByPathPost]:
+        """Retrieve list of available ACL templates for a given `path`."""
+        return _convertir(self._llamar('POST', 'filesystem/acltemplate/by_path', json=cuerpo), FilesystemAcltemplateByPathPost)
+
+    def filesystem_acltemplate_get_instance_post(self, cuerpo=None) -> FilesystemAcltemplateGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'filesystem/acltemplate/get_instance', json=cuerpo), FilesystemAcltemplateGetInstancePost)
+
+    def filesystem_acltemplate_id_delete(self, id) -> Any:
+        """DELETE /filesystem/acltemplate/id/{id_}"""
+        return _convertir(self._llamar('DELETE', f"filesystem/acltemplate/id/{id}"), None)
+
+    def filesystem_acltemplate_id_get(self, id) -> Union[FilesystemAcltemplateIdGet, List[FilesystemAcltemplateIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"filesystem/acltemplate/id/{id}"), FilesystemAcltemplateIdGet)
+
+    def filesystem_acltemplate_id_put(self, id, cuerpo=None) -> FilesystemAcltemplateIdPut:
+        """update filesystem ACL template with `id`."""
+        return _convertir(self._llamar('PUT', f"filesystem/acltemplate/id/{id}", json=cuerpo), FilesystemAcltemplateIdPut)
+
+    def filesystem_can_access_as_user_post(self, cuerpo=None) -> Any:
+        """Check if `username` is able to access `path` with specific `permissions`. At least one of `read/write/execute`"""
+        return _convertir(self._llamar('POST', 'filesystem/can_access_as_user', json=cuerpo), None)
+
+    def filesystem_chown_post(self, cuerpo=None) -> Any:
+        """Change owner or group of file at `path`."""
+        return _convertir(self._llamar('POST', 'filesystem/chown', json=cuerpo), None)
+
+    def filesystem_get_post(self, cuerpo=None) -> Any:
+        """Job to get contents of `path`."""
+        return _convertir(self._llamar('POST', 'filesystem/get', json=cuerpo), None)
+
+    def filesystem_get_zfs_attributes_post(self, cuerpo=None) -> FilesystemGetZfsAttributesPost:
+        """Get the current ZFS attributes for the file at the given path"""
+        return _convertir(self._llamar('POST', 'filesystem/get_zfs_attributes', json=cuerpo), FilesystemGetZfsAttributesPost)
+
+    def filesystem_getacl_post(self, cuerpo=None) -> Union[FilesystemGetaclPost, List[FilesystemGetaclPost], Any]:
+        """Return ACL of a given path. This may return a POSIX1e ACL or a NFSv4 ACL. The acl type is indicated"""
+        return _convertir(self._llamar('POST', 'filesystem/getacl', json=cuerpo), FilesystemGetaclPost)
+
+    def filesystem_listdir_post(self, cuerpo=None) -> Union[FilesystemListdirPost, List[FilesystemListdirPost], Any]:
+        """Get the contents of a directory."""
+        return _convertir(self._llamar('POST', 'filesystem/listdir', json=cuerpo), FilesystemListdirPost)
+
+    def filesystem_mkdir_post(self, cuerpo=None) -> FilesystemMkdirPost:
+        """Create a directory at the specified path."""
+        return _convertir(self._llamar('POST', 'filesystem/mkdir', json=cuerpo), FilesystemMkdirPost)
+
+    def filesystem_put_post(self, cuerpo=None) -> Any:
+        """Job to put contents to `path`."""
+        return _convertir(self._llamar('POST', 'filesystem/put', json=cuerpo), None)
+
+    def filesystem_set_zfs_attributes_post(self, cuerpo=None) -> FilesystemSetZfsAttributesPost:
+        """Set special ZFS-related file flags on the specified path"""
+        return _convertir(self._llamar('POST', 'filesystem/set_zfs_attributes', json=cuerpo), FilesystemSetZfsAttributesPost)
+
+    def filesystem_setacl_post(self, cuerpo=None) -> Union[FilesystemSetaclPost, List[FilesystemSetaclPost], Any]:
+        """Set ACL of a given path. Takes the following parameters:"""
+        return _convertir(self._llamar('POST', 'filesystem/setacl', json=cuerpo), FilesystemSetaclPost)
+
+    def filesystem_setperm_post(self, cuerpo=None) -> Any:
+        """Set unix permissions on given `path`."""
+        return _convertir(self._llamar('POST', 'filesystem/setperm', json=cuerpo), None)
+
+    def filesystem_stat_post(self, cuerpo=None) -> FilesystemStatPost:
+        """Return filesystem information for a given path."""
+        return _convertir(self._llamar('POST', 'filesystem/stat', json=cuerpo), FilesystemStatPost)
+
+    def filesystem_statfs_post(self, cuerpo=None) -> FilesystemStatfsPost:
+        """Return stats from the filesystem of a given path."""
+        return _convertir(self._llamar('POST', 'filesystem/statfs', json=cuerpo), FilesystemStatfsPost)
+
+    def ftp_get(self) -> FtpGet:
+        """GET /ftp"""
+        return _convertir(self._llamar('GET', 'ftp'), FtpGet)
+
+    def ftp_put(self, cuerpo=None) -> FtpPut:
+        """Update ftp service configuration."""
+        return _convertir(self._llamar('PUT', 'ftp', json=cuerpo), FtpPut)
+
+    def group_get(self, **params) -> Union[GroupGet, List[GroupGet], Any]:
+        """Query groups with `query-filters` and `query-options`."""
+        return _convertir(self._llamar('GET', 'group', params=params), GroupGet)
+
+    def iter_group_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[GroupGet]:
+        """Itera todos los resultados de /group paginando con limit/offset"""
+        return self._paginar('group', GroupGet, tamano_pagina, params)
+
+    def group_post(self, cuerpo=None) -> Any:
+        """Create a new group."""
+        return _convertir(self._llamar('POST', 'group', json=cuerpo), None)
+
+    def group_get_group_obj_post(self, cuerpo=None) -> GroupGetGroupObjPost:
+        """Returns dictionary containing information from struct grp for the group specified by either"""
+        return _convertir(self._llamar('POST', 'group/get_group_obj', json=cuerpo), GroupGetGroupObjPost)
+
+    def group_get_instance_post(self, cuerpo=None) -> GroupGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'group/get_instance', json=cuerpo), GroupGetInstancePost)
+
+    def group_get_next_gid_get(self) -> Any:
+        """Get the next available/free gid."""
+        return _convertir(self._llamar('GET', 'group/get_next_gid'), None)
+
+    def group_has_password_enabled_user_post(self, cuerpo=None) -> Any:
+        """Checks whether at least one local user with a password is a member of any of the `group_ids`."""
+        return _convertir(self._llamar('POST', 'group/has_password_enabled_user', json=cuerpo), None)
+
+    def group_id_delete(self, id, cuerpo=None) -> Any:
+        """Delete group `id`."""
+        return _convertir(self._llamar('DELETE', f"group/id/{id}", json=cuerpo), None)
+
+    def group_id_get(self, id) -> Union[GroupIdGet, List[GroupIdGet], Any]:
+        """Query groups with `query-filters` and `query-options`."""
+        return _convertir(self._llamar('GET', f"group/id/{id}"), GroupIdGet)
+
+    def group_id_put(self, id, cuerpo=None) -> Any:
+        """Update attributes of an existing group."""
+        return _convertir(self._llamar('PUT', f"group/id/{id}", json=cuerpo), None)
+
+    def hardware_memory_error_info_get(self) -> Any:
+        """GET /hardware/memory/error_info"""
+        return _convertir(self._llamar('GET', 'hardware/memory/error_info'), None)
+
+    def idmap_get(self, **params) -> Union[IdmapGet, List[IdmapGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'idmap', params=params), IdmapGet)
+
+    def iter_idmap_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[IdmapGet]:
+        """Itera todos los resultados de /idmap paginando con limit/offset"""
+        return self._paginar('idmap', IdmapGet, tamano_pagina, params)
+
+    def idmap_post(self, cuerpo=None) -> IdmapPost:
+        """Create a new IDMAP domain. These domains must be unique. This table"""
+        return _convertir(self._llamar('POST', 'idmap', json=cuerpo), IdmapPost)
+
+    def idmap_backend_choices_get(self) -> Any:
+        """Returns array of valid idmap backend choices per directory service."""
+        return _convertir(self._llamar('GET', 'idmap/backend_choices'), None)
+
+    def idmap_backend_options_get(self) -> Any:
+        """This returns full information about idmap backend options. Not all"""
+        return _convertir(self._llamar('GET', 'idmap/backend_options'), None)
+
+    def idmap_clear_idmap_cache_get(self) -> Any:
+        """Stop samba, remove the winbindd_cache.tdb file, start samba, flush samba's cache."""
+        return _convertir(self._llamar('GET', 'idmap/clear_idmap_cache'), None)
+
+    def idmap_get_instance_post(self, cuerpo=None) -> IdmapGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'idmap/get_instance', json=cuerpo), IdmapGetInstancePost)
+
+    def idmap_id_delete(self, id) -> Any:
+        """Delete a domain by id. Deletion of default system domains is not permitted."""
+        return _convertir(self._llamar('DELETE', f"idmap/id/{id}"), None)
+
+    def idmap_id_get(self, id) -> Union[IdmapIdGet, List[IdmapIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"idmap/id/{id}"), IdmapIdGet)
+
+    def idmap_id_put(self, id, cuerpo=None) -> IdmapIdPut:
+        """Update a domain by id."""
+        return _convertir(self._llamar('PUT', f"idmap/id/{id}", json=cuerpo), IdmapIdPut)
+
+    def initshutdownscript_get(self, **params) -> Union[InitshutdownscriptGet, List[InitshutdownscriptGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'initshutdownscript', params=params), InitshutdownscriptGet)
+
+    def iter_initshutdownscript_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[InitshutdownscriptGet]:
+        """Itera todos los resultados de /initshutdownscript paginando con limit/offset"""
+        return self._paginar('initshutdownscript', InitshutdownscriptGet, tamano_pagina, params)
+
+    def initshutdownscript_post(self, cuerpo=None) -> InitshutdownscriptPost:
+        """Create an initshutdown script task."""
+        return _convertir(self._llamar('POST', 'initshutdownscript', json=cuerpo), InitshutdownscriptPost)
+
+    def initshutdownscript_get_instance_post(self, cuerpo=None) -> InitshutdownscriptGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'initshutdownscript/get_instance', json=cuerpo), InitshutdownscriptGetInstancePost)
+
+    def initshutdownscript_id_delete(self, id) -> Any:
+        """Delete init/shutdown task of `id`."""
+        return _convertir(self._llamar('DELETE', f"initshutdownscript/id/{id}"), None)
+
+    def initshutdownscript_id_get(self, id) -> Union[InitshutdownscriptIdGet, List[InitshutdownscriptIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"initshutdownscript/id/{id}"), InitshutdownscriptIdGet)
+
+    def initshutdownscript_id_put(self, id, cuerpo=None) -> InitshutdownscriptIdPut:
+        """Update initshutdown script task of `id`."""
+        return _convertir(self._llamar('PUT', f"initshutdownscript/id/{id}", json=cuerpo), InitshutdownscriptIdPut)
+
+    def interface_get(self, **params) -> Union[InterfaceGet, List[InterfaceGet], Any]:
+        """Query Interfaces with `query-filters` and `query-options`"""
+        return _convertir(self._llamar('GET', 'interface', params=params), InterfaceGet)
+
+    def iter_interface_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[InterfaceGet]:
+        """Itera todos los resultados de /interface paginando con limit/offset"""
+        return self._paginar('interface', InterfaceGet, tamano_pagina, params)
+
+    def interface_post(self, cuerpo=None) -> InterfacePost:
+        """Create virtual interfaces (Link Aggregation, VLAN)"""
+        return _convertir(self._llamar('POST', 'interface', json=cuerpo), InterfacePost)
+
+    def interface_bridge_members_choices_post(self, cuerpo=None) -> Any:
+        """Return available interface choices that can be added to a `br` (bridge) interface."""
+        return _convertir(self._llamar('POST', 'interface/bridge_members_choices', json=cuerpo), None)
+
+    def interface_cancel_rollback_get(self) -> Any:
+        """If this method is called after interface changes have been committed and within the checkin timeout,"""
+        return _convertir(self._llamar('GET', 'interface/cancel_rollback'), None)
+
+    def interface_capabilities_get_post(self, cuerpo=None) -> InterfaceCapabilitiesGetPost:
+        """Return enabled, disabled and supported capabilities (also known as features)"""
+        return _convertir(self._llamar('POST', 'interface/capabilities/get', json=cuerpo), InterfaceCapabilitiesGetPost)
+
+    def interface_capabilities_set_post(self, cuerpo=None) -> Any:
+        """Enable or Disable capabilties (also known as features) on a given interface."""
+        return _convertir(self._llamar('POST', 'interface/capabilities/set', json=cuerpo), None)
+
+    def interface_checkin_get(self) -> Any:
+        """If this method is called after interface changes have been committed and within the checkin timeout,"""
+        return _convertir(self._llamar('GET', 'interface/checkin'), None)
+
+    def interface_checkin_waiting_get(self) -> Any:
+        """Returns whether we are waiting user to check in the applied network changes"""
+        return _convertir(self._llamar('GET', 'interface/checkin_waiting'), None)
+
+    def interface_choices_post(self, cuerpo=None) -> Any:
+        """Choices of available network interfaces."""
+        return _convertir(self._llamar('POST', 'interface/choices', json=cuerpo), None)
+
+    def interface_commit_post(self, cuerpo=None) -> Any:
+        """Commit/apply pending interfaces changes."""
+        return _convertir(self._llamar('POST', 'interface/commit', json=cuerpo), None)
+
+    def interface_default_route_will_be_removed_get(self) -> Any:
+        """On a fresh install of SCALE, dhclient is started for every interface so IP"""
+        return _convertir(self._llamar('GET', 'interface/default_route_will_be_removed'), None)
+
+    def interface_get_instance_post(self, cuerpo=None) -> InterfaceGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'interface/get_instance', json=cuerpo), InterfaceGetInstancePost)
+
+    def interface_has_pending_changes_get(self) -> Any:
+        """Returns whether there are pending interfaces changes to be applied or not."""
+        return _convertir(self._llamar('GET', 'interface/has_pending_changes'), None)
+
+    def interface_id_delete(self, id) -> Any:
+        """Delete Interface of `id`."""
+        return _convertir(self._llamar('DELETE', f"interface/id/{id}"), None)
+
+    def interface_id_get(self, id) -> Union[InterfaceIdGet, List[InterfaceIdGet], Any]:
+        """Query Interfaces with `query-filters` and `query-options`"""
+        return _convertir(self._llamar('GET', f"interface/id/{id}"), InterfaceIdGet)
+
+    def interface_id_put(self, id, cuerpo=None) -> InterfaceIdPut:
+        """Update Interface of `id`."""
+        return _convertir(self._llamar('PUT', f"interface/id/{id}", json=cuerpo), InterfaceIdPut)
+
+    def interface_ip_in_use_post(self, cuerpo=None) -> List[InterfaceIpInUsePost]:
+        """Get all IPv4 / Ipv6 from all valid interfaces, excluding tap and epair."""
+        return _convertir(self._llamar('POST', 'interface/ip_in_use', json=cuerpo), InterfaceIpInUsePost)
+
+    def interface_lacpdu_rate_choices_get(self) -> InterfaceLacpduRateChoicesGet:
+        """Available lacpdu rate policies for the LACP lagg type interfaces."""
+        return _convertir(self._llamar('GET', 'interface/lacpdu_rate_choices'), InterfaceLacpduRateChoicesGet)
+
+    def interface_lag_ports_choices_post(self, cuerpo=None) -> Any:
+        """Return available interface choices that can be added to a `bond` (lag) interface."""
+        return _convertir(self._llamar('POST', 'interface/lag_ports_choices', json=cuerpo), None)
+
+    def interface_rollback_get(self) -> Any:
+        """Rollback pending interfaces changes."""
+        return _convertir(self._llamar('GET', 'interface/rollback'), None)
+
+    def interface_save_default_route_post(self, cuerpo=None) -> Any:
+        """This method exists _solely_ to provide a 'warning' and therefore"""
+        return _convertir(self._llamar('POST', 'interface/save_default_route', json=cuerpo), None)
+
+    def interface_services_restarted_on_sync_get(self) -> List[InterfaceServicesRestartedOnSyncGet]:
+        """Returns which services will be set to listen on 0.0.0.0 (and, thus, restarted) on sync."""
+        return _convertir(self._llamar('GET', 'interface/services_restarted_on_sync'), InterfaceServicesRestartedOnSyncGet)
+
+    def interface_vlan_parent_interface_choices_get(self) -> Any:
+        """Return available interface choices for `vlan_parent_interface` attribute."""
+        return _convertir(self._llamar('GET', 'interface/vlan_parent_interface_choices'), None)
+
+    def interface_xmit_hash_policy_choices_get(self) -> InterfaceXmitHashPolicyChoicesGet:
+        """Available transmit hash policies for the LACP or LOADBALANCE"""
+        return _convertir(self._llamar('GET', 'interface/xmit_hash_policy_choices'), InterfaceXmitHashPolicyChoicesGet)
+
+    def ipmi_chassis_identify_post(self, cuerpo=None) -> Any:
+        """Toggle the chassis identify light."""
+        return _convertir(self._llamar('POST', 'ipmi/chassis/identify', json=cuerpo), None)
+
+    def ipmi_chassis_info_get(self) -> Any:
+        """Return looks like:"""
+        return _convertir(self._llamar('GET', 'ipmi/chassis/info'), None)
+
+    def ipmi_is_loaded_get(self) -> Any:
+        """Returns a boolean value indicating if /dev/ipmi0 is loaded."""
+        return _convertir(self._llamar('GET', 'ipmi/is_loaded'), None)
+
+    def ipmi_lan_get(self, cuerpo=None) -> Union[IpmiLanGet, List[IpmiLanGet], Any]:
+        """Query available IPMI Channels with `query-filters` and `query-options`."""
+        return _convertir(self._llamar('GET', 'ipmi/lan', json=cuerpo), IpmiLanGet)
+
+    def ipmi_lan_channels_get(self) -> Any:
+        """Return a list of available IPMI channels."""
+        return _convertir(self._llamar('GET', 'ipmi/lan/channels'), None)
+
+    def ipmi_lan_get_instance_post(self, cuerpo=None) -> IpmiLanGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'ipmi/lan/get_instance', json=cuerpo), IpmiLanGetInstancePost)
+
+    def ipmi_lan_id_get(self, id, cuerpo=None) -> Union[IpmiLanIdGet, List[IpmiLanIdGet], Any]:
+        """Query available IPMI Channels with `query-filters` and `query-options`."""
+        return _convertir(self._llamar('GET', f"ipmi/lan/id/{id}", json=cuerpo), IpmiLanIdGet)
+
+    def ipmi_lan_id_put(self, id, cuerpo=None) -> IpmiLanIdPut:
+        """Update IPMI configuration on channel number `id`."""
+        return _convertir(self._llamar('PUT', f"ipmi/lan/id/{id}", json=cuerpo), IpmiLanIdPut)
+
+    def ipmi_mc_info_get(self) -> Any:
+        """Return looks like:"""
+        return _convertir(self._llamar('GET', 'ipmi/mc/info'), None)
+
+    def ipmi_sel_clear_get(self) -> Any:
+        """GET /ipmi/sel/clear"""
+        return _convertir(self._llamar('GET', 'ipmi/sel/clear'), None)
+
+    def ipmi_sel_elist_get(self, **params) -> Any:
+        """Query IPMI System Event Log (SEL) extended list"""
+        return _convertir(self._llamar('GET', 'ipmi/sel/elist', params=params), None)
+
+    def iter_ipmi_sel_elist_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[Any]:
+        """Itera todos los resultados de /ipmi/sel/elist paginando con limit/offset"""
+        return self._paginar('ipmi/sel/elist', None, tamano_pagina, params)
+
+    def ipmi_sel_info_get(self) -> Any:
+        """Query General information about the IPMI System Event Log"""
+        return _convertir(self._llamar('GET', 'ipmi/sel/info'), None)
+
+    def ipmi_sensors_query_get(self, **params) -> Any:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'ipmi/sensors/query', params=params), None)
+
+    def iter_ipmi_sensors_query_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[Any]:
+        """Itera todos los resultados de /ipmi/sensors/query paginando con limit/offset"""
+        return self._paginar('ipmi/sensors/query', None, tamano_pagina, params)
+
+    def iscsi_auth_get(self, **params) -> Union[IscsiAuthGet, List[IscsiAuthGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'iscsi/auth', params=params), IscsiAuthGet)
+
+    def iter_iscsi_auth_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[IscsiAuthGet]:
+        """Itera todos los resultados de /iscsi/auth paginando con limit/offset"""
+        return self._paginar('iscsi/auth', IscsiAuthGet, tamano_pagina, params)
+
+    def iscsi_auth_post(self, cuerpo=None) -> IscsiAuthPost:
+        """Create an iSCSI Authorized Access."""
+        return _convertir(self._llamar('POST', 'iscsi/auth', json=cuerpo), IscsiAuthPost)
+
+    def iscsi_auth_get_instance_post(self, cuerpo=None) -> IscsiAuthGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'iscsi/auth/get_instance', json=cuerpo), IscsiAuthGetInstancePost)
+
+    def iscsi_auth_id_delete(self, id) -> Any:
+        """Delete iSCSI Authorized Access of `id`."""
+        return _convertir(self._llamar('DELETE', f"iscsi/auth/id/{id}"), None)
+
+    def iscsi_auth_id_get(self, id) -> Union[IscsiAuthIdGet, List[IscsiAuthIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"iscsi/auth/id/{id}"), IscsiAuthIdGet)
+
+    def iscsi_auth_id_put(self, id, cuerpo=None) -> IscsiAuthIdPut:
+        """Update iSCSI Authorized Access of `id`."""
+        return _convertir(self._llamar('PUT', f"iscsi/auth/id/{id}", json=cuerpo), IscsiAuthIdPut)
+
+    def iscsi_extent_get(self, **params) -> Union[IscsiExtentGet, List[IscsiExtentGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'iscsi/extent', params=params), IscsiExtentGet)
+
+    def iter_iscsi_extent_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[IscsiExtentGet]:
+        """Itera todos los resultados de /iscsi/extent paginando con limit/offset"""
+        return self._paginar('iscsi/extent', IscsiExtentGet, tamano_pagina, params)
+
+    def iscsi_extent_post(self, cuerpo=None) -> IscsiExtentPost:
+        """Create an iSCSI Extent."""
+        return _convertir(self._llamar('POST', 'iscsi/extent', json=cuerpo), IscsiExtentPost)
+
+    def iscsi_extent_disk_choices_get(self) -> Any:
+        """Return a dict of available zvols that can be used"""
+        return _convertir(self._llamar('GET', 'iscsi/extent/disk_choices'), None)
+
+    def iscsi_extent_get_instance_post(self, cuerpo=None) -> IscsiExtentGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'iscsi/extent/get_instance', json=cuerpo), IscsiExtentGetInstancePost)
+
+    def iscsi_extent_id_delete(self, id, cuerpo=None) -> Any:
+        """Delete iSCSI Extent of `id`."""
+        return _convertir(self._llamar('DELETE', f"iscsi/extent/id/{id}", json=cuerpo), None)
+
+    def iscsi_extent_id_get(self, id) -> Union[IscsiExtentIdGet, List[IscsiExtentIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"iscsi/extent/id/{id}"), IscsiExtentIdGet)
+
+    def iscsi_extent_id_put(self, id, cuerpo=None) -> IscsiExtentIdPut:
+        """Update iSCSI Extent of `id`."""
+        return _convertir(self._llamar('PUT', f"iscsi/extent/id/{id}", json=cuerpo), IscsiExtentIdPut)
+
+    def iscsi_global_get(self) -> IscsiGlobalGet:
+        """GET /iscsi/global"""
+        return _convertir(self._llamar('GET', 'iscsi/global'), IscsiGlobalGet)
+
+    def iscsi_global_put(self, cuerpo=None) -> IscsiGlobalPut:
+        """`alua` is a no-op for FreeNAS."""
+        return _convertir(self._llamar('PUT', 'iscsi/global', json=cuerpo), IscsiGlobalPut)
+
+    def iscsi_global_alua_enabled_get(self) -> Any:
+        """Returns whether iSCSI ALUA is enabled or not."""
+        return _convertir(self._llamar('GET', 'iscsi/global/alua_enabled'), None)
+
+    def iscsi_global_client_count_get(self) -> Any:
+        """Return currently connected clients count."""
+        return _convertir(self._llamar('GET', 'iscsi/global/client_count'), None)
+
+    def iscsi_global_iser_enabled_get(self) -> Any:
+        """Returns whether iSER is enabled or not."""
+        return _convertir(self._llamar('GET', 'iscsi/global/iser_enabled'), None)
+
+    def iscsi_global_sessions_post(self, cuerpo=None) -> Union[IscsiGlobalSessionsPost, List[IscsiGlobalSessionsPost], Any]:
+        """Get a list of currently running iSCSI sessions. This includes initiator and target names"""
+        return _convertir(self._llamar('POST', 'iscsi/global/sessions', json=cuerpo), IscsiGlobalSessionsPost)
+
+    def iscsi_initiator_get(self, **params) -> Union[IscsiInitiatorGet, List[IscsiInitiatorGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'iscsi/initiator', params=params), IscsiInitiatorGet)
+
+    def iter_iscsi_initiator_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[IscsiInitiatorGet]:
+        """Itera todos los resultados de /iscsi/initiator paginando con limit/offset"""
+        return self._paginar('iscsi/initiator', IscsiInitiatorGet, tamano_pagina, params)
+
+    def iscsi_initiator_post(self, cuerpo=None) -> IscsiInitiatorPost:
+        """Create an iSCSI Initiator."""
+        return _convertir(self._llamar('POST', 'iscsi/initiator', json=cuerpo), IscsiInitiatorPost)
+
+    def iscsi_initiator_get_instance_post(self, cuerpo=None) -> IscsiInitiatorGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'iscsi/initiator/get_instance', json=cuerpo), IscsiInitiatorGetInstancePost)
+
+    def iscsi_initiator_id_delete(self, id) -> Any:
+        """Delete iSCSI initiator of `id`."""
+        return _convertir(self._llamar('DELETE', f"iscsi/initiator/id/{id}"), None)
+
+    def iscsi_initiator_id_get(self, id) -> Union[IscsiInitiatorIdGet, List[IscsiInitiatorIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"iscsi/initiator/id/{id}"), IscsiInitiatorIdGet)
+
+    def iscsi_initiator_id_put(self, id, cuerpo=None) -> IscsiInitiatorIdPut:
+        """Update iSCSI initiator of `id`."""
+        return _convertir(self._llamar('PUT', f"iscsi/initiator/id/{id}", json=cuerpo), IscsiInitiatorIdPut)
+
+    def iscsi_portal_get(self, **params) -> Union[IscsiPortalGet, List[IscsiPortalGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'iscsi/portal', params=params), IscsiPortalGet)
+
+    def iter_iscsi_portal_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[IscsiPortalGet]:
+        """Itera todos los resultados de /iscsi/portal paginando con limit/offset"""
+        return self._paginar('iscsi/portal', IscsiPortalGet, tamano_pagina, params)
+
+    def iscsi_portal_post(self, cuerpo=None) -> IscsiPortalPost:
+        """Create a new iSCSI Portal."""
+        return _convertir(self._llamar('POST', 'iscsi/portal', json=cuerpo), IscsiPortalPost)
+
+    def iscsi_portal_get_instance_post(self, cuerpo=None) -> IscsiPortalGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'iscsi/portal/get_instance', json=cuerpo), IscsiPortalGetInstancePost)
+
+    def iscsi_portal_id_delete(self, id) -> Any:
+        """Delete iSCSI Portal `id`."""
+        return _convertir(self._llamar('DELETE', f"iscsi/portal/id/{id}"), None)
+
+    def iscsi_portal_id_get(self, id) -> Union[IscsiPortalIdGet, List[IscsiPortalIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"iscsi/portal/id/{id}"), IscsiPortalIdGet)
+
+    def iscsi_portal_id_put(self, id, cuerpo=None) -> IscsiPortalIdPut:
+        """Update iSCSI Portal `id`."""
+        return _convertir(self._llamar('PUT', f"iscsi/portal/id/{id}", json=cuerpo), IscsiPortalIdPut)
+
+    def iscsi_portal_listen_ip_choices_get(self) -> Any:
+        """Returns possible choices for `listen.ip` attribute of portal create and update."""
+        return _convertir(self._llamar('GET', 'iscsi/portal/listen_ip_choices'), None)
+
+    def iscsi_target_get(self, **params) -> Union[IscsiTargetGet, List[IscsiTargetGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'iscsi/target', params=params), IscsiTargetGet)
+
+    def iter_iscsi_target_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[IscsiTargetGet]:
+        """Itera todos los resultados de /iscsi/target paginando con limit/offset"""
+        return self._paginar('iscsi/target', IscsiTargetGet, tamano_pagina, params)
+
+    def iscsi_target_post(self, cuerpo=None) -> IscsiTargetPost:
+        """Create an iSCSI Target."""
+        return _convertir(self._llamar('POST', 'iscsi/target', json=cuerpo), IscsiTargetPost)
+
+    def iscsi_target_get_instance_post(self, cuerpo=None) -> IscsiTargetGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'iscsi/target/get_instance', json=cuerpo), IscsiTargetGetInstancePost)
+
+    def iscsi_target_id_delete(self, id, cuerpo=None) -> Any:
+        """Delete iSCSI Target of `id`."""
+        return _convertir(self._llamar('DELETE', f"iscsi/target/id/{id}", json=cuerpo), None)
+
+    def iscsi_target_id_get(self, id) -> Union[IscsiTargetIdGet, List[IscsiTargetIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"iscsi/target/id/{id}"), IscsiTargetIdGet)
+
+    def iscsi_target_id_put(self, id, cuerpo=None) -> IscsiTargetIdPut:
+        """Update iSCSI Target of `id`."""
+        return _convertir(self._llamar('PUT', f"iscsi/target/id/{id}", json=cuerpo), IscsiTargetIdPut)
+
+    def iscsi_target_validate_name_post(self, cuerpo=None) -> Any:
+        """Returns validation error for iSCSI target name"""
+        return _convertir(self._llamar('POST', 'iscsi/target/validate_name', json=cuerpo), None)
+
+    def iscsi_targetextent_get(self, **params) -> Union[IscsiTargetextentGet, List[IscsiTargetextentGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'iscsi/targetextent', params=params), IscsiTargetextentGet)
+
+    def iter_iscsi_targetextent_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[IscsiTargetextentGet]:
+        """Itera todos los resultados de /iscsi/targetextent paginando con limit/offset"""
+        return self._paginar('iscsi/targetextent', IscsiTargetextentGet, tamano_pagina, params)
+
+    def iscsi_targetextent_post(self, cuerpo=None) -> IscsiTargetextentPost:
+        """Create an Associated Target."""
+        return _convertir(self._llamar('POST', 'iscsi/targetextent', json=cuerpo), IscsiTargetextentPost)
+
+    def iscsi_targetextent_get_instance_post(self, cuerpo=None) -> IscsiTargetextentGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'iscsi/targetextent/get_instance', json=cuerpo), IscsiTargetextentGetInstancePost)
+
+    def iscsi_targetextent_id_delete(self, id, cuerpo=None) -> Any:
+        """Delete Associated Target of `id`."""
+        return _convertir(self._llamar('DELETE', f"iscsi/targetextent/id/{id}", json=cuerpo), None)
+
+    def iscsi_targetextent_id_get(self, id) -> Union[IscsiTargetextentIdGet, List[IscsiTargetextentIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"iscsi/targetextent/id/{id}"), IscsiTargetextentIdGet)
+
+    def iscsi_targetextent_id_put(self, id, cuerpo=None) -> IscsiTargetextentIdPut:
+        """Update Associated Target of `id`."""
+        return _convertir(self._llamar('PUT', f"iscsi/targetextent/id/{id}", json=cuerpo), IscsiTargetextentIdPut)
+
+    def jbof_get(self, **params) -> Union[JbofGet, List[JbofGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'jbof', params=params), JbofGet)
+
+    def iter_jbof_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[JbofGet]:
+        """Itera todos los resultados de /jbof paginando con limit/offset"""
+        return self._paginar('jbof', JbofGet, tamano_pagina, params)
+
+    def jbof_post(self, cuerpo=None) -> JbofPost:
+        """Create a new JBOF."""
+        return _convertir(self._llamar('POST', 'jbof', json=cuerpo), JbofPost)
+
+    def jbof_get_instance_post(self, cuerpo=None) -> JbofGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'jbof/get_instance', json=cuerpo), JbofGetInstancePost)
+
+    def jbof_id_delete(self, id, cuerpo=None) -> Any:
+        """Delete a JBOF by ID."""
+        return _convertir(self._llamar('DELETE', f"jbof/id/{id}", json=cuerpo), None)
+
+    def jbof_id_get(self, id) -> Union[JbofIdGet, List[JbofIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"jbof/id/{id}"), JbofIdGet)
+
+    def jbof_id_put(self, id, cuerpo=None) -> JbofIdPut:
+        """Update JBOF of `id`"""
+        return _convertir(self._llamar('PUT', f"jbof/id/{id}", json=cuerpo), JbofIdPut)
+
+    def jbof_licensed_get(self) -> Any:
+        """Return a count of the number of JBOF units licensed."""
+        return _convertir(self._llamar('GET', 'jbof/licensed'), None)
+
+    def jbof_reapply_config_get(self) -> Any:
+        """Reapply the JBOF configuration to attached JBOFs."""
+        return _convertir(self._llamar('GET', 'jbof/reapply_config'), None)
+
+    def k8s_to_docker_list_backups_post(self, cuerpo=None) -> K8sToDockerListBackupsPost:
+        """List existing kubernetes backups"""
+        return _convertir(self._llamar('POST', 'k8s_to_docker/list_backups', json=cuerpo), K8sToDockerListBackupsPost)
+
+    def k8s_to_docker_migrate_post(self, cuerpo=None) -> List[K8sToDockerMigratePost]:
+        """Migrate kubernetes backups to docker."""
+        return _convertir(self._llamar('POST', 'k8s_to_docker/migrate', json=cuerpo), K8sToDockerMigratePost)
+
+    def kerberos_get(self) -> Any:
+        """GET /kerberos"""
+        return _convertir(self._llamar('GET', 'kerberos'), None)
+
+    def kerberos_put(self, cuerpo=None) -> Any:
+        """`appdefaults_aux` add parameters to 'appdefaults' section of the krb5.conf file."""
+        return _convertir(self._llamar('PUT', 'kerberos', json=cuerpo), None)
+
+    def kerberos_keytab_get(self, **params) -> Union[KerberosKeytabGet, List[KerberosKeytabGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'kerberos/keytab', params=params), KerberosKeytabGet)
+
+    def iter_kerberos_keytab_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[KerberosKeytabGet]:
+        """Itera todos los resultados de /kerberos/keytab paginando con limit/offset"""
+        return self._paginar('kerberos/keytab', KerberosKeytabGet, tamano_pagina, params)
+
+    def kerberos_keytab_post(self, cuerpo=None) -> KerberosKeytabPost:
+        """Create a kerberos keytab. Uploaded keytab files will be merged with the system"""
+        return _convertir(self._llamar('POST', 'kerberos/keytab', json=cuerpo), KerberosKeytabPost)
+
+    def kerberos_keytab_get_instance_post(self, cuerpo=None) -> KerberosKeytabGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'kerberos/keytab/get_instance', json=cuerpo), KerberosKeytabGetInstancePost)
+
+    def kerberos_keytab_id_delete(self, id) -> Any:
+        """Delete kerberos keytab by id, and force regeneration of"""
+        return _convertir(self._llamar('DELETE', f"kerberos/keytab/id/{id}"), None)
+
+    def kerberos_keytab_id_get(self, id) -> Union[KerberosKeytabIdGet, List[KerberosKeytabIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"kerberos/keytab/id/{id}"), KerberosKeytabIdGet)
+
+    def kerberos_keytab_id_put(self, id, cuerpo=None) -> KerberosKeytabIdPut:
+        """Update kerberos keytab by id."""
+        return _convertir(self._llamar('PUT', f"kerberos/keytab/id/{id}", json=cuerpo), KerberosKeytabIdPut)
+
+    def kerberos_realm_get(self, **params) -> Union[KerberosRealmGet, List[KerberosRealmGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'kerberos/realm', params=params), KerberosRealmGet)
+
+    def iter_kerberos_realm_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[KerberosRealmGet]:
+        """Itera todos los resultados de /kerberos/realm paginando con limit/offset"""
+        return self._paginar('kerberos/realm', KerberosRealmGet, tamano_pagina, params)
+
+    def kerberos_realm_post(self, cuerpo=None) -> KerberosRealmPost:
+        """Create a new kerberos realm. This will be automatically populated during the"""
+        return _convertir(self._llamar('POST', 'kerberos/realm', json=cuerpo), KerberosRealmPost)
+
+    def kerberos_realm_get_instance_post(self, cuerpo=None) -> KerberosRealmGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'kerberos/realm/get_instance', json=cuerpo), KerberosRealmGetInstancePost)
+
+    def kerberos_realm_id_delete(self, id) -> Any:
+        """Delete a kerberos realm by ID."""
+        return _convertir(self._llamar('DELETE', f"kerberos/realm/id/{id}"), None)
+
+    def kerberos_realm_id_get(self, id) -> Union[KerberosRealmIdGet, List[KerberosRealmIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"kerberos/realm/id/{id}"), KerberosRealmIdGet)
+
+    def kerberos_realm_id_put(self, id, cuerpo=None) -> KerberosRealmIdPut:
+        """Update a kerberos realm by id. This will be automatically populated during the"""
+        return _convertir(self._llamar('PUT', f"kerberos/realm/id/{id}", json=cuerpo), KerberosRealmIdPut)
+
+    def keychaincredential_get(self, **params) -> Union[KeychaincredentialGet, List[KeychaincredentialGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'keychaincredential', params=params), KeychaincredentialGet)
+
+    def iter_keychaincredential_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[KeychaincredentialGet]:
+        """Itera todos los resultados de /keychaincredential paginando con limit/offset"""
+        return self._paginar('keychaincredential', KeychaincredentialGet, tamano_pagina, params)
+
+    def keychaincredential_post(self, cuerpo=None) -> Union[KeychaincredentialPost, List[KeychaincredentialPost], Any]:
+        """Create a Keychain Credential."""
+        return _convertir(self._llamar('POST', 'keychaincredential', json=cuerpo), KeychaincredentialPost)
+
+    def keychaincredential_generate_ssh_key_pair_get(self) -> KeychaincredentialGenerateSshKeyPairGet:
+        """Generate a public/private key pair (useful for `SSH_KEY_PAIR` type)"""
+        return _convertir(self._llamar('GET', 'keychaincredential/generate_ssh_key_pair'), KeychaincredentialGenerateSshKeyPairGet)
+
+    def keychaincredential_get_instance_post(self, cuerpo=None) -> KeychaincredentialGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'keychaincredential/get_instance', json=cuerpo), KeychaincredentialGetInstancePost)
+
+    def keychaincredential_id_delete(self, id, cuerpo=None) -> Any:
+        """Delete Keychain Credential with specific `id`."""
+        return _convertir(self._llamar('DELETE', f"keychaincredential/id/{id}", json=cuerpo), None)
+
+    def keychaincredential_id_get(self, id) -> Union[KeychaincredentialIdGet, List[KeychaincredentialIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"keychaincredential/id/{id}"), KeychaincredentialIdGet)
+
+    def keychaincredential_id_put(self, id, cuerpo=None) -> Union[KeychaincredentialIdPut, List[KeychaincredentialIdPut], Any]:
+        """Update a Keychain Credential with specific `id`."""
+        return _convertir(self._llamar('PUT', f"keychaincredential/id/{id}", json=cuerpo), KeychaincredentialIdPut)
+
+    def keychaincredential_remote_ssh_host_key_scan_post(self, cuerpo=None) -> Any:
+        """Discover a remote host key (useful for `SSH_CREDENTIALS`)"""
+        return _convertir(self._llamar('POST', 'keychaincredential/remote_ssh_host_key_scan', json=cuerpo), None)
+
+    def keychaincredential_remote_ssh_semiautomatic_setup_post(self, cuerpo=None) -> KeychaincredentialRemoteSshSemiautomaticSetupPost:
+        """Perform semi-automatic SSH connection setup with other TrueNAS machine."""
+        return _convertir(self._llamar('POST', 'keychaincredential/remote_ssh_semiautomatic_setup', json=cuerpo), KeychaincredentialRemoteSshSemiautomaticSetupPost)
+
+    def keychaincredential_setup_ssh_connection_post(self, cuerpo=None) -> KeychaincredentialSetupSshConnectionPost:
+        """Creates an SSH Connection performing the following steps:"""
+        return _convertir(self._llamar('POST', 'keychaincredential/setup_ssh_connection', json=cuerpo), KeychaincredentialSetupSshConnectionPost)
+
+    def keychaincredential_used_by_post(self, cuerpo=None) -> List[KeychaincredentialUsedByPost]:
+        """Returns list of objects that use this credential."""
+        return _convertir(self._llamar('POST', 'keychaincredential/used_by', json=cuerpo), KeychaincredentialUsedByPost)
+
+    def kmip_get(self) -> KmipGet:
+        """GET /kmip"""
+        return _convertir(self._llamar('GET', 'kmip'), KmipGet)
+
+    def kmip_put(self, cuerpo=None) -> KmipPut:
+        """Update KMIP Server Configuration."""
+        return _convertir(self._llamar('PUT', 'kmip', json=cuerpo), KmipPut)
+
+    def kmip_clear_sync_pending_keys_get(self) -> Any:
+        """Clear all keys which are pending to be synced between KMIP server and TN database."""
+        return _convertir(self._llamar('GET', 'kmip/clear_sync_pending_keys'), None)
+
+    def kmip_kmip_sync_pending_get(self) -> Any:
+        """Returns true or false based on if there are keys which are to be synced from local database to remote KMIP"""
+        return _convertir(self._llamar('GET', 'kmip/kmip_sync_pending'), None)
+
+    def kmip_sync_keys_get(self) -> Any:
+        """Sync ZFS/SED keys between KMIP Server and TN database."""
+        return _convertir(self._llamar('GET', 'kmip/sync_keys'), None)
+
+    def ldap_get(self) -> LdapGet:
+        """GET /ldap"""
+        return _convertir(self._llamar('GET', 'ldap'), LdapGet)
+
+    def ldap_put(self, cuerpo=None) -> LdapPut:
+        """`hostname` list of ip addresses or hostnames of LDAP servers with"""
+        return _convertir(self._llamar('PUT', 'ldap', json=cuerpo), LdapPut)
+
+    def ldap_schema_choices_get(self) -> Any:
+        """Returns list of available LDAP schema choices."""
+        return _convertir(self._llamar('GET', 'ldap/schema_choices'), None)
+
+    def ldap_ssl_choices_get(self) -> Any:
+        """Returns list of SSL choices."""
+        return _convertir(self._llamar('GET', 'ldap/ssl_choices'), None)
+
+    def mail_get(self) -> MailGet:
+        """GET /mail"""
+        return _convertir(self._llamar('GET', 'mail'), MailGet)
+
+    def mail_put(self, cuerpo=None) -> MailPut:
+        """Update Mail Service Configuration."""
+        return _convertir(self._llamar('PUT', 'mail', json=cuerpo), MailPut)
+
+    def mail_send_post(self, cuerpo=None) -> Any:
+        """Sends mail using configured mail settings."""
+        return _convertir(self._llamar('POST', 'mail/send', json=cuerpo), None)
+
+    def network_configuration_get(self) -> NetworkConfigurationGet:
+        """GET /network/configuration"""
+        return _convertir(self._llamar('GET', 'network/configuration'), NetworkConfigurationGet)
+
+    def network_configuration_put(self, cuerpo=None) -> NetworkConfigurationPut:
+        """Update Network Configuration Service configuration."""
+        return _convertir(self._llamar('PUT', 'network/configuration', json=cuerpo), NetworkConfigurationPut)
+
+    def network_configuration_activity_choices_get(self) -> Any:
+        """Returns allowed/forbidden network activity choices."""
+        return _convertir(self._llamar('GET', 'network/configuration/activity_choices'), None)
+
+    def network_general_summary_get(self) -> NetworkGeneralSummaryGet:
+        """Retrieve general information for current Network."""
+        return _convertir(self._llamar('GET', 'network/general/summary'), NetworkGeneralSummaryGet)
+
+    def nfs_get(self) -> NfsGet:
+        """GET /nfs"""
+        return _convertir(self._llamar('GET', 'nfs'), NfsGet)
+
+    def nfs_put(self, cuerpo=None) -> NfsPut:
+        """Update NFS Service Configuration."""
+        return _convertir(self._llamar('PUT', 'nfs', json=cuerpo), NfsPut)
+
+    def nfs_bindip_choices_get(self) -> Any:
+        """Returns ip choices for NFS service to use"""
+        return _convertir(self._llamar('GET', 'nfs/bindip_choices'), None)
+
+    def nfs_client_count_get(self) -> Any:
+        """Return currently connected clients count."""
+        return _convertir(self._llamar('GET', 'nfs/client_count'), None)
+
+    def nfs_get_nfs3_clients_get(self, **params) -> Any:
+        """Read contents of rmtab. This information may not"""
+        return _convertir(self._llamar('GET', 'nfs/get_nfs3_clients', params=params), None)
+
+    def iter_nfs_get_nfs3_clients_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[Any]:
+        """Itera todos los resultados de /nfs/get_nfs3_clients paginando con limit/offset"""
+        return self._paginar('nfs/get_nfs3_clients', None, tamano_pagina, params)
+
+    def nfs_get_nfs4_clients_get(self, **params) -> Union[NfsGetNfs4ClientsGet, List[NfsGetNfs4ClientsGet], Any]:
+        """Read information about NFSv4 clients from /proc/fs/nfsd/clients"""
+        return _convertir(self._llamar('GET', 'nfs/get_nfs4_clients', params=params), NfsGetNfs4ClientsGet)
+
+    def iter_nfs_get_nfs4_clients_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[NfsGetNfs4ClientsGet]:
+        """Itera todos los resultados de /nfs/get_nfs4_clients paginando con limit/offset"""
+        return self._paginar('nfs/get_nfs4_clients', NfsGetNfs4ClientsGet, tamano_pagina, params)
+
+    def pool_get(self, **params) -> Union[PoolGet, List[PoolGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'pool', params=params), PoolGet)
+
+    def iter_pool_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[PoolGet]:
+        """Itera todos los resultados de /pool paginando con limit/offset"""
+        return self._paginar('pool', PoolGet, tamano_pagina, params)
+
+    def pool_post(self, cuerpo=None) -> PoolPost:
+        """Create a new ZFS Pool."""
+        return _convertir(self._llamar('POST', 'pool', json=cuerpo), PoolPost)
+
+    def pool_attach_post(self, cuerpo=None) -> Any:
+        """`target_vdev` is the GUID of the vdev where the disk needs to be attached. In case of STRIPED vdev, this"""
+        return _convertir(self._llamar('POST', 'pool/attach', json=cuerpo), None)
+
+    def pool_dataset_get(self, **params) -> Union[PoolDatasetGet, List[PoolDatasetGet], Any]:
+        """Query Pool Datasets with `query-filters` and `query-options`."""
+        return _convertir(self._llamar('GET', 'pool/dataset', params=params), PoolDatasetGet)
+
+    def iter_pool_dataset_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[PoolDatasetGet]:
+        """Itera todos los resultados de /pool/dataset paginando con limit/offset"""
+        return self._paginar('pool/dataset', PoolDatasetGet, tamano_pagina, params)
+
+    def pool_dataset_post(self, cuerpo=None) -> PoolDatasetPost:
+        """Creates a dataset/zvol."""
+        return _convertir(self._llamar('POST', 'pool/dataset', json=cuerpo), PoolDatasetPost)
+
+    def pool_dataset_change_key_post(self, cuerpo=None) -> Any:
+        """Change encryption properties for `id` encrypted dataset."""
+        return _convertir(self._llamar('POST', 'pool/dataset/change_key', json=cuerpo), None)
+
+    def pool_dataset_checksum_choices_get(self) -> PoolDatasetChecksumChoicesGet:
+        """Retrieve checksums supported for ZFS dataset."""
+        return _convertir(self._llamar('GET', 'pool/dataset/checksum_choices'), PoolDatasetChecksumChoicesGet)
+
+    def pool_dataset_compression_choices_get(self) -> PoolDatasetCompressionChoicesGet:
+        """Retrieve compression algorithm supported by ZFS."""
+        return _convertir(self._llamar('GET', 'pool/dataset/compression_choices'), PoolDatasetCompressionChoicesGet)
+
+    def pool_dataset_details_get(self) -> Any:
+        """Retrieve all dataset(s) details outlining any"""
+        return _convertir(self._llamar('GET', 'pool/dataset/details'), None)
+
+    def pool_dataset_encryption_algorithm_choices_get(self) -> PoolDatasetEncryptionAlgorithmChoicesGet:
+        """Retrieve encryption algorithms supported for ZFS dataset encryption."""
+        return _convertir(self._llamar('GET', 'pool/dataset/encryption_algorithm_choices'), PoolDatasetEncryptionAlgorithmChoicesGet)
+
+    def pool_dataset_encryption_summary_post(self, cuerpo=None) -> List[PoolDatasetEncryptionSummaryPost]:
+        """Retrieve summary of all encrypted roots under `id`."""
+        return _convertir(self._llamar('POST', 'pool/dataset/encryption_summary', json=cuerpo), PoolDatasetEncryptionSummaryPost)
+
+    def pool_dataset_export_key_post(self, cuerpo=None) -> Any:
+        """Export own encryption key for dataset `id`. If `download` is `true`, key will be downloaded in a json file"""
+        return _convertir(self._llamar('POST', 'pool/dataset/export_key', json=cuerpo), None)
+
+    def pool_dataset_export_keys_post(self, cuerpo=None) -> Any:
+        """Export keys for `id` and its children which are stored in the system. The exported file is a JSON file"""
+        return _convertir(self._llamar('POST', 'pool/dataset/export_keys', json=cuerpo), None)
+
+    def pool_dataset_export_keys_for_replication_post(self, cuerpo=None) -> Any:
+        """Export keys for replication task `id` for source dataset(s) which are stored in the system. The exported file"""
+        return _convertir(self._llamar('POST', 'pool/dataset/export_keys_for_replication', json=cuerpo), None)
+
+    def pool_dataset_get_instance_post(self, cuerpo=None) -> PoolDatasetGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'pool/dataset/get_instance', json=cuerpo), PoolDatasetGetInstancePost)
+
+    def pool_dataset_id_delete(self, id, cuerpo=None) -> Any:
+        """Delete dataset/zvol `id`."""
+        return _convertir(self._llamar('DELETE', f"pool/dataset/id/{id}", json=cuerpo), None)
+
+    def pool_dataset_id_get(self, id) -> Union[PoolDatasetIdGet, List[PoolDatasetIdGet], Any]:
+        """Query Pool Datasets with `query-filters` and `query-options`."""
+        return _convertir(self._llamar('GET', f"pool/dataset/id/{id}"), PoolDatasetIdGet)
+
+    def pool_dataset_id_put(self, id, cuerpo=None) -> PoolDatasetIdPut:
+        """Updates a dataset/zvol `id`."""
+        return _convertir(self._llamar('PUT', f"pool/dataset/id/{id}", json=cuerpo), PoolDatasetIdPut)
+
+    def pool_dataset_id_attachments_post(self, id, cuerpo=None) -> List[PoolDatasetIdAttachmentsPost]:
+        """Return a list of services dependent of this dataset."""
+        return _convertir(self._llamar('POST', f"pool/dataset/id/{id}/attachments", json=cuerpo), PoolDatasetIdAttachmentsPost)
+
+    def pool_dataset_id_get_quota_post(self, id, cuerpo=None) -> Any:
+        """Return a list of the specified `quota_type` of quotas on the ZFS dataset `ds`."""
+        return _convertir(self._llamar('POST', f"pool/dataset/id/{id}/get_quota", json=cuerpo), None)
+
+    def pool_dataset_id_processes_post(self, id, cuerpo=None) -> List[PoolDatasetIdProcessesPost]:
+        """Return a list of processes using this dataset."""
+        return _convertir(self._llamar('POST', f"pool/dataset/id/{id}/processes", json=cuerpo), PoolDatasetIdProcessesPost)
+
+    def pool_dataset_id_promote_post(self, id, cuerpo=None) -> Any:
+        """Promote the cloned dataset `id`."""
+        return _convertir(self._llamar('POST', f"pool/dataset/id/{id}/promote", json=cuerpo), None)
+
+    def pool_dataset_id_set_quota_post(self, id, cuerpo=None) -> Any:
+        """There are three over-arching types of quotas for ZFS datasets."""
+        return _convertir(self._llamar('POST', f"pool/dataset/id/{id}/set_quota", json=cuerpo), None)
+
+    def pool_dataset_inherit_parent_encryption_properties_post(self, cuerpo=None) -> Any:
+        """Allows inheriting parent's encryption root discarding its current encryption settings. This"""
+        return _convertir(self._llamar('POST', 'pool/dataset/inherit_parent_encryption_properties', json=cuerpo), None)
+
+    def pool_dataset_lock_post(self, cuerpo=None) -> Any:
+        """Locks `id` dataset. It will unmount the dataset and its children before locking."""
+        return _convertir(self._llamar('POST', 'pool/dataset/lock', json=cuerpo), None)
+
+    def pool_dataset_recommended_zvol_blocksize_post(self, cuerpo=None) -> Any:
+        """Helper method to get recommended size for a new zvol (dataset of type VOLUME)."""
+        return _convertir(self._llamar('POST', 'pool/dataset/recommended_zvol_blocksize', json=cuerpo), None)
+
+    def pool_dataset_recordsize_choices_post(self, cuerpo=None) -> Any:
+        """Retrieve recordsize choices for datasets."""
+        return _convertir(self._llamar('POST', 'pool/dataset/recordsize_choices', json=cuerpo), None)
+
+    def pool_dataset_snapshot_count_post(self, cuerpo=None) -> Any:
+        """Returns snapshot count for specified `dataset`."""
+        return _convertir(self._llamar('POST', 'pool/dataset/snapshot_count', json=cuerpo), None)
+
+    def pool_dataset_unlock_post(self, cuerpo=None) -> PoolDatasetUnlockPost:
+        """Unlock dataset `id` (and its children if `unlock_options.recursive` is `true`)."""
+        return _convertir(self._llamar('POST', 'pool/dataset/unlock', json=cuerpo), PoolDatasetUnlockPost)
+
+    def pool_ddt_prefetch_post(self, cuerpo=None) -> Any:
+        """Prefetch DDT entries in pool `pool_name`."""
+        return _convertir(self._llamar('POST', 'pool/ddt_prefetch', json=cuerpo), None)
+
+    def pool_ddt_prune_post(self, cuerpo=None) -> Any:
+        """Prune DDT entries in pool `pool_name` based on the specified options."""
+        return _convertir(self._llamar('POST', 'pool/ddt_prune', json=cuerpo), None)
+
+    def pool_filesystem_choices_post(self, cuerpo=None) -> Any:
+        """Returns all available datasets, except the following:"""
+        return _convertir(self._llamar('POST', 'pool/filesystem_choices', json=cuerpo), None)
+
+    def pool_get_instance_post(self, cuerpo=None) -> PoolGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'pool/get_instance', json=cuerpo), PoolGetInstancePost)
+
+    def pool_id_get(self, id) -> Union[PoolIdGet, List[PoolIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"pool/id/{id}"), PoolIdGet)
+
+    def pool_id_put(self, id, cuerpo=None) -> PoolIdPut:
+        """Update pool of `id`, adding the new topology."""
+        return _convertir(self._llamar('PUT', f"pool/id/{id}", json=cuerpo), PoolIdPut)
+
+    def pool_id_attachments_post(self, id, cuerpo=None) -> List[PoolIdAttachmentsPost]:
+        """Return a list of services dependent of this pool."""
+        return _convertir(self._llamar('POST', f"pool/id/{id}/attachments", json=cuerpo), PoolIdAttachmentsPost)
+
+    def pool_id_detach_post(self, id, cuerpo=None) -> Any:
+        """Detach a disk from pool of id `id`."""
+        return _convertir(self._llamar('POST', f"pool/id/{id}/detach", json=cuerpo), None)
+
+    def pool_id_expand_post(self, id, cuerpo=None) -> Any:
+        """Expand pool to fit all available disk space."""
+        return _convertir(self._llamar('POST', f"pool/id/{id}/expand", json=cuerpo), None)
+
+    def pool_id_export_post(self, id, cuerpo=None) -> Any:
+        """Export pool of `id`."""
+        return _convertir(self._llamar('POST', f"pool/id/{id}/export", json=cuerpo), None)
+
+    def pool_id_get_disks_post(self, id, cuerpo=None) -> Any:
+        """Get all disks in use by pools."""
+        return _convertir(self._llamar('POST', f"pool/id/{id}/get_disks", json=cuerpo), None)
+
+    def pool_id_is_upgraded_post(self, id, cuerpo=None) -> Any:
+        """Returns whether or not the pool of `id` is on the latest version and with all feature"""
+        return _convertir(self._llamar('POST', f"pool/id/{id}/is_upgraded", json=cuerpo), None)
+
+    def pool_id_offline_post(self, id, cuerpo=None) -> Any:
+        """Offline a disk from pool of id `id`."""
+        return _convertir(self._llamar('POST', f"pool/id/{id}/offline", json=cuerpo), None)
+
+    def pool_id_online_post(self, id, cuerpo=None) -> Any:
+        """Online a disk from pool of id `id`."""
+        return _convertir(self._llamar('POST', f"pool/id/{id}/online", json=cuerpo), None)
+
+    def pool_id_processes_post(self, id, cuerpo=None) -> List[PoolIdProcessesPost]:
+        """Returns a list of running processes using this pool."""
+        return _convertir(self._llamar('POST', f"pool/id/{id}/processes", json=cuerpo), PoolIdProcessesPost)
+
+    def pool_id_remove_post(self, id, cuerpo=None) -> Any:
+        """Remove a disk from pool of id `id`."""
+        return _convertir(self._llamar('POST', f"pool/id/{id}/remove", json=cuerpo), None)
+
+    def pool_id_replace_post(self, id, cuerpo=None) -> Any:
+        """Replace a disk on a pool."""
+        return _convertir(self._llamar('POST', f"pool/id/{id}/replace", json=cuerpo), None)
+
+    def pool_id_scrub_post(self, id, cuerpo=None) -> Any:
+        """Performs a scrub action to pool of `id`."""
+        return _convertir(self._llamar('POST', f"pool/id/{id}/scrub", json=cuerpo), None)
+
+    def pool_id_upgrade_post(self, id, cuerpo=None) -> Any:
+        """Upgrade pool of `id` to latest version with all feature flags."""
+        return _convertir(self._llamar('POST', f"pool/id/{id}/upgrade", json=cuerpo), None)
+
+    def pool_import_find_get(self) -> List[PoolImportFindGet]:
+        """Returns a job id which can be used to retrieve a list of pools available for"""
+        return _convertir(self._llamar('GET', 'pool/import_find'), PoolImportFindGet)
+
+    def pool_import_pool_post(self, cuerpo=None) -> Any:
+        """Import a pool found with `pool.import_find`."""
+        return _convertir(self._llamar('POST', 'pool/import_pool', json=cuerpo), None)
+
+    def pool_resilver_get(self) -> PoolResilverGet:
+        """GET /pool/resilver"""
+        return _convertir(self._llamar('GET', 'pool/resilver'), PoolResilverGet)
+
+    def pool_resilver_put(self, cuerpo=None) -> PoolResilverPut:
+        """Configure Pool Resilver Priority."""
+        return _convertir(self._llamar('PUT', 'pool/resilver', json=cuerpo), PoolResilverPut)
+
+    def pool_scrub_get(self, **params) -> Union[PoolScrubGet, List[PoolScrubGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'pool/scrub', params=params), PoolScrubGet)
+
+    def iter_pool_scrub_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[PoolScrubGet]:
+        """Itera todos los resultados de /pool/scrub paginando con limit/offset"""
+        return self._paginar('pool/scrub', PoolScrubGet, tamano_pagina, params)
+
+    def pool_scrub_post(self, cuerpo=None) -> PoolScrubPost:
+        """Create a scrub task for a pool."""
+        return _convertir(self._llamar('POST', 'pool/scrub', json=cuerpo), PoolScrubPost)
+
+    def pool_scrub_get_instance_post(self, cuerpo=None) -> PoolScrubGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'pool/scrub/get_instance', json=cuerpo), PoolScrubGetInstancePost)
+
+    def pool_scrub_id_delete(self, id) -> Any:
+        """Delete scrub task of `id`."""
+        return _convertir(self._llamar('DELETE', f"pool/scrub/id/{id}"), None)
+
+    def pool_scrub_id_get(self, id) -> Union[PoolScrubIdGet, List[PoolScrubIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"pool/scrub/id/{id}"), PoolScrubIdGet)
+
+    def pool_scrub_id_put(self, id, cuerpo=None) -> PoolScrubIdPut:
+        """Update scrub task of `id`."""
+        return _convertir(self._llamar('PUT', f"pool/scrub/id/{id}", json=cuerpo), PoolScrubIdPut)
+
+    def pool_scrub_run_post(self, cuerpo=None) -> Any:
+        """Initiate a scrub of a pool `name` if last scrub was performed more than `threshold` days before."""
+        return _convertir(self._llamar('POST', 'pool/scrub/run', json=cuerpo), None)
+
+    def pool_scrub_scrub_post(self, cuerpo=None) -> Any:
+        """Start/Stop/Pause a scrub on pool `name`."""
+        return _convertir(self._llamar('POST', 'pool/scrub/scrub', json=cuerpo), None)
+
+    def pool_snapshottask_get(self, **params) -> Union[PoolSnapshottaskGet, List[PoolSnapshottaskGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'pool/snapshottask', params=params), PoolSnapshottaskGet)
+
+    def iter_pool_snapshottask_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[PoolSnapshottaskGet]:
+        """Itera todos los resultados de /pool/snapshottask paginando con limit/offset"""
+        return self._paginar('pool/snapshottask', PoolSnapshottaskGet, tamano_pagina, params)
+
+    def pool_snapshottask_post(self, cuerpo=None) -> PoolSnapshottaskPost:
+        """Create a Periodic Snapshot Task"""
+        return _convertir(self._llamar('POST', 'pool/snapshottask', json=cuerpo), PoolSnapshottaskPost)
+
+    def pool_snapshottask_get_instance_post(self, cuerpo=None) -> PoolSnapshottaskGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'pool/snapshottask/get_instance', json=cuerpo), PoolSnapshottaskGetInstancePost)
+
+    def pool_snapshottask_id_delete(self, id, cuerpo=None) -> Any:
+        """Delete a Periodic Snapshot Task with specific `id`"""
+        return _convertir(self._llamar('DELETE', f"pool/snapshottask/id/{id}", json=cuerpo), None)
+
+    def pool_snapshottask_id_get(self, id) -> Union[PoolSnapshottaskIdGet, List[PoolSnapshottaskIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"pool/snapshottask/id/{id}"), PoolSnapshottaskIdGet)
+
+    def pool_snapshottask_id_put(self, id, cuerpo=None) -> PoolSnapshottaskIdPut:
+        """Update a Periodic Snapshot Task with specific `id`"""
+        return _convertir(self._llamar('PUT', f"pool/snapshottask/id/{id}", json=cuerpo), PoolSnapshottaskIdPut)
+
+    def pool_snapshottask_id_delete_will_change_retention_for_post(self, id, cuerpo=None) -> Any:
+        """Returns a list of snapshots which will change the retention if periodic snapshot task `id` is deleted."""
+        return _convertir(self._llamar('POST', f"pool/snapshottask/id/{id}/delete_will_change_retention_for", json=cuerpo), None)
+
+    def pool_snapshottask_id_run_post(self, id, cuerpo=None) -> Any:
+        """Execute a Periodic Snapshot Task of `id`."""
+        return _convertir(self._llamar('POST', f"pool/snapshottask/id/{id}/run", json=cuerpo), None)
+
+    def pool_snapshottask_id_update_will_change_retention_for_post(self, id, cuerpo=None) -> Any:
+        """Returns a list of snapshots which will change the retention if periodic snapshot task `id` is updated"""
+        return _convertir(self._llamar('POST', f"pool/snapshottask/id/{id}/update_will_change_retention_for", json=cuerpo), None)
+
+    def pool_snapshottask_max_count_get(self) -> Any:
+        """Returns a maximum amount of snapshots (per-dataset) the system can sustain."""
+        return _convertir(self._llamar('GET', 'pool/snapshottask/max_count'), None)
+
+    def pool_snapshottask_max_total_count_get(self) -> Any:
+        """Returns a maximum amount of snapshots (total) the system can sustain."""
+        return _convertir(self._llamar('GET', 'pool/snapshottask/max_total_count'), None)
+
+    def pool_validate_name_post(self, cuerpo=None) -> Any:
+        """Validates `pool_name` is a valid name for a pool."""
+        return _convertir(self._llamar('POST', 'pool/validate_name', json=cuerpo), None)
+
+    def privilege_get(self, **params) -> Union[PrivilegeGet, List[PrivilegeGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'privilege', params=params), PrivilegeGet)
+
+    def iter_privilege_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[PrivilegeGet]:
+        """Itera todos los resultados de /privilege paginando con limit/offset"""
+        return self._paginar('privilege', PrivilegeGet, tamano_pagina, params)
+
+    def privilege_post(self, cuerpo=None) -> PrivilegePost:
+        """Creates a privilege."""
+        return _convertir(self._llamar('POST', 'privilege', json=cuerpo), PrivilegePost)
+
+    def privilege_get_instance_post(self, cuerpo=None) -> PrivilegeGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'privilege/get_instance', json=cuerpo), PrivilegeGetInstancePost)
+
+    def privilege_id_delete(self, id) -> Any:
+        """Delete the privilege `id`."""
+        return _convertir(self._llamar('DELETE', f"privilege/id/{id}"), None)
+
+    def privilege_id_get(self, id) -> Union[PrivilegeIdGet, List[PrivilegeIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"privilege/id/{id}"), PrivilegeIdGet)
+
+    def privilege_id_put(self, id, cuerpo=None) -> PrivilegeIdPut:
+        """Update the privilege `id`."""
+        return _convertir(self._llamar('PUT', f"privilege/id/{id}", json=cuerpo), PrivilegeIdPut)
+
+    def privilege_roles_get(self, **params) -> Union[PrivilegeRolesGet, List[PrivilegeRolesGet], Any]:
+        """Get all available roles."""
+        return _convertir(self._llamar('GET', 'privilege/roles', params=params), PrivilegeRolesGet)
+
+    def iter_privilege_roles_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[PrivilegeRolesGet]:
+        """Itera todos los resultados de /privilege/roles paginando con limit/offset"""
+        return self._paginar('privilege/roles', PrivilegeRolesGet, tamano_pagina, params)
+
+    def replication_get(self, **params) -> Any:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'replication', params=params), None)
+
+    def iter_replication_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[Any]:
+        """Itera todos los resultados de /replication paginando con limit/offset"""
+        return self._paginar('replication', None, tamano_pagina, params)
+
+    def replication_post(self, cuerpo=None) -> Any:
+        """Create a Replication Task"""
+        return _convertir(self._llamar('POST', 'replication', json=cuerpo), None)
+
+    def replication_config_get(self) -> Any:
+        """GET /replication/config"""
+        return _convertir(self._llamar('GET', 'replication/config'), None)
+
+    def replication_config_put(self, cuerpo=None) -> Any:
+        """`max_parallel_replication_tasks` represents a maximum number of parallel replication tasks running."""
+        return _convertir(self._llamar('PUT', 'replication/config', json=cuerpo), None)
+
+    def replication_count_eligible_manual_snapshots_post(self, cuerpo=None) -> ReplicationCountEligibleManualSnapshotsPost:
+        """Count how many existing snapshots of `dataset` match `naming_schema`."""
+        return _convertir(self._llamar('POST', 'replication/count_eligible_manual_snapshots', json=cuerpo), ReplicationCountEligibleManualSnapshotsPost)
+
+    def replication_create_dataset_post(self, cuerpo=None) -> Any:
+        """Creates dataset on remote side"""
+        return _convertir(self._llamar('POST', 'replication/create_dataset', json=cuerpo), None)
+
+    def replication_get_instance_post(self, cuerpo=None) -> Any:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'replication/get_instance', json=cuerpo), None)
+
+    def replication_id_delete(self, id) -> Any:
+        """Delete a Replication Task with specific `id`"""
+        return _convertir(self._llamar('DELETE', f"replication/id/{id}"), None)
+
+    def replication_id_get(self, id) -> Any:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"replication/id/{id}"), None)
+
+    def replication_id_put(self, id, cuerpo=None) -> Any:
+        """Update a Replication Task with specific `id`"""
+        return _convertir(self._llamar('PUT', f"replication/id/{id}", json=cuerpo), None)
+
+    def replication_id_restore_post(self, id, cuerpo=None) -> Any:
+        """Create the opposite of replication task `id` (PULL if it was PUSH and vice versa)."""
+        return _convertir(self._llamar('POST', f"replication/id/{id}/restore", json=cuerpo), None)
+
+    def replication_id_run_post(self, id, cuerpo=None) -> Any:
+        """Run Replication Task of `id`."""
+        return _convertir(self._llamar('POST', f"replication/id/{id}/run", json=cuerpo), None)
+
+    def replication_list_datasets_post(self, cuerpo=None) -> Any:
+        """List datasets on remote side"""
+        return _convertir(self._llamar('POST', 'replication/list_datasets', json=cuerpo), None)
+
+    def replication_list_naming_schemas_get(self) -> Any:
+        """List all naming schemas used in periodic snapshot and replication tasks."""
+        return _convertir(self._llamar('GET', 'replication/list_naming_schemas'), None)
+
+    def replication_run_onetime_post(self, cuerpo=None) -> Any:
+        """Run replication task without creating it."""
+        return _convertir(self._llamar('POST', 'replication/run_onetime', json=cuerpo), None)
+
+    def replication_target_unmatched_snapshots_post(self, cuerpo=None) -> Any:
+        """Check if target has any snapshots that do not exist on source. Returns these snapshots grouped by dataset."""
+        return _convertir(self._llamar('POST', 'replication/target_unmatched_snapshots', json=cuerpo), None)
+
+    def reporting_get(self) -> ReportingGet:
+        """GET /reporting"""
+        return _convertir(self._llamar('GET', 'reporting'), ReportingGet)
+
+    def reporting_put(self, cuerpo=None) -> ReportingPut:
+        """`tier1_days` can be set to specify for how many days we want to store reporting history which in netdata"""
+        return _convertir(self._llamar('PUT', 'reporting', json=cuerpo), ReportingPut)
+
+    def reporting_exporters_get(self, **params) -> Union[ReportingExportersGet, List[ReportingExportersGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'reporting/exporters', params=params), ReportingExportersGet)
+
+    def iter_reporting_exporters_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[ReportingExportersGet]:
+        """Itera todos los resultados de /reporting/exporters paginando con limit/offset"""
+        return self._paginar('reporting/exporters', ReportingExportersGet, tamano_pagina, params)
+
+    def reporting_exporters_post(self, cuerpo=None) -> ReportingExportersPost:
+        """Create a specific reporting exporter configuration containing required details for exporting reporting metrics."""
+        return _convertir(self._llamar('POST', 'reporting/exporters', json=cuerpo), ReportingExportersPost)
+
+    def reporting_exporters_exporter_schemas_get(self) -> List[ReportingExportersExporterSchemasGet]:
+        """Get the schemas for all the reporting export types we support with their respective attributes"""
+        return _convertir(self._llamar('GET', 'reporting/exporters/exporter_schemas'), ReportingExportersExporterSchemasGet)
+
+    def reporting_exporters_get_instance_post(self, cuerpo=None) -> ReportingExportersGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'reporting/exporters/get_instance', json=cuerpo), ReportingExportersGetInstancePost)
+
+    def reporting_exporters_id_delete(self, id) -> Any:
+        """Delete Reporting Exporter of `id`."""
+        return _convertir(self._llamar('DELETE', f"reporting/exporters/id/{id}"), None)
+
+    def reporting_exporters_id_get(self, id) -> Union[ReportingExportersIdGet, List[ReportingExportersIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"reporting/exporters/id/{id}"), ReportingExportersIdGet)
+
+    def reporting_exporters_id_put(self, id, cuerpo=None) -> ReportingExportersIdPut:
+        """Update Reporting Exporter of `id`."""
+        return _convertir(self._llamar('PUT', f"reporting/exporters/id/{id}", json=cuerpo), ReportingExportersIdPut)
+
+    def reporting_get_data_post(self, cuerpo=None) -> List[ReportingGetDataPost]:
+        """Get reporting data for given graphs."""
+        return _convertir(self._llamar('POST', 'reporting/get_data', json=cuerpo), ReportingGetDataPost)
+
+    def reporting_graph_post(self, cuerpo=None) -> List[ReportingGraphPost]:
+        """Get reporting data for `name` graph."""
+        return _convertir(self._llamar('POST', 'reporting/graph', json=cuerpo), ReportingGraphPost)
+
+    def reporting_graphs_get(self, **params) -> Union[ReportingGraphsGet, List[ReportingGraphsGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'reporting/graphs', params=params), ReportingGraphsGet)
+
+    def iter_reporting_graphs_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[ReportingGraphsGet]:
+        """Itera todos los resultados de /reporting/graphs paginando con limit/offset"""
+        return self._paginar('reporting/graphs', ReportingGraphsGet, tamano_pagina, params)
+
+    def reporting_netdata_get_data_post(self, cuerpo=None) -> List[ReportingNetdataGetDataPost]:
+        """Get reporting data for given graphs."""
+        return _convertir(self._llamar('POST', 'reporting/netdata_get_data', json=cuerpo), ReportingNetdataGetDataPost)
+
+    def reporting_netdata_graph_post(self, cuerpo=None) -> List[ReportingNetdataGraphPost]:
+        """Get reporting data for `name` graph."""
+        return _convertir(self._llamar('POST', 'reporting/netdata_graph', json=cuerpo), ReportingNetdataGraphPost)
+
+    def reporting_netdata_graphs_get(self, **params) -> Union[ReportingNetdataGraphsGet, List[ReportingNetdataGraphsGet], Any]:
+        """Get reporting netdata graphs."""
+        return _convertir(self._llamar('GET', 'reporting/netdata_graphs', params=params), ReportingNetdataGraphsGet)
+
+    def iter_reporting_netdata_graphs_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[ReportingNetdataGraphsGet]:
+        """Itera todos los resultados de /reporting/netdata_graphs paginando con limit/offset"""
+        return self._paginar('reporting/netdata_graphs', ReportingNetdataGraphsGet, tamano_pagina, params)
+
+    def route_ipv4gw_reachable_post(self, cuerpo=None) -> Any:
+        """Get the IPv4 gateway and verify if it is reachable by any interface."""
+        return _convertir(self._llamar('POST', 'route/ipv4gw_reachable', json=cuerpo), None)
+
+    def route_system_routes_get(self, **params) -> Union[RouteSystemRoutesGet, List[RouteSystemRoutesGet], Any]:
+        """Get current/applied network routes."""
+        return _convertir(self._llamar('GET', 'route/system_routes', params=params), RouteSystemRoutesGet)
+
+    def iter_route_system_routes_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[RouteSystemRoutesGet]:
+        """Itera todos los resultados de /route/system_routes paginando con limit/offset"""
+        return self._paginar('route/system_routes', RouteSystemRoutesGet, tamano_pagina, params)
+
+    def rsynctask_get(self, **params) -> Union[RsynctaskGet, List[RsynctaskGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'rsynctask', params=params), RsynctaskGet)
+
+    def iter_rsynctask_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[RsynctaskGet]:
+        """Itera todos los resultados de /rsynctask paginando con limit/offset"""
+        return self._paginar('rsynctask', RsynctaskGet, tamano_pagina, params)
+
+    def rsynctask_post(self, cuerpo=None) -> RsynctaskPost:
+        """Create a Rsync Task."""
+        return _convertir(self._llamar('POST', 'rsynctask', json=cuerpo), RsynctaskPost)
+
+    def rsynctask_get_instance_post(self, cuerpo=None) -> RsynctaskGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'rsynctask/get_instance', json=cuerpo), RsynctaskGetInstancePost)
+
+    def rsynctask_id_delete(self, id) -> Any:
+        """Delete Rsync Task of `id`."""
+        return _convertir(self._llamar('DELETE', f"rsynctask/id/{id}"), None)
+
+    def rsynctask_id_get(self, id) -> Union[RsynctaskIdGet, List[RsynctaskIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"rsynctask/id/{id}"), RsynctaskIdGet)
+
+    def rsynctask_id_put(self, id, cuerpo=None) -> RsynctaskIdPut:
+        """Update Rsync Task of `id`."""
+        return _convertir(self._llamar('PUT', f"rsynctask/id/{id}", json=cuerpo), RsynctaskIdPut)
+
+    def rsynctask_id_run_post(self, id, cuerpo=None) -> Any:
+        """Job to run rsync task of `id`."""
+        return _convertir(self._llamar('POST', f"rsynctask/id/{id}/run", json=cuerpo), None)
+
+    def service_get(self, **params) -> Union[ServiceGet, List[ServiceGet], Any]:
+        """Query all system services with `query-filters` and `query-options`."""
+        return _convertir(self._llamar('GET', 'service', params=params), ServiceGet)
+
+    def iter_service_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[ServiceGet]:
+        """Itera todos los resultados de /service paginando con limit/offset"""
+        return self._paginar('service', ServiceGet, tamano_pagina, params)
+
+    def service_get_instance_post(self, cuerpo=None) -> ServiceGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'service/get_instance', json=cuerpo), ServiceGetInstancePost)
+
+    def service_id_get(self, id) -> Union[ServiceIdGet, List[ServiceIdGet], Any]:
+        """Query all system services with `query-filters` and `query-options`."""
+        return _convertir(self._llamar('GET', f"service/id/{id}"), ServiceIdGet)
+
+    def service_id_put(self, id, cuerpo=None) -> Any:
+        """Update service entry of `id_or_name`."""
+        return _convertir(self._llamar('PUT', f"service/id/{id}", json=cuerpo), None)
+
+    def service_reload_post(self, cuerpo=None) -> Any:
+        """Reload the service specified by `service`."""
+        return _convertir(self._llamar('POST', 'service/reload', json=cuerpo), None)
+
+    def service_restart_post(self, cuerpo=None) -> Any:
+        """Restart the service specified by `service`."""
+        return _convertir(self._llamar('POST', 'service/restart', json=cuerpo), None)
+
+    def service_start_post(self, cuerpo=None) -> Any:
+        """Start the service specified by `service`."""
+        return _convertir(self._llamar('POST', 'service/start', json=cuerpo), None)
+
+    def service_started_post(self, cuerpo=None) -> Any:
+        """Test if service specified by `service` has been started."""
+        return _convertir(self._llamar('POST', 'service/started', json=cuerpo), None)
+
+    def service_started_or_enabled_post(self, cuerpo=None) -> Any:
+        """Test if service specified by `service` is started or enabled to start automatically."""
+        return _convertir(self._llamar('POST', 'service/started_or_enabled', json=cuerpo), None)
+
+    def service_stop_post(self, cuerpo=None) -> Any:
+        """Stop the service specified by `service`."""
+        return _convertir(self._llamar('POST', 'service/stop', json=cuerpo), None)
+
+    def sharing_nfs_get(self, **params) -> Union[SharingNfsGet, List[SharingNfsGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'sharing/nfs', params=params), SharingNfsGet)
+
+    def iter_sharing_nfs_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[SharingNfsGet]:
+        """Itera todos los resultados de /sharing/nfs paginando con limit/offset"""
+        return self._paginar('sharing/nfs', SharingNfsGet, tamano_pagina, params)
+
+    def sharing_nfs_post(self, cuerpo=None) -> SharingNfsPost:
+        """Create a NFS Share."""
+        return _convertir(self._llamar('POST', 'sharing/nfs', json=cuerpo), SharingNfsPost)
+
+    def sharing_nfs_get_instance_post(self, cuerpo=None) -> SharingNfsGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'sharing/nfs/get_instance', json=cuerpo), SharingNfsGetInstancePost)
+
+    def sharing_nfs_id_delete(self, id) -> Any:
+        """Delete NFS Share of `id`."""
+        return _convertir(self._llamar('DELETE', f"sharing/nfs/id/{id}"), None)
+
+    def sharing_nfs_id_get(self, id) -> Union[SharingNfsIdGet, List[SharingNfsIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"sharing/nfs/id/{id}"), SharingNfsIdGet)
+
+    def sharing_nfs_id_put(self, id, cuerpo=None) -> SharingNfsIdPut:
+        """Update NFS Share of `id`."""
+        return _convertir(self._llamar('PUT', f"sharing/nfs/id/{id}", json=cuerpo), SharingNfsIdPut)
+
+    def sharing_smb_get(self, **params) -> Any:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'sharing/smb', params=params), None)
+
+    def iter_sharing_smb_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[Any]:
+        """Itera todos los resultados de /sharing/smb paginando con limit/offset"""
+        return self._paginar('sharing/smb', None, tamano_pagina, params)
+
+    def sharing_smb_post(self, cuerpo=None) -> Any:
+        """Create a SMB Share."""
+        return _convertir(self._llamar('POST', 'sharing/smb', json=cuerpo), None)
+
+    def sharing_smb_get_instance_post(self, cuerpo=None) -> Any:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'sharing/smb/get_instance', json=cuerpo), None)
+
+    def sharing_smb_getacl_post(self, cuerpo=None) -> SharingSmbGetaclPost:
+        """POST /sharing/smb/getacl"""
+        return _convertir(self._llamar('POST', 'sharing/smb/getacl', json=cuerpo), SharingSmbGetaclPost)
+
+    def sharing_smb_id_delete(self, id) -> Any:
+        """Delete SMB Share of `id`. This will forcibly disconnect SMB clients"""
+        return _convertir(self._llamar('DELETE', f"sharing/smb/id/{id}"), None)
+
+    def sharing_smb_id_get(self, id) -> Any:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"sharing/smb/id/{id}"), None)
+
+    def sharing_smb_id_put(self, id, cuerpo=None) -> Any:
+        """Update SMB Share of `id`."""
+        return _convertir(self._llamar('PUT', f"sharing/smb/id/{id}", json=cuerpo), None)
+
+    def sharing_smb_presets_get(self) -> Any:
+        """Retrieve pre-defined configuration sets for specific use-cases. These parameter"""
+        return _convertir(self._llamar('GET', 'sharing/smb/presets'), None)
+
+    def sharing_smb_setacl_post(self, cuerpo=None) -> SharingSmbSetaclPost:
+        """Set an ACL on `share_name`. This only impacts access through the SMB protocol."""
+        return _convertir(self._llamar('POST', 'sharing/smb/setacl', json=cuerpo), SharingSmbSetaclPost)
+
+    def smart_get(self) -> SmartGet:
+        """GET /smart"""
+        return _convertir(self._llamar('GET', 'smart'), SmartGet)
+
+    def smart_put(self, cuerpo=None) -> SmartPut:
+        """Update SMART Service Configuration."""
+        return _convertir(self._llamar('PUT', 'smart', json=cuerpo), SmartPut)
+
+    def smart_test_get(self, **params) -> Union[SmartTestGet, List[SmartTestGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'smart/test', params=params), SmartTestGet)
+
+    def iter_smart_test_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[SmartTestGet]:
+        """Itera todos los resultados de /smart/test paginando con limit/offset"""
+        return self._paginar('smart/test', SmartTestGet, tamano_pagina, params)
+
+    def smart_test_post(self, cuerpo=None) -> SmartTestPost:
+        """Create a SMART Test Task."""
+        return _convertir(self._llamar('POST', 'smart/test', json=cuerpo), SmartTestPost)
+
+    def smart_test_abort_post(self, cuerpo=None) -> Any:
+        """Abort non-captive S.M.A.R.T. tests for disk."""
+        return _convertir(self._llamar('POST', 'smart/test/abort', json=cuerpo), None)
+
+    def smart_test_disk_choices_post(self, cuerpo=None) -> Any:
+        """Returns disk choices for S.M.A.R.T. test."""
+        return _convertir(self._llamar('POST', 'smart/test/disk_choices', json=cuerpo), None)
+
+    def smart_test_get_instance_post(self, cuerpo=None) -> SmartTestGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'smart/test/get_instance', json=cuerpo), SmartTestGetInstancePost)
+
+    def smart_test_id_delete(self, id) -> Any:
+        """Delete SMART Test Task of `id`."""
+        return _convertir(self._llamar('DELETE', f"smart/test/id/{id}"), None)
+
+    def smart_test_id_get(self, id) -> Union[SmartTestIdGet, List[SmartTestIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"smart/test/id/{id}"), SmartTestIdGet)
+
+    def smart_test_id_put(self, id, cuerpo=None) -> SmartTestIdPut:
+        """Update SMART Test Task of `id`."""
+        return _convertir(self._llamar('PUT', f"smart/test/id/{id}", json=cuerpo), SmartTestIdPut)
+
+    def smart_test_manual_test_post(self, cuerpo=None) -> List[SmartTestManualTestPost]:
+        """Run manual SMART tests for `disks`."""
+        return _convertir(self._llamar('POST', 'smart/test/manual_test', json=cuerpo), SmartTestManualTestPost)
+
+    def smart_test_query_for_disk_post(self, cuerpo=None) -> Any:
+        """Query S.M.A.R.T. tests for the specified disk name."""
+        return _convertir(self._llamar('POST', 'smart/test/query_for_disk', json=cuerpo), None)
+
+    def smart_test_results_get(self, **params) -> Union[SmartTestResultsGet, List[SmartTestResultsGet], Any]:
+        """Get disk(s) S.M.A.R.T. test(s) results."""
+        return _convertir(self._llamar('GET', 'smart/test/results', params=params), SmartTestResultsGet)
+
+    def iter_smart_test_results_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[SmartTestResultsGet]:
+        """Itera todos los resultados de /smart/test/results paginando con limit/offset"""
+        return self._paginar('smart/test/results', SmartTestResultsGet, tamano_pagina, params)
+
+    def smb_get(self) -> SmbGet:
+        """GET /smb"""
+        return _convertir(self._llamar('GET', 'smb'), SmbGet)
+
+    def smb_put(self, cuerpo=None) -> SmbPut:
+        """Update SMB Service Configuration."""
+        return _convertir(self._llamar('PUT', 'smb', json=cuerpo), SmbPut)
+
+    def smb_bindip_choices_get(self) -> Any:
+        """List of valid choices for IP addresses to which to bind the SMB service."""
+        return _convertir(self._llamar('GET', 'smb/bindip_choices'), None)
+
+    def smb_client_count_get(self) -> Any:
+        """Return currently connected clients count."""
+        return _convertir(self._llamar('GET', 'smb/client_count'), None)
+
+    def smb_status_post(self, cuerpo=None) -> Any:
+        """Returns SMB server status (sessions, open files, locks, notifications)."""
+        return _convertir(self._llamar('POST', 'smb/status', json=cuerpo), None)
+
+    def smb_unixcharset_choices_get(self) -> Any:
+        """GET /smb/unixcharset_choices"""
+        return _convertir(self._llamar('GET', 'smb/unixcharset_choices'), None)
+
+    def snmp_get(self) -> SnmpGet:
+        """GET /snmp"""
+        return _convertir(self._llamar('GET', 'snmp'), SnmpGet)
+
+    def snmp_put(self, cuerpo=None) -> SnmpPut:
+        """Update SNMP Service Configuration."""
+        return _convertir(self._llamar('PUT', 'snmp', json=cuerpo), SnmpPut)
+
+    def ssh_get(self) -> SshGet:
+        """GET /ssh"""
+        return _convertir(self._llamar('GET', 'ssh'), SshGet)
+
+    def ssh_put(self, cuerpo=None) -> SshPut:
+        """Update settings of SSH daemon service."""
+        return _convertir(self._llamar('PUT', 'ssh', json=cuerpo), SshPut)
+
+    def ssh_bindiface_choices_get(self) -> Any:
+        """Available choices for the bindiface attribute of SSH service."""
+        return _convertir(self._llamar('GET', 'ssh/bindiface_choices'), None)
+
+    def staticroute_get(self, **params) -> Union[StaticrouteGet, List[StaticrouteGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'staticroute', params=params), StaticrouteGet)
+
+    def iter_staticroute_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[StaticrouteGet]:
+        """Itera todos los resultados de /staticroute paginando con limit/offset"""
+        return self._paginar('staticroute', StaticrouteGet, tamano_pagina, params)
+
+    def staticroute_post(self, cuerpo=None) -> StaticroutePost:
+        """Create a Static Route."""
+        return _convertir(self._llamar('POST', 'staticroute', json=cuerpo), StaticroutePost)
+
+    def staticroute_get_instance_post(self, cuerpo=None) -> StaticrouteGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'staticroute/get_instance', json=cuerpo), StaticrouteGetInstancePost)
+
+    def staticroute_id_delete(self, id) -> Any:
+        """Delete Static Route of `id`."""
+        return _convertir(self._llamar('DELETE', f"staticroute/id/{id}"), None)
+
+    def staticroute_id_get(self, id) -> Union[StaticrouteIdGet, List[StaticrouteIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"staticroute/id/{id}"), StaticrouteIdGet)
+
+    def staticroute_id_put(self, id, cuerpo=None) -> StaticrouteIdPut:
+        """Update Static Route of `id`."""
+        return _convertir(self._llamar('PUT', f"staticroute/id/{id}", json=cuerpo), StaticrouteIdPut)
+
+    def support_get(self) -> SupportGet:
+        """GET /support"""
+        return _convertir(self._llamar('GET', 'support'), SupportGet)
+
+    def support_put(self, cuerpo=None) -> SupportPut:
+        """Update Proactive Support settings."""
+        return _convertir(self._llamar('PUT', 'support', json=cuerpo), SupportPut)
+
+    def support_attach_ticket_post(self, cuerpo=None) -> Any:
+        """Method to attach a file to an existing ticket."""
+        return _convertir(self._llamar('POST', 'support/attach_ticket', json=cuerpo), None)
+
+    def support_attach_ticket_max_size_get(self) -> Any:
+        """Returns maximum uploaded file size for `support.attach_ticket`"""
+        return _convertir(self._llamar('GET', 'support/attach_ticket_max_size'), None)
+
+    def support_fields_get(self) -> Any:
+        """Returns list of pairs of field names and field titles for Proactive Support."""
+        return _convertir(self._llamar('GET', 'support/fields'), None)
+
+    def support_is_available_get(self) -> Any:
+        """Returns whether Proactive Support is available for this product type and current license."""
+        return _convertir(self._llamar('GET', 'support/is_available'), None)
+
+    def support_is_available_and_enabled_get(self) -> Any:
+        """Returns whether Proactive Support is available and enabled."""
+        return _convertir(self._llamar('GET', 'support/is_available_and_enabled'), None)
+
+    def support_new_ticket_post(self, cuerpo=None) -> SupportNewTicketPost:
+        """Creates a new ticket for support."""
+        return _convertir(self._llamar('POST', 'support/new_ticket', json=cuerpo), SupportNewTicketPost)
+
+    def support_similar_issues_post(self, cuerpo=None) -> List[SupportSimilarIssuesPost]:
+        """POST /support/similar_issues"""
+        return _convertir(self._llamar('POST', 'support/similar_issues', json=cuerpo), SupportSimilarIssuesPost)
+
+    def system_advanced_get(self) -> SystemAdvancedGet:
+        """GET /system/advanced"""
+        return _convertir(self._llamar('GET', 'system/advanced'), SystemAdvancedGet)
+
+    def system_advanced_put(self, cuerpo=None) -> SystemAdvancedPut:
+        """Update System Advanced Service Configuration."""
+        return _convertir(self._llamar('PUT', 'system/advanced', json=cuerpo), SystemAdvancedPut)
+
+    def system_advanced_get_gpu_pci_choices_get(self) -> Any:
+        """This endpoint gives all the gpu pci ids/slots that can be isolated."""
+        return _convertir(self._llamar('GET', 'system/advanced/get_gpu_pci_choices'), None)
+
+    def system_advanced_login_banner_get(self) -> Any:
+        """Returns user set login banner"""
+        return _convertir(self._llamar('GET', 'system/advanced/login_banner'), None)
+
+    def system_advanced_sed_global_password_get(self) -> Any:
+        """Returns configured global SED password in clear-text if one"""
+        return _convertir(self._llamar('GET', 'system/advanced/sed_global_password'), None)
+
+    def system_advanced_sed_global_password_is_set_get(self) -> Any:
+        """Returns a boolean identifying whether or not a global"""
+        return _convertir(self._llamar('GET', 'system/advanced/sed_global_password_is_set'), None)
+
+    def system_advanced_serial_port_choices_get(self) -> Any:
+        """Get available choices for `serialport`."""
+        return _convertir(self._llamar('GET', 'system/advanced/serial_port_choices'), None)
+
+    def system_advanced_syslog_certificate_authority_choices_get(self) -> Any:
+        """Return choices of certificate authorities which can be used for `syslog_tls_certificate_authority`."""
+        return _convertir(self._llamar('GET', 'system/advanced/syslog_certificate_authority_choices'), None)
+
+    def system_advanced_syslog_certificate_choices_get(self) -> Any:
+        """Return choices of certificates which can be used for `syslog_tls_certificate`."""
+        return _convertir(self._llamar('GET', 'system/advanced/syslog_certificate_choices'), None)
+
+    def system_advanced_update_gpu_pci_ids_post(self, cuerpo=None) -> Any:
+        """`isolated_gpu_pci_ids` is a list of PCI ids which are isolated from host system."""
+        return _convertir(self._llamar('POST', 'system/advanced/update_gpu_pci_ids', json=cuerpo), None)
+
+    def system_debug_get(self) -> Any:
+        """Download a debug file."""
+        return _convertir(self._llamar('GET', 'system/debug'), None)
+
+    def system_feature_enabled_post(self, cuerpo=None) -> Any:
+        """Returns whether the `feature` is enabled or not"""
+        return _convertir(self._llamar('POST', 'system/feature_enabled', json=cuerpo), None)
+
+    def system_general_get(self) -> SystemGeneralGet:
+        """GET /system/general"""
+        return _convertir(self._llamar('GET', 'system/general'), SystemGeneralGet)
+
+    def system_general_put(self, cuerpo=None) -> SystemGeneralPut:
+        """Update System General Service Configuration."""
+        return _convertir(self._llamar('PUT', 'system/general', json=cuerpo), SystemGeneralPut)
+
+    def system_general_checkin_get(self) -> Any:
+        """After UI settings are saved with `rollback_timeout` this method needs to be called within that timeout limit"""
+        return _convertir(self._llamar('GET', 'system/general/checkin'), None)
+
+    def system_general_checkin_waiting_get(self) -> Any:
+        """Determines whether or not we are waiting user to check-in the applied UI settings changes before they are rolled"""
+        return _convertir(self._llamar('GET', 'system/general/checkin_waiting'), None)
+
+    def system_general_country_choices_get(self) -> Any:
+        """Return a dictionary whose keys represent the"""
+        return _convertir(self._llamar('GET', 'system/general/country_choices'), None)
+
+    def system_general_kbdmap_choices_get(self) -> Any:
+        """Returns kbdmap choices."""
+        return _convertir(self._llamar('GET', 'system/general/kbdmap_choices'), None)
+
+    def system_general_language_choices_get(self) -> Any:
+        """Returns language choices."""
+        return _convertir(self._llamar('GET', 'system/general/language_choices'), None)
+
+    def system_general_local_url_get(self) -> Any:
+        """Returns configured local url in the format of protocol://host:port"""
+        return _convertir(self._llamar('GET', 'system/general/local_url'), None)
+
+    def system_general_timezone_choices_get(self) -> Any:
+        """Returns available timezones"""
+        return _convertir(self._llamar('GET', 'system/general/timezone_choices'), None)
+
+    def system_general_ui_address_choices_get(self) -> Any:
+        """Returns UI ipv4 address choices."""
+        return _convertir(self._llamar('GET', 'system/general/ui_address_choices'), None)
+
+    def system_general_ui_certificate_choices_get(self) -> Any:
+        """Return choices of certificates which can be used for `ui_certificate`."""
+        return _convertir(self._llamar('GET', 'system/general/ui_certificate_choices'), None)
+
+    def system_general_ui_httpsprotocols_choices_get(self) -> SystemGeneralUiHttpsprotocolsChoicesGet:
+        """Returns available HTTPS protocols."""
+        return _convertir(self._llamar('GET', 'system/general/ui_httpsprotocols_choices'), SystemGeneralUiHttpsprotocolsChoicesGet)
+
+    def system_general_ui_restart_get(self, cuerpo=None) -> Any:
+        """Restart HTTP server to use latest UI settings."""
+        return _convertir(self._llamar('GET', 'system/general/ui_restart', json=cuerpo), None)
+
+    def system_general_ui_restart_post(self, cuerpo=None) -> Any:
+        """Restart HTTP server to use latest UI settings."""
+        return _convertir(self._llamar('POST', 'system/general/ui_restart', json=cuerpo), None)
+
+    def system_general_ui_v6address_choices_get(self) -> Any:
+        """Returns UI ipv6 address choices."""
+        return _convertir(self._llamar('GET', 'system/general/ui_v6address_choices'), None)
+
+    def system_global_id_get(self) -> Any:
+        """Retrieve a 128 bit hexadecimal UUID value unique for each TrueNAS system."""
+        return _convertir(self._llamar('GET', 'system/global/id'), None)
+
+    def system_host_id_get(self) -> Any:
+        """Retrieve a hex string that is generated based"""
+        return _convertir(self._llamar('GET', 'system/host_id'), None)
+
+    def system_info_get(self) -> SystemInfoGet:
+        """Returns basic system information."""
+        return _convertir(self._llamar('GET', 'system/info'), SystemInfoGet)
+
+    def system_license_update_post(self, cuerpo=None) -> Any:
+        """Update license file"""
+        return _convertir(self._llamar('POST', 'system/license_update', json=cuerpo), None)
+
+    def system_ntpserver_get(self, **params) -> Union[SystemNtpserverGet, List[SystemNtpserverGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'system/ntpserver', params=params), SystemNtpserverGet)
+
+    def iter_system_ntpserver_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[SystemNtpserverGet]:
+        """Itera todos los resultados de /system/ntpserver paginando con limit/offset"""
+        return self._paginar('system/ntpserver', SystemNtpserverGet, tamano_pagina, params)
+
+    def system_ntpserver_post(self, cuerpo=None) -> SystemNtpserverPost:
+        """Add an NTP Server."""
+        return _convertir(self._llamar('POST', 'system/ntpserver', json=cuerpo), SystemNtpserverPost)
+
+    def system_ntpserver_get_instance_post(self, cuerpo=None) -> SystemNtpserverGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'system/ntpserver/get_instance', json=cuerpo), SystemNtpserverGetInstancePost)
+
+    def system_ntpserver_id_delete(self, id) -> Any:
+        """Delete NTP server of `id`."""
+        return _convertir(self._llamar('DELETE', f"system/ntpserver/id/{id}"), None)
+
+    def system_ntpserver_id_get(self, id) -> Union[SystemNtpserverIdGet, List[SystemNtpserverIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"system/ntpserver/id/{id}"), SystemNtpserverIdGet)
+
+    def system_ntpserver_id_put(self, id, cuerpo=None) -> SystemNtpserverIdPut:
+        """Update NTP server of `id`."""
+        return _convertir(self._llamar('PUT', f"system/ntpserver/id/{id}", json=cuerpo), SystemNtpserverIdPut)
+
+    def system_product_type_get(self) -> Any:
+        """Returns the type of the product."""
+        return _convertir(self._llamar('GET', 'system/product_type'), None)
+
+    def system_ready_get(self) -> Any:
+        """Returns whether the system completed boot and is ready to use"""
+        return _convertir(self._llamar('GET', 'system/ready'), None)
+
+    def system_reboot_post(self, cuerpo=None) -> Any:
+        """Reboots the operating system."""
+        return _convertir(self._llamar('POST', 'system/reboot', json=cuerpo), None)
+
+    def system_reboot_info_get(self) -> SystemRebootInfoGet:
+        """GET /system/reboot/info"""
+        return _convertir(self._llamar('GET', 'system/reboot/info'), SystemRebootInfoGet)
+
+    def system_release_notes_url_post(self, cuerpo=None) -> Any:
+        """Returns the release notes URL for a version of SCALE."""
+        return _convertir(self._llamar('POST', 'system/release_notes_url', json=cuerpo), None)
+
+    def system_security_get(self) -> SystemSecurityGet:
+        """GET /system/security"""
+        return _convertir(self._llamar('GET', 'system/security'), SystemSecurityGet)
+
+    def system_security_put(self, cuerpo=None) -> SystemSecurityPut:
+        """Update System Security Service Configuration."""
+        return _convertir(self._llamar('PUT', 'system/security', json=cuerpo), SystemSecurityPut)
+
+    def system_security_info_fips_available_get(self) -> Any:
+        """Returns a boolean identifying whether or not FIPS"""
+        return _convertir(self._llamar('GET', 'system/security/info/fips_available'), None)
+
+    def system_security_info_fips_enabled_get(self) -> Any:
+        """Returns a boolean identifying whether or not FIPS"""
+        return _convertir(self._llamar('GET', 'system/security/info/fips_enabled'), None)
+
+    def system_shutdown_post(self, cuerpo=None) -> Any:
+        """Shuts down the operating system."""
+        return _convertir(self._llamar('POST', 'system/shutdown', json=cuerpo), None)
+
+    def system_state_get(self) -> Any:
+        """Returns system state:"""
+        return _convertir(self._llamar('GET', 'system/state'), None)
+
+    def system_version_get(self) -> Any:
+        """Returns the full name of the software version of the system."""
+        return _convertir(self._llamar('GET', 'system/version'), None)
+
+    def system_version_short_get(self) -> Any:
+        """Returns the short name of the software version of the system."""
+        return _convertir(self._llamar('GET', 'system/version_short'), None)
+
+    def systemdataset_get(self) -> SystemdatasetGet:
+        """GET /systemdataset"""
+        return _convertir(self._llamar('GET', 'systemdataset'), SystemdatasetGet)
+
+    def systemdataset_put(self, cuerpo=None) -> SystemdatasetPut:
+        """Update System Dataset Service Configuration."""
+        return _convertir(self._llamar('PUT', 'systemdataset', json=cuerpo), SystemdatasetPut)
+
+    def systemdataset_pool_choices_post(self, cuerpo=None) -> Any:
+        """Retrieve pool choices which can be used for configuring system dataset."""
+        return _convertir(self._llamar('POST', 'systemdataset/pool_choices', json=cuerpo), None)
+
+    def tn_connect_get(self) -> TnConnectGet:
+        """GET /tn_connect"""
+        return _convertir(self._llamar('GET', 'tn_connect'), TnConnectGet)
+
+    def tn_connect_put(self, cuerpo=None) -> TnConnectPut:
+        """Update TrueNAS Connect configuration."""
+        return _convertir(self._llamar('PUT', 'tn_connect', json=cuerpo), TnConnectPut)
+
+    def tn_connect_generate_claim_token_get(self) -> Any:
+        """Generate a claim token for TrueNAS Connect."""
+        return _convertir(self._llamar('GET', 'tn_connect/generate_claim_token'), None)
+
+    def tn_connect_get_registration_uri_get(self) -> Any:
+        """Return the registration URI for TrueNAS Connect."""
+        return _convertir(self._llamar('GET', 'tn_connect/get_registration_uri'), None)
+
+    def tn_connect_ip_choices_get(self) -> Any:
+        """Returns IP choices which can be used with TrueNAS Connect."""
+        return _convertir(self._llamar('GET', 'tn_connect/ip_choices'), None)
+
+    def truecommand_get(self) -> TruecommandGet:
+        """GET /truecommand"""
+        return _convertir(self._llamar('GET', 'truecommand'), TruecommandGet)
+
+    def truecommand_put(self, cuerpo=None) -> TruecommandPut:
+        """Update Truecommand service settings."""
+        return _convertir(self._llamar('PUT', 'truecommand', json=cuerpo), TruecommandPut)
+
+    def truenas_accept_eula_get(self) -> Any:
+        """Accept TrueNAS EULA."""
+        return _convertir(self._llamar('GET', 'truenas/accept_eula'), None)
+
+    def truenas_get_chassis_hardware_get(self) -> Any:
+        """Returns what type of hardware this is, detected from dmidecode."""
+        return _convertir(self._llamar('GET', 'truenas/get_chassis_hardware'), None)
+
+    def truenas_get_eula_get(self) -> Any:
+        """Returns the TrueNAS End-User License Agreement (EULA)."""
+        return _convertir(self._llamar('GET', 'truenas/get_eula'), None)
+
+    def truenas_is_eula_accepted_get(self) -> Any:
+        """Returns whether the EULA is accepted or not."""
+        return _convertir(self._llamar('GET', 'truenas/is_eula_accepted'), None)
+
+    def truenas_is_ix_hardware_get(self) -> Any:
+        """Return a boolean value on whether this is hardware that iXsystems sells."""
+        return _convertir(self._llamar('GET', 'truenas/is_ix_hardware'), None)
+
+    def truenas_is_production_get(self) -> Any:
+        """Returns if system is marked as production."""
+        return _convertir(self._llamar('GET', 'truenas/is_production'), None)
+
+    def truenas_managed_by_truecommand_get(self) -> Any:
+        """Returns whether TrueNAS is being managed by TrueCommand"""
+        return _convertir(self._llamar('GET', 'truenas/managed_by_truecommand'), None)
+
+    def truenas_set_production_post(self, cuerpo=None) -> Any:
+        """Sets system production state and optionally sends initial debug."""
+        return _convertir(self._llamar('POST', 'truenas/set_production', json=cuerpo), None)
+
+    def tunable_get(self, **params) -> Union[TunableGet, List[TunableGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'tunable', params=params), TunableGet)
+
+    def iter_tunable_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[TunableGet]:
+        """Itera todos los resultados de /tunable paginando con limit/offset"""
+        return self._paginar('tunable', TunableGet, tamano_pagina, params)
+
+    def tunable_post(self, cuerpo=None) -> TunablePost:
+        """Create a tunable."""
+        return _convertir(self._llamar('POST', 'tunable', json=cuerpo), TunablePost)
+
+    def tunable_get_instance_post(self, cuerpo=None) -> TunableGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'tunable/get_instance', json=cuerpo), TunableGetInstancePost)
+
+    def tunable_id_delete(self, id) -> Any:
+        """Delete Tunable of `id`."""
+        return _convertir(self._llamar('DELETE', f"tunable/id/{id}"), None)
+
+    def tunable_id_get(self, id) -> Union[TunableIdGet, List[TunableIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"tunable/id/{id}"), TunableIdGet)
+
+    def tunable_id_put(self, id, cuerpo=None) -> TunableIdPut:
+        """Update Tunable of `id`."""
+        return _convertir(self._llamar('PUT', f"tunable/id/{id}", json=cuerpo), TunableIdPut)
+
+    def tunable_tunable_type_choices_get(self) -> TunableTunableTypeChoicesGet:
+        """Retrieve the supported tunable types that can be changed."""
+        return _convertir(self._llamar('GET', 'tunable/tunable_type_choices'), TunableTunableTypeChoicesGet)
+
+    def update_check_available_post(self, cuerpo=None) -> Any:
+        """Checks if there is an update available from update server."""
+        return _convertir(self._llamar('POST', 'update/check_available', json=cuerpo), None)
+
+    def update_download_get(self) -> Any:
+        """Download updates using selected train."""
+        return _convertir(self._llamar('GET', 'update/download'), None)
+
+    def update_file_post(self, cuerpo=None) -> Any:
+        """Updates the system using the uploaded .tar file."""
+        return _convertir(self._llamar('POST', 'update/file', json=cuerpo), None)
+
+    def update_get_auto_download_get(self) -> Any:
+        """Returns if update auto-download is enabled."""
+        return _convertir(self._llamar('GET', 'update/get_auto_download'), None)
+
+    def update_get_pending_post(self, cuerpo=None) -> Any:
+        """Gets a list of packages already downloaded and ready to be applied."""
+        return _convertir(self._llamar('POST', 'update/get_pending', json=cuerpo), None)
+
+    def update_get_trains_get(self) -> Any:
+        """Returns available trains dict and the currently configured train as well as the"""
+        return _convertir(self._llamar('GET', 'update/get_trains'), None)
+
+    def update_manual_post(self, cuerpo=None) -> Any:
+        """Update the system using a manual update file."""
+        return _convertir(self._llamar('POST', 'update/manual', json=cuerpo), None)
+
+    def update_set_auto_download_post(self, cuerpo=None) -> Any:
+        """Sets if update auto-download is enabled."""
+        return _convertir(self._llamar('POST', 'update/set_auto_download', json=cuerpo), None)
+
+    def update_set_train_post(self, cuerpo=None) -> Any:
+        """Set an update train to be used by default in updates."""
+        return _convertir(self._llamar('POST', 'update/set_train', json=cuerpo), None)
+
+    def update_update_post(self, cuerpo=None) -> Any:
+        """Downloads (if not already in cache) and apply an update."""
+        return _convertir(self._llamar('POST', 'update/update', json=cuerpo), None)
+
+    def ups_get(self) -> UpsGet:
+        """GET /ups"""
+        return _convertir(self._llamar('GET', 'ups'), UpsGet)
+
+    def ups_put(self, cuerpo=None) -> UpsPut:
+        """Update UPS Service Configuration."""
+        return _convertir(self._llamar('PUT', 'ups', json=cuerpo), UpsPut)
+
+    def ups_driver_choices_get(self) -> Any:
+        """Returns choices of UPS drivers supported by the system."""
+        return _convertir(self._llamar('GET', 'ups/driver_choices'), None)
+
+    def ups_port_choices_get(self) -> Any:
+        """GET /ups/port_choices"""
+        return _convertir(self._llamar('GET', 'ups/port_choices'), None)
+
+    def user_get(self, **params) -> Union[UserGet, List[UserGet], Any]:
+        """Query users with `query-filters` and `query-options`."""
+        return _convertir(self._llamar('GET', 'user', params=params), UserGet)
+
+    def iter_user_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[UserGet]:
+        """Itera todos los resultados de /user paginando con limit/offset"""
+        return self._paginar('user', UserGet, tamano_pagina, params)
+
+    def user_post(self, cuerpo=None) -> UserPost:
+        """Create a new user."""
+        return _convertir(self._llamar('POST', 'user', json=cuerpo), UserPost)
+
+    def user_get_instance_post(self, cuerpo=None) -> UserGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'user/get_instance', json=cuerpo), UserGetInstancePost)
+
+    def user_get_next_uid_get(self) -> Any:
+        """Get the next available/free uid."""
+        return _convertir(self._llamar('GET', 'user/get_next_uid'), None)
+
+    def user_get_user_obj_post(self, cuerpo=None) -> UserGetUserObjPost:
+        """Returns dictionary containing information from struct passwd for the user specified by either"""
+        return _convertir(self._llamar('POST', 'user/get_user_obj', json=cuerpo), UserGetUserObjPost)
+
+    def user_has_local_administrator_set_up_get(self) -> Any:
+        """Return whether a local administrator with a valid password exists."""
+        return _convertir(self._llamar('GET', 'user/has_local_administrator_set_up'), None)
+
+    def user_id_delete(self, id, cuerpo=None) -> Any:
+        """Delete user `id`."""
+        return _convertir(self._llamar('DELETE', f"user/id/{id}", json=cuerpo), None)
+
+    def user_id_get(self, id) -> Union[UserIdGet, List[UserIdGet], Any]:
+        """Query users with `query-filters` and `query-options`."""
+        return _convertir(self._llamar('GET', f"user/id/{id}"), UserIdGet)
+
+    def user_id_put(self, id, cuerpo=None) -> UserIdPut:
+        """Update attributes of an existing user."""
+        return _convertir(self._llamar('PUT', f"user/id/{id}", json=cuerpo), UserIdPut)
+
+    def user_shell_choices_post(self, cuerpo=None) -> Any:
+        """Return the available shell choices to be used in `user.create` and `user.update`."""
+        return _convertir(self._llamar('POST', 'user/shell_choices', json=cuerpo), None)
+
+    def user_unset_2fa_secret_post(self, cuerpo=None) -> Any:
+        """Unset two-factor authentication secret for `username`."""
+        return _convertir(self._llamar('POST', 'user/unset_2fa_secret', json=cuerpo), None)
+
+    def virt_device_disk_choices_get(self) -> Any:
+        """Returns disk choices available for device type 'DISK' for virtual machines. This includes"""
+        return _convertir(self._llamar('GET', 'virt/device/disk_choices'), None)
+
+    def virt_device_export_disk_image_post(self, cuerpo=None) -> Any:
+        """Exports a zvol to a formatted VM disk image."""
+        return _convertir(self._llamar('POST', 'virt/device/export_disk_image', json=cuerpo), None)
+
+    def virt_device_gpu_choices_post(self, cuerpo=None) -> Any:
+        """Provide choices for GPU devices."""
+        return _convertir(self._llamar('POST', 'virt/device/gpu_choices', json=cuerpo), None)
+
+    def virt_device_import_disk_image_post(self, cuerpo=None) -> Any:
+        """Imports a specified disk image."""
+        return _convertir(self._llamar('POST', 'virt/device/import_disk_image', json=cuerpo), None)
+
+    def virt_device_nic_choices_post(self, cuerpo=None) -> Any:
+        """Returns choices for NIC device."""
+        return _convertir(self._llamar('POST', 'virt/device/nic_choices', json=cuerpo), None)
+
+    def virt_device_pci_choices_get(self) -> Any:
+        """Returns choices for PCI devices valid for VM virt instances."""
+        return _convertir(self._llamar('GET', 'virt/device/pci_choices'), None)
+
+    def virt_device_usb_choices_get(self) -> Any:
+        """Provide choices for USB devices."""
+        return _convertir(self._llamar('GET', 'virt/device/usb_choices'), None)
+
+    def virt_global_get(self) -> VirtGlobalGet:
+        """GET /virt/global"""
+        return _convertir(self._llamar('GET', 'virt/global'), VirtGlobalGet)
+
+    def virt_global_put(self, cuerpo=None) -> VirtGlobalPut:
+        """Update global virtualization settings."""
+        return _convertir(self._llamar('PUT', 'virt/global', json=cuerpo), VirtGlobalPut)
+
+    def virt_global_bridge_choices_get(self) -> Any:
+        """Bridge choices for virtualization purposes."""
+        return _convertir(self._llamar('GET', 'virt/global/bridge_choices'), None)
+
+    def virt_global_get_network_post(self, cuerpo=None) -> VirtGlobalGetNetworkPost:
+        """Details for the given network."""
+        return _convertir(self._llamar('POST', 'virt/global/get_network', json=cuerpo), VirtGlobalGetNetworkPost)
+
+    def virt_global_pool_choices_get(self) -> Any:
+        """Pool choices for virtualization purposes."""
+        return _convertir(self._llamar('GET', 'virt/global/pool_choices'), None)
+
+    def virt_instance_get(self, **params) -> Union[VirtInstanceGet, List[VirtInstanceGet], Any]:
+        """Query all instances with `query-filters` and `query-options`."""
+        return _convertir(self._llamar('GET', 'virt/instance', params=params), VirtInstanceGet)
+
+    def iter_virt_instance_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[VirtInstanceGet]:
+        """Itera todos los resultados de /virt/instance paginando con limit/offset"""
+        return self._paginar('virt/instance', VirtInstanceGet, tamano_pagina, params)
+
+    def virt_instance_post(self, cuerpo=None) -> VirtInstancePost:
+        """Create a new virtualized instance."""
+        return _convertir(self._llamar('POST', 'virt/instance', json=cuerpo), VirtInstancePost)
+
+    def virt_instance_device_add_post(self, cuerpo=None) -> Any:
+        """Add a device to an instance."""
+        return _convertir(self._llamar('POST', 'virt/instance/device_add', json=cuerpo), None)
+
+    def virt_instance_device_delete_post(self, cuerpo=None) -> Any:
+        """Delete a device from an instance."""
+        return _convertir(self._llamar('POST', 'virt/instance/device_delete', json=cuerpo), None)
+
+    def virt_instance_device_list_post(self, cuerpo=None) -> Any:
+        """List all devices associated to an instance."""
+        return _convertir(self._llamar('POST', 'virt/instance/device_list', json=cuerpo), None)
+
+    def virt_instance_device_update_post(self, cuerpo=None) -> Any:
+        """Update a device in an instance."""
+        return _convertir(self._llamar('POST', 'virt/instance/device_update', json=cuerpo), None)
+
+    def virt_instance_get_instance_post(self, cuerpo=None) -> VirtInstanceGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'virt/instance/get_instance', json=cuerpo), VirtInstanceGetInstancePost)
+
+    def virt_instance_id_delete(self, id) -> Any:
+        """Delete an instance."""
+        return _convertir(self._llamar('DELETE', f"virt/instance/id/{id}"), None)
+
+    def virt_instance_id_get(self, id) -> Union[VirtInstanceIdGet, List[VirtInstanceIdGet], Any]:
+        """Query all instances with `query-filters` and `query-options`."""
+        return _convertir(self._llamar('GET', f"virt/instance/id/{id}"), VirtInstanceIdGet)
+
+    def virt_instance_id_put(self, id, cuerpo=None) -> VirtInstanceIdPut:
+        """Update instance."""
+        return _convertir(self._llamar('PUT', f"virt/instance/id/{id}", json=cuerpo), VirtInstanceIdPut)
+
+    def virt_instance_image_choices_post(self, cuerpo=None) -> Any:
+        """Provide choices for instance image from a remote repository."""
+        return _convertir(self._llamar('POST', 'virt/instance/image_choices', json=cuerpo), None)
+
+    def virt_instance_restart_post(self, cuerpo=None) -> Any:
+        """Restart an instance."""
+        return _convertir(self._llamar('POST', 'virt/instance/restart', json=cuerpo), None)
+
+    def virt_instance_start_post(self, cuerpo=None) -> Any:
+        """Start an instance."""
+        return _convertir(self._llamar('POST', 'virt/instance/start', json=cuerpo), None)
+
+    def virt_instance_stop_post(self, cuerpo=None) -> Any:
+        """Stop an instance."""
+        return _convertir(self._llamar('POST', 'virt/instance/stop', json=cuerpo), None)
+
+    def virt_volume_get(self, **params) -> Union[VirtVolumeGet, List[VirtVolumeGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'virt/volume', params=params), VirtVolumeGet)
+
+    def iter_virt_volume_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[VirtVolumeGet]:
+        """Itera todos los resultados de /virt/volume paginando con limit/offset"""
+        return self._paginar('virt/volume', VirtVolumeGet, tamano_pagina, params)
+
+    def virt_volume_post(self, cuerpo=None) -> VirtVolumePost:
+        """POST /virt/volume"""
+        return _convertir(self._llamar('POST', 'virt/volume', json=cuerpo), VirtVolumePost)
+
+    def virt_volume_get_instance_post(self, cuerpo=None) -> VirtVolumeGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'virt/volume/get_instance', json=cuerpo), VirtVolumeGetInstancePost)
+
+    def virt_volume_id_delete(self, id) -> Any:
+        """DELETE /virt/volume/id/{id_}"""
+        return _convertir(self._llamar('DELETE', f"virt/volume/id/{id}"), None)
+
+    def virt_volume_id_get(self, id) -> Union[VirtVolumeIdGet, List[VirtVolumeIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"virt/volume/id/{id}"), VirtVolumeIdGet)
+
+    def virt_volume_id_put(self, id, cuerpo=None) -> VirtVolumeIdPut:
+        """PUT /virt/volume/id/{id_}"""
+        return _convertir(self._llamar('PUT', f"virt/volume/id/{id}", json=cuerpo), VirtVolumeIdPut)
+
+    def virt_volume_import_iso_post(self, cuerpo=None) -> VirtVolumeImportIsoPost:
+        """A file might be uploaded to this endpoint. To upload a file, please send a multipart request with two parts. The first, named `data`, should contain a JSON-encoded payload, and the second, named `file`, should contain an uploaded file."""
+        return _convertir(self._llamar('POST', 'virt/volume/import_iso', json=cuerpo), VirtVolumeImportIsoPost)
+
+    def virt_volume_import_zvol_post(self, cuerpo=None) -> VirtVolumeImportZvolPost:
+        """POST /virt/volume/import_zvol"""
+        return _convertir(self._llamar('POST', 'virt/volume/import_zvol', json=cuerpo), VirtVolumeImportZvolPost)
+
+    def vmware_get(self, **params) -> Union[VmwareGet, List[VmwareGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', 'vmware', params=params), VmwareGet)
+
+    def iter_vmware_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[VmwareGet]:
+        """Itera todos los resultados de /vmware paginando con limit/offset"""
+        return self._paginar('vmware', VmwareGet, tamano_pagina, params)
+
+    def vmware_post(self, cuerpo=None) -> VmwarePost:
+        """Create VMWare snapshot."""
+        return _convertir(self._llamar('POST', 'vmware', json=cuerpo), VmwarePost)
+
+    def vmware_dataset_has_vms_post(self, cuerpo=None) -> Any:
+        """Returns 'true' if `dataset` is configured with a VMWare snapshot"""
+        return _convertir(self._llamar('POST', 'vmware/dataset_has_vms', json=cuerpo), None)
+
+    def vmware_get_datastores_post(self, cuerpo=None) -> Any:
+        """Get datastores from VMWare."""
+        return _convertir(self._llamar('POST', 'vmware/get_datastores', json=cuerpo), None)
+
+    def vmware_get_instance_post(self, cuerpo=None) -> VmwareGetInstancePost:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'vmware/get_instance', json=cuerpo), VmwareGetInstancePost)
+
+    def vmware_id_delete(self, id) -> Any:
+        """Delete VMWare snapshot of `id`."""
+        return _convertir(self._llamar('DELETE', f"vmware/id/{id}"), None)
+
+    def vmware_id_get(self, id) -> Union[VmwareIdGet, List[VmwareIdGet], Any]:
+        """`query-options.extra` can be specified as query parameters with prefixing them with `extra.` prefix. For example, `extra.retrieve_properties=false` will pass `retrieve_properties` as an extra argument to pool/dataset endpoint."""
+        return _convertir(self._llamar('GET', f"vmware/id/{id}"), VmwareIdGet)
+
+    def vmware_id_put(self, id, cuerpo=None) -> VmwareIdPut:
+        """Update VMWare snapshot of `id`."""
+        return _convertir(self._llamar('PUT', f"vmware/id/{id}", json=cuerpo), VmwareIdPut)
+
+    def vmware_match_datastores_with_datasets_post(self, cuerpo=None) -> Any:
+        """Requests datastores from vCenter server and tries to match them with local filesystems."""
+        return _convertir(self._llamar('POST', 'vmware/match_datastores_with_datasets', json=cuerpo), None)
+
+    def zfs_snapshot_get(self, **params) -> Any:
+        """Query all ZFS Snapshots with `query-filters` and `query-options`."""
+        return _convertir(self._llamar('GET', 'zfs/snapshot', params=params), None)
+
+    def iter_zfs_snapshot_get(self, tamano_pagina=TAMANO_PAGINA, **params) -> Iterator[Any]:
+        """Itera todos los resultados de /zfs/snapshot paginando con limit/offset"""
+        return self._paginar('zfs/snapshot', None, tamano_pagina, params)
+
+    def zfs_snapshot_post(self, cuerpo=None) -> Any:
+        """Take a snapshot from a given dataset."""
+        return _convertir(self._llamar('POST', 'zfs/snapshot', json=cuerpo), None)
+
+    def zfs_snapshot_clone_post(self, cuerpo=None) -> Any:
+        """Clone a given snapshot to a new dataset."""
+        return _convertir(self._llamar('POST', 'zfs/snapshot/clone', json=cuerpo), None)
+
+    def zfs_snapshot_get_instance_post(self, cuerpo=None) -> Any:
+        """Returns instance matching `id`. If `id` is not found, Validation error is raised."""
+        return _convertir(self._llamar('POST', 'zfs/snapshot/get_instance', json=cuerpo), None)
+
+    def zfs_snapshot_hold_post(self, cuerpo=None) -> Any:
+        """Holds snapshot `id`."""
+        return _convertir(self._llamar('POST', 'zfs/snapshot/hold', json=cuerpo), None)
+
+    def zfs_snapshot_id_delete(self, id, cuerpo=None) -> Any:
+        """Delete snapshot of name `id`."""
+        return _convertir(self._llamar('DELETE', f"zfs/snapshot/id/{id}", json=cuerpo), None)
+
+    def zfs_snapshot_id_get(self, id) -> Any:
+        """Query all ZFS Snapshots with `query-filters` and `query-options`."""
+        return _convertir(self._llamar('GET', f"zfs/snapshot/id/{id}"), None)
+
+    def zfs_snapshot_id_put(self, id, cuerpo=None) -> Any:
+        """PUT /zfs/snapshot/id/{id_}"""
+        return _convertir(self._llamar('PUT', f"zfs/snapshot/id/{id}", json=cuerpo), None)
+
+    def zfs_snapshot_release_post(self, cuerpo=None) -> Any:
+        """Release held snapshot `id`."""
+        return _convertir(self._llamar('POST', 'zfs/snapshot/release', json=cuerpo), None)
+
+    def zfs_snapshot_rollback_post(self, cuerpo=None) -> Any:
+        """Rollback to a given snapshot `id`."""
+        return _convertir(self._llamar('POST', 'zfs/snapshot/rollback', json=cuerpo), None)
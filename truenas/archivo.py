@@ -0,0 +1,359 @@
+"""Archivo de backups deduplicado por contenido, con retención
+
+Cada backup se trocea en bloques definidos por contenido (hash Gear con
+cortes normalizados, al estilo FastCDC), así que un cambio en la
+configuración solo altera los bloques que lo contienen. Cada bloque se
+guarda una sola vez, comprimido, con su SHA-256 como nombre; un backup es
+un manifiesto JSON con la lista de bloques. Un backup sin cambios solo
+cuesta su manifiesto.
+
+Estructura del directorio::
+
+    bloques/ab/abcdef....zst     bloques comprimidos (zstd, o zlib sin zstandard)
+    manifiestos/<host>/<id>.json un manifiesto por backup
+    .lock                        bloqueo entre procesos (backup frente a recolector)
+"""
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import zlib
+from datetime import datetime
+
+try:
+    import zstandard
+except ImportError:  # zstd es opcional: sin él los bloques se comprimen con zlib
+    zstandard = None
+
+try:
+    import fcntl
+except ImportError:  # fcntl solo existe en Unix: sin él solo se coordinan los hilos
+    fcntl = None
+
+# Tamaños de bloque (bytes): mínimo, medio objetivo y máximo
+TAMANO_MINIMO = 2 * 1024
+TAMANO_MEDIO = 8 * 1024
+TAMANO_MAXIMO = 64 * 1024
+
+# Retención por defecto: backups horarios, diarios y semanales que se conservan
+RETENCION = tuple(int(n) for n in os.getenv('TRUENAS_BACKUP_RETENCION', '24,7,4').split(","))
+# Los bloques sin referencias más recientes que esto no se borran (backups en curso)
+GRACIA_GC = 3600
+
+MASCARA_64 = (1 << 64) - 1
+# Tabla Gear: 256 valores pseudoaleatorios fijos de 64 bits
+GEAR = tuple(int.from_bytes(hashlib.sha256(bytes([i])).digest()[:8], "big") for i in range(256))
+
+
+def _mascara(bits):
+    """Máscara sobre los bits altos del hash (los bajos solo dependen de los últimos bytes)"""
+    return ((1 << bits) - 1) << (64 - bits)
+
+
+class Troceador:
+    """Trocea un flujo de bytes en bloques definidos por contenido
+
+    Los cortes no dependen de cómo llegue el flujo (tamaño de los
+    bloques de red): solo se corta cuando hay al menos ``maximo`` bytes
+    pendientes o al final.
+    """
+
+    def __init__(self, minimo=TAMANO_MINIMO, medio=TAMANO_MEDIO, maximo=TAMANO_MAXIMO):
+        self.minimo = minimo
+        self.medio = medio
+        self.maximo = maximo
+        bits = max(1, medio.bit_length() - 1)
+        # Corte normalizado: más difícil antes del tamaño medio, más fácil después
+        self.mascara_dificil = _mascara(bits + 2)
+        self.mascara_facil = _mascara(max(1, bits - 2))
+
+    def _corte(self, datos, inicio, fin):
+        """Longitud del bloque que empieza en ``inicio`` (con datos hasta ``fin``)"""
+        n = fin - inicio
+        if n <= self.minimo:
+            return n
+        gear = GEAR
+        h = 0
+        i = inicio + self.minimo
+        limite_medio = inicio + min(n, self.medio)
+        limite = inicio + min(n, self.maximo)
+        mascara = self.mascara_dificil
+        while i < limite_medio:
+            h = ((h << 1) + gear[datos[i]]) & MASCARA_64
+            i += 1
+            if not h & mascara:
+                return i - inicio
+        mascara = self.mascara_facil
+        while i < limite:
+            h = ((h << 1) + gear[datos[i]]) & MASCARA_64
+            i += 1
+            if not h & mascara:
+                return i - inicio
+        return limite - inicio
+
+    def trocear(self, bloques):
+        """Genera los bloques de contenido a partir de un iterable de ``bytes``"""
+        buffer = bytearray()
+        for bloque in bloques:
+            if not bloque:
+                continue
+            buffer += bloque
+            pos = 0
+            while len(buffer) - pos >= self.maximo:
+                longitud = self._corte(buffer, pos, len(buffer))
+                yield bytes(buffer[pos:pos + longitud])
+                pos += longitud
+            del buffer[:pos]
+        pos = 0
+        while pos < len(buffer):
+            longitud = self._corte(buffer, pos, len(buffer))
+            yield bytes(buffer[pos:pos + longitud])
+            pos += longitud
+
+
+def comprimir(datos):
+    """Devuelve ``(extension, datos comprimidos)``"""
+    if zstandard is not None:
+        return ".zst", zstandard.ZstdCompressor(level=3).compress(datos)
+    return ".zlib", zlib.compress(datos, 6)
+
+
+def descomprimir(extension, datos):
+    if extension == ".zst":
+        if zstandard is None:
+            raise RuntimeError("El bloque está comprimido con zstd y zstandard no está instalado")
+        return zstandard.ZstdDecompressor().decompress(datos)
+    return zlib.decompress(datos)
+
+
+def _escribir_atomico(destino, datos):
+    directorio = os.path.dirname(destino)
+    os.makedirs(directorio, exist_ok=True)
+    fd, temporal = tempfile.mkstemp(prefix=".", suffix=".part", dir=directorio)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(datos)
+        os.replace(temporal, destino)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.unlink(temporal)
+        raise
+
+
+class ArchivoBackups:
+    """Almacén de backups deduplicado por contenido en un directorio"""
+
+    EXTENSIONES = (".zst", ".zlib")
+
+    def __init__(self, directorio, troceador=None):
+        self.directorio = directorio
+        self.troceador = troceador or Troceador()
+        self._lock = threading.Lock()
+        self._lock_bloques = threading.Lock()
+
+    # Bloques
+
+    @contextlib.contextmanager
+    def _bloqueo_bloques(self):
+        """Excluye marcar un bloque existente de comprobarlo y borrarlo en el recolector
+
+        Vale entre hilos y, con ``fcntl``, entre procesos que comparten el
+        archivo (un backup de cron mientras otro proceso recolecta).
+        """
+        with self._lock_bloques:
+            if fcntl is None:
+                yield
+                return
+            fd = os.open(os.path.join(self.directorio, ".lock"), os.O_CREAT | os.O_RDWR, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                os.close(fd)
+
+    def _ruta_bloque(self, sha, extension):
+        return os.path.join(self.directorio, "bloques", sha[:2], sha + extension)
+
+    def _buscar_bloque(self, sha):
+        for extension in self.EXTENSIONES:
+            ruta = self._ruta_bloque(sha, extension)
+            if os.path.exists(ruta):
+                return ruta, extension
+        return None, None
+
+    def _guardar_bloque(self, datos):
+        """Guarda un bloque si no existe; devuelve ``(sha, bytes escritos)``"""
+        sha = hashlib.sha256(datos).hexdigest()
+        ruta, _ = self._buscar_bloque(sha)
+        if ruta is not None:
+            # Ya existe: solo se marca como usado para el recolector. Con el
+            # bloqueo, el recolector no puede verlo antiguo y borrarlo después
+            with self._bloqueo_bloques():
+                try:
+                    os.utime(ruta)
+                    return sha, 0
+                except OSError:
+                    pass
+        extension, comprimido = comprimir(datos)
+        _escribir_atomico(self._ruta_bloque(sha, extension), comprimido)
+        return sha, len(comprimido)
+
+    def leer_bloque(self, sha):
+        ruta, extension = self._buscar_bloque(sha)
+        if ruta is None:
+            raise FileNotFoundError(f"Falta el bloque {sha} en el archivo")
+        with open(ruta, "rb") as f:
+            datos = descomprimir(extension, f.read())
+        if hashlib.sha256(datos).hexdigest() != sha:
+            raise ValueError(f"El bloque {sha} está corrupto")
+        return datos
+
+    # Manifiestos
+
+    def _dir_manifiestos(self, host):
+        return os.path.join(self.directorio, "manifiestos", host.replace("/", "_").replace(":", "_"))
+
+    def guardar(self, host, bloques, ts=None):
+        """Guarda un backup a partir de un iterable de ``bytes`` (streaming)
+
+        Devuelve el manifiesto con ``bytes_nuevos``: lo que realmente se
+        escribió en disco (0 si la configuración no cambió).
+        """
+        ts = time.time() if ts is None else ts
+        sha256 = hashlib.sha256()
+        total = 0
+        nuevos = 0
+        lista = []
+        for datos in self.troceador.trocear(bloques):
+            sha256.update(datos)
+            total += len(datos)
+            sha, escritos = self._guardar_bloque(datos)
+            nuevos += escritos
+            lista.append([sha, len(datos)])
+
+        identificador = datetime.fromtimestamp(ts).strftime("%Y%m%dT%H%M%S")
+        manifiesto = {
+            "version": 1,
+            "host": host,
+            "id": identificador,
+            "ts": ts,
+            "bytes": total,
+            "sha256": sha256.hexdigest(),
+            "bloques": lista,
+        }
+        directorio = self._dir_manifiestos(host)
+        destino = os.path.join(directorio, identificador + ".json")
+        sufijo = 1
+        while os.path.exists(destino):
+            destino = os.path.join(directorio, f"{identificador}-{sufijo}.json")
+            sufijo += 1
+        manifiesto["id"] = os.path.basename(destino)[:-len(".json")]
+        _escribir_atomico(destino, json.dumps(manifiesto).encode("utf-8"))
+        return dict(manifiesto, bytes_nuevos=nuevos)
+
+    def hosts(self):
+        raiz = os.path.join(self.directorio, "manifiestos")
+        return sorted(os.listdir(raiz)) if os.path.isdir(raiz) else []
+
+    def manifiestos(self, host):
+        """Manifiestos de un host, del más reciente al más antiguo"""
+        directorio = self._dir_manifiestos(host)
+        if not os.path.isdir(directorio):
+            return []
+        resultado = []
+        for nombre in os.listdir(directorio):
+            if nombre.endswith(".json"):
+                with open(os.path.join(directorio, nombre), encoding="utf-8") as f:
+                    resultado.append(json.load(f))
+        return sorted(resultado, key=lambda m: m["ts"], reverse=True)
+
+    def manifiesto(self, host, identificador=None):
+        """Manifiesto ``identificador`` de un host (el último si es None)"""
+        for manifiesto in self.manifiestos(host):
+            if identificador is None or manifiesto["id"] == identificador:
+                return manifiesto
+        raise FileNotFoundError(f"No hay backup {identificador or ''} de {host}".replace("  ", " "))
+
+    # Restauración
+
+    def reensamblar(self, manifiesto):
+        """Genera los bytes del backup bloque a bloque (memoria constante)"""
+        for sha, _ in manifiesto["bloques"]:
+            yield self.leer_bloque(sha)
+
+    def restaurar(self, manifiesto, destino):
+        """Reconstruye un backup en ``destino`` verificando su SHA-256"""
+        sha256 = hashlib.sha256()
+        directorio = os.path.dirname(os.path.abspath(destino))
+        fd, temporal = tempfile.mkstemp(prefix=".truebackup_", suffix=".part", dir=directorio)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for datos in self.reensamblar(manifiesto):
+                    f.write(datos)
+                    sha256.update(datos)
+                f.flush()
+                os.fsync(f.fileno())
+            if sha256.hexdigest() != manifiesto["sha256"]:
+                raise ValueError(f"El SHA-256 del backup {manifiesto['id']} no coincide")
+            os.replace(temporal, destino)
+        except BaseException:
+            if os.path.exists(temporal):
+                os.unlink(temporal)
+            raise
+        return {"archivo": destino, "bytes": manifiesto["bytes"], "sha256": manifiesto["sha256"]}
+
+    # Retención
+
+    def aplicar_retencion(self, host, retencion=RETENCION):
+        """Borra los manifiestos que no conserva la política horaria/diaria/semanal
+
+        Para cada periodo se conserva el backup más reciente de cada una de
+        las últimas N horas, días y semanas (``retencion = (N_h, N_d, N_s)``).
+        Devuelve los identificadores borrados.
+        """
+        horas, dias, semanas = retencion
+        manifiestos = self.manifiestos(host)
+        conservar = set()
+        for n, formato in ((horas, "%Y%m%d%H"), (dias, "%Y%m%d"), (semanas, "%G%V")):
+            periodos = set()
+            for manifiesto in manifiestos:
+                periodo = datetime.fromtimestamp(manifiesto["ts"]).strftime(formato)
+                if periodo in periodos:
+                    continue
+                if len(periodos) >= n:
+                    break
+                periodos.add(periodo)
+                conservar.add(manifiesto["id"])
+        borrados = []
+        for manifiesto in manifiestos:
+            if manifiesto["id"] not in conservar:
+                os.unlink(os.path.join(self._dir_manifiestos(host), manifiesto["id"] + ".json"))
+                borrados.append(manifiesto["id"])
+        return borrados
+
+    def recolectar_bloques(self, gracia=GRACIA_GC):
+        """Borra los bloques que ningún manifiesto referencia; devuelve los bytes liberados"""
+        with self._lock:
+            usados = {sha for host in self.hosts() for m in self.manifiestos(host) for sha, _ in m["bloques"]}
+            limite = time.time() - gracia
+            liberados = 0
+            for raiz, _, archivos in os.walk(os.path.join(self.directorio, "bloques")):
+                for archivo in archivos:
+                    sha = archivo.split(".")[0]
+                    ruta = os.path.join(raiz, archivo)
+                    if sha in usados or archivo.startswith("."):
+                        continue
+                    # La fecha se comprueba y el bloque se borra sin soltar el bloqueo:
+                    # un backup que lo reutiliza lo marca antes o no lo encuentra
+                    with self._bloqueo_bloques():
+                        try:
+                            estado = os.stat(ruta)
+                            if estado.st_mtime < limite:
+                                os.unlink(ruta)
+                                liberados += estado.st_size
+                        except OSError:
+                            continue
+            return liberados
@@ -0,0 +1,64 @@
+"""Proveedores de autenticación para el cliente de TrueNAS
+
+Cada proveedor recibe la configuración de un host (variables de entorno
+o una entrada del inventario) y devuelve los argumentos de credenciales
+de ``ClienteTrueNAS``. Se pueden añadir otros con ``@proveedor("nombre")``.
+"""
+import os
+
+PROVEEDORES = {}
+
+
+def proveedor(nombre):
+    """Registra una función como proveedor de autenticación ``nombre``"""
+    def registrar(funcion):
+        PROVEEDORES[nombre] = funcion
+        return funcion
+    return registrar
+
+
+@proveedor("token")
+def auth_token(config):
+    """Token de API (cabecera Bearer)"""
+    return {"api_key": config.get("api_key")}
+
+
+@proveedor("basic")
+def auth_basic(config):
+    """Usuario y contraseña (cabecera Basic)"""
+    return {"usuario": config.get("usuario"), "password": config.get("password")}
+
+
+@proveedor("token-archivo")
+def auth_token_archivo(config):
+    """Token de API leído de un archivo (secretos montados, cron)"""
+    with open(config["api_key_file"], encoding="utf-8") as f:
+        return {"api_key": f.read().strip()}
+
+
+def config_entorno():
+    """Configuración del host a partir de las variables de entorno (.env)"""
+    return {
+        "url": os.getenv('TRUENAS_URL'),
+        "api_key": os.getenv('API_KEY'),
+        "api_key_file": os.getenv('API_KEY_FILE'),
+        "usuario": os.getenv('TRUENAS_USER'),
+        "password": os.getenv('TRUENAS_PASS'),
+    }
+
+
+def credenciales(auth, config):
+    """Devuelve los argumentos de credenciales del proveedor ``auth``"""
+    try:
+        funcion = PROVEEDORES[auth]
+    except KeyError:
+        raise ValueError(f"Proveedor de autenticación desconocido: {auth}") from None
+    return funcion(config)
+
+
+def crear_cliente(auth="token", config=None, **kwargs):
+    """Crea un ``ClienteTrueNAS`` con la URL y credenciales de ``config``"""
+    from truenas.cliente import ClienteTrueNAS
+
+    config = config_entorno() if config is None else config
+    return ClienteTrueNAS(config.get("url"), **credenciales(auth, config), **kwargs)
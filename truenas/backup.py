@@ -0,0 +1,132 @@
+import hashlib
+import os
+import tempfile
+import time
+from datetime import datetime
+
+# Tamaño de bloque para la descarga en streaming (bytes)
+CHUNK_SIZE = int(os.getenv('TRUENAS_BACKUP_CHUNK', str(1024 * 1024)))
+
+# Opciones de config/save: incluir la semilla de secretos y las claves de root
+OPCIONES_BACKUP = {
+    "secretseed": True,
+    "root_authorized_keys": True
+}
+
+
+def nombre_backup(directorio="", prefijo="truebackup"):
+    """Devuelve la ruta del backup con la fecha y hora actual"""
+    now = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return os.path.join(directorio, f"{prefijo}_{now}.db")
+
+
+def guardar_stream(response, destino, chunk_size=None, console=None, descripcion="Backup", limitador=None):
+    """Escribe una respuesta en streaming a disco con memoria constante
+
+    Los datos se escriben en un archivo temporal del mismo directorio que
+    se renombra de forma atómica al terminar, de modo que nunca queda un
+    backup a medias con el nombre definitivo. El SHA-256 se calcula
+    mientras se descarga. Si se pasa ``console`` se muestra una barra de
+    progreso con el throughput; con ``limitador`` (``LimitadorAncho``) se
+    limita el ancho de banda de la descarga.
+    """
+    chunk_size = chunk_size or CHUNK_SIZE
+    directorio = os.path.dirname(os.path.abspath(destino))
+    total = int(response.headers.get("Content-Length") or 0) or None
+    sha256 = hashlib.sha256()
+    escritos = 0
+    inicio = time.monotonic()
+
+    progress = None
+    if console is not None:
+        from rich.progress import BarColumn, DownloadColumn, Progress, TextColumn, TransferSpeedColumn
+        progress = Progress(
+            TextColumn("[green]{task.description}"),
+            BarColumn(complete_style="green", finished_style="green"),
+            DownloadColumn(),
+            TransferSpeedColumn(),
+            console=console,
+            transient=True
+        )
+
+    # El directorio se crea justo antes de escribir: una descarga que falla
+    # al conectar no deja directorios vacíos
+    os.makedirs(directorio, exist_ok=True)
+    fd, temporal = tempfile.mkstemp(prefix=".truebackup_", suffix=".part", dir=directorio)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if progress is not None:
+                progress.start()
+                tarea = progress.add_task(descripcion, total=total)
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    f.write(chunk)
+                    sha256.update(chunk)
+                    escritos += len(chunk)
+                    if limitador is not None:
+                        limitador.consumir(len(chunk))
+                    if progress is not None:
+                        progress.update(tarea, advance=len(chunk))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, destino)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.unlink(temporal)
+        raise
+    finally:
+        if progress is not None:
+            progress.stop()
+        response.close()
+
+    duracion = time.monotonic() - inicio
+    return {
+        "archivo": destino,
+        "bytes": escritos,
+        "sha256": sha256.hexdigest(),
+        "duracion": round(duracion, 3),
+        "throughput": escritos / duracion if duracion > 0 else None,
+    }
+
+
+def descargar_backup(cliente, destino=None, chunk_size=None, console=None, limitador=None):
+    """Descarga en streaming el backup de configuración (config/save)"""
+    destino = destino or nombre_backup()
+    response = cliente.post("config/save", json=OPCIONES_BACKUP, stream=True)
+    response.raise_for_status()
+    return guardar_stream(response, destino, chunk_size=chunk_size, console=console, limitador=limitador)
+
+
+def descargar_backup_job(cliente, destino=None, timeout=None, chunk_size=None, console=None):
+    """Descarga el backup como job (core/download de config.save) y espera a que termine"""
+    from truenas.jobs import descargar_resultado_job
+
+    destino = destino or nombre_backup()
+    return descargar_resultado_job(cliente, "config.save", [OPCIONES_BACKUP], destino,
+                                   nombre_archivo=os.path.basename(destino), timeout=timeout,
+                                   chunk_size=chunk_size, console=console)
+
+
+def archivar_backup(cliente, archivo, host, chunk_size=None, retencion=None, limitador=None, recolectar=True):
+    """Descarga el backup en streaming directamente al archivo deduplicado
+
+    Aplica la retención del host y, si ``recolectar``, borra los bloques
+    que ya no se usan. Devuelve el manifiesto (con ``bytes_nuevos``), los
+    backups podados y los bytes liberados.
+    """
+    from truenas.archivo import RETENCION
+
+    inicio = time.monotonic()
+    response = cliente.post("config/save", json=OPCIONES_BACKUP, stream=True)
+    try:
+        response.raise_for_status()
+        bloques = response.iter_content(chunk_size=chunk_size or CHUNK_SIZE)
+        if limitador is not None:
+            bloques = limitador.limitar(bloques)
+        manifiesto = archivo.guardar(host, bloques)
+    finally:
+        response.close()
+    podados = archivo.aplicar_retencion(host, retencion or RETENCION)
+    liberados = archivo.recolectar_bloques() if podados and recolectar else 0
+    return dict(manifiesto, podados=podados, liberados=liberados,
+                duracion=round(time.monotonic() - inicio, 3))
@@ -0,0 +1,176 @@
+"""Backup de la configuración de toda una flota en paralelo
+
+Cada host del inventario descarga su ``config/save`` en streaming a disco
+(o al archivo deduplicado) con una concurrencia global acotada y un
+límite de ancho de banda por enlace. Un host que falla se reprograma con
+backoff exponencial sin ocupar un hueco de concurrencia mientras espera,
+así que el tiempo total es el del host más lento y no la suma de todos.
+"""
+import heapq
+import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import requests
+
+from truenas import backup
+from truenas.concurrencia import MAX_CONCURRENCIA
+from truenas.flota import TIMEOUT_HOST, crear_cliente
+
+# Reintentos por host y espera base del backoff (segundos)
+REINTENTOS = int(os.getenv('TRUENAS_BACKUP_REINTENTOS', '3'))
+BACKOFF = float(os.getenv('TRUENAS_BACKUP_BACKOFF', '2'))
+BACKOFF_MAXIMO = 60
+# Ancho de banda por enlace (bytes/s, admite sufijos K/M/G; vacío = sin límite)
+ANCHO = os.getenv('TRUENAS_BACKUP_ANCHO', '')
+
+SUFIJOS = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+
+def parsear_ancho(valor):
+    """Convierte ``"10M"``, ``"512K"`` o ``"1048576"`` a bytes/s (None si vacío o 0)"""
+    valor = (valor or "").strip().upper().removesuffix("B").removesuffix("/S")
+    if not valor:
+        return None
+    factor = SUFIJOS.get(valor[-1], 1)
+    numero = float(valor[:-1] if valor[-1] in SUFIJOS else valor)
+    return int(numero * factor) or None
+
+
+class LimitadorAncho:
+    """Cubo de fichas: limita los bytes por segundo de una descarga
+
+    Permite una ráfaga de ``rafaga`` bytes (por defecto, un segundo) y
+    después duerme lo necesario para no superar la tasa media.
+    """
+
+    def __init__(self, bytes_por_segundo, rafaga=None):
+        self.tasa = bytes_por_segundo
+        self.capacidad = rafaga or bytes_por_segundo
+        self.fichas = self.capacidad
+        self.ultimo = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consumir(self, n):
+        with self._lock:
+            ahora = time.monotonic()
+            self.fichas = min(self.capacidad, self.fichas + (ahora - self.ultimo) * self.tasa) - n
+            self.ultimo = ahora
+            espera = -self.fichas / self.tasa if self.fichas < 0 else 0
+        if espera > 0:
+            time.sleep(espera)
+
+    def limitar(self, bloques):
+        """Envuelve un iterable de ``bytes`` aplicando el límite"""
+        for bloque in bloques:
+            self.consumir(len(bloque))
+            yield bloque
+
+
+def reintentable(error):
+    """Errores transitorios: red, timeouts y respuestas 5xx/429 (no credenciales ni disco)"""
+    if isinstance(error, requests.HTTPError):
+        codigo = error.response.status_code if error.response is not None else 0
+        return codigo >= 500 or codigo == 429
+    return isinstance(error, requests.RequestException)
+
+
+def espera_backoff(intento, base=BACKOFF):
+    """Espera antes del reintento ``intento`` (1, 2, ...): exponencial con jitter"""
+    return min(BACKOFF_MAXIMO, base * 2 ** (intento - 1)) * random.uniform(0.5, 1.0)
+
+
+def respaldar_host(host, destino=None, archivo=None, timeout=TIMEOUT_HOST, ancho=None, retencion=None):
+    """Descarga el backup de un host (un intento); lanza la excepción si falla"""
+    limitador = LimitadorAncho(ancho) if ancho else None
+    with crear_cliente(host, timeout) as cliente:
+        if archivo is not None:
+            resultado = backup.archivar_backup(cliente, archivo, host["nombre"], retencion=retencion,
+                                               limitador=limitador, recolectar=False)
+            resultado["archivo"] = resultado["id"]
+            resultado["throughput"] = resultado["bytes"] / resultado["duracion"] if resultado["duracion"] else None
+            return resultado
+        directorio = os.path.join(destino or "", host["nombre"].replace("/", "_"))
+        return backup.descargar_backup(cliente, backup.nombre_backup(directorio), limitador=limitador)
+
+
+def respaldar_flota(hosts, destino=None, archivo=None, max_concurrencia=None, timeout=TIMEOUT_HOST,
+                    ancho=None, reintentos=REINTENTOS, retencion=None):
+    """Hace el backup de todos los hosts y devuelve un resultado por host según terminan
+
+    Cada resultado incluye ``host``, ``archivo``, ``bytes``, ``duracion``,
+    ``throughput``, ``sha256``, ``intentos`` y ``error`` (None si fue bien).
+    Con ``archivo`` (``ArchivoBackups``) los bloques huérfanos se
+    recolectan una sola vez al final.
+    """
+    if not hosts:
+        return
+    workers = max(1, min(max_concurrencia or MAX_CONCURRENCIA, len(hosts)))
+    # Cola de (instante en que puede empezar, orden, host, intento)
+    cola = [(0.0, i, host, 1) for i, host in enumerate(hosts)]
+    en_curso = {}
+    hubo_poda = False
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="truenas-backup") as executor:
+        while cola or en_curso:
+            ahora = time.monotonic()
+            while cola and cola[0][0] <= ahora and len(en_curso) < workers:
+                _, orden, host, intento = heapq.heappop(cola)
+                futuro = executor.submit(respaldar_host, host, destino, archivo, timeout, ancho, retencion)
+                en_curso[futuro] = (orden, host, intento, time.monotonic())
+
+            espera = max(0.0, cola[0][0] - ahora) if cola and len(en_curso) < workers else None
+            if not en_curso:
+                time.sleep(espera or 0)
+                continue
+            terminados, _ = wait(en_curso, timeout=espera, return_when=FIRST_COMPLETED)
+            for futuro in terminados:
+                orden, host, intento, inicio = en_curso.pop(futuro)
+                error = futuro.exception()
+                if error is not None and intento <= reintentos and reintentable(error):
+                    heapq.heappush(cola, (time.monotonic() + espera_backoff(intento), orden, host, intento + 1))
+                    continue
+                if error is not None:
+                    yield {"host": host["nombre"], "archivo": None, "bytes": 0,
+                           "duracion": round(time.monotonic() - inicio, 3), "throughput": None,
+                           "sha256": None, "intentos": intento, "error": str(error) or type(error).__name__}
+                    continue
+                resultado = futuro.result()
+                hubo_poda = hubo_poda or bool(resultado.get("podados"))
+                yield {"host": host["nombre"], "archivo": resultado["archivo"], "bytes": resultado["bytes"],
+                       "duracion": resultado["duracion"], "throughput": resultado["throughput"],
+                       "sha256": resultado["sha256"], "intentos": intento, "error": None}
+    if archivo is not None and hubo_poda:
+        archivo.recolectar_bloques()
+
+
+def mostrar_informe(resultados, console):
+    """Tabla resumen del backup de la flota"""
+    from rich.table import Table
+
+    from truenas.formato import formatear_tamano
+
+    tabla = Table(title="[bold green]BACKUP DE LA FLOTA[/bold green]", style="green", header_style="bold green")
+    for columna in ("Host", "Estado", "Tamaño", "Tiempo", "Velocidad", "Intentos", "SHA-256"):
+        tabla.add_column(columna)
+    for resultado in sorted(resultados, key=lambda r: r["host"]):
+        if resultado["error"]:
+            tabla.add_row(resultado["host"], "[red]ERROR[/red]", "-", f"{resultado['duracion']:.2f}s", "-",
+                          str(resultado["intentos"]), "-")
+            continue
+        velocidad = resultado["throughput"]
+        tabla.add_row(
+            resultado["host"],
+            "[green]OK[/green]",
+            formatear_tamano(resultado["bytes"]),
+            f"{resultado['duracion']:.2f}s",
+            f"{formatear_tamano(velocidad)}/s" if velocidad else "-",
+            str(resultado["intentos"]),
+            resultado["sha256"][:16],
+        )
+    console.print(tabla)
+    for resultado in resultados:
+        if resultado["error"]:
+            console.print(f"[bold red]❌ {resultado['host']}:[/bold red] {resultado['error']}",
+                          overflow="ellipsis", no_wrap=True)
@@ -0,0 +1,241 @@
+"""Caché de respuestas de la API con TTL por endpoint
+
+Se coloca delante de ``ClienteTrueNAS``: una LRU en memoria y, si se
+indica un directorio, una copia en disco que sobrevive entre ejecuciones
+(cron, flota). La clave se deriva del método, la URL, los parámetros, el
+cuerpo y las credenciales. Si el servidor devuelve ``ETag`` o
+``Last-Modified``, una entrada caducada se revalida con una petición
+condicional y un ``304`` la renueva sin volver a descargarla.
+
+Las llamadas que modifican el sistema (POST/PUT/DELETE a rutas que no
+son consultas) invalidan las entradas de su mismo recurso (``pool/...``).
+
+En disco cada entrada es una línea JSON (instante, ruta, estado y
+cabeceras) seguida del cuerpo en bruto; no se usa ``pickle``, así que
+leer un directorio de caché ajeno no puede ejecutar código, y una
+entrada que no se puede decodificar cuenta como fallo.
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# "" o "memoria": solo LRU en memoria; "0": desactivada; otro valor: directorio en disco
+CACHE = os.getenv('TRUENAS_CACHE', 'memoria')
+ENTRADAS_MAXIMAS = int(os.getenv('TRUENAS_CACHE_ENTRADAS', '256'))
+
+# TTL (segundos) por ruta. Solo se guardan las rutas listadas: la ruta debe
+# coincidir exactamente, salvo en GET con una entrada comodín ("ruta/*"), que
+# cubre las subrutas (gana la más larga). Los POST de solo lectura como
+# disk/temperatures van por coincidencia exacta. Un TTL de 0 marca una
+# consulta que no se guarda pero tampoco invalida nada
+TTL_POR_RUTA = {
+    "disk": 600,
+    "disk/temperatures": 60,
+    "disk/temperature_agg": 600,
+    "pool": 5,
+    "pool/dataset/details": 60,
+    "app/available_space": 60,
+    "reporting/get_data": 0,
+    "core/get_jobs": 0,
+    "alert/list": 0,
+}
+
+METODOS_MUTACION = ("POST", "PUT", "DELETE", "PATCH")
+
+
+def ttl_de(metodo, ruta, ttls=TTL_POR_RUTA):
+    """TTL de una petición (None si no es una consulta conocida)"""
+    ruta = ruta.strip("/")
+    ttl = ttls.get(ruta)
+    if ttl is not None or metodo.upper() != "GET":
+        return ttl
+    partes = ruta.split("/")
+    for n in range(len(partes) - 1, 0, -1):
+        ttl = ttls.get("/".join(partes[:n]) + "/*")
+        if ttl is not None:
+            return ttl
+    return None
+
+
+def directorio_ruta(ruta):
+    """Subdirectorio de una ruta en la caché en disco (un nivel por segmento)"""
+    return [re.sub(r"[^A-Za-z0-9_.-]", "_", parte).lstrip(".") or "_" for parte in ruta.strip("/").split("/") if parte]
+
+
+def clave_peticion(metodo, url, params=None, cuerpo=None, autorizacion=None):
+    """Clave estable de una petición (método, URL, parámetros, cuerpo y credenciales)"""
+    datos = json.dumps([metodo, url, sorted((params or {}).items()), cuerpo,
+                        hashlib.sha256((autorizacion or "").encode()).hexdigest()],
+                       sort_keys=True, default=str)
+    return hashlib.sha256(datos.encode("utf-8")).hexdigest()
+
+
+def reconstruir_respuesta(entrada, url):
+    """Crea un ``requests.Response`` a partir de una entrada de la caché"""
+    response = requests.Response()
+    response.status_code = entrada["status"]
+    response.headers = CaseInsensitiveDict(entrada["headers"])
+    response._content = entrada["content"]
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.url = url
+    return response
+
+
+def escribir_entrada(f, entrada):
+    """Escribe una entrada: cabecera JSON en una línea y el cuerpo en bruto"""
+    cabecera = {campo: entrada[campo] for campo in ("ts", "ruta", "status", "headers")}
+    f.write(json.dumps(cabecera, separators=(",", ":")).encode("utf-8") + b"\n")
+    f.write(entrada["content"])
+
+
+def leer_entrada(f):
+    """Lee una entrada escrita con ``escribir_entrada``; ValueError si no es válida"""
+    cabecera = json.loads(f.readline())
+    if not (isinstance(cabecera, dict) and isinstance(cabecera.get("ts"), (int, float))
+            and isinstance(cabecera.get("ruta"), str) and isinstance(cabecera.get("status"), int)
+            and isinstance(cabecera.get("headers"), dict)
+            and all(isinstance(v, str) for v in cabecera["headers"].values())):
+        raise ValueError("entrada de caché no válida")
+    cabecera["content"] = f.read()
+    return cabecera
+
+
+class CacheRespuestas:
+    """LRU en memoria (y opcionalmente en disco) de respuestas con TTL por ruta"""
+
+    def __init__(self, directorio=None, ttls=None, entradas_maximas=ENTRADAS_MAXIMAS):
+        self.directorio = directorio
+        self.ttls = TTL_POR_RUTA if ttls is None else ttls
+        self.entradas_maximas = entradas_maximas
+        self.memoria = OrderedDict()  # clave -> entrada
+        self.aciertos = 0
+        self.fallos = 0
+        self._lock = threading.Lock()
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+
+    # Almacenamiento
+
+    def _ruta_disco(self, clave, ruta):
+        # Las entradas de cada ruta cuelgan de su propio directorio (pool/dataset/...),
+        # así que invalidar un recurso es borrar su subárbol sin leer nada
+        return os.path.join(self.directorio, "rutas", *directorio_ruta(ruta), "_" + clave)
+
+    def _leer(self, clave, ruta):
+        with self._lock:
+            entrada = self.memoria.get(clave)
+            if entrada is not None:
+                self.memoria.move_to_end(clave)
+                return entrada
+        if not self.directorio:
+            return None
+        try:
+            with open(self._ruta_disco(clave, ruta), "rb") as f:
+                entrada = leer_entrada(f)
+        except (OSError, ValueError):
+            return None
+        self._guardar_memoria(clave, entrada)
+        return entrada
+
+    def _guardar_memoria(self, clave, entrada):
+        with self._lock:
+            self.memoria[clave] = entrada
+            self.memoria.move_to_end(clave)
+            while len(self.memoria) > self.entradas_maximas:
+                self.memoria.popitem(last=False)
+
+    def _guardar(self, clave, entrada):
+        self._guardar_memoria(clave, entrada)
+        if not self.directorio:
+            return
+        destino = self._ruta_disco(clave, entrada["ruta"])
+        os.makedirs(os.path.dirname(destino), exist_ok=True)
+        fd, temporal = tempfile.mkstemp(prefix=".", suffix=".part", dir=os.path.dirname(destino))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                escribir_entrada(f, entrada)
+            os.replace(temporal, destino)
+        except OSError:
+            if os.path.exists(temporal):
+                os.unlink(temporal)
+
+    def invalidar(self, prefijo=None):
+        """Elimina las entradas de las rutas que empiezan por ``prefijo`` (todas si None)"""
+        prefijo = (prefijo or "").strip("/")
+        with self._lock:
+            claves = [clave for clave, entrada in self.memoria.items()
+                      if entrada["ruta"] == prefijo or entrada["ruta"].startswith(prefijo + "/") or not prefijo]
+            for clave in claves:
+                del self.memoria[clave]
+        if not self.directorio:
+            return
+        shutil.rmtree(os.path.join(self.directorio, "rutas", *directorio_ruta(prefijo)), ignore_errors=True)
+
+    # Peticiones
+
+    def peticion(self, enviar, metodo, ruta, url, kwargs, autorizacion=None):
+        """Resuelve una petición desde la caché o con ``enviar(kwargs)``
+
+        Las peticiones en streaming no se guardan. Una mutación que termina
+        bien invalida las entradas de su recurso (primer segmento de la ruta).
+        """
+        ruta = ruta.strip("/")
+        ttl = ttl_de(metodo, ruta, self.ttls)
+        if kwargs.get("stream") or not ttl:
+            response = enviar(kwargs)
+            if ttl is None and metodo.upper() in METODOS_MUTACION and response.ok:
+                self.invalidar(ruta.split("/")[0])
+            return response
+
+        clave = clave_peticion(metodo.upper(), url, kwargs.get("params"), kwargs.get("json"), autorizacion)
+        entrada = self._leer(clave, ruta)
+        ahora = time.time()
+        if entrada is not None and ahora - entrada["ts"] < ttl:
+            with self._lock:
+                self.aciertos += 1
+            return reconstruir_respuesta(entrada, url)
+
+        with self._lock:
+            self.fallos += 1
+        condicionales = {}
+        if entrada is not None:
+            cabeceras = CaseInsensitiveDict(entrada["headers"])
+            if cabeceras.get("ETag"):
+                condicionales["If-None-Match"] = cabeceras["ETag"]
+            if cabeceras.get("Last-Modified"):
+                condicionales["If-Modified-Since"] = cabeceras["Last-Modified"]
+        if condicionales:
+            kwargs = dict(kwargs, headers={**(kwargs.get("headers") or {}), **condicionales})
+
+        response = enviar(kwargs)
+        if response.status_code == 304 and entrada is not None:
+            entrada = dict(entrada, ts=ahora)
+            self._guardar(clave, entrada)
+            return reconstruir_respuesta(entrada, url)
+        if response.status_code == 200:
+            self._guardar(clave, {
+                "ts": ahora,
+                "ruta": ruta,
+                "status": response.status_code,
+                "headers": dict(response.headers),
+                "content": response.content,
+            })
+        return response
+
+
+def cache_por_defecto():
+    """Caché según ``TRUENAS_CACHE``: None si está desactivada"""
+    if CACHE in ("0", "no", "off"):
+        return None
+    if CACHE in ("", "memoria"):
+        return CacheRespuestas()
+    return CacheRespuestas(directorio=CACHE)
@@ -0,0 +1,494 @@
+"""Línea de comandos unificada: ``python -m truenas <comando>``
+
+Comandos: ``pools``, ``watch``, ``backup``, ``restore``, ``fleet`` y ``exporter``. Cada comando importa
+solo lo que usa (rich, la capa de presentación, el historial...), así que
+un ``backup`` lanzado desde cron no carga nada de la interfaz.
+"""
+import argparse
+import os
+import sys
+
+
+def crear_cliente(args):
+    """Cliente a partir del entorno con el proveedor de autenticación elegido"""
+    from truenas.auth import crear_cliente as crear_cliente_auth
+
+    return crear_cliente_auth(args.auth)
+
+
+def nombre_host(cliente):
+    from urllib.parse import urlparse
+
+    return urlparse(cliente.url).netloc
+
+
+def avisar_stderr(mensaje):
+    print(f"❌ {mensaje}", file=sys.stderr)
+
+
+def cargar_alertas(args, avisar):
+    """Motor de alertas de ``--alertas`` (o ``TRUENAS_ALERTAS``); None si no se usan"""
+    from truenas.alertas import ALERTAS, cargar_motor
+
+    ruta = args.alertas or ALERTAS
+    return cargar_motor(ruta, avisar) if ruta else None
+
+
+def preparar_sondeo(args, avisar, continuo=False, ventana_metricas=None):
+    """Devuelve ``(cliente, sondear)``; ``sondear()`` registra historial y previsión"""
+    import time
+
+    from truenas.historial import abrir_historial
+    from truenas.metricas import VENTANA_INICIAL
+    from truenas.prevision import Previsiones
+    from truenas.sondeo import Sondeo
+
+    cliente = crear_cliente(args)
+    sondeo = Sondeo(cliente, avisar=avisar, ventana_metricas=ventana_metricas or VENTANA_INICIAL)
+    historial = abrir_historial(args.historial)
+    previsiones = Previsiones(historial)
+    motor = cargar_alertas(args, avisar)
+    host = nombre_host(cliente)
+
+    def sondear():
+        snapshot = sondeo.obtener_snapshot(con_datasets=historial is not None or continuo, pool=args.pool,
+                                           con_alertas=motor is not None)
+        ts = time.time()
+        # Previsión de llenado: una muestra más sobre las sumas acumuladas. Se
+        # calcula antes de registrar el sondeo para no contar la muestra dos veces
+        previsiones.actualizar(host, snapshot["pools"], snapshot["datasets"], ts=ts)
+        if historial is not None:
+            historial.registrar(host, snapshot["pools"], ts=ts)
+            if snapshot["datasets"]:
+                historial.registrar_datasets(host, snapshot["datasets"], ts=ts)
+        if motor is not None and not snapshot["error"]:
+            snapshot["alertas"] = motor.procesar(host, snapshot["pools"], snapshot["alertas_nas"])
+        return snapshot
+
+    return cliente, sondear
+
+
+def descargar_backup(cliente, destino=None, job=False, console=None):
+    """Descarga el backup de configuración e informa del resultado; devuelve el código de salida"""
+    import requests
+
+    from truenas import backup
+
+    try:
+        if job:
+            resultado = backup.descargar_backup_job(cliente, destino, console=console)
+        else:
+            # Descarga en streaming a un temporal que se renombra al terminar
+            resultado = backup.descargar_backup(cliente, destino, console=console)
+    except requests.exceptions.HTTPError as e:
+        print(f"Error HTTP {e.response.status_code}: {e.response.text}", file=sys.stderr)
+        return 1
+    except requests.exceptions.RequestException as e:
+        print(f"Error de conexión: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Error inesperado: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Backup descargado correctamente como {resultado['archivo']}")
+    print(f"SHA-256: {resultado['sha256']}")
+    return 0
+
+
+def emitir_snapshot(formato, host, snapshot, salida=None):
+    """Escribe una instantánea en ``formato`` (json, ndjson o prometheus)"""
+    from truenas import salida as salida_api
+
+    salida = salida or sys.stdout
+    if formato == "ndjson":
+        salida_api.escribir_ndjson(salida, salida_api.registros_snapshot(host, snapshot))
+    elif formato == "json":
+        cabecera = {"host": host, "espacio_app_bytes": snapshot.get("espacio_app_bytes")}
+        salida_api.escribir_json(salida, map(salida_api.datos_pool, snapshot["pools"]), cabecera=cabecera)
+    else:
+        muestras = salida_api.muestras_host(host, snapshot["pools"], snapshot.get("espacio_app_bytes"))
+        salida.write(salida_api.texto_prometheus(muestras))
+        salida.flush()
+
+
+def comando_pools(args):
+    """Muestra una vez el estado de los pools (o en continuo con ``--watch``)"""
+    if args.watch:
+        args.intervalo = args.watch
+        return comando_watch(args)
+
+    if args.format:
+        # Salida para máquinas: sin rich y sin preguntas
+        cliente, sondear = preparar_sondeo(args, avisar_stderr)
+        emitir_snapshot(args.format, nombre_host(cliente), sondear())
+        return 0
+
+    from rich.console import Console
+
+    from truenas.pantalla import mostrar_estado
+
+    console = Console()
+    cliente, sondear = preparar_sondeo(args, lambda mensaje: console.print(f"[bold red]❌ {mensaje}[/bold red]"))
+    snapshot = sondear()
+    mostrar_estado(console, snapshot["pools"], espacio_app=snapshot["espacio_app"])
+
+    # Sin terminal (cron, tuberías) no se pregunta
+    if sys.stdin.isatty():
+        respuesta = input("\n¿Deseas guardar un backup de la configuración ahora? (s/n): ").strip().lower()
+        if respuesta == "s":
+            return descargar_backup(cliente, console=console)
+    return 0
+
+
+def comando_watch(args):
+    """Monitoriza los pools refrescando cada ``intervalo`` segundos"""
+    if args.format:
+        return watch_formato(args)
+
+    from rich.console import Console
+
+    from truenas.metricas import VENTANA_WATCH
+    from truenas.pantalla import FPS_POR_DEFECTO, modo_watch
+
+    console = Console()
+    _, sondear = preparar_sondeo(args, lambda mensaje: console.print(f"[bold red]❌ {mensaje}[/bold red]"),
+                                 continuo=True, ventana_metricas=VENTANA_WATCH)
+    modo_watch(sondear, args.intervalo, console, fps=FPS_POR_DEFECTO if args.fps is None else args.fps)
+    return 0
+
+
+def watch_formato(args):
+    """Emite una instantánea en ``args.format`` cada ``intervalo`` segundos"""
+    import time
+
+    cliente, sondear = preparar_sondeo(args, avisar_stderr, continuo=True)
+    host = nombre_host(cliente)
+    try:
+        while True:
+            inicio = time.monotonic()
+            emitir_snapshot(args.format, host, sondear())
+            time.sleep(max(0.0, args.intervalo - (time.monotonic() - inicio)))
+    except KeyboardInterrupt:
+        return 0
+
+
+def comando_backup(args):
+    """Descarga el backup de configuración; la barra de progreso solo con terminal"""
+    from truenas.backup import nombre_backup
+
+    if args.all:
+        return backup_flota(args)
+    if args.archivo:
+        return archivar_backup(args)
+
+    console = None
+    if sys.stderr.isatty():
+        from rich.console import Console
+
+        console = Console(stderr=True)
+    destino = nombre_backup(args.destino) if args.destino else None
+    return descargar_backup(crear_cliente(args), destino, job=args.job, console=console)
+
+
+def archivar_backup(args):
+    """Guarda el backup en el archivo deduplicado y aplica la retención"""
+    import requests
+
+    from truenas import backup
+    from truenas.archivo import ArchivoBackups
+
+    cliente = crear_cliente(args)
+    try:
+        resultado = backup.archivar_backup(cliente, ArchivoBackups(args.archivo), nombre_host(cliente),
+                                           retencion=args.retencion)
+    except requests.exceptions.HTTPError as e:
+        print(f"Error HTTP {e.response.status_code}: {e.response.text}", file=sys.stderr)
+        return 1
+    except requests.exceptions.RequestException as e:
+        print(f"Error de conexión: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Error inesperado: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Backup {resultado['id']} archivado: {resultado['bytes']} bytes, "
+          f"{resultado['bytes_nuevos']} nuevos en disco")
+    print(f"SHA-256: {resultado['sha256']}")
+    if resultado["podados"]:
+        print(f"Retención: {len(resultado['podados'])} backups eliminados, {resultado['liberados']} bytes liberados")
+    return 0
+
+
+def backup_flota(args):
+    """Backup de todos los hosts del inventario en paralelo, con informe final"""
+    from truenas import backup_flota as backup_flota_api
+    from truenas.flota import TIMEOUT_HOST, cargar_inventario
+
+    archivo = None
+    if args.archivo:
+        from truenas.archivo import ArchivoBackups
+
+        archivo = ArchivoBackups(args.archivo)
+    hosts = cargar_inventario(args.inventario)
+    ancho = backup_flota_api.parsear_ancho(args.ancho if args.ancho is not None else backup_flota_api.ANCHO)
+    resultados = backup_flota_api.respaldar_flota(
+        hosts, destino=args.destino, archivo=archivo, max_concurrencia=args.concurrencia,
+        timeout=TIMEOUT_HOST if args.timeout is None else args.timeout, ancho=ancho,
+        reintentos=backup_flota_api.REINTENTOS if args.reintentos is None else args.reintentos,
+        retencion=args.retencion,
+    )
+
+    if args.format:
+        from truenas import salida as salida_api
+
+        errores = []
+
+        def registrar():
+            for resultado in resultados:
+                if resultado["error"]:
+                    errores.append(resultado["host"])
+                yield resultado
+
+        if args.format == "json":
+            salida_api.escribir_json(sys.stdout, registrar(), clave="hosts")
+        else:
+            salida_api.escribir_ndjson(sys.stdout, registrar())
+        return 1 if errores else 0
+
+    from rich.console import Console
+
+    console = Console()
+    lista = []
+    with console.status(f"[green]Haciendo backup de {len(hosts)} hosts...[/green]"):
+        for resultado in resultados:
+            lista.append(resultado)
+    backup_flota_api.mostrar_informe(lista, console)
+    return 1 if any(r["error"] for r in lista) else 0
+
+
+def comando_restore(args):
+    """Lista los backups del archivo o reconstruye uno en ``destino``"""
+    from truenas.archivo import ArchivoBackups
+
+    archivo = ArchivoBackups(args.archivo)
+    hosts = [args.host] if args.host else archivo.hosts()
+    if args.listar or not args.destino:
+        for host in hosts:
+            for manifiesto in archivo.manifiestos(host):
+                print(f"{host}\t{manifiesto['id']}\t{manifiesto['bytes']}\t{manifiesto['sha256']}")
+        return 0
+
+    if len(hosts) != 1:
+        print("Indica --host: el archivo contiene backups de varios hosts" if hosts
+              else "El archivo no contiene backups", file=sys.stderr)
+        return 1
+    try:
+        resultado = archivo.restaurar(archivo.manifiesto(hosts[0], args.id), args.destino)
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"Error al restaurar: {e}", file=sys.stderr)
+        return 1
+    print(f"Backup restaurado como {resultado['archivo']} ({resultado['bytes']} bytes)")
+    print(f"SHA-256: {resultado['sha256']}")
+    return 0
+
+
+def comando_fleet(args):
+    """Muestra en una única tabla (o en ``--format``) los pools de todos los hosts del inventario"""
+    from truenas.flota import TIMEOUT_HOST, cargar_inventario, recolectar_flota
+    from truenas.historial import abrir_historial
+
+    hosts = cargar_inventario(args.inventario)
+    historial = abrir_historial(args.historial)
+    motor = cargar_alertas(args, avisar_stderr)
+    timeout = TIMEOUT_HOST if args.timeout is None else args.timeout
+
+    def recolectar():
+        eventos = []
+        for resultado in recolectar_flota(hosts, args.concurrencia, timeout, con_alertas=motor is not None):
+            if not resultado["error"]:
+                if historial is not None:
+                    historial.registrar(resultado["host"], resultado["pools"])
+                if motor is not None:
+                    eventos.extend(motor.evaluar(resultado["host"], resultado["pools"],
+                                                 resultado.get("alertas_nas")))
+            yield resultado
+        # Un único envío y una única escritura del estado para toda la flota
+        if motor is not None:
+            motor.notificar(eventos)
+            motor.guardar()
+
+    if args.format:
+        return emitir_flota(args.format, recolectar())
+
+    from rich.console import Console
+
+    from truenas.flota import mostrar_tabla_flota
+
+    console = Console()
+    resultados = []
+    with console.status(f"[green]Consultando {len(hosts)} hosts...[/green]"):
+        for resultado in recolectar():
+            resultados.append(resultado)
+
+    mostrar_tabla_flota(resultados, console)
+    return 0
+
+
+def emitir_flota(formato, resultados, salida=None):
+    """Escribe los resultados de la flota en ``formato`` según llegan"""
+    from truenas import salida as salida_api
+
+    salida = salida or sys.stdout
+    if formato == "ndjson":
+        salida_api.escribir_ndjson(salida, salida_api.registros_flota(resultados))
+    elif formato == "json":
+        salida_api.escribir_json(salida, map(salida_api.datos_host, resultados))
+    else:
+        muestras = (
+            muestra
+            for r in resultados
+            for muestra in salida_api.muestras_host(r["host"], r["pools"], error=r["error"], duracion=r.get("duracion"))
+        )
+        salida.write(salida_api.texto_prometheus(muestras))
+        salida.flush()
+    return 0
+
+
+def comando_exporter(args):
+    """Exportador de Prometheus: sondeo en segundo plano y /metrics desde memoria"""
+    from truenas import exportador
+
+    if args.inventario:
+        from truenas.flota import TIMEOUT_HOST, cargar_inventario, crear_cliente as crear_cliente_host
+
+        timeout = TIMEOUT_HOST if args.timeout is None else args.timeout
+        hosts = [(host["nombre"], crear_cliente_host(host, timeout)) for host in cargar_inventario(args.inventario)]
+    else:
+        cliente = crear_cliente(args)
+        hosts = [(nombre_host(cliente), cliente)]
+
+    direccion = args.direccion or exportador.DIRECCION
+    puerto = args.puerto or exportador.PUERTO
+    instancia = exportador.Exportador(hosts, intervalo=args.intervalo or exportador.INTERVALO,
+                                      max_concurrencia=args.concurrencia)
+    print(f"Sirviendo métricas de {len(hosts)} hosts en http://{direccion}:{puerto}/metrics", file=sys.stderr)
+    exportador.servir(instancia, direccion, puerto)
+    return 0
+
+
+def opciones_pools(parser):
+    parser.add_argument("--pool", metavar="NOMBRE",
+                        help="Consulta solo este pool (filtrado en el servidor)")
+    parser.add_argument("--historial", metavar="RUTA",
+                        help="Registra cada sondeo en esta base de datos SQLite")
+    parser.add_argument("--fps", type=float,
+                        help="Fotogramas por segundo del modo watch (0 desactiva la animación)")
+    opcion_alertas(parser)
+    opcion_formato(parser)
+
+
+def opcion_alertas(parser):
+    parser.add_argument("--alertas", metavar="RUTA",
+                        help="Evalúa las reglas de alerta de este JSON en cada sondeo (por defecto TRUENAS_ALERTAS)")
+
+
+def opcion_formato(parser):
+    parser.add_argument("--format", choices=("json", "ndjson", "prometheus"),
+                        help="Salida para máquinas en lugar de la interfaz (sin rich ni preguntas)")
+
+
+def retencion(valor):
+    """Convierte ``H,D,S`` en una tupla de tres enteros"""
+    try:
+        horas, dias, semanas = (int(n) for n in valor.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError("usa el formato H,D,S (p. ej. 24,7,4)")
+    return horas, dias, semanas
+
+
+def crear_parser():
+    from truenas.auth import PROVEEDORES
+
+    parser = argparse.ArgumentParser(prog="truenas", description="Utilidades para la API de TrueNAS")
+    parser.add_argument("--auth", choices=sorted(PROVEEDORES), default=os.getenv('TRUENAS_AUTH', 'token'),
+                        help="Proveedor de autenticación (por defecto TRUENAS_AUTH o token)")
+    comandos = parser.add_subparsers(dest="comando", required=True, metavar="comando")
+
+    pools = comandos.add_parser("pools", help="Estado de los pools")
+    opciones_pools(pools)
+    pools.add_argument("--watch", type=float, metavar="N",
+                       help="Monitoriza los pools refrescando cada N segundos")
+    pools.set_defaults(funcion=comando_pools)
+
+    watch = comandos.add_parser("watch", help="Monitoriza los pools en continuo")
+    watch.add_argument("intervalo", type=float, nargs="?", default=5,
+                       help="Segundos entre sondeos (por defecto 5)")
+    opciones_pools(watch)
+    watch.set_defaults(funcion=comando_watch)
+
+    backup = comandos.add_parser("backup", help="Descarga el backup de la configuración")
+    backup.add_argument("--destino", metavar="DIR", help="Directorio donde guardar el backup")
+    backup.add_argument("--job", action="store_true",
+                        help="Descarga como job (core/download) en lugar de config/save")
+    backup.add_argument("--all", action="store_true",
+                        help="Backup de todos los hosts del inventario en paralelo")
+    backup.add_argument("--inventario", default="inventario.json", metavar="RUTA",
+                        help="Inventario JSON de hosts (con --all)")
+    backup.add_argument("--concurrencia", type=int, default=None,
+                        help="Número máximo de backups simultáneos (con --all)")
+    backup.add_argument("--ancho", metavar="BYTES/S",
+                        help="Límite de ancho de banda por host, p. ej. 10M (con --all)")
+    backup.add_argument("--reintentos", type=int, default=None,
+                        help="Reintentos con backoff de un host que falla (con --all, por defecto 3)")
+    backup.add_argument("--timeout", type=float, default=None,
+                        help="Timeout por host en segundos (con --all)")
+    backup.add_argument("--format", choices=("json", "ndjson"),
+                        help="Informe para máquinas en lugar de la tabla (con --all)")
+    backup.add_argument("--archivo", metavar="DIR",
+                        help="Guarda el backup en este archivo deduplicado en lugar de un .db")
+    backup.add_argument("--retencion", type=retencion, metavar="H,D,S",
+                        help="Backups horarios, diarios y semanales a conservar en el archivo "
+                             "(por defecto TRUENAS_BACKUP_RETENCION o 24,7,4)")
+    backup.set_defaults(funcion=comando_backup)
+
+    restore = comandos.add_parser("restore", help="Lista o restaura backups del archivo deduplicado")
+    restore.add_argument("archivo", metavar="DIR", help="Directorio del archivo de backups")
+    restore.add_argument("destino", nargs="?", help="Archivo .db a reconstruir (sin él, lista los backups)")
+    restore.add_argument("--host", help="Host del backup (obligatorio si el archivo tiene varios)")
+    restore.add_argument("--id", help="Identificador del backup (por defecto, el más reciente)")
+    restore.add_argument("--listar", action="store_true", help="Lista los backups disponibles")
+    restore.set_defaults(funcion=comando_restore)
+
+    fleet = comandos.add_parser("fleet", help="Estado de los pools de una flota de servidores")
+    fleet.add_argument("inventario", nargs="?", default="inventario.json",
+                       help="Archivo JSON con los hosts y sus credenciales")
+    fleet.add_argument("--concurrencia", type=int, default=None,
+                       help="Número máximo de hosts consultados a la vez")
+    fleet.add_argument("--timeout", type=float, default=None,
+                       help="Timeout por host en segundos")
+    fleet.add_argument("--historial", metavar="RUTA",
+                       help="Registra el sondeo de cada host en esta base de datos SQLite")
+    opcion_alertas(fleet)
+    opcion_formato(fleet)
+    fleet.set_defaults(funcion=comando_fleet)
+
+    exporter = comandos.add_parser("exporter", help="Exportador de Prometheus con sondeo en segundo plano")
+    exporter.add_argument("--inventario", metavar="RUTA",
+                          help="Inventario JSON de hosts (por defecto, el host de TRUENAS_URL)")
+    exporter.add_argument("--direccion", help="Dirección de escucha (por defecto 127.0.0.1)")
+    exporter.add_argument("--puerto", type=int, help="Puerto de escucha (por defecto 9814)")
+    exporter.add_argument("--intervalo", type=float, help="Segundos entre sondeos de cada host (por defecto 30)")
+    exporter.add_argument("--concurrencia", type=int, default=None,
+                          help="Número máximo de hosts sondeados a la vez")
+    exporter.add_argument("--timeout", type=float, default=None,
+                          help="Timeout por host en segundos (con --inventario)")
+    exporter.set_defaults(funcion=comando_exporter)
+    return parser
+
+
+def main(argv=None):
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    args = crear_parser().parse_args(argv)
+    return args.funcion(args)
@@ -0,0 +1,123 @@
+import base64
+import os
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Deshabilitar advertencias de SSL (los NAS suelen usar certificados autofirmados)
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# Valores por defecto del cliente
+TIMEOUT_POR_DEFECTO = (5, 30)  # (conexión, lectura) en segundos
+REINTENTOS_POR_DEFECTO = 3
+BACKOFF_POR_DEFECTO = 0.5
+CONEXIONES_POR_DEFECTO = 10
+# Validar los cuerpos de las peticiones contra api-doc.json antes de enviarlas
+VALIDAR_SPEC = os.getenv('TRUENAS_VALIDAR_SPEC', '') not in ('', '0')
+
+
+class ClienteTrueNAS:
+    """Cliente HTTP con sesión persistente (keep-alive) para la API de TrueNAS
+
+    Mantiene un único ``requests.Session`` con un pool de conexiones
+    dimensionado, de modo que todas las llamadas reutilizan la misma
+    conexión TCP/TLS. La cabecera de autenticación (Bearer o Basic) se
+    calcula una sola vez y los timeouts y reintentos son uniformes.
+    """
+
+    def __init__(self, url, api_key=None, usuario=None, password=None,
+                 timeout=TIMEOUT_POR_DEFECTO, reintentos=REINTENTOS_POR_DEFECTO,
+                 backoff=BACKOFF_POR_DEFECTO, conexiones=CONEXIONES_POR_DEFECTO,
+                 verify=False, validar=VALIDAR_SPEC, cache=None):
+        if not url:
+            raise ValueError("Se requiere la URL de la API de TrueNAS")
+        # Verificar que la URL termine con / para evitar problemas de concatenación
+        self.url = url if url.endswith('/') else url + '/'
+        self.timeout = timeout
+        self.validar = validar
+        if cache is None:
+            from truenas.cache import cache_por_defecto
+
+            cache = cache_por_defecto()
+        # cache=False desactiva la caché de respuestas
+        self.cache = cache or None
+
+        self.session = requests.Session()
+        self.session.verify = verify
+        self.session.headers.update(cabeceras_autenticacion(api_key, usuario, password))
+
+        retry = Retry(
+            total=reintentos,
+            connect=reintentos,
+            read=reintentos,
+            backoff_factor=backoff,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD", "OPTIONS"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=conexiones, pool_maxsize=conexiones, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def url_de(self, ruta):
+        """Construye la URL completa de un endpoint sin duplicar barras"""
+        return self.url + ruta.lstrip('/')
+
+    def request(self, metodo, ruta, **kwargs):
+        """Realiza una petición aplicando el timeout por defecto
+
+        Si ``validar`` está activo, el cuerpo JSON se comprueba contra
+        api-doc.json y se lanza ``ErrorValidacion`` sin llegar a enviarlo.
+        Con caché, las consultas con TTL se sirven desde ella (ver
+        ``truenas/cache.py``).
+        """
+        if self.validar and "json" in kwargs:
+            from truenas.spec import cargar_spec
+
+            cargar_spec().validar_cuerpo(ruta, metodo, kwargs["json"])
+        kwargs.setdefault("timeout", self.timeout)
+        url = self.url_de(ruta)
+        if self.cache is None:
+            return self.session.request(metodo, url, **kwargs)
+        return self.cache.peticion(lambda opciones: self.session.request(metodo, url, **opciones),
+                                   metodo, ruta, url, kwargs, self.session.headers.get("Authorization"))
+
+    def get(self, ruta, **kwargs):
+        return self.request("GET", ruta, **kwargs)
+
+    def post(self, ruta, **kwargs):
+        return self.request("POST", ruta, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def cabeceras_autenticacion(api_key=None, usuario=None, password=None):
+    """Devuelve las cabeceras de autenticación (Bearer o Basic) precalculadas"""
+    cabeceras = {"Content-Type": "application/json"}
+    if api_key:
+        cabeceras["Authorization"] = f"Bearer {api_key}"
+    elif usuario is not None:
+        credenciales = f"{usuario}:{password or ''}".encode("utf-8")
+        cabeceras["Authorization"] = "Basic " + base64.b64encode(credenciales).decode("ascii")
+    return cabeceras
+
+
+def cliente_desde_entorno(auth="token", **kwargs):
+    """Crea un cliente a partir de las variables de entorno (.env)
+
+    ``auth`` es el nombre de un proveedor de ``truenas.auth``: ``"token"``
+    (API_KEY), ``"basic"`` (TRUENAS_USER / TRUENAS_PASS) o
+    ``"token-archivo"`` (API_KEY_FILE).
+    """
+    from truenas.auth import crear_cliente
+
+    return crear_cliente(auth, **kwargs)
@@ -0,0 +1,22 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Límite de peticiones simultáneas por defecto (configurable por entorno)
+MAX_CONCURRENCIA = int(os.getenv('TRUENAS_MAX_CONCURRENCIA', '8'))
+
+
+def ejecutar_en_paralelo(tareas, max_concurrencia=None):
+    """Ejecuta en paralelo tareas independientes y devuelve sus resultados
+
+    ``tareas`` es un diccionario ``nombre -> función sin argumentos``; el
+    resultado es un diccionario ``nombre -> valor devuelto``. El tiempo
+    total es el de la tarea más lenta en lugar de la suma de todas.
+    Las excepciones de una tarea se propagan al recoger su resultado.
+    """
+    if not tareas:
+        return {}
+    max_concurrencia = max_concurrencia or MAX_CONCURRENCIA
+    workers = max(1, min(max_concurrencia, len(tareas)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="truenas") as executor:
+        futuros = {nombre: executor.submit(funcion) for nombre, funcion in tareas.items()}
+        return {nombre: futuro.result() for nombre, futuro in futuros.items()}
@@ -0,0 +1,100 @@
+"""Opciones de consulta de los endpoints ``query`` de la API REST
+
+Los filtros, ``sort`` y la paginación ``limit``/``offset`` se resuelven en
+el servidor. api-doc.json no declara ``select`` para la API REST (un
+parámetro desconocido se interpretaría como filtro), así que la proyección
+se aplica al decodificar cada página: lo que no se pide no llega a los
+índices, al historial ni a la caché de paneles. Con msgspec instalado la
+proyección se hace durante la propia decodificación (ver
+``truenas/decodificacion.py``).
+"""
+from truenas.decodificacion import cargar, decodificar_structs
+
+# Operadores de filtro -> sufijo del parámetro de query (campo__op=valor)
+OPERADORES = {
+    "=": "",
+    "!=": "__neq",
+    ">": "__gt",
+    "<": "__lt",
+    ">=": "__gte",
+    "<=": "__lte",
+    "~": "__regex",
+}
+
+
+def parametros_consulta(filtros=None, limit=None, offset=None, sort=None):
+    """Traduce filtros y opciones de consulta a parámetros de query
+
+    ``filtros`` es un diccionario ``campo -> valor`` (igualdad) o una lista
+    de tuplas ``(campo, operador, valor)`` con los operadores de
+    ``OPERADORES``.
+    """
+    params = {}
+    if isinstance(filtros, dict):
+        filtros = [(campo, "=", valor) for campo, valor in filtros.items()]
+    for campo, operador, valor in filtros or []:
+        if operador not in OPERADORES:
+            raise ValueError(f"Operador de filtro no soportado: {operador}")
+        if isinstance(valor, bool):
+            valor = str(valor).lower()
+        params[campo + OPERADORES[operador]] = valor
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    if sort:
+        params["sort"] = sort if isinstance(sort, str) else ",".join(sort)
+    return params
+
+
+def proyectar(registros, select):
+    """Reduce cada registro a los campos de ``select`` (todos si es None)"""
+    if not select:
+        return registros
+    return [{campo: registro[campo] for campo in select if campo in registro} for registro in registros]
+
+
+def decodificar_pagina(response, select=None):
+    """Decodifica una página de resultados aplicando la proyección ``select``"""
+    if select:
+        registros = decodificar_structs(response.content, select)
+        if registros is not None:
+            return registros
+    return proyectar(cargar(response.content), select)
+
+
+def admite_paginacion(ruta):
+    """Indica si api-doc.json declara ``limit``/``offset`` para ``GET ruta``"""
+    from truenas.spec import cargar_spec
+
+    try:
+        operacion = cargar_spec().operacion("/" + ruta.strip("/"), "GET")
+    except OSError:
+        # Sin especificación disponible se asume la API estándar de query
+        return True
+    nombres = {p["name"] for p in (operacion or {}).get("parametros", [])}
+    return {"limit", "offset"} <= nombres
+
+
+def consultar(cliente, ruta, filtros=None, select=None, sort=None, por_pagina=None):
+    """Ejecuta una consulta completa con filtros, proyección y paginación
+
+    Si ``por_pagina`` está indicado y el endpoint admite paginación, se
+    piden páginas de ese tamaño hasta recibir una incompleta.
+    """
+    if not por_pagina or not admite_paginacion(ruta):
+        response = cliente.get(ruta, params=parametros_consulta(filtros, sort=sort))
+        response.raise_for_status()
+        return decodificar_pagina(response, select)
+
+    registros = []
+    offset = 0
+    while True:
+        params = parametros_consulta(filtros, limit=por_pagina, offset=offset, sort=sort)
+        response = cliente.get(ruta, params=params)
+        response.raise_for_status()
+        pagina = decodificar_pagina(response, select)
+        registros.extend(pagina)
+        if len(pagina) < por_pagina:
+            return registros
+        offset += por_pagina
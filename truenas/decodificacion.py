@@ -0,0 +1,86 @@
+"""Decodificación JSON con backend rápido opcional
+
+Se usa orjson o msgspec si están instalados y, si no, ``json`` de la
+biblioteca estándar. Con msgspec, las listas de ``/pool`` y ``/disk`` se
+decodifican directamente a structs con solo los campos pedidos: el resto
+del objeto se salta sin llegar a crear sus diccionarios.
+"""
+import json
+from typing import Any, Optional, Union
+
+try:
+    import msgspec
+except ImportError:  # msgspec es opcional
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "msgspec" if msgspec is not None else "json"
+
+_decodificadores = {}
+
+
+def cargar(contenido):
+    """Decodifica un documento JSON (bytes o str) con el backend disponible"""
+    if orjson is not None:
+        return orjson.loads(contenido)
+    if msgspec is not None:
+        return msgspec.json.decode(contenido)
+    return json.loads(contenido)
+
+
+def _get(self, campo, defecto=None):
+    valor = getattr(self, campo, msgspec.UNSET)
+    return defecto if valor is msgspec.UNSET else valor
+
+
+def _getitem(self, campo):
+    valor = getattr(self, campo, msgspec.UNSET)
+    if valor is msgspec.UNSET:
+        raise KeyError(campo)
+    return valor
+
+
+def _contains(self, campo):
+    return getattr(self, campo, msgspec.UNSET) is not msgspec.UNSET
+
+
+def _decodificador(campos):
+    """Decoder de msgspec para una lista de structs con ``campos`` (cacheado)
+
+    Los structs exponen ``get``, ``[]`` e ``in`` como un diccionario de solo
+    lectura; un campo ausente en el JSON se comporta como clave ausente.
+    """
+    if not isinstance(campos, dict):
+        campos = dict.fromkeys(campos, Any)
+    clave = tuple(campos.items())
+    decodificador = _decodificadores.get(clave)
+    if decodificador is None:
+        definicion = [
+            (campo, Union[Optional[tipo], msgspec.UnsetType], msgspec.UNSET)
+            for campo, tipo in campos.items()
+        ]
+        struct = msgspec.defstruct(
+            "Registro", definicion, gc=False,
+            namespace={"get": _get, "__getitem__": _getitem, "__contains__": _contains},
+        )
+        decodificador = _decodificadores[clave] = msgspec.json.Decoder(list[struct])
+    return decodificador
+
+
+def decodificar_structs(contenido, campos):
+    """Decodifica una lista de objetos a structs con solo ``campos``
+
+    ``campos`` es un diccionario ``nombre -> tipo`` (o una secuencia de
+    nombres). Devuelve None si msgspec no está instalado o el documento no
+    encaja con los tipos declarados, para que se use la vía genérica.
+    """
+    if msgspec is None:
+        return None
+    try:
+        return _decodificador(campos).decode(contenido)
+    except msgspec.ValidationError:
+        return None
@@ -0,0 +1,127 @@
+"""Exportador de Prometheus con sondeo en segundo plano
+
+Un planificador consulta cada host cada ``intervalo`` segundos (nunca dos
+sondeos del mismo host a la vez) y guarda en memoria sus muestras. Tras
+cada sondeo se regenera el cuerpo de ``/metrics``, así que un scrape solo
+devuelve bytes ya calculados: varias réplicas de Prometheus raspando a la
+vez no generan ni una petición más contra la API del NAS.
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from truenas.concurrencia import MAX_CONCURRENCIA
+from truenas.salida import muestras_host, texto_prometheus
+from truenas.sondeo import Sondeo
+
+# Valores por defecto (configurables por entorno)
+PUERTO = int(os.getenv('TRUENAS_EXPORTER_PUERTO', '9814'))
+DIRECCION = os.getenv('TRUENAS_EXPORTER_DIRECCION', '127.0.0.1')
+INTERVALO = float(os.getenv('TRUENAS_EXPORTER_INTERVALO', '30'))
+
+TIPO_CONTENIDO = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Exportador:
+    """Mantiene en memoria las métricas de varios hosts, refrescadas en segundo plano
+
+    ``hosts`` es una lista de ``(nombre, cliente)``. Cada host tiene su
+    propio ``Sondeo`` (series de I/O y caché de temperaturas) y su propia
+    entrada en la caché de muestras, de modo que un host lento o caído no
+    retrasa ni invalida al resto.
+    """
+
+    def __init__(self, hosts, intervalo=INTERVALO, max_concurrencia=None):
+        self.intervalo = intervalo
+        self.sondeos = {nombre: Sondeo(cliente) for nombre, cliente in hosts}
+        self.muestras = {nombre: list(muestras_host(nombre, [], error="Sin datos todavía"))
+                         for nombre in self.sondeos}
+        self.cuerpo = texto_prometheus(self._todas()).encode("utf-8")
+        self._lock = threading.Lock()
+        self._parar = threading.Event()
+        self._en_curso = set()
+        workers = max(1, min(max_concurrencia or MAX_CONCURRENCIA, len(self.sondeos)))
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="truenas-exportador")
+        self._hilo = None
+
+    def _todas(self):
+        return (muestra for muestras in list(self.muestras.values()) for muestra in muestras)
+
+    def sondear_host(self, nombre):
+        """Sondea un host y actualiza su entrada de la caché y el cuerpo de /metrics"""
+        inicio = time.monotonic()
+        try:
+            snapshot = self.sondeos[nombre].obtener_snapshot()
+            error = snapshot["error"]
+            muestras = list(muestras_host(nombre, snapshot["pools"] if not error else [],
+                                          snapshot["espacio_app_bytes"], error=error,
+                                          duracion=round(time.monotonic() - inicio, 3)))
+        except Exception as e:
+            muestras = list(muestras_host(nombre, [], error=str(e) or type(e).__name__,
+                                          duracion=round(time.monotonic() - inicio, 3)))
+        with self._lock:
+            self.muestras[nombre] = muestras
+            self.cuerpo = texto_prometheus(self._todas()).encode("utf-8")
+            self._en_curso.discard(nombre)
+
+    def _planificar(self):
+        proximos = dict.fromkeys(self.sondeos, 0.0)
+        while not self._parar.is_set():
+            ahora = time.monotonic()
+            for nombre, proximo in proximos.items():
+                with self._lock:
+                    if proximo > ahora or nombre in self._en_curso:
+                        continue
+                    self._en_curso.add(nombre)
+                proximos[nombre] = ahora + self.intervalo
+                self._executor.submit(self.sondear_host, nombre)
+            self._parar.wait(max(0.05, min(proximos.values()) - time.monotonic()))
+
+    def iniciar(self):
+        """Arranca el planificador en un hilo en segundo plano"""
+        self._hilo = threading.Thread(target=self._planificar, name="truenas-planificador", daemon=True)
+        self._hilo.start()
+
+    def parar(self):
+        self._parar.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def crear_servidor(exportador, direccion=DIRECCION, puerto=PUERTO):
+    """Servidor HTTP que sirve ``/metrics`` desde la memoria del exportador"""
+
+    class Manejador(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] == "/metrics":
+                self._responder(200, exportador.cuerpo, TIPO_CONTENIDO)
+            elif self.path == "/":
+                self._responder(200, b"truenas exporter: /metrics\n", "text/plain; charset=utf-8")
+            else:
+                self._responder(404, b"", "text/plain")
+
+        def _responder(self, codigo, cuerpo, tipo):
+            self.send_response(codigo)
+            self.send_header("Content-Type", tipo)
+            self.send_header("Content-Length", str(len(cuerpo)))
+            self.end_headers()
+            self.wfile.write(cuerpo)
+
+        def log_message(self, *args):
+            pass
+
+    return ThreadingHTTPServer((direccion, puerto), Manejador)
+
+
+def servir(exportador, direccion=DIRECCION, puerto=PUERTO):
+    """Arranca el planificador y sirve /metrics hasta Ctrl+C"""
+    servidor = crear_servidor(exportador, direccion, puerto)
+    exportador.iniciar()
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        exportador.parar()
+        servidor.server_close()
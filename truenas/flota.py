@@ -0,0 +1,143 @@
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+
+from truenas.auth import crear_cliente as crear_cliente_auth
+from truenas.concurrencia import MAX_CONCURRENCIA
+from truenas.formato import formatear_tamano
+from truenas.pools import extraer_datos_pools, obtener_pools
+
+# Timeout por host (segundos) aplicado a cada petición HTTP
+TIMEOUT_HOST = float(os.getenv('TRUENAS_TIMEOUT_HOST', '10'))
+# Reintentos por petición en modo flota: un nodo caído no debe retener a los demás
+REINTENTOS_HOST = 1
+
+
+def cargar_inventario(ruta):
+    """Lee el inventario de hosts (JSON) expandiendo variables de entorno
+
+    El archivo contiene una lista de hosts (o ``{"hosts": [...]}``) con
+    ``nombre``, ``url`` y credenciales según su proveedor de ``truenas.auth``:
+    ``api_key`` para ``auth: token``, ``usuario``/``password`` para
+    ``auth: basic`` o ``api_key_file`` para ``auth: token-archivo``. Los
+    valores admiten referencias ``${VARIABLE}`` para no guardar secretos
+    en claro.
+    """
+    with open(ruta, encoding="utf-8") as f:
+        datos = json.load(f)
+    hosts = datos.get("hosts", []) if isinstance(datos, dict) else datos
+
+    inventario = []
+    for host in hosts:
+        host = {k: os.path.expandvars(v) if isinstance(v, str) else v for k, v in host.items()}
+        if not host.get("url"):
+            raise ValueError(f"Host sin 'url' en el inventario: {host.get('nombre', host)}")
+        host.setdefault("nombre", host["url"])
+        host.setdefault("auth", "basic" if "usuario" in host else "token")
+        inventario.append(host)
+    return inventario
+
+
+def crear_cliente(host, timeout=TIMEOUT_HOST):
+    """Crea un cliente para un host del inventario con sus credenciales"""
+    opciones = {
+        "timeout": (min(5, timeout), timeout),
+        "reintentos": host.get("reintentos", REINTENTOS_HOST),
+        "verify": host.get("verify", False),
+    }
+    return crear_cliente_auth(host["auth"], host, **opciones)
+
+
+def recolectar_host(host, timeout=TIMEOUT_HOST, con_alertas=False):
+    """Obtiene los pools (con sus discos) de un host; nunca lanza excepciones
+
+    Con ``con_alertas`` añade ``alertas_nas`` (``/alert/list``, None si falla).
+    """
+    inicio = time.monotonic()
+    resultado = {"host": host["nombre"], "pools": [], "error": None}
+    try:
+        # La tabla de flota solo muestra estado, capacidad, errores y número de
+        # discos, y todo sale de la topología de /pool: no hace falta /disk
+        with crear_cliente(host, timeout) as cliente:
+            pools = obtener_pools(cliente)
+            if con_alertas:
+                resultado["alertas_nas"] = obtener_alertas_nas(cliente)
+        resultado["pools"] = extraer_datos_pools(pools, {})
+    except Exception as e:
+        resultado["error"] = str(e) or type(e).__name__
+    resultado["duracion"] = round(time.monotonic() - inicio, 3)
+    return resultado
+
+
+def obtener_alertas_nas(cliente):
+    try:
+        response = cliente.get("alert/list")
+        response.raise_for_status()
+        return response.json()
+    except Exception:
+        return None
+
+
+def recolectar_flota(hosts, max_concurrencia=None, timeout=TIMEOUT_HOST, limite_total=None, con_alertas=False):
+    """Consulta todos los hosts en paralelo y devuelve los resultados según llegan
+
+    La concurrencia está acotada por ``max_concurrencia``. Si se indica
+    ``limite_total`` (segundos), los hosts que no hayan respondido a
+    tiempo se devuelven con error sin esperar a sus hilos.
+    """
+    if not hosts:
+        return
+    workers = max(1, min(max_concurrencia or MAX_CONCURRENCIA, len(hosts)))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="truenas-flota")
+    futuros = {executor.submit(recolectar_host, host, timeout, con_alertas): host for host in hosts}
+    pendientes = set(futuros)
+    try:
+        for futuro in as_completed(futuros, timeout=limite_total):
+            pendientes.discard(futuro)
+            yield futuro.result()
+    except FuturesTimeout:
+        for futuro in pendientes:
+            yield {"host": futuros[futuro]["nombre"], "pools": [],
+                   "error": "Tiempo de espera agotado", "duracion": limite_total}
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def mostrar_tabla_flota(resultados, console):
+    """Muestra en una única tabla los pools de toda la flota"""
+    from rich.table import Table
+
+    tabla = Table(title="[bold green]ESTADO DE LA FLOTA[/bold green]", style="green", header_style="bold green")
+    for columna in ("Host", "Pool", "Estado", "Tamaño", "Libre", "Uso", "Errores L/E/C", "Discos", "Tiempo"):
+        tabla.add_column(columna)
+
+    errores_host = []
+    for resultado in sorted(resultados, key=lambda r: r["host"]):
+        tiempo = f"{resultado['duracion']:.2f}s" if resultado.get("duracion") is not None else "-"
+        if resultado["error"]:
+            tabla.add_row(resultado["host"], "-", "[red]INACCESIBLE[/red]", "-", "-", "-", "-", "-", tiempo)
+            errores_host.append((resultado["host"], resultado["error"]))
+            continue
+        if not resultado["pools"]:
+            tabla.add_row(resultado["host"], "-", "[yellow]Sin pools[/yellow]", "-", "-", "-", "-", "-", tiempo)
+            continue
+        for pool in resultado["pools"]:
+            errores = (pool.get("read_errors"), pool.get("write_errors"), pool.get("checksum_errors"))
+            hay_errores = any(isinstance(e, int) and e > 0 for e in errores)
+            color_errores = "red" if hay_errores else "green"
+            color_estado = "green" if pool["status"] == "ONLINE" else "red"
+            tabla.add_row(
+                resultado["host"],
+                pool["name"],
+                f"[{color_estado}]{pool['status']}[/{color_estado}]",
+                formatear_tamano(pool["size"]),
+                formatear_tamano(pool["available"]),
+                f"{pool['used_percent']:.1f}%",
+                f"[{color_errores}]{'/'.join(str(e) for e in errores)}[/{color_errores}]",
+                str(len(pool["disks"])),
+                tiempo,
+            )
+    console.print(tabla)
+    for host, error in errores_host:
+        console.print(f"[bold red]❌ {host}:[/bold red] {error}", overflow="ellipsis", no_wrap=True)
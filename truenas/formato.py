@@ -0,0 +1,7 @@
+def formatear_tamano(bytes):
+    """Convierte bytes a una unidad legible"""
+    for unidad in ['B', 'KB', 'MB', 'GB', 'TB', 'PB']:
+        if bytes < 1024.0:
+            return f"{bytes:.2f} {unidad}"
+        bytes /= 1024.0
+    return f"{bytes:.2f} PB"
@@ -0,0 +1,249 @@
+"""Generador del cliente tipado a partir de api-doc.json
+
+Uso::
+
+    python -m truenas.generador [api-doc.json] [truenas/api.py]
+"""
+import keyword
+import re
+import sys
+
+from truenas.spec import Spec
+
+RUTA_SALIDA = "truenas/api.py"
+PARAMETROS_PAGINACION = {"limit", "offset"}
+
+TIPOS_PYTHON = {
+    "string": "str",
+    "integer": "int",
+    "number": "float",
+    "boolean": "bool",
+    "array": "list",
+    "object": "dict",
+    "null": "None",
+}
+
+CABECERA = '''"""Cliente tipado de la API de TrueNAS
+
+GENERADO AUTOMÁTICAMENTE por ``python -m truenas.generador`` a partir de
+api-doc.json. No editar a mano: regenerar cuando cambie la especificación.
+"""
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional, Union
+
+from truenas.decodificacion import cargar
+
+# Tamaño de página por defecto de los iteradores paginados
+TAMANO_PAGINA = 500
+
+
+def _convertir(datos, cls):
+    """Convierte la respuesta JSON en instancias de ``cls`` (listas incluidas)"""
+    if cls is None:
+        return datos
+    if isinstance(datos, list):
+        return [cls.desde_dict(d) if isinstance(d, dict) else d for d in datos]
+    if isinstance(datos, dict):
+        return cls.desde_dict(datos)
+    return datos
+
+
+class _Modelo:
+    """Base de los modelos generados: construcción desde dict ignorando campos extra"""
+
+    __slots__ = ()
+    _claves = ()
+
+    @classmethod
+    def desde_dict(cls, datos):
+        return cls(*(datos.get(clave) for clave in cls._claves))
+
+    def a_dict(self):
+        return {clave: getattr(self, campo) for campo, clave in zip(self.__slots__, self._claves)}
+
+'''
+
+
+def nombre_identificador(texto):
+    """Convierte un texto arbitrario en un identificador Python válido"""
+    nombre = re.sub(r"\W", "_", texto).strip("_") or "campo"
+    if nombre[0].isdigit():
+        nombre = "_" + nombre
+    if keyword.iskeyword(nombre) or nombre in ("self", "cuerpo", "params"):
+        nombre += "_"
+    return nombre
+
+
+def nombre_clase(texto):
+    return "".join(parte.capitalize() for parte in re.split(r"\W|_", texto) if parte) or "Modelo"
+
+
+def nombre_metodo(ruta, metodo):
+    """``/pool/id/{id_}/scrub`` + POST -> ``pool_id_scrub_post``"""
+    partes = [p for p in ruta.strip("/").split("/") if p and not p.startswith("{")]
+    return nombre_identificador("_".join(partes + [metodo.lower()]))
+
+
+def tipo_anotacion(esquema):
+    """Anotación de tipo aproximada para un esquema"""
+    if not esquema:
+        return "Any"
+    if "anyOf" in esquema:
+        tipos = sorted({tipo_anotacion(opcion) for opcion in esquema["anyOf"]})
+        return "Any" if "Any" in tipos else (tipos[0] if len(tipos) == 1 else f"Union[{', '.join(tipos)}]")
+    tipo = esquema.get("type")
+    if isinstance(tipo, list):
+        tipos = [TIPOS_PYTHON.get(t, "Any") for t in tipo if t != "null"]
+        base = tipos[0] if len(tipos) == 1 else "Any"
+        return f"Optional[{base}]" if "null" in tipo and base != "Any" else base
+    return TIPOS_PYTHON.get(tipo, "Any")
+
+
+def esquema_objeto(esquema):
+    """Busca el esquema de objeto (con propiedades) de una respuesta
+
+    Las respuestas de tipo query son ``anyOf`` de lista de objetos, objeto
+    (``get``) o entero (``count``); se devuelve el esquema del objeto.
+    """
+    if not isinstance(esquema, dict):
+        return None
+    if esquema.get("properties"):
+        return esquema
+    for opcion in esquema.get("anyOf") or []:
+        encontrado = esquema_objeto(opcion)
+        if encontrado:
+            return encontrado
+    items = esquema.get("items")
+    if isinstance(items, list):
+        items = items[0] if items else None
+    return esquema_objeto(items)
+
+
+def generar_modelo(nombre, esquema):
+    campos = list(esquema["properties"].items())
+    slots = [nombre_identificador(clave) for clave, _ in campos]
+    # Evitar colisiones tras normalizar los nombres
+    vistos = set()
+    for i, slot in enumerate(slots):
+        while slot in vistos:
+            slot += "_"
+        slots[i] = slot
+        vistos.add(slot)
+    lineas = [
+        "@dataclass",
+        f"class {nombre}(_Modelo):",
+        f"    __slots__ = ({', '.join(repr(s) for s in slots)}{',' if len(slots) == 1 else ''})",
+        f"    _claves = ({', '.join(repr(c) for c, _ in campos)}{',' if len(campos) == 1 else ''})",
+        "",
+    ]
+    for slot, (_, subesquema) in zip(slots, campos):
+        lineas.append(f"    {slot}: {tipo_anotacion(subesquema)}")
+    return "\n".join(lineas) + "\n\n\n"
+
+
+def tipo_retorno(esquema, modelo):
+    """Anotación del valor devuelto: modelo, lista de modelos o ambos"""
+    if not modelo:
+        return "Any"
+    if esquema.get("properties"):
+        return modelo
+    if esquema.get("type") == "array":
+        return f"List[{modelo}]"
+    return f"Union[{modelo}, List[{modelo}], Any]"
+
+
+def docstring_operacion(descripcion):
+    """Primera línea de la descripción, segura dentro de un docstring"""
+    linea = (descripcion or "").strip().split("\n")[0].strip()
+    return linea.replace("\\", "\\\\").replace('"', "'")
+
+
+def generar_metodo(ruta, metodo, operacion, modelo, esquema, cuerpo):
+    nombre = nombre_metodo(ruta, metodo)
+    parametros_ruta = [p for p in operacion["parametros"] if p["in"] == "path"]
+    parametros_query = [p for p in operacion["parametros"] if p["in"] == "query"]
+    argumentos = ["self"] + [nombre_identificador(p["name"]) for p in parametros_ruta]
+    if cuerpo:
+        argumentos.append("cuerpo=None")
+    if parametros_query:
+        argumentos.append("**params")
+    ruta_formato = ruta.lstrip("/")
+    for p in parametros_ruta:
+        ruta_formato = ruta_formato.replace("{" + p["name"] + "}", "{" + nombre_identificador(p["name"]) + "}")
+    ruta_expr = f'f"{ruta_formato}"' if parametros_ruta else repr(ruta_formato)
+    llamada = [ruta_expr]
+    if cuerpo:
+        llamada.append("json=cuerpo")
+    if parametros_query:
+        llamada.append("params=params")
+    retorno = tipo_retorno(esquema or {}, modelo)
+    docstring = docstring_operacion(operacion["descripcion"]) or f"{metodo} /{ruta.lstrip('/')}"
+
+    lineas = [
+        f"    def {nombre}({', '.join(argumentos)}) -> {retorno}:",
+        f'        """{docstring}"""',
+        f"        return _convertir(self._llamar({metodo!r}, {', '.join(llamada)}), {modelo or 'None'})",
+        "",
+    ]
+    nombres_query = {p["name"] for p in parametros_query}
+    if metodo == "GET" and PARAMETROS_PAGINACION <= nombres_query:
+        argumentos_iter = [a for a in argumentos if a != "**params"] + ["tamano_pagina=TAMANO_PAGINA", "**params"]
+        lineas += [
+            f"    def iter_{nombre}({', '.join(argumentos_iter)}) -> Iterator[{modelo or 'Any'}]:",
+            f'        """Itera todos los resultados de /{ruta.lstrip("/")} paginando con limit/offset"""',
+            f"        return self._paginar({ruta_expr}, {modelo or 'None'}, tamano_pagina, params)",
+            "",
+        ]
+    return "\n".join(lineas) + "\n"
+
+
+def generar(spec):
+    """Genera el código fuente del cliente tipado"""
+    modelos = []
+    metodos = []
+    nombres_modelo = set()
+    for (ruta, metodo), operacion in sorted(spec.operaciones.items()):
+        modelo = None
+        respuesta = spec.esquema(operacion["respuesta"])
+        esquema = esquema_objeto(respuesta)
+        if esquema:
+            modelo = nombre_clase(nombre_metodo(ruta, metodo))
+            if modelo not in nombres_modelo:
+                nombres_modelo.add(modelo)
+                modelos.append(generar_modelo(modelo, esquema))
+        metodos.append(generar_metodo(ruta, metodo, operacion, modelo, respuesta, operacion["cuerpo"] is not None))
+
+    clase = [
+        "class ApiTrueNAS:",
+        '    """Un método por ruta y verbo de api-doc.json sobre un ``ClienteTrueNAS``"""',
+        "",
+        "    def __init__(self, cliente):",
+        "        self.cliente = cliente",
+        "",
+        "    def _llamar(self, metodo, ruta, **kwargs):",
+        "        response = self.cliente.request(metodo, ruta, **kwargs)",
+        "        response.raise_for_status()",
+        "        return cargar(response.content) if response.content else None",
+        "",
+        "    def _paginar(self, ruta, modelo, tamano_pagina, params):",
+        "        offset = params.pop(\"offset\", 0)",
+        "        while True:",
+        "            pagina = self._llamar(\"GET\", ruta, params=dict(params, limit=tamano_pagina, offset=offset))",
+        "            for elemento in pagina or []:",
+        "                yield _convertir(elemento, modelo)",
+        "            if not pagina or len(pagina) < tamano_pagina:",
+        "                return",
+        "            offset += tamano_pagina",
+        "",
+        "",
+    ]
+    return CABECERA + "\n" + "".join(modelos) + "\n".join(clase) + "".join(metodos).rstrip() + "\n"
+
+
+if __name__ == "__main__":
+    ruta_spec = sys.argv[1] if len(sys.argv) > 1 else None
+    ruta_salida = sys.argv[2] if len(sys.argv) > 2 else RUTA_SALIDA
+    codigo = generar(Spec(ruta_spec))
+    with open(ruta_salida, "w", encoding="utf-8") as f:
+        f.write(codigo)
+    print(f"Cliente generado en {ruta_salida}")
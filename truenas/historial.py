@@ -0,0 +1,170 @@
+import os
+import sqlite3
+import threading
+import time
+
+# Ruta de la base de datos de historial (vacío = no registrar)
+RUTA_HISTORIAL = os.getenv('TRUENAS_HISTORIAL', '')
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS pool_muestras (
+    ts REAL NOT NULL,
+    host TEXT NOT NULL,
+    pool TEXT NOT NULL,
+    status TEXT,
+    size INTEGER,
+    allocated INTEGER,
+    available INTEGER,
+    used_percent REAL,
+    read_errors INTEGER,
+    write_errors INTEGER,
+    checksum_errors INTEGER,
+    fragmentation INTEGER,
+    resilvering INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_pool_muestras ON pool_muestras (host, pool, ts);
+
+CREATE TABLE IF NOT EXISTS disco_muestras (
+    ts REAL NOT NULL,
+    host TEXT NOT NULL,
+    pool TEXT NOT NULL,
+    disco TEXT NOT NULL,
+    temperature REAL,
+    smart_status INTEGER,
+    read_errors INTEGER,
+    write_errors INTEGER,
+    checksum_errors INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_disco_muestras ON disco_muestras (host, pool, ts);
+
+CREATE TABLE IF NOT EXISTS dataset_muestras (
+    ts REAL NOT NULL,
+    host TEXT NOT NULL,
+    pool TEXT NOT NULL,
+    dataset TEXT NOT NULL,
+    used INTEGER,
+    available INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_dataset_muestras ON dataset_muestras (host, dataset, ts);
+"""
+
+CONTADORES = ("read_errors", "write_errors", "checksum_errors")
+
+
+class Historial:
+    """Almacén local (SQLite en modo WAL) de las instantáneas de cada sondeo
+
+    Solo se añaden filas: cada sondeo inserta en una única transacción
+    una fila por pool y una por disco. Los índices por (host, pool, ts)
+    permiten consultar la evolución sin volver a preguntar al NAS.
+    """
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self._lock = threading.Lock()
+        self.conexion = sqlite3.connect(ruta, check_same_thread=False)
+        self.conexion.execute("PRAGMA journal_mode=WAL")
+        self.conexion.execute("PRAGMA synchronous=NORMAL")
+        self.conexion.executescript(ESQUEMA)
+
+    def registrar(self, host, pools_data, ts=None):
+        """Guarda en lote los pools y discos de un sondeo"""
+        ts = time.time() if ts is None else ts
+        filas_pools = []
+        filas_discos = []
+        for pool in pools_data:
+            filas_pools.append((
+                ts, host, pool["name"], pool.get("status"), pool.get("size"), pool.get("allocated"),
+                pool.get("available"), pool.get("used_percent"),
+                pool.get("read_errors"), pool.get("write_errors"), pool.get("checksum_errors"),
+                pool.get("fragmentation"), int(bool(pool.get("resilvering"))),
+            ))
+            for disco in pool.get("disks", []):
+                smart = disco.get("smart_status")
+                filas_discos.append((
+                    ts, host, pool["name"], disco.get("name"), disco.get("temperature"),
+                    None if smart is None else int(bool(smart)),
+                    disco.get("read_errors"), disco.get("write_errors"), disco.get("checksum_errors"),
+                ))
+        with self._lock, self.conexion:
+            self.conexion.executemany(
+                "INSERT INTO pool_muestras VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", filas_pools)
+            self.conexion.executemany(
+                "INSERT INTO disco_muestras VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", filas_discos)
+
+    def registrar_datasets(self, host, datasets, ts=None):
+        """Guarda en lote el uso de los datasets ``(nombre, pool, usado, disponible)``"""
+        ts = time.time() if ts is None else ts
+        filas = [(ts, host, pool, nombre, usado, disponible) for nombre, pool, usado, disponible in datasets]
+        with self._lock, self.conexion:
+            self.conexion.executemany("INSERT INTO dataset_muestras VALUES (?, ?, ?, ?, ?, ?)", filas)
+
+    def _consultar(self, sql, parametros=()):
+        with self._lock:
+            return self.conexion.execute(sql, parametros).fetchall()
+
+    def pools(self, host=None):
+        """Lista los pares (host, pool) registrados"""
+        if host is None:
+            return self._consultar("SELECT DISTINCT host, pool FROM pool_muestras ORDER BY host, pool")
+        return self._consultar(
+            "SELECT DISTINCT host, pool FROM pool_muestras WHERE host = ? ORDER BY pool", (host,))
+
+    def capacidad(self, host, pool, desde=None):
+        """Serie ``(ts, allocated, size)`` de un pool desde ``desde`` (epoch)"""
+        return self._consultar(
+            "SELECT ts, allocated, size FROM pool_muestras WHERE host = ? AND pool = ? AND ts >= ? ORDER BY ts",
+            (host, pool, desde or 0))
+
+    def uso_dataset(self, host, dataset, desde=None):
+        """Serie ``(ts, used, available)`` de un dataset desde ``desde`` (epoch)"""
+        return self._consultar(
+            "SELECT ts, used, available FROM dataset_muestras WHERE host = ? AND dataset = ? AND ts >= ? ORDER BY ts",
+            (host, dataset, desde or 0))
+
+    def datasets(self, host, pool):
+        """Nombres de los datasets registrados de un pool"""
+        return [fila[0] for fila in self._consultar(
+            "SELECT DISTINCT dataset FROM dataset_muestras WHERE host = ? AND pool = ? ORDER BY dataset",
+            (host, pool))]
+
+    def crecimiento(self, host, pool, dias=30):
+        """Crecimiento del espacio usado en los últimos ``dias``
+
+        Devuelve ``(primera, ultima)`` como tuplas ``(ts, allocated, size)``
+        o None si no hay datos suficientes.
+        """
+        desde = time.time() - dias * 86400
+        primera = self._consultar(
+            "SELECT ts, allocated, size FROM pool_muestras WHERE host = ? AND pool = ? AND ts >= ? "
+            "ORDER BY ts LIMIT 1", (host, pool, desde))
+        ultima = self._consultar(
+            "SELECT ts, allocated, size FROM pool_muestras WHERE host = ? AND pool = ? AND ts >= ? "
+            "ORDER BY ts DESC LIMIT 1", (host, pool, desde))
+        if not primera or primera[0][0] == ultima[0][0]:
+            return None
+        return primera[0], ultima[0]
+
+    def primer_error(self, host, pool, contador="checksum_errors", disco=None):
+        """Primer instante en que ``contador`` fue distinto de cero (o None)"""
+        if contador not in CONTADORES:
+            raise ValueError(f"Contador desconocido: {contador}")
+        if disco is None:
+            filas = self._consultar(
+                f"SELECT MIN(ts) FROM pool_muestras WHERE host = ? AND pool = ? AND {contador} > 0",
+                (host, pool))
+        else:
+            filas = self._consultar(
+                f"SELECT MIN(ts) FROM disco_muestras WHERE host = ? AND pool = ? AND disco = ? AND {contador} > 0",
+                (host, pool, disco))
+        return filas[0][0] if filas else None
+
+    def close(self):
+        with self._lock:
+            self.conexion.close()
+
+
+def abrir_historial(ruta=None):
+    """Abre el historial configurado o devuelve None si no se registra"""
+    ruta = ruta or RUTA_HISTORIAL
+    return Historial(ruta) if ruta else None
@@ -0,0 +1,166 @@
+import os
+import tempfile
+import time
+from urllib.parse import urljoin
+
+from truenas.backup import guardar_stream
+
+# Polling adaptativo de /core/get_jobs (segundos)
+INTERVALO_INICIAL = 0.25
+INTERVALO_MAXIMO = 5.0
+FACTOR_BACKOFF = 1.5
+
+ESTADOS_FINALES = ("SUCCESS", "FAILED", "ABORTED")
+
+
+class ErrorJob(Exception):
+    """Un job de TrueNAS terminó en FAILED/ABORTED o no terminó a tiempo"""
+
+    def __init__(self, job_id, mensaje, job=None):
+        super().__init__(f"Job {job_id}: {mensaje}")
+        self.job_id = job_id
+        self.job = job
+
+
+def iniciar_job(cliente, ruta, cuerpo=None):
+    """Llama a un endpoint que devuelve un job y retorna su id"""
+    response = cliente.post(ruta, json=cuerpo)
+    response.raise_for_status()
+    return response.json()
+
+
+def iniciar_scrub(cliente, pool_id, accion="START"):
+    """Inicia (o pausa/detiene) el scrub de un pool y retorna el id del job"""
+    return iniciar_job(cliente, f"pool/id/{pool_id}/scrub", accion)
+
+
+def consultar_jobs(cliente, ids):
+    """Obtiene el estado de varios jobs de un host en una sola petición"""
+    ids = set(ids)
+    if len(ids) == 1:
+        params = {"id": next(iter(ids))}
+    else:
+        params = {"id__gte": min(ids), "id__lte": max(ids)}
+    response = cliente.get("core/get_jobs", params=params)
+    response.raise_for_status()
+    return {job["id"]: job for job in response.json() if job.get("id") in ids}
+
+
+def comprobar_job(job):
+    """Lanza ErrorJob si el job terminó con error; si no, devuelve el job"""
+    if job.get("state") in ("FAILED", "ABORTED"):
+        raise ErrorJob(job.get("id"), job.get("error") or job.get("state"), job)
+    return job
+
+
+class SeguidorJobs:
+    """Sigue muchos jobs (de uno o varios hosts) desde un único hilo
+
+    En cada ronda se hace una sola petición a ``/core/get_jobs`` por host
+    con todos sus jobs pendientes. El intervalo entre rondas crece con
+    backoff mientras no haya cambios y vuelve al mínimo cuando algún job
+    avanza, así los jobs cortos se detectan rápido y los largos no
+    saturan la API.
+    """
+
+    def __init__(self, intervalo_inicial=INTERVALO_INICIAL, intervalo_maximo=INTERVALO_MAXIMO):
+        self.intervalo_inicial = intervalo_inicial
+        self.intervalo_maximo = intervalo_maximo
+        self.pendientes = {}  # cliente -> {job_id: clave}
+        self.resultados = {}  # clave -> job
+        self.progreso = {}
+
+    def agregar(self, cliente, job_id, clave=None):
+        """Registra un job; ``clave`` identifica el resultado (por defecto el id)"""
+        clave = job_id if clave is None else clave
+        self.pendientes.setdefault(cliente, {})[job_id] = clave
+        return clave
+
+    def esperar(self, timeout=None, al_terminar=None):
+        """Espera a que terminen todos los jobs y devuelve ``clave -> job``
+
+        ``al_terminar(clave, job)`` se invoca en cuanto termina cada job.
+        Los errores de un job quedan en su resultado (``state``); usar
+        ``comprobar_job`` para convertirlos en excepción.
+        """
+        limite = time.monotonic() + timeout if timeout is not None else None
+        intervalo = self.intervalo_inicial
+        while self.pendientes:
+            hubo_cambios = False
+            for cliente, jobs in list(self.pendientes.items()):
+                for job_id, job in consultar_jobs(cliente, jobs).items():
+                    progreso = (job.get("state"), (job.get("progress") or {}).get("percent"))
+                    if self.progreso.get((cliente, job_id)) != progreso:
+                        self.progreso[(cliente, job_id)] = progreso
+                        hubo_cambios = True
+                    if job.get("state") in ESTADOS_FINALES:
+                        clave = jobs.pop(job_id)
+                        self.resultados[clave] = job
+                        if al_terminar is not None:
+                            al_terminar(clave, job)
+                if not jobs:
+                    del self.pendientes[cliente]
+            if not self.pendientes:
+                break
+            if limite is not None and time.monotonic() >= limite:
+                ids = [job_id for jobs in self.pendientes.values() for job_id in jobs]
+                raise ErrorJob(ids, "tiempo de espera agotado")
+
+            intervalo = self.intervalo_inicial if hubo_cambios else min(intervalo * FACTOR_BACKOFF, self.intervalo_maximo)
+            if limite is not None:
+                intervalo = min(intervalo, max(0.0, limite - time.monotonic()))
+            time.sleep(intervalo)
+        return self.resultados
+
+
+def esperar_job(cliente, job_id, timeout=None, bloqueante=False):
+    """Espera a que termine un job y devuelve su información
+
+    Con ``bloqueante=True`` se usa ``core/job_wait``, que no responde
+    hasta que el job termina; si no, se hace polling con backoff.
+    """
+    if bloqueante:
+        response = cliente.post("core/job_wait", json=job_id,
+                                timeout=(cliente.timeout[0], timeout) if timeout else None)
+        response.raise_for_status()
+        return comprobar_job(consultar_jobs(cliente, [job_id])[job_id])
+    seguidor = SeguidorJobs()
+    seguidor.agregar(cliente, job_id)
+    return comprobar_job(seguidor.esperar(timeout=timeout)[job_id])
+
+
+def descargar_resultado_job(cliente, metodo, args, destino, nombre_archivo=None,
+                            timeout=None, chunk_size=None, console=None):
+    """Lanza un job de descarga vía ``core/download`` y guarda el archivo en streaming
+
+    El job escribe directamente en la conexión de descarga (no buffered),
+    así que el archivo se transmite mientras se genera. La descarga se
+    guarda en un temporal que solo se renombra a ``destino`` si el job
+    termina en SUCCESS; si falla, se borra y no queda un archivo truncado
+    con el nombre definitivo.
+    """
+    response = cliente.post("core/download", json={
+        "method": metodo,
+        "args": args,
+        "filename": nombre_archivo or metodo,
+        "buffered": False,
+    })
+    response.raise_for_status()
+    job_id, url = response.json()
+
+    descarga = cliente.session.get(urljoin(cliente.url, url), stream=True, timeout=cliente.timeout)
+    descarga.raise_for_status()
+    directorio = os.path.dirname(os.path.abspath(destino))
+    os.makedirs(directorio, exist_ok=True)
+    fd, temporal = tempfile.mkstemp(prefix=".truejob_", suffix=".part", dir=directorio)
+    os.close(fd)
+    try:
+        resultado = guardar_stream(descarga, temporal, chunk_size=chunk_size, console=console)
+        resultado["job"] = esperar_job(cliente, job_id, timeout=timeout)
+        os.replace(temporal, destino)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.unlink(temporal)
+        raise
+    resultado["archivo"] = destino
+    return resultado
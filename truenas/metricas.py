@@ -0,0 +1,195 @@
+import math
+import time
+from array import array
+
+from truenas.decodificacion import cargar
+
+# Muestras que dibuja la sparkline y segundos entre muestras de reporting
+ANCHO_SPARKLINE = 30
+PASO_MUESTRAS = 1
+# Ventana inicial (segundos) de la primera consulta a /reporting/get_data: solo
+# lo que se muestra. El modo watch, que vive más, pide la ventana larga
+VENTANA_INICIAL = ANCHO_SPARKLINE * PASO_MUESTRAS
+VENTANA_WATCH = 600
+# Muestras que se conservan por serie (a 1 muestra/s, ~10 minutos)
+CAPACIDAD_SERIE = 600
+# Los gráficos ``disk`` de netdata reportan lecturas/escrituras en KiB/s
+FACTOR_BYTES_DISK = 1024
+
+BLOQUES_SPARKLINE = "▁▂▃▄▅▆▇█"
+
+
+class SerieTemporal:
+    """Buffer circular compacto (``array('d')``) para una serie de reporting
+
+    Guarda los instantes y una columna por cada valor de la leyenda sin
+    crear un objeto por muestra; al llenarse sobrescribe las más antiguas.
+    """
+
+    __slots__ = ("leyenda", "capacidad", "tiempos", "columnas", "inicio", "tamano")
+
+    def __init__(self, leyenda, capacidad=CAPACIDAD_SERIE):
+        self.leyenda = list(leyenda)
+        self.capacidad = capacidad
+        self.tiempos = array('d', bytes(8 * capacidad))
+        self.columnas = {nombre: array('d', bytes(8 * capacidad)) for nombre in self.leyenda}
+        self.inicio = 0
+        self.tamano = 0
+
+    @property
+    def ultimo_ts(self):
+        if not self.tamano:
+            return None
+        return self.tiempos[(self.inicio + self.tamano - 1) % self.capacidad]
+
+    def agregar(self, ts, valores):
+        """Añade una muestra; ignora las que no son más recientes que la última"""
+        ultimo = self.ultimo_ts
+        if ultimo is not None and ts <= ultimo:
+            return False
+        if self.tamano < self.capacidad:
+            posicion = (self.inicio + self.tamano) % self.capacidad
+            self.tamano += 1
+        else:
+            posicion = self.inicio
+            self.inicio = (self.inicio + 1) % self.capacidad
+        self.tiempos[posicion] = ts
+        for nombre, valor in zip(self.leyenda, valores):
+            self.columnas[nombre][posicion] = math.nan if valor is None else valor
+        return True
+
+    def valores(self, nombre):
+        """Devuelve los valores de una columna en orden cronológico"""
+        columna = self.columnas[nombre]
+        fin = self.inicio + self.tamano
+        if fin <= self.capacidad:
+            return columna[self.inicio:fin]
+        return columna[self.inicio:] + columna[:fin - self.capacidad]
+
+    def ultimo(self, nombre):
+        """Último valor válido de una columna (o None)"""
+        for valor in reversed(self.valores(nombre)):
+            if not math.isnan(valor):
+                return valor
+        return None
+
+
+def sparkline(valores, ancho=ANCHO_SPARKLINE):
+    """Dibuja una mini-gráfica con bloques Unicode de los últimos ``ancho`` valores"""
+    valores = [v for v in valores[-ancho:] if not math.isnan(v)]
+    if not valores:
+        return ""
+    minimo, maximo = min(valores), max(valores)
+    rango = (maximo - minimo) or 1.0
+    escala = len(BLOQUES_SPARKLINE) - 1
+    return "".join(BLOQUES_SPARKLINE[int((v - minimo) / rango * escala)] for v in valores)
+
+
+class Metricas:
+    """Series de I/O de discos obtenidas de ``/reporting/get_data``
+
+    Todas las series se piden en una única petición por sondeo y, tras la
+    primera, solo se solicita la ventana de tiempo nueva desde la última
+    muestra recibida. Un disco nuevo pide su ventana inicial por separado
+    y uno sin muestras no obliga a repetir la ventana de los demás.
+    """
+
+    def __init__(self, capacidad=CAPACIDAD_SERIE, ventana_inicial=VENTANA_INICIAL):
+        self.capacidad = capacidad
+        self.ventana_inicial = ventana_inicial
+        self.series = {}  # (grafico, identificador) -> SerieTemporal
+        # Gráficos que en su última consulta no devolvieron muestras -> fin de esa consulta
+        self.sin_datos = {}
+
+    def _cursor(self, clave):
+        """Último instante consultado de un gráfico (None si nunca se ha visto)"""
+        serie = self.series.get(clave)
+        ultimo = serie.ultimo_ts if serie is not None else None
+        vacio = self.sin_datos.get(clave)
+        if ultimo is None:
+            return vacio
+        return ultimo if vacio is None else max(ultimo, vacio)
+
+    def _consultar(self, cliente, graficos, inicio, ahora):
+        response = cliente.post("reporting/get_data", json={
+            "graphs": [{"name": nombre, "identifier": identificador} for nombre, identificador in graficos],
+            "query": {"start": inicio, "end": ahora, "aggregate": False},
+        })
+        response.raise_for_status()
+        con_datos = set()
+        for grafico in cargar(response.content):
+            clave = (grafico["name"], grafico.get("identifier"))
+            leyenda = grafico.get("legend") or []
+            serie = self.series.get(clave)
+            if serie is None or serie.leyenda != leyenda[1:]:
+                serie = self.series[clave] = SerieTemporal(leyenda[1:], self.capacidad)
+            for fila in grafico.get("data") or []:
+                if fila and fila[0] is not None and serie.agregar(fila[0], fila[1:]):
+                    con_datos.add(clave)
+        # Los gráficos sin muestras nuevas (discos inactivos, omitidos en la
+        # respuesta) avanzan igualmente para no volver a pedir su ventana
+        for clave in graficos:
+            if clave in con_datos:
+                self.sin_datos.pop(clave, None)
+            else:
+                self.sin_datos[clave] = ahora
+
+    def actualizar(self, cliente, graficos):
+        """Consulta en lote los gráficos ``(nombre, identificador)`` y añade las muestras nuevas
+
+        Los gráficos ya vistos piden solo la ventana desde su último
+        instante; los nuevos, la ventana inicial en una petición aparte.
+        """
+        graficos = list(dict.fromkeys(graficos))
+        if not graficos:
+            return
+        ahora = int(time.time())
+        cursores = {clave: self._cursor(clave) for clave in graficos}
+        nuevos = [clave for clave, cursor in cursores.items() if cursor is None]
+        conocidos = [clave for clave, cursor in cursores.items() if cursor is not None]
+        if nuevos:
+            self._consultar(cliente, nuevos, ahora - self.ventana_inicial, ahora)
+        if conocidos:
+            inicio = int(min(cursores[clave] for clave in conocidos)) + 1
+            if inicio < ahora:
+                self._consultar(cliente, conocidos, inicio, ahora)
+
+    def actualizar_discos(self, cliente, nombres_discos):
+        """Consulta las series de I/O de una lista de discos"""
+        self.actualizar(cliente, [("disk", nombre) for nombre in nombres_discos if nombre])
+
+    def io_pool(self, pool):
+        """Tasas actuales (bytes/s) e historial de I/O de un pool sumando sus discos"""
+        series = [self.series.get(("disk", disco.get("name"))) for disco in pool.get("disks", [])]
+        series = [s for s in series
+                  if s is not None and s.tamano and "reads" in s.columnas and "writes" in s.columnas]
+        if not series:
+            return None
+
+        def suma(columna):
+            n = min(s.tamano for s in series)
+            total = array('d', bytes(8 * n))
+            for serie in series:
+                valores = serie.valores(columna)[-n:]
+                for i, valor in enumerate(valores):
+                    if not math.isnan(valor):
+                        total[i] += valor * FACTOR_BYTES_DISK
+            return total
+
+        lecturas, escrituras = suma("reads"), suma("writes")
+        return {
+            "read_rate": lecturas[-1],
+            "write_rate": escrituras[-1],
+            "read_history": sparkline(lecturas),
+            "write_history": sparkline(escrituras),
+        }
+
+
+def enriquecer_pools(metricas, cliente, pools_data):
+    """Actualiza las series de los discos de los pools y añade sus tasas de I/O"""
+    metricas.actualizar_discos(cliente, [d.get("name") for pool in pools_data for d in pool.get("disks", [])])
+    for pool in pools_data:
+        io = metricas.io_pool(pool)
+        if io is not None:
+            pool.update(io)
+    return pools_data
@@ -0,0 +1,384 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+
+from rich.console import Group
+from rich.markup import escape
+from rich.panel import Panel
+from rich.progress import BarColumn, Progress, TextColumn
+from rich.rule import Rule
+from rich.segment import Segment
+from rich.style import Style
+from rich.text import Text
+
+from truenas.formato import formatear_tamano
+
+# Fotogramas por segundo del modo watch (0 desactiva la animación del reloj).
+# Cada fotograma reenvía la vista completa al terminal, así que por defecto el
+# reloj queda fijo en la hora del último cambio y solo se redibuja con datos nuevos
+FPS_POR_DEFECTO = 0
+
+LOGO = r"""
+    [green]
+ooooooooo.    o8o                    .oooooo.     o8o           oooo  
+`888   `Y88.  `"'                   d8P'  `Y8b    `"'           `888  
+ 888   .d88' oooo  oo.ooooo.       888           oooo  oooo d8b  888  
+ 888ooo88P'  `888   888' `88b      888           `888  `888""8P  888  
+ 888          888   888   888      888     ooooo  888   888      888  
+ 888          888   888   888      `88.    .88'   888   888      888  
+o888o        o888o  888bod8P'       `Y8bood8P'   o888o d888b    o888o 
+                    888                                               
+                   o888o                                              
+                                                                                                                 
+    [/green]
+    """
+
+
+def formatear_dias(dias):
+    """Formatea una cantidad de días de previsión"""
+    if dias is None:
+        return "nunca"
+    return "ya" if dias <= 0 else f"{dias:.0f} d"
+
+
+def formatear_crecimiento(bytes_dia):
+    """Formatea un crecimiento en bytes por día (con signo)"""
+    if bytes_dia is None:
+        return "N/A"
+    signo = "-" if bytes_dia < 0 else "+"
+    return f"{signo}{formatear_tamano(abs(bytes_dia))}/día"
+
+
+def hay_errores(pool):
+    """Indica si el pool tiene errores de lectura, escritura o checksum"""
+    return any(
+        isinstance(pool.get(campo), int) and pool.get(campo) > 0
+        for campo in ("read_errors", "write_errors", "checksum_errors")
+    )
+
+
+def construir_panel_pool(pool):
+    """Construye los renderables de un pool: cabecera, uso, errores, detalles y discos"""
+    nombre = pool["name"]
+    estado = pool["status"]
+    size = pool.get("size")
+    available = pool.get("available")
+    used_percent = pool.get("used_percent")
+
+    # Encabezado del pool
+    text_header = f"[green]Nombre:[/green] {nombre}   [green]Estado:[/green] {estado}"
+    partes = [Panel(text_header, style=Style(color="green"))]
+
+    # Mostrar detalles si están disponibles
+    if not (size and available is not None and used_percent is not None):
+        partes.append(Text.from_markup("[yellow]Información no disponible[/yellow]"))
+        return Group(*partes)
+
+    # Espacio y uso
+    partes.append(Text.from_markup(f"[green]Tamaño:[/green] {formatear_tamano(size)}"))
+    partes.append(Text.from_markup(f"[green]Libre: [/green]{formatear_tamano(available)}"))
+
+    # Barra de progreso
+    progress = Progress(
+        TextColumn("[progress.description]{task.description}", style="green"),
+        BarColumn(bar_width=40, complete_style="green", finished_style="green"),
+        TextColumn("[green]{task.percentage:>3.0f}% usado"),
+    )
+    progress.add_task("Uso", total=100, completed=used_percent)
+    partes.append(progress.get_renderable())
+
+    # Mostrar errores con color apropiado
+    color = 'red' if hay_errores(pool) else 'green'
+    for etiqueta, campo in (("lectura", "read_errors"), ("escritura", "write_errors"), ("checksum", "checksum_errors")):
+        partes.append(Text.from_markup(f"[{color}]Errores de {etiqueta}:[/{color}] {pool.get(campo, 'N/A')}"))
+
+    # Detalles técnicos
+    resilver_info = "[red]Sí[/red]" if pool.get("resilvering", False) else "[green]No[/green]"
+
+    ops = pool.get("ops") or []
+    read_ops = ops[1] if len(ops) > 1 else "N/A"
+    write_ops = ops[2] if len(ops) > 2 else "N/A"
+
+    bytes_list = pool.get("bytes") or []
+    read_bytes = bytes_list[1] if len(bytes_list) > 1 else 0
+    write_bytes = bytes_list[2] if len(bytes_list) > 2 else 0
+
+    # Tasas reales por segundo (reporting/get_data), si están disponibles
+    if pool.get("read_rate") is not None:
+        read_rate = f"{formatear_tamano(pool['read_rate'])}/s  [green]{pool.get('read_history', '')}[/green]"
+        write_rate = f"{formatear_tamano(pool['write_rate'])}/s  [green]{pool.get('write_history', '')}[/green]"
+    else:
+        read_rate = write_rate = "N/A"
+
+    extra_info = f"""
+[green]¿Resilvering?:[/green] {resilver_info}
+[green]Fragmentación:[/green] {pool.get("fragmentation", "N/A")}%
+[green]Self-Healed:[/green] {pool.get("self_healed", "N/A")}
+[green]Ashift (conf):[/green] {pool.get("configured_ashift", "N/A")}
+[green]Ashift lógico:[/green] {pool.get("logical_ashift", "N/A")}
+[green]Ashift físico:[/green] {pool.get("physical_ashift", "N/A")}
+[green]Lectura:[/green] {read_rate}
+[green]Escritura:[/green] {write_rate}
+[green]Operaciones de lectura (total):[/green] {read_ops}
+[green]Operaciones de escritura (total):[/green] {write_ops}
+[green]Bytes leídos (total):[/green] {formatear_tamano(read_bytes)}
+[green]Bytes escritos (total):[/green] {formatear_tamano(write_bytes)}
+"""
+    partes.append(Panel(extra_info.strip(), title="[bold green]Detalles técnicos[/bold green]", style="green"))
+
+    # Previsión de llenado (pool y datasets con más uso)
+    forecast = pool.get("forecast")
+    if forecast and forecast.get("growth_per_day") is not None:
+        lineas = [
+            f"[green]Crecimiento:[/green] {formatear_crecimiento(forecast['growth_per_day'])}",
+            f"[green]Días hasta 80% / 90% / lleno:[/green] {formatear_dias(forecast.get('days_to_80'))}"
+            f" / {formatear_dias(forecast.get('days_to_90'))} / {formatear_dias(forecast.get('days_to_100'))}",
+        ]
+        for dataset in pool.get("dataset_forecasts") or []:
+            lineas.append(
+                f"[green]{dataset['name']}:[/green] {formatear_tamano(dataset['used'])}, "
+                f"{formatear_crecimiento(dataset.get('growth_per_day'))}, lleno en {formatear_dias(dataset.get('days_to_100'))}"
+            )
+        partes.append(Panel("\n".join(lineas), title="[bold green]Previsión[/bold green]", style="green"))
+
+    # Panel de vdevs (todas las clases del árbol de topología)
+    vdevs = pool.get("vdevs", [])
+    if vdevs:
+        vdev_lines = []
+        for vdev in vdevs:
+            errores = tuple(vdev.get(campo, 0) for campo in ("read_errors", "write_errors", "checksum_errors"))
+            color = "red" if any(errores) or vdev.get("status") not in (None, "ONLINE") else "green"
+            vdev_lines.append(
+                f"[{color}]{vdev['class']}[/{color}] {vdev.get('name')} ({vdev.get('type')}, {vdev.get('disks')} discos): "
+                f"{vdev.get('status')} - Errores L/E/C: [{color}]{'/'.join(map(str, errores))}[/{color}]"
+            )
+        partes.append(Panel("\n".join(vdev_lines), title="[bold green]Vdevs[/bold green]", style="green"))
+
+    # Panel de discos
+    discos = pool.get("disks", [])
+    if discos:
+        disco_lines = []
+        for disco in discos:
+            estado = "[green]OK[/green]" if disco.get("smart_status") else "[red]Fallo[/red]"
+            temp = disco.get("temperature", "N/A")
+            linea = f"{disco.get('name')}: {estado} - Temp: {temp}°C"
+            if disco.get("temperature_avg") is not None:
+                linea += (f" (mín {disco.get('temperature_min')} / máx {disco.get('temperature_max')}"
+                          f" / media {disco['temperature_avg']:.0f})")
+            if "read_errors" in disco:
+                errores = tuple(disco.get(campo, 0) for campo in ("read_errors", "write_errors", "checksum_errors"))
+                color = "red" if any(errores) else "green"
+                linea += f" - Errores L/E/C: [{color}]{'/'.join(map(str, errores))}[/{color}]"
+            disco_lines.append(linea)
+        partes.append(Panel("\n".join(disco_lines), title="[bold green]Discos físicos[/bold green]", style="green"))
+
+    return Group(*partes)
+
+
+def firma_pool(pool):
+    """Resume los campos visibles de un pool para detectar cambios entre sondeos"""
+    return (
+        pool.get("status"), pool.get("size"), pool.get("available"), pool.get("used_percent"),
+        pool.get("read_errors"), pool.get("write_errors"), pool.get("checksum_errors"),
+        pool.get("resilvering"), pool.get("fragmentation"), pool.get("self_healed"),
+        pool.get("configured_ashift"), pool.get("logical_ashift"), pool.get("physical_ashift"),
+        tuple(pool.get("ops") or ()), tuple(pool.get("bytes") or ()),
+        pool.get("read_rate"), pool.get("write_rate"),
+        tuple(None if v is None else round(v) for v in (pool.get("forecast") or {}).values()),
+        tuple((d.get("name"), d.get("used"), None if d.get("days_to_100") is None else round(d["days_to_100"]))
+              for d in pool.get("dataset_forecasts") or ()),
+        tuple((v.get("name"), v.get("status"), v.get("read_errors"), v.get("write_errors"), v.get("checksum_errors"))
+              for v in pool.get("vdevs", [])),
+        tuple((d.get("name"), d.get("smart_status"), d.get("temperature"), d.get("temperature_avg"),
+               d.get("read_errors"), d.get("write_errors"), d.get("checksum_errors"))
+              for d in pool.get("disks", [])),
+    )
+
+
+class RenderCacheado:
+    """Renderable que guarda sus líneas ya renderizadas para un ancho dado
+
+    Mientras no cambie el ancho del terminal, volver a dibujarlo solo
+    copia los segmentos guardados en lugar de recomponer paneles y barras.
+    """
+
+    def __init__(self, renderable):
+        self.renderable = renderable
+        self._ancho = None
+        self._lineas = None
+
+    def __rich_console__(self, console, options):
+        if self._ancho != options.max_width:
+            self._lineas = console.render_lines(self.renderable, options.update(height=None), pad=False)
+            self._ancho = options.max_width
+        nueva_linea = Segment.line()
+        for linea in self._lineas:
+            yield from linea
+            yield nueva_linea
+
+
+class CachePaneles:
+    """Caché de paneles por pool: solo se reconstruyen los pools que cambiaron"""
+
+    def __init__(self):
+        self._paneles = {}  # nombre -> (firma, RenderCacheado)
+        self.reconstruidos = 0
+
+    def obtener(self, pool):
+        firma = firma_pool(pool)
+        cacheado = self._paneles.get(pool["name"])
+        if cacheado is not None and cacheado[0] == firma:
+            return cacheado[1]
+        panel = RenderCacheado(construir_panel_pool(pool))
+        self._paneles[pool["name"]] = (firma, panel)
+        self.reconstruidos += 1
+        return panel
+
+    def actualizar(self, pools_info):
+        """Devuelve los paneles de todos los pools y descarta los que ya no existen"""
+        self.reconstruidos = 0
+        paneles = [self.obtener(pool) for pool in pools_info]
+        vigentes = {pool["name"] for pool in pools_info}
+        for nombre in list(self._paneles):
+            if nombre not in vigentes:
+                del self._paneles[nombre]
+                self.reconstruidos += 1
+        return paneles
+
+
+class Reloj:
+    """Reloj con los dos puntos parpadeantes; muestra la hora al renderizarse
+
+    Forma parte de la misma composición que los paneles, así que lo
+    anima el bucle de refresco y no necesita un hilo propio.
+    """
+
+    def __init__(self, parpadeo=True):
+        self.parpadeo = parpadeo
+
+    def texto(self):
+        hora_actual = datetime.now().strftime("%H:%M:%S")
+        # Parpadeo: mostrar o no mostrar los dos puntos
+        if self.parpadeo and int(time.time() * 2) % 2:
+            hora_actual = hora_actual.replace(':', ' ')
+        return hora_actual
+
+    def __rich_console__(self, console, options):
+        yield Text(self.texto(), style="green", justify="center")
+
+
+def mostrar_estado(console, pools_info, espacio_app=None):
+    """Muestra una vez el estado de los pools con la interfaz Pip-Boy"""
+    console.clear()
+    console.print(LOGO, justify="center")
+    console.rule("[bold green]ESTADO DE LOS POOLS[/bold green]")
+    console.print(Reloj(parpadeo=False))
+
+    for pool in pools_info:
+        console.print(construir_panel_pool(pool))
+
+        # Alerta si hay errores
+        if hay_errores(pool):
+            console.bell()
+
+        console.print("\n")
+
+    if espacio_app is not None:
+        console.print("\nEspacio disponible para aplicaciones:")
+        console.print(f"  {espacio_app} GB")
+
+
+def modo_watch(obtener_snapshot, intervalo, console, fps=FPS_POR_DEFECTO):
+    """Monitoriza los pools refrescando cada ``intervalo`` segundos
+
+    Un único bucle dibuja reloj y paneles con rich.live; la consulta a la
+    API se lanza en segundo plano para no congelar la vista. Con ``fps``
+    mayor que 0 el reloj se anima y la vista se reenvía cada vez que cambia
+    su texto (como mucho dos veces por segundo). Los paneles de los pools sin cambios se
+    reutilizan desde la caché. No se usa pantalla completa: con muchos
+    pools la salida crece por debajo del terminal y se puede desplazar.
+    Con ``fps=0`` (por defecto) solo se redibuja cuando algún pool o el pie
+    cambian, y si la salida no es un terminal no hay animación: se
+    imprime el estado cada vez que cambia.
+    """
+    cache = CachePaneles()
+    if not console.is_terminal:
+        return _watch_sin_terminal(obtener_snapshot, intervalo, console, cache)
+
+    from rich.live import Live
+
+    cabecera = RenderCacheado(Group(
+        Text.from_markup(LOGO, justify="center"),
+        Rule("[bold green]ESTADO DE LOS POOLS[/bold green]"),
+    ))
+    reloj = Reloj(parpadeo=fps > 0)
+    paneles = []
+    texto_pie = "[green]Consultando...[/green]"
+    pie = Text.from_markup(texto_pie)
+    fotograma = 1 / fps if fps > 0 else None
+    proximo_sondeo = time.monotonic()
+    futuro = None
+    cambios = True
+    texto_reloj = None
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="truenas-watch") as executor, \
+            Live(console=console, auto_refresh=False, vertical_overflow="visible") as live:
+        try:
+            while True:
+                if futuro is None and time.monotonic() >= proximo_sondeo:
+                    futuro = executor.submit(obtener_snapshot)
+                    proximo_sondeo = time.monotonic() + intervalo
+                if futuro is not None and futuro.done():
+                    try:
+                        snapshot = futuro.result()
+                    except Exception as e:
+                        # Un sondeo fallido no detiene el watch: se conservan los
+                        # paneles anteriores y el error queda en la línea de estado
+                        snapshot = None
+                        nuevo_pie = f"[bold red]❌ Error al consultar el estado: {escape(str(e) or type(e).__name__)}"
+                    futuro = None
+                    if snapshot is not None:
+                        paneles = cache.actualizar(snapshot["pools"])
+                        cambios = cambios or bool(cache.reconstruidos)
+                        nuevo_pie = f"[green]Espacio disponible para aplicaciones:[/green] {snapshot.get('espacio_app')} GB"
+                    cambios = cambios or nuevo_pie != texto_pie
+                    texto_pie = nuevo_pie
+                    pie = Text.from_markup(texto_pie)
+                # Solo se envía la vista al terminal si cambió algún panel, el pie
+                # o (con animación) el texto visible del reloj
+                if cambios:
+                    live.update(Group(cabecera, reloj, *paneles, pie), refresh=True)
+                    cambios = False
+                    texto_reloj = reloj.texto()
+                elif fotograma is not None and reloj.texto() != texto_reloj:
+                    live.refresh()
+                    texto_reloj = reloj.texto()
+                if fotograma is not None:
+                    time.sleep(fotograma)
+                elif futuro is not None:
+                    wait([futuro], timeout=intervalo)
+                else:
+                    time.sleep(max(0.0, proximo_sondeo - time.monotonic()))
+        except KeyboardInterrupt:
+            if futuro is not None:
+                futuro.cancel()
+
+
+def _watch_sin_terminal(obtener_snapshot, intervalo, console, cache):
+    """Variante de watch sin animación para salidas que no son un terminal"""
+    try:
+        while True:
+            inicio = time.monotonic()
+            try:
+                snapshot = obtener_snapshot()
+            except Exception as e:
+                console.print(f"[bold red]❌ Error al consultar el estado: {escape(str(e) or type(e).__name__)}[/bold red]")
+                time.sleep(max(0.0, intervalo - (time.monotonic() - inicio)))
+                continue
+            paneles = cache.actualizar(snapshot["pools"])
+            if cache.reconstruidos:
+                console.rule(f"[bold green]{datetime.now().strftime('%H:%M:%S')}[/bold green]")
+                console.print(Group(*paneles))
+            time.sleep(max(0.0, intervalo - (time.monotonic() - inicio)))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,197 @@
+import os
+
+from truenas.consultas import consultar
+
+# Tamaño de página para /disk (limit/offset)
+DISCOS_POR_PAGINA = int(os.getenv('TRUENAS_DISK_PAGE_SIZE', '1000'))
+
+# Campos (y tipos) que usan el panel y la flota; el resto de atributos se descarta
+CAMPOS_POOL = {
+    "id": int,
+    "name": str,
+    "status": str,
+    "resilvering": bool,
+    "topology": dict,
+}
+CAMPOS_DISCO = {
+    "name": str,
+    "type": str,
+    "pool": str,
+    "temperature": float,
+    "smart_enabled": bool,
+    "smart_status": dict,
+}
+
+
+def obtener_pools(cliente, filtros=None, select=CAMPOS_POOL):
+    """Obtiene la lista de pools disponibles (``filtros`` como ``{"name": "tank"}``)"""
+    return consultar(cliente, "pool", filtros=filtros, select=select)
+
+
+def obtener_discos(cliente, por_pagina=None, filtros=None, select=CAMPOS_DISCO):
+    """Obtiene el inventario de discos, paginando con limit/offset
+
+    ``filtros`` se resuelve en el servidor, p. ej. ``{"pool": "tank"}``.
+    """
+    return consultar(cliente, "disk", filtros=filtros, select=select,
+                     por_pagina=por_pagina or DISCOS_POR_PAGINA)
+
+
+def indexar_discos_por_pool(discos):
+    """Agrupa los discos por nombre de pool para consultarlos en O(1)"""
+    indice = {}
+    for d in discos:
+        nombre_pool = d.get("pool")
+        if not nombre_pool:
+            continue
+        indice.setdefault(nombre_pool, []).append({
+            "name": d.get("name"),
+            "type": d.get("type"),
+            "temperature": d.get("temperature"),
+            "smart_enabled": d.get("smart_enabled"),
+            "smart_status": (d.get("smart_status") or {}).get("passed"),
+        })
+    return indice
+
+
+# Clases de vdev del árbol de topología y cuáles aportan capacidad al pool
+CLASES_VDEV = ("data", "special", "dedup", "log", "cache", "spare")
+CLASES_CAPACIDAD = ("data", "special", "dedup")
+CONTADORES_ERROR = ("read_errors", "write_errors", "checksum_errors")
+
+
+def _sumar_lista(total, valores):
+    """Suma elemento a elemento ``valores`` sobre ``total`` (in situ)"""
+    if not valores:
+        return total
+    if total is None:
+        return list(valores)
+    for i, valor in enumerate(valores[:len(total)]):
+        total[i] += valor or 0
+    return total
+
+
+def recorrer_topologia(topology):
+    """Recorre todo el árbol de topología y agrega sus estadísticas en una pasada
+
+    Visita todas las clases de vdev (data, log, cache, special, dedup,
+    spare) y sus hijos. Devuelve ``(totales, vdevs, discos)``: los
+    totales del pool, un registro por vdev de primer nivel y un registro
+    por disco hoja con sus contadores de error. La capacidad se suma de
+    los vdevs de data/special/dedup; los errores, de todos los nodos.
+    """
+    totales = {"size": 0, "allocated": 0, "self_healed": 0, "ops": None, "bytes": None}
+    totales.update({contador: 0 for contador in CONTADORES_ERROR})
+    vdevs = []
+    discos = []
+    fragmentacion_ponderada = 0
+    primer_vdev = None
+
+    for clase in CLASES_VDEV:
+        for vdev in (topology or {}).get(clase) or []:
+            stats = vdev.get("stats") or {}
+            registro = {
+                "name": vdev.get("name"),
+                "type": vdev.get("type"),
+                "class": clase,
+                "status": vdev.get("status"),
+                "size": stats.get("size") or 0,
+                "allocated": stats.get("allocated") or 0,
+                "disks": 0,
+            }
+            registro.update({contador: 0 for contador in CONTADORES_ERROR})
+            vdevs.append(registro)
+
+            if clase in CLASES_CAPACIDAD:
+                totales["size"] += registro["size"]
+                totales["allocated"] += registro["allocated"]
+                fragmentacion_ponderada += (stats.get("fragmentation") or 0) * registro["size"]
+                if primer_vdev is None:
+                    primer_vdev = stats
+            totales["ops"] = _sumar_lista(totales["ops"], stats.get("ops"))
+            totales["bytes"] = _sumar_lista(totales["bytes"], stats.get("bytes"))
+
+            # Recorrido iterativo del vdev y sus hijos
+            pendientes = [vdev]
+            while pendientes:
+                nodo = pendientes.pop()
+                stats_nodo = nodo.get("stats") or {}
+                for contador in CONTADORES_ERROR:
+                    valor = stats_nodo.get(contador) or 0
+                    registro[contador] += valor
+                    totales[contador] += valor
+                totales["self_healed"] += stats_nodo.get("self_healed") or 0
+                hijos = nodo.get("children") or []
+                if hijos:
+                    pendientes.extend(hijos)
+                elif nodo.get("type") == "DISK":
+                    registro["disks"] += 1
+                    disco = {
+                        "name": nodo.get("disk") or nodo.get("device") or nodo.get("name"),
+                        "vdev": registro["name"],
+                        "class": clase,
+                        "status": nodo.get("status"),
+                    }
+                    disco.update({contador: stats_nodo.get(contador) or 0 for contador in CONTADORES_ERROR})
+                    discos.append(disco)
+
+    primer_vdev = primer_vdev or {}
+    totales["fragmentation"] = round(fragmentacion_ponderada / totales["size"]) if totales["size"] else None
+    for campo in ("configured_ashift", "logical_ashift", "physical_ashift"):
+        totales[campo] = primer_vdev.get(campo)
+    return totales, vdevs, discos
+
+
+def correlacionar_discos(discos_pool, discos_topologia):
+    """Añade a cada disco del índice los contadores de error de su hoja en la topología
+
+    Los discos que aparecen en la topología pero no en ``/disk`` (por
+    ejemplo, si la API no devuelve el nombre del pool) se añaden igual.
+    """
+    por_nombre = {disco["name"]: disco for disco in discos_pool}
+    resultado = list(discos_pool)
+    for hoja in discos_topologia:
+        disco = por_nombre.get(hoja["name"])
+        if disco is None:
+            disco = {"name": hoja["name"], "type": None, "temperature": None,
+                     "smart_enabled": None, "smart_status": None}
+            por_nombre[hoja["name"]] = disco
+            resultado.append(disco)
+        disco.update({clave: valor for clave, valor in hoja.items() if clave != "name"})
+    return resultado
+
+
+def extraer_datos_pools(pools, indice_discos):
+    """Extrae de /pool los datos que muestra el panel, con los discos de cada pool"""
+    pools_data = []
+    for pool in pools:
+        totales, vdevs, discos_topologia = recorrer_topologia(pool.get('topology'))
+        size = totales["size"]
+        allocated = totales["allocated"]
+
+        if size:
+            available = size - allocated
+            used_percent = round((allocated / size) * 100, 2)
+
+            pools_data.append({
+                "name": pool["name"],
+                "status": pool["status"],
+                "size": size,
+                "allocated": allocated,
+                "available": available,
+                "used_percent": used_percent,
+                "read_errors": totales["read_errors"],
+                "write_errors": totales["write_errors"],
+                "checksum_errors": totales["checksum_errors"],
+                "fragmentation": totales["fragmentation"],
+                "self_healed": totales["self_healed"],
+                "configured_ashift": totales["configured_ashift"],
+                "logical_ashift": totales["logical_ashift"],
+                "physical_ashift": totales["physical_ashift"],
+                "ops": totales["ops"],
+                "bytes": totales["bytes"],
+                "resilvering": pool.get("resilvering", False),
+                "vdevs": vdevs,
+                "disks": correlacionar_discos(indice_discos.get(pool["name"], []), discos_topologia)
+            })
+    return pools_data
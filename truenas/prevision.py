@@ -0,0 +1,193 @@
+import time
+from array import array
+
+from truenas.decodificacion import cargar
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él las sumas se hacen en Python
+    np = None
+
+# Umbrales de ocupación para los que se calcula la previsión
+UMBRALES = (0.8, 0.9, 1.0)
+# Número de datasets (los de más uso) con previsión propia por pool
+TOP_DATASETS = 5
+SEGUNDOS_DIA = 86400.0
+# Días de historial con los que se inicializa cada tendencia
+DIAS_HISTORIAL = 90
+
+
+class TendenciaLineal:
+    """Recta de mínimos cuadrados con sumas acumuladas (ajuste incremental)
+
+    Guarda solo n, Σx, Σy, Σxy y Σx²; añadir una muestra es O(1) y el
+    historial inicial se carga de una vez con operaciones vectorizadas.
+    Las coordenadas se toman relativas a la primera muestra (x en días,
+    y en bytes) para conservar la precisión con valores grandes.
+    """
+
+    __slots__ = ("x0", "y0", "n", "sx", "sy", "sxy", "sxx", "ultimo_ts", "ultimo_valor")
+
+    def __init__(self):
+        self.x0 = None
+        self.y0 = None
+        self.n = 0
+        self.sx = self.sy = self.sxy = self.sxx = 0.0
+        self.ultimo_ts = None
+        self.ultimo_valor = None
+
+    def agregar(self, ts, valor):
+        """Añade una muestra (ignorada si no es posterior a la última)"""
+        if self.ultimo_ts is not None and ts <= self.ultimo_ts:
+            return
+        if self.x0 is None:
+            self.x0, self.y0 = ts, valor
+        x = (ts - self.x0) / SEGUNDOS_DIA
+        y = valor - self.y0
+        self.n += 1
+        self.sx += x
+        self.sy += y
+        self.sxy += x * y
+        self.sxx += x * x
+        self.ultimo_ts, self.ultimo_valor = ts, valor
+
+    def agregar_lote(self, tiempos, valores):
+        """Añade muchas muestras ordenadas por tiempo de una sola vez"""
+        if self.ultimo_ts is not None:
+            pares = [(t, v) for t, v in zip(tiempos, valores) if t > self.ultimo_ts]
+            tiempos, valores = [t for t, _ in pares], [v for _, v in pares]
+        if not len(tiempos):
+            return
+        if self.x0 is None:
+            self.x0, self.y0 = tiempos[0], valores[0]
+        if np is not None:
+            x = (np.asarray(tiempos, dtype=float) - self.x0) / SEGUNDOS_DIA
+            y = np.asarray(valores, dtype=float) - self.y0
+            self.sx += float(x.sum())
+            self.sy += float(y.sum())
+            self.sxy += float(x @ y)
+            self.sxx += float(x @ x)
+        else:
+            x = array('d', ((t - self.x0) / SEGUNDOS_DIA for t in tiempos))
+            y = array('d', (v - self.y0 for v in valores))
+            self.sx += sum(x)
+            self.sy += sum(y)
+            self.sxy += sum(a * b for a, b in zip(x, y))
+            self.sxx += sum(a * a for a in x)
+        self.n += len(tiempos)
+        self.ultimo_ts, self.ultimo_valor = tiempos[-1], valores[-1]
+
+    @property
+    def pendiente(self):
+        """Crecimiento estimado en unidades de ``valor`` por día (o None)"""
+        denominador = self.n * self.sxx - self.sx * self.sx
+        if self.n < 2 or denominador <= 0:
+            return None
+        return (self.n * self.sxy - self.sx * self.sy) / denominador
+
+    def dias_hasta(self, objetivo):
+        """Días hasta alcanzar ``objetivo`` al ritmo actual (None si no crece)"""
+        pendiente = self.pendiente
+        if self.ultimo_valor is None:
+            return None
+        if self.ultimo_valor >= objetivo:
+            return 0.0
+        if not pendiente or pendiente <= 0:
+            return None
+        return (objetivo - self.ultimo_valor) / pendiente
+
+
+def prevision(tendencia, capacidad):
+    """Resume una tendencia: crecimiento diario y días hasta cada umbral"""
+    resultado = {"growth_per_day": tendencia.pendiente}
+    for umbral in UMBRALES:
+        resultado[f"days_to_{int(umbral * 100)}"] = tendencia.dias_hasta(capacidad * umbral) if capacidad else None
+    return resultado
+
+
+def valor_propiedad(propiedad):
+    """Extrae el valor numérico de una propiedad ZFS (``{"parsed": ...}``) o de un número"""
+    if isinstance(propiedad, dict):
+        propiedad = propiedad.get("parsed")
+    return propiedad if isinstance(propiedad, (int, float)) and not isinstance(propiedad, bool) else None
+
+
+def aplanar_datasets(datasets):
+    """Recorre el árbol de ``/pool/dataset/details`` y devuelve ``(nombre, pool, usado, disponible)``"""
+    pendientes = list(datasets or [])
+    resultado = []
+    while pendientes:
+        dataset = pendientes.pop()
+        usado = valor_propiedad(dataset.get("used"))
+        disponible = valor_propiedad(dataset.get("available"))
+        if usado is not None and disponible is not None:
+            resultado.append((dataset.get("name"), dataset.get("pool"), usado, disponible))
+        pendientes.extend(dataset.get("children") or [])
+    return resultado
+
+
+def obtener_datasets(cliente):
+    """Obtiene el uso de todos los datasets desde ``/pool/dataset/details``"""
+    response = cliente.get("pool/dataset/details")
+    response.raise_for_status()
+    return aplanar_datasets(cargar(response.content))
+
+
+class Previsiones:
+    """Previsiones de llenado por pool y por dataset, actualizadas en cada refresco
+
+    Las tendencias se inicializan desde el historial local (si existe) y
+    después cada sondeo solo suma una muestra por pool o dataset.
+    """
+
+    def __init__(self, historial=None, top_datasets=TOP_DATASETS, dias_historial=DIAS_HISTORIAL):
+        self.historial = historial
+        self.top_datasets = top_datasets
+        self.dias_historial = dias_historial
+        self.pools = {}     # (host, pool) -> TendenciaLineal
+        self.datasets = {}  # (host, dataset) -> TendenciaLineal
+
+    def _tendencia(self, tabla, clave, cargar, ts):
+        """Tendencia de ``clave``; la primera vez se inicializa con el historial anterior a ``ts``"""
+        tendencia = tabla.get(clave)
+        if tendencia is None:
+            tendencia = tabla[clave] = TendenciaLineal()
+            if self.historial is not None:
+                # Solo las muestras anteriores al sondeo actual: si ya se ha
+                # registrado, no se cuenta dos veces
+                filas = [f for f in cargar(ts - self.dias_historial * SEGUNDOS_DIA) if f[0] < ts]
+                if filas:
+                    tendencia.agregar_lote([f[0] for f in filas], [f[1] for f in filas])
+        return tendencia
+
+    def actualizar(self, host, pools_data, datasets=None, ts=None):
+        """Añade la muestra del sondeo y escribe la previsión en cada pool
+
+        A cada pool se le añade ``forecast`` (crecimiento diario y
+        ``days_to_80``/``days_to_90``/``days_to_100``) y, si se pasan
+        datasets, ``dataset_forecasts`` con los de más uso.
+        """
+        ts = time.time() if ts is None else ts
+        for pool in pools_data:
+            if pool.get("allocated") is None:
+                continue
+            tendencia = self._tendencia(self.pools, (host, pool["name"]),
+                                        lambda desde: self.historial.capacidad(host, pool["name"], desde), ts)
+            tendencia.agregar(ts, pool["allocated"])
+            pool["forecast"] = prevision(tendencia, pool.get("size"))
+
+        if datasets is None:
+            return pools_data
+        por_pool = {}
+        for nombre, nombre_pool, usado, disponible in datasets:
+            tendencia = self._tendencia(self.datasets, (host, nombre),
+                                        lambda desde: self.historial.uso_dataset(host, nombre, desde), ts)
+            tendencia.agregar(ts, usado)
+            por_pool.setdefault(nombre_pool, []).append((usado, nombre, usado + disponible, tendencia))
+        for pool in pools_data:
+            principales = sorted(por_pool.get(pool["name"], []), key=lambda d: d[0], reverse=True)[:self.top_datasets]
+            pool["dataset_forecasts"] = [
+                dict(prevision(tendencia, capacidad), name=nombre, used=usado)
+                for usado, nombre, capacidad, tendencia in principales
+            ]
+        return pools_data
@@ -0,0 +1,300 @@
+"""Pruebas de rendimiento contra el servidor simulado de la API
+
+Arranca ``truenas.simulador`` a la escala pedida y ejecuta cada escenario
+(``pools``, ``backup``, ``fleet``) en un proceso aparte, para que el pico
+de memoria (RSS) sea el del cliente y no el del simulador. De cada
+escenario se mide la latencia de refresco de extremo a extremo, las
+peticiones y los bytes servidos, el tiempo de decodificación JSON, el de
+renderizado y el pico de RSS. Los resultados se guardan en JSON y se
+pueden comparar con una ejecución anterior para detectar regresiones.
+La caché de respuestas del cliente está desactivada salvo con
+``--con-cache``, para que cada iteración llegue a la API.
+
+Uso::
+
+    python -m truenas.rendimiento --pools 8 --vdevs 6 --discos 12 --hosts 20 \\
+        --latencia 20 --fallos 0.01 --salida bench.json --comparar bench-anterior.json
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # resource solo existe en Unix: sin él no se mide el RSS
+    resource = None
+
+ESCENARIOS = ("pools", "backup", "fleet")
+REPETICIONES = 5
+# Métricas que se comparan con la ejecución anterior (más alto es peor)
+METRICAS_REGRESION = ("latencia.p50", "latencia.p95", "peticiones", "bytes", "decodificacion_s", "render_s",
+                      "rss_pico_kb")
+TOLERANCIA = 0.2
+
+_tiempos = {"decodificacion": 0.0}
+
+
+def percentil(valores, p):
+    """Percentil ``p`` (0-100) por el método del rango más cercano"""
+    if not valores:
+        return None
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, max(0, round(p / 100 * len(ordenados) + 0.5) - 1))]
+
+
+def resumen(valores):
+    if not valores:
+        return {"media": None, "p50": None, "p95": None, "max": None}
+    return {
+        "media": round(sum(valores) / len(valores), 6),
+        "p50": round(percentil(valores, 50), 6),
+        "p95": round(percentil(valores, 95), 6),
+        "max": round(max(valores), 6),
+    }
+
+
+# Proceso hijo: instrumentación y escenarios
+
+def _cronometrar(funcion):
+    def envoltura(*args, **kwargs):
+        inicio = time.perf_counter()
+        try:
+            return funcion(*args, **kwargs)
+        finally:
+            _tiempos["decodificacion"] += time.perf_counter() - inicio
+    return envoltura
+
+
+def instrumentar():
+    """Cronometra la decodificación JSON
+
+    Debe llamarse antes de importar los módulos que usan ``cargar``, que
+    guardan su propia referencia a la función.
+    """
+    import requests
+
+    from truenas import decodificacion
+
+    decodificacion.cargar = _cronometrar(decodificacion.cargar)
+    decodificacion.decodificar_structs = _cronometrar(decodificacion.decodificar_structs)
+    requests.models.Response.json = _cronometrar(requests.models.Response.json)
+
+
+def consola_memoria():
+    from rich.console import Console
+
+    return Console(file=io.StringIO(), width=120, force_terminal=True, color_system="truecolor")
+
+
+def escenario_pools(urls, repeticiones):
+    """Panel de pools: instantánea completa (sondeo persistente, como en watch) y renderizado"""
+    from truenas.auth import crear_cliente
+    from truenas.pantalla import mostrar_estado
+    from truenas.sondeo import Sondeo
+
+    sondeo = Sondeo(crear_cliente("token", {"url": urls[0], "api_key": "rendimiento"}))
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        snapshot = sondeo.obtener_snapshot(con_datasets=True)
+        inicio_render = time.perf_counter()
+        mostrar_estado(consola_memoria(), snapshot["pools"], espacio_app=snapshot["espacio_app"])
+        fin = time.perf_counter()
+        yield fin - inicio, fin - inicio_render, snapshot["error"]
+
+
+def escenario_backup(urls, repeticiones):
+    """Descarga en streaming de config/save a disco"""
+    from truenas.auth import crear_cliente
+    from truenas.backup import descargar_backup
+
+    cliente = crear_cliente("token", {"url": urls[0], "api_key": "rendimiento"})
+    with tempfile.TemporaryDirectory() as directorio:
+        for i in range(repeticiones):
+            inicio = time.perf_counter()
+            descargar_backup(cliente, os.path.join(directorio, f"backup_{i}.db"))
+            yield time.perf_counter() - inicio, 0.0, None
+
+
+def escenario_fleet(urls, repeticiones):
+    """Tabla de la flota: todos los hosts en paralelo y renderizado"""
+    from truenas.flota import mostrar_tabla_flota, recolectar_flota
+
+    hosts = [{"nombre": f"h{i}", "url": url, "api_key": "rendimiento", "auth": "token"}
+             for i, url in enumerate(urls)]
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultados = list(recolectar_flota(hosts))
+        inicio_render = time.perf_counter()
+        mostrar_tabla_flota(resultados, consola_memoria())
+        fin = time.perf_counter()
+        errores = [r["error"] for r in resultados if r["error"]]
+        yield fin - inicio, fin - inicio_render, errores[0] if errores else None
+
+
+FUNCIONES_ESCENARIO = {
+    "pools": escenario_pools,
+    "backup": escenario_backup,
+    "fleet": escenario_fleet,
+}
+
+
+def ejecutar_hijo(escenario, urls, repeticiones):
+    """Ejecuta un escenario en este proceso y devuelve sus mediciones"""
+    instrumentar()
+    latencias, render, errores = [], [], 0
+    for latencia, tiempo_render, error in FUNCIONES_ESCENARIO[escenario](urls, repeticiones):
+        latencias.append(latencia)
+        render.append(tiempo_render)
+        errores += bool(error)
+    return {
+        "latencias": latencias,
+        "render_s": round(sum(render), 6),
+        "decodificacion_s": round(_tiempos["decodificacion"], 6),
+        "iteraciones_con_error": errores,
+        "rss_pico_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None,
+    }
+
+
+# Proceso principal
+
+def ejecutar_escenario(simulador, urls, escenario, repeticiones, entorno=None):
+    """Lanza un escenario en un subproceso y combina sus mediciones con los contadores del simulador"""
+    simulador.reiniciar_contadores()
+    proceso = subprocess.run(
+        [sys.executable, "-m", "truenas.rendimiento", "--hijo", escenario, "--urls", ",".join(urls),
+         "--repeticiones", str(repeticiones)],
+        capture_output=True, text=True, env=entorno,
+    )
+    if proceso.returncode != 0:
+        raise RuntimeError(f"El escenario {escenario} ha fallado:\n{proceso.stderr}")
+    medicion = json.loads(proceso.stdout.strip().splitlines()[-1])
+    contadores = simulador.contadores()
+    latencias = medicion.pop("latencias")
+    return {
+        "iteraciones": len(latencias),
+        "latencia": resumen(latencias),
+        "latencia_primera": round(latencias[0], 6) if latencias else None,
+        "peticiones": contadores["peticiones"],
+        "bytes": contadores["bytes"],
+        "errores_servidor": contadores["errores"],
+        "peticiones_por_ruta": contadores["por_ruta"],
+        **medicion,
+    }
+
+
+def _valor(resultado, metrica):
+    for parte in metrica.split("."):
+        resultado = (resultado or {}).get(parte)
+    return resultado
+
+
+def comparar(actual, anterior, tolerancia=TOLERANCIA):
+    """Devuelve las métricas que han empeorado más de ``tolerancia`` (proporción)"""
+    regresiones = []
+    for escenario, resultado in actual["escenarios"].items():
+        previo = anterior.get("escenarios", {}).get(escenario)
+        if previo is None:
+            continue
+        for metrica in METRICAS_REGRESION:
+            nuevo, viejo = _valor(resultado, metrica), _valor(previo, metrica)
+            if isinstance(nuevo, (int, float)) and isinstance(viejo, (int, float)) and viejo > 0:
+                if nuevo > viejo * (1 + tolerancia):
+                    regresiones.append({"escenario": escenario, "metrica": metrica, "anterior": viejo,
+                                        "actual": nuevo, "cambio": round(nuevo / viejo - 1, 3)})
+    return regresiones
+
+
+def mostrar_resultados(resultados, salida=None):
+    salida = salida or sys.stdout
+    salida.write(f"{'Escenario':<10}{'p50 (ms)':>10}{'p95 (ms)':>10}{'Peticiones':>12}{'Bytes':>14}"
+                 f"{'Decod. (ms)':>13}{'Render (ms)':>13}{'RSS (MB)':>10}\n")
+    for escenario, r in resultados["escenarios"].items():
+        rss = f"{r['rss_pico_kb'] / 1024:.1f}" if r["rss_pico_kb"] else "-"
+        salida.write(f"{escenario:<10}{r['latencia']['p50'] * 1000:>10.1f}{r['latencia']['p95'] * 1000:>10.1f}"
+                     f"{r['peticiones']:>12}{r['bytes']:>14}{r['decodificacion_s'] * 1000:>13.1f}"
+                     f"{r['render_s'] * 1000:>13.1f}{rss:>10}\n")
+
+
+def main(argv=None):
+    from truenas import simulador as simulador_api
+
+    parser = argparse.ArgumentParser(description="Pruebas de rendimiento contra una API de TrueNAS simulada")
+    parser.add_argument("--escenarios", default=",".join(ESCENARIOS),
+                        help=f"Escenarios separados por comas (por defecto {','.join(ESCENARIOS)})")
+    parser.add_argument("--repeticiones", type=int, default=REPETICIONES, help="Iteraciones por escenario")
+    parser.add_argument("--con-cache", action="store_true",
+                        help="Usa la caché de respuestas del cliente (por defecto cada iteración llega a la API)")
+    parser.add_argument("--salida", metavar="RUTA", help="Guarda los resultados en este JSON")
+    parser.add_argument("--comparar", metavar="RUTA", help="Compara con unos resultados anteriores")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA,
+                        help="Empeoramiento admitido antes de marcar una regresión (por defecto 0.2)")
+    parser.add_argument("--hijo", help=argparse.SUPPRESS)
+    parser.add_argument("--urls", help=argparse.SUPPRESS)
+    simulador_api.opciones_escala(parser)
+    args = parser.parse_args(argv)
+
+    if args.hijo:
+        print(json.dumps(ejecutar_hijo(args.hijo, args.urls.split(","), args.repeticiones)))
+        return 0
+
+    escenarios = [e.strip() for e in args.escenarios.split(",") if e.strip()]
+    desconocidos = set(escenarios) - set(FUNCIONES_ESCENARIO)
+    if desconocidos:
+        parser.error(f"escenarios desconocidos: {', '.join(sorted(desconocidos))}")
+
+    simulador = simulador_api.Simulador(simulador_api.escala_args(args), latencia=args.latencia / 1000,
+                                        jitter=args.jitter / 1000, fallos=args.fallos,
+                                        fallos_job=args.fallos_job)
+    servidor = simulador_api.crear_servidor(simulador)
+    threading.Thread(target=servidor.serve_forever, name="truenas-simulador", daemon=True).start()
+    urls = [simulador_api.url_host(servidor, i) for i in range(simulador.escala["hosts"])]
+
+    # Sin caché por defecto: con ella solo la primera iteración llega a la API
+    # y el resto mide aciertos de caché
+    entorno = dict(os.environ)
+    entorno["TRUENAS_CACHE"] = "memoria" if args.con_cache else "0"
+    resultados = {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "escala": simulador.escala,
+        "latencia_ms": args.latencia,
+        "jitter_ms": args.jitter,
+        "fallos": args.fallos,
+        "repeticiones": args.repeticiones,
+        "cache": args.con_cache,
+        "escenarios": {},
+    }
+    try:
+        for escenario in escenarios:
+            resultados["escenarios"][escenario] = ejecutar_escenario(simulador, urls, escenario,
+                                                                     args.repeticiones, entorno)
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
+
+    mostrar_resultados(resultados)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(resultados, f, indent=2)
+            f.write("\n")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            regresiones = comparar(resultados, json.load(f), args.tolerancia)
+        for r in regresiones:
+            print(f"❌ Regresión en {r['escenario']}.{r['metrica']}: {r['anterior']} -> {r['actual']} "
+                  f"(+{r['cambio'] * 100:.0f}%)", file=sys.stderr)
+        return 1 if regresiones else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""Salida legible por máquinas: JSON, NDJSON y formato de texto de Prometheus
+
+No importa nada de la capa de presentación (rich). JSON y NDJSON se
+escriben en streaming, un pool o un host cada vez, y se vacía el buffer
+tras cada registro para que el consumidor los reciba según llegan. Las
+métricas de Prometheus se agrupan por familia antes de escribirse,
+porque el formato exige que las muestras de una métrica vayan juntas.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional
+    orjson = None
+
+# Campos del pool que solo sirven para la interfaz (sparklines en texto) y no
+# forman parte del esquema de JSON/NDJSON
+CAMPOS_PRESENTACION = frozenset(("read_history", "write_history"))
+
+# (nombre, tipo, ayuda) de cada familia de métricas, en orden de salida
+FAMILIAS = (
+    ("truenas_up", "gauge", "1 si el host respondió al último sondeo"),
+    ("truenas_scrape_duration_seconds", "gauge", "Duración del sondeo del host"),
+    ("truenas_app_available_bytes", "gauge", "Espacio disponible para aplicaciones"),
+    ("truenas_pool_online", "gauge", "1 si el pool está ONLINE"),
+    ("truenas_pool_size_bytes", "gauge", "Capacidad del pool"),
+    ("truenas_pool_allocated_bytes", "gauge", "Espacio usado del pool"),
+    ("truenas_pool_available_bytes", "gauge", "Espacio libre del pool"),
+    ("truenas_pool_used_percent", "gauge", "Porcentaje de uso del pool"),
+    ("truenas_pool_fragmentation_percent", "gauge", "Fragmentación del pool"),
+    ("truenas_pool_errors", "gauge", "Errores del pool por tipo (read, write, checksum)"),
+    ("truenas_pool_resilvering", "gauge", "1 si el pool está en resilver"),
+    ("truenas_pool_read_bytes_per_second", "gauge", "Tasa de lectura del pool"),
+    ("truenas_pool_write_bytes_per_second", "gauge", "Tasa de escritura del pool"),
+    ("truenas_disk_temperature_celsius", "gauge", "Temperatura del disco"),
+    ("truenas_disk_smart_passed", "gauge", "1 si el test SMART del disco es correcto"),
+    ("truenas_disk_errors", "gauge", "Errores del disco por tipo (read, write, checksum)"),
+)
+
+TIPOS_ERROR = (("read", "read_errors"), ("write", "write_errors"), ("checksum", "checksum_errors"))
+
+
+def volcar(valor):
+    """Serializa a una línea JSON (orjson si está disponible)"""
+    if orjson is not None:
+        return orjson.dumps(valor, default=str).decode("utf-8")
+    return json.dumps(valor, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def datos_pool(pool):
+    """Copia del pool sin los campos de presentación"""
+    return {clave: valor for clave, valor in pool.items() if clave not in CAMPOS_PRESENTACION}
+
+
+def datos_host(resultado):
+    """Resultado de un host de la flota con sus pools sin campos de presentación"""
+    return dict(resultado, pools=[datos_pool(pool) for pool in resultado["pools"]])
+
+
+def escribir_ndjson(salida, registros):
+    """Escribe un registro JSON por línea según se van generando"""
+    for registro in registros:
+        salida.write(volcar(registro) + "\n")
+        salida.flush()
+
+
+def escribir_json(salida, elementos, cabecera=None, clave="pools"):
+    """Escribe una lista JSON elemento a elemento
+
+    Con ``cabecera`` se escribe un objeto con sus campos y la lista bajo
+    ``clave``; sin ella, solo la lista.
+    """
+    if cabecera is None:
+        salida.write("[")
+    else:
+        campos = volcar(cabecera)[1:-1]
+        salida.write("{" + campos + ("," if campos else "") + volcar(clave) + ":[")
+    for i, elemento in enumerate(elementos):
+        salida.write(("," if i else "") + "\n" + volcar(elemento))
+        salida.flush()
+    salida.write("\n]\n" if cabecera is None else "\n]}\n")
+    salida.flush()
+
+
+def registros_snapshot(host, snapshot):
+    """Registros NDJSON de una instantánea: uno por pool y uno del host"""
+    for pool in snapshot["pools"]:
+        yield {"tipo": "pool", "host": host, **datos_pool(pool)}
+    yield {"tipo": "host", "host": host, "espacio_app_bytes": snapshot.get("espacio_app_bytes")}
+
+
+def registros_flota(resultados):
+    """Registros NDJSON de la flota: uno por pool y uno por host, según llegan"""
+    for resultado in resultados:
+        for pool in resultado["pools"]:
+            yield {"tipo": "pool", "host": resultado["host"], **datos_pool(pool)}
+        yield {"tipo": "host", "host": resultado["host"], "error": resultado["error"],
+               "duracion": resultado.get("duracion")}
+
+
+def _escapar(valor):
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _etiquetas(**etiquetas):
+    return "{" + ",".join(f'{clave}="{_escapar(valor)}"' for clave, valor in etiquetas.items()) + "}"
+
+
+def muestras_host(host, pools, espacio_app_bytes=None, error=None, duracion=None):
+    """Genera ``(familia, etiquetas, valor)`` para un host y sus pools"""
+    yield "truenas_up", _etiquetas(host=host), 0 if error else 1
+    if duracion is not None:
+        yield "truenas_scrape_duration_seconds", _etiquetas(host=host), duracion
+    if isinstance(espacio_app_bytes, (int, float)):
+        yield "truenas_app_available_bytes", _etiquetas(host=host), espacio_app_bytes
+    for pool in pools:
+        base = {"host": host, "pool": pool["name"]}
+        yield "truenas_pool_online", _etiquetas(**base), 1 if pool["status"] == "ONLINE" else 0
+        yield "truenas_pool_size_bytes", _etiquetas(**base), pool["size"]
+        yield "truenas_pool_allocated_bytes", _etiquetas(**base), pool["allocated"]
+        yield "truenas_pool_available_bytes", _etiquetas(**base), pool["available"]
+        yield "truenas_pool_used_percent", _etiquetas(**base), pool["used_percent"]
+        if pool.get("fragmentation") is not None:
+            yield "truenas_pool_fragmentation_percent", _etiquetas(**base), pool["fragmentation"]
+        for tipo, clave in TIPOS_ERROR:
+            yield "truenas_pool_errors", _etiquetas(**base, type=tipo), pool.get(clave) or 0
+        yield "truenas_pool_resilvering", _etiquetas(**base), 1 if pool.get("resilvering") else 0
+        if pool.get("read_rate") is not None:
+            yield "truenas_pool_read_bytes_per_second", _etiquetas(**base), pool["read_rate"]
+            yield "truenas_pool_write_bytes_per_second", _etiquetas(**base), pool["write_rate"]
+        for disco in pool.get("disks", []):
+            etiquetas_disco = dict(base, disk=disco["name"])
+            if isinstance(disco.get("temperature"), (int, float)):
+                yield "truenas_disk_temperature_celsius", _etiquetas(**etiquetas_disco), disco["temperature"]
+            if disco.get("smart_status") is not None:
+                yield "truenas_disk_smart_passed", _etiquetas(**etiquetas_disco), 1 if disco["smart_status"] else 0
+            for tipo, clave in TIPOS_ERROR:
+                if clave in disco:
+                    yield "truenas_disk_errors", _etiquetas(**etiquetas_disco, type=tipo), disco[clave] or 0
+
+
+def texto_prometheus(muestras):
+    """Formato de texto de Prometheus con las muestras agrupadas por familia"""
+    por_familia = {}
+    for familia, etiquetas, valor in muestras:
+        por_familia.setdefault(familia, []).append(f"{familia}{etiquetas} {valor}")
+    lineas = []
+    for familia, tipo, ayuda in FAMILIAS:
+        if familia in por_familia:
+            lineas.append(f"# HELP {familia} {ayuda}")
+            lineas.append(f"# TYPE {familia} {tipo}")
+            lineas.extend(por_familia[familia])
+    return "\n".join(lineas) + "\n"
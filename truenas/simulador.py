@@ -0,0 +1,342 @@
+"""Servidor simulado de la API de TrueNAS para pruebas de rendimiento
+
+Las respuestas parten de los esquemas de ``api-doc.json`` (cada objeto
+tiene los campos que declara la especificación) y se rellenan con datos
+coherentes a la escala pedida: hosts, pools, vdevs por pool y discos por
+vdev. Cada host se sirve bajo su propio prefijo (``/h0/api/v2.0``,
+``/h1/api/v2.0``, ...) en un único servidor. Se puede inyectar latencia y
+una proporción de fallos (HTTP 503, que el cliente reintenta en los GET)
+y de jobs de descarga (``core/download``) que terminan en FAILED tras
+enviar un archivo truncado, y se cuentan las peticiones y los bytes
+servidos.
+
+Uso: ``python -m truenas.simulador [--puerto 8765] [--pools 4] ...``
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from truenas.spec import cargar_spec
+
+PREFIJO_API = "/api/v2.0"
+PROFUNDIDAD_MAXIMA = 8
+
+ESCALA_POR_DEFECTO = {
+    "hosts": 1,
+    "pools": 4,
+    "vdevs": 4,
+    "discos": 6,
+    "backup_bytes": 4 * 1024 * 1024,
+}
+
+
+def ejemplo(esquema, profundidad=0):
+    """Genera un valor mínimo válido para un esquema resuelto de la especificación"""
+    if not isinstance(esquema, dict) or profundidad > PROFUNDIDAD_MAXIMA:
+        return None
+    for combinacion in ("anyOf", "oneOf", "allOf"):
+        if esquema.get(combinacion):
+            return ejemplo(esquema[combinacion][0], profundidad + 1)
+    if "enum" in esquema and esquema["enum"]:
+        return esquema["enum"][0]
+    tipo = esquema.get("type")
+    if isinstance(tipo, list):
+        tipo = next((t for t in tipo if t != "null"), "null")
+    if tipo == "object" or "properties" in esquema:
+        return {nombre: ejemplo(propiedad, profundidad + 1)
+                for nombre, propiedad in (esquema.get("properties") or {}).items()}
+    if tipo == "array":
+        items = esquema.get("items")
+        if isinstance(items, list):
+            items = items[0] if items else {}
+        return [ejemplo(items, profundidad + 1)] if items else []
+    return {"string": "", "integer": 0, "number": 0.0, "boolean": False}.get(tipo)
+
+
+def elemento_lista(spec, ruta, metodo="GET"):
+    """Ejemplo de un elemento de la respuesta (lista) de ``ruta``"""
+    valor = ejemplo(spec.esquema_respuesta(ruta, metodo))
+    return dict(valor[0]) if isinstance(valor, list) and valor and isinstance(valor[0], dict) else {}
+
+
+def _stats(rng, size, allocated):
+    return {
+        "timestamp": int(time.time()), "size": size, "allocated": allocated,
+        "read_errors": 0, "write_errors": 0, "checksum_errors": rng.choice((0, 0, 0, 1)),
+        "fragmentation": rng.randint(0, 40), "self_healed": 0,
+        "configured_ashift": 12, "logical_ashift": 9, "physical_ashift": 12,
+        "ops": [0, rng.randint(0, 500), rng.randint(0, 500), 0, 0, 0, 0],
+        "bytes": [0, rng.randint(0, 10 ** 8), rng.randint(0, 10 ** 8), 0, 0, 0, 0],
+    }
+
+
+def generar_host(spec, indice, escala):
+    """Genera las respuestas de un host: pools con su topología, discos y demás endpoints"""
+    rng = random.Random(indice)
+    base_pool = elemento_lista(spec, "pool")
+    base_disco = elemento_lista(spec, "disk")
+    base_alerta = elemento_lista(spec, "alert/list")
+    tamano_disco = 8 * 10 ** 12
+
+    pools, discos, datasets = [], [], []
+    for p in range(escala["pools"]):
+        nombre_pool = f"tank{p}"
+        vdevs = []
+        for v in range(escala["vdevs"]):
+            hijos = []
+            for d in range(escala["discos"]):
+                nombre = f"sd{p}v{v}d{d}"
+                hijos.append({"type": "DISK", "name": f"{nombre}1", "disk": nombre, "device": f"{nombre}1",
+                              "guid": f"{indice}{p}{v}{d}", "path": f"/dev/{nombre}1", "status": "ONLINE",
+                              "stats": _stats(rng, tamano_disco, 0), "children": [], "unavail_disk": None})
+                discos.append(dict(base_disco, name=nombre, devname=nombre, identifier=f"{{serial}}{indice}-{nombre}",
+                                   serial=f"S{indice}{p:02}{v:02}{d:02}", size=tamano_disco, type="HDD",
+                                   pool=nombre_pool, temperature=rng.randint(28, 55),
+                                   smart_enabled=True, smart_status={"passed": True}))
+            size = tamano_disco * (escala["discos"] - 2 if escala["discos"] > 2 else 1)
+            vdevs.append({"type": "RAIDZ2", "name": f"raidz2-{v}", "guid": f"{indice}{p}{v}", "path": None,
+                          "status": "ONLINE", "stats": _stats(rng, size, int(size * rng.uniform(0.2, 0.9))),
+                          "children": hijos, "unavail_disk": None})
+        pools.append(dict(base_pool, id=p + 1, name=nombre_pool, guid=f"{indice}{p}", status="ONLINE",
+                          path=f"/mnt/{nombre_pool}", healthy=True, resilvering=False, scan={},
+                          topology={"data": vdevs, "log": [], "cache": [], "spare": [], "special": [], "dedup": []}))
+        datasets.append({"name": nombre_pool, "pool": nombre_pool, "used": {"parsed": rng.randint(10 ** 12, 10 ** 13)},
+                         "available": {"parsed": rng.randint(10 ** 12, 10 ** 13)}, "children": []})
+
+    # Backup pseudoaleatorio y determinista del tamaño pedido
+    backup = random.Random(indice).randbytes(escala["backup_bytes"])
+    return {
+        "pools": pools,
+        "discos": discos,
+        "datasets": datasets,
+        "alertas": [dict(base_alerta, uuid=f"{indice}-1", klass="ScrubPaused", level="INFO", dismissed=False,
+                         formatted="Scrub en pausa", source="")],
+        "backup": backup,
+    }
+
+
+class Simulador:
+    """Estado del servidor simulado: datos por host, inyección de fallos y contadores"""
+
+    def __init__(self, escala=None, latencia=0.0, jitter=0.0, fallos=0.0, semilla=0, fallos_job=0.0):
+        self.escala = dict(ESCALA_POR_DEFECTO, **(escala or {}))
+        self.latencia = latencia
+        self.jitter = jitter
+        self.fallos = fallos
+        self.fallos_job = fallos_job
+        self.jobs = {}  # id -> (host, job)
+        self._jobs_fallidos = set()
+        self.rng = random.Random(semilla)
+        spec = cargar_spec()
+        self.hosts = [generar_host(spec, i, self.escala) for i in range(self.escala["hosts"])]
+        self._cuerpos = {}
+        self._lock = threading.Lock()
+        self.reiniciar_contadores()
+
+    def reiniciar_contadores(self):
+        with self._lock:
+            self.peticiones = 0
+            self.bytes = 0
+            self.errores = 0
+            self.por_ruta = {}
+
+    def contadores(self):
+        with self._lock:
+            return {"peticiones": self.peticiones, "bytes": self.bytes, "errores": self.errores,
+                    "por_ruta": dict(self.por_ruta)}
+
+    def _contar(self, ruta, n, error=False):
+        with self._lock:
+            self.peticiones += 1
+            self.bytes += n
+            self.errores += error
+            self.por_ruta[ruta] = self.por_ruta.get(ruta, 0) + 1
+
+    def _json(self, clave, generar):
+        """Serializa cada respuesta una sola vez: se mide al cliente, no al simulador"""
+        cuerpo = self._cuerpos.get(clave)
+        if cuerpo is None:
+            cuerpo = self._cuerpos[clave] = json.dumps(generar()).encode("utf-8")
+        return cuerpo
+
+    def _crear_job(self, indice, metodo):
+        with self._lock:
+            job_id = len(self.jobs) + 1
+            self.jobs[job_id] = (indice, {"id": job_id, "method": metodo, "state": "RUNNING", "error": None,
+                                          "progress": {"percent": 0}})
+            if self.fallos_job and self.rng.random() < self.fallos_job:
+                self._jobs_fallidos.add(job_id)
+        return job_id
+
+    def _descargar_job(self, job_id):
+        """Sirve el archivo de un job de ``core/download`` y lo da por terminado"""
+        with self._lock:
+            indice, job = self.jobs.get(job_id, (None, None))
+        if job is None:
+            return 404, "text/plain", b""
+        backup = self.hosts[indice]["backup"]
+        if job_id in self._jobs_fallidos:
+            job.update(state="FAILED", error="Fallo simulado del job")
+            return 200, "application/octet-stream", backup[:len(backup) // 2]
+        job.update(state="SUCCESS", progress={"percent": 100})
+        return 200, "application/octet-stream", backup
+
+    def responder(self, metodo, ruta, consulta, cuerpo):
+        """Devuelve ``(codigo, tipo, bytes)`` para una petición a ``/h<n>/api/v2.0/<ruta>``"""
+        if metodo == "GET" and ruta.startswith("/_download/"):
+            try:
+                return self._descargar_job(int(ruta.rsplit("/", 1)[1]))
+            except ValueError:
+                return 404, "text/plain", b""
+        partes = ruta.split(PREFIJO_API, 1)
+        try:
+            indice = int(partes[0].strip("/").lstrip("h") or 0)
+            datos = self.hosts[indice]
+        except (ValueError, IndexError):
+            return 404, "text/plain", b""
+        ruta = partes[1].strip("/") if len(partes) > 1 else ""
+        q = parse_qs(consulta)
+
+        if metodo == "GET" and ruta in ("pool", "disk"):
+            registros = datos["pools" if ruta == "pool" else "discos"]
+            filtros = tuple((k, v[0]) for k, v in sorted(q.items()) if k in ("name", "pool"))
+            offset = int(q.get("offset", [0])[0])
+            limit = int(q.get("limit", [0])[0]) or None
+
+            def generar():
+                filtrados = [r for r in registros if all(str(r.get(k)) == v for k, v in filtros)]
+                return filtrados[offset:offset + limit if limit else None]
+            return 200, "application/json", self._json((indice, ruta, filtros, offset, limit), generar)
+        if metodo == "GET" and ruta == "app/available_space":
+            return 200, "application/json", self._json((indice, ruta), lambda: 512 * 1024 ** 3)
+        if metodo == "GET" and ruta == "alert/list":
+            return 200, "application/json", self._json((indice, ruta), lambda: datos["alertas"])
+        if metodo == "GET" and ruta == "pool/dataset/details":
+            return 200, "application/json", self._json((indice, ruta), lambda: datos["datasets"])
+        if metodo == "POST" and ruta == "config/save":
+            return 200, "application/octet-stream", datos["backup"]
+        if metodo == "GET" and ruta == "core/get_jobs":
+            if "id" in q:
+                ids = {int(q["id"][0])}
+            else:
+                ids = set(range(int(q.get("id__gte", [1])[0]), int(q.get("id__lte", [len(self.jobs)])[0]) + 1))
+            with self._lock:
+                jobs = [dict(job) for i, (host, job) in sorted(self.jobs.items()) if i in ids and host == indice]
+            return 200, "application/json", json.dumps(jobs).encode()
+
+        peticion = json.loads(cuerpo) if cuerpo else {}
+        if metodo == "POST" and ruta == "core/download":
+            job_id = self._crear_job(indice, peticion.get("method"))
+            return 200, "application/json", json.dumps([job_id, f"/_download/{job_id}?auth_token=simulado"]).encode()
+        if metodo == "POST" and ruta in ("disk/temperatures", "disk/temperature_agg"):
+            temperaturas = {d["name"]: d["temperature"] for d in datos["discos"]}
+            nombres = peticion.get("names") or list(temperaturas)
+            if ruta == "disk/temperatures":
+                return 200, "application/json", json.dumps({n: temperaturas.get(n) for n in nombres}).encode()
+            return 200, "application/json", json.dumps(
+                {n: {"min": temperaturas.get(n, 30) - 3, "max": temperaturas.get(n, 30) + 4,
+                     "avg": temperaturas.get(n, 30)} for n in nombres}).encode()
+        if metodo == "POST" and ruta == "reporting/get_data":
+            consulta_datos = peticion.get("query") or {}
+            fin = int(consulta_datos.get("end") or time.time())
+            inicio = max(int(consulta_datos.get("start") or fin - 60), fin - 600)
+            filas = [[t, self.rng.random() * 10 ** 7, self.rng.random() * 10 ** 7] for t in range(inicio, fin, 10)]
+            return 200, "application/json", json.dumps([
+                {"name": g.get("name"), "identifier": g.get("identifier"), "data": filas, "aggregations": {},
+                 "start": inicio, "end": fin, "legend": ["time", "reads", "writes"]}
+                for g in peticion.get("graphs") or []
+            ]).encode()
+        return 404, "text/plain", b""
+
+    def atender(self, metodo, ruta, consulta, cuerpo):
+        """Aplica la latencia y los fallos inyectados, responde y cuenta la petición"""
+        if self.latencia or self.jitter:
+            time.sleep(self.latencia + self.rng.uniform(0, self.jitter))
+        if self.fallos and self.rng.random() < self.fallos:
+            cuerpo_error = b'{"message": "Fallo simulado"}'
+            self._contar(ruta, len(cuerpo_error), error=True)
+            return 503, "application/json", cuerpo_error
+        codigo, tipo, respuesta = self.responder(metodo, ruta, consulta, cuerpo)
+        self._contar(ruta, len(respuesta), error=codigo >= 400)
+        return codigo, tipo, respuesta
+
+
+def crear_servidor(simulador, direccion="127.0.0.1", puerto=0):
+    """Servidor HTTP/1.1 (keep-alive) del simulador; ``puerto=0`` elige uno libre"""
+
+    class Manejador(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _atender(self, metodo):
+            longitud = int(self.headers.get("Content-Length") or 0)
+            cuerpo = self.rfile.read(longitud) if longitud else b""
+            url = urlparse(self.path)
+            codigo, tipo, respuesta = simulador.atender(metodo, url.path, url.query, cuerpo)
+            self.send_response(codigo)
+            self.send_header("Content-Type", tipo)
+            self.send_header("Content-Length", str(len(respuesta)))
+            self.end_headers()
+            self.wfile.write(respuesta)
+
+        def do_GET(self):
+            self._atender("GET")
+
+        def do_POST(self):
+            self._atender("POST")
+
+        def log_message(self, *args):
+            pass
+
+    return ThreadingHTTPServer((direccion, puerto), Manejador)
+
+
+def url_host(servidor, indice):
+    direccion, puerto = servidor.server_address[:2]
+    return f"http://{direccion}:{puerto}/h{indice}{PREFIJO_API}"
+
+
+def opciones_escala(parser):
+    parser.add_argument("--hosts", type=int, default=ESCALA_POR_DEFECTO["hosts"], help="Número de hosts simulados")
+    parser.add_argument("--pools", type=int, default=ESCALA_POR_DEFECTO["pools"], help="Pools por host")
+    parser.add_argument("--vdevs", type=int, default=ESCALA_POR_DEFECTO["vdevs"], help="Vdevs por pool")
+    parser.add_argument("--discos", type=int, default=ESCALA_POR_DEFECTO["discos"], help="Discos por vdev")
+    parser.add_argument("--backup-bytes", type=int, default=ESCALA_POR_DEFECTO["backup_bytes"],
+                        help="Tamaño del backup de config/save")
+    parser.add_argument("--latencia", type=float, default=0.0, help="Latencia añadida por petición (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Variación aleatoria de la latencia (ms)")
+    parser.add_argument("--fallos", type=float, default=0.0, help="Proporción de peticiones que fallan con 503")
+    parser.add_argument("--fallos-job", type=float, default=0.0,
+                        help="Proporción de jobs de core/download que terminan en FAILED")
+
+
+def escala_args(args):
+    return {"hosts": args.hosts, "pools": args.pools, "vdevs": args.vdevs, "discos": args.discos,
+            "backup_bytes": args.backup_bytes}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servidor simulado de la API de TrueNAS")
+    parser.add_argument("--direccion", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8765)
+    opciones_escala(parser)
+    args = parser.parse_args(argv)
+
+    simulador = Simulador(escala_args(args), latencia=args.latencia / 1000, jitter=args.jitter / 1000,
+                          fallos=args.fallos, fallos_job=args.fallos_job)
+    servidor = crear_servidor(simulador, args.direccion, args.puerto)
+    for i in range(args.hosts):
+        print(url_host(servidor, i))
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import requests
+
+from truenas import metricas as metricas_api
+from truenas import pools as pools_api
+from truenas import prevision as prevision_api
+from truenas import temperaturas as temperaturas_api
+from truenas.concurrencia import ejecutar_en_paralelo
+
+
+def espacio_gb(espacio_bytes):
+    """Convierte bytes a GB con dos decimales ("No disponible" si no hay dato)"""
+    if not isinstance(espacio_bytes, (int, float)):
+        return "No disponible"
+    return round(espacio_bytes / (1024 ** 3), 2)
+
+
+class Sondeo:
+    """Obtiene instantáneas del estado de un host conservando el estado entre sondeos
+
+    Guarda las series de I/O de reporting/get_data y la caché de
+    temperaturas de los discos, de modo que en el modo watch cada sondeo
+    solo pide lo nuevo. No depende de la capa de presentación: los
+    problemas no fatales se notifican con ``avisar(mensaje)``; si falla la
+    consulta de los pools, la instantánea lo indica en ``error``.
+    """
+
+    def __init__(self, cliente, avisar=None, ventana_metricas=metricas_api.VENTANA_INICIAL):
+        self.cliente = cliente
+        self.avisar = avisar or (lambda mensaje: None)
+        self.metricas = metricas_api.Metricas(ventana_inicial=ventana_metricas)
+        self.temperaturas = temperaturas_api.CacheTemperaturas()
+        self.error = None
+
+    def obtener_pools(self, pool=None):
+        """Obtiene la lista de pools disponibles (solo ``pool`` si se indica)"""
+        try:
+            return pools_api.obtener_pools(self.cliente, filtros={"name": pool} if pool else None)
+        except requests.RequestException as e:
+            self.error = str(e) or type(e).__name__
+            self.avisar(f"Error al consultar los pools: {e}")
+            return []
+
+    def obtener_discos(self, pool=None):
+        """Obtiene el inventario de discos (solo los de ``pool`` si se indica)"""
+        try:
+            return pools_api.obtener_discos(self.cliente, filtros={"pool": pool} if pool else None)
+        except requests.RequestException:
+            return []
+
+    def espacio_aplicaciones_bytes(self):
+        """Obtiene el espacio disponible para aplicaciones en bytes (None si no está disponible)"""
+        try:
+            response = self.cliente.get("app/available_space", timeout=5)
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.Timeout:
+            self.avisar("Timeout al intentar conectar con el servidor TrueNAS")
+        except requests.exceptions.ConnectionError as e:
+            self.avisar(f"No se puede conectar con el servidor TrueNAS: {e}")
+        except requests.exceptions.RequestException as e:
+            self.avisar(f"Error al consultar el espacio disponible: {e}")
+        except Exception as e:
+            self.avisar(f"Error inesperado: {e}")
+        return None
+
+    def espacio_disponible_aplicaciones(self):
+        """Obtiene el espacio disponible para aplicaciones (GB)"""
+        return espacio_gb(self.espacio_aplicaciones_bytes())
+
+    def obtener_datasets(self):
+        """Obtiene el uso de los datasets (None si no está disponible)"""
+        try:
+            return prevision_api.obtener_datasets(self.cliente)
+        except requests.RequestException:
+            return None
+
+    def obtener_alertas(self):
+        """Obtiene las alertas del NAS (``/alert/list``); None si no están disponibles"""
+        try:
+            response = self.cliente.get("alert/list")
+            response.raise_for_status()
+            return response.json()
+        except requests.RequestException as e:
+            self.avisar(f"Error al consultar las alertas del NAS: {e}")
+            return None
+
+    def obtener_snapshot(self, con_datasets=False, pool=None, con_alertas=False):
+        """Consulta la API y devuelve una instantánea con los pools y el espacio de apps"""
+        # Las consultas son independientes: se lanzan en paralelo y se combinan
+        # en una única instantánea antes de renderizar
+        self.error = None
+        tareas = {
+            "pools": lambda: self.obtener_pools(pool),
+            "discos": lambda: self.obtener_discos(pool),
+            "espacio_app_bytes": self.espacio_aplicaciones_bytes,
+        }
+        if con_datasets:
+            tareas["datasets"] = self.obtener_datasets
+        if con_alertas:
+            tareas["alertas_nas"] = self.obtener_alertas
+        snapshot = ejecutar_en_paralelo(tareas)
+
+        # Un único recorrido de /disk por ejecución, en lugar de uno por pool
+        indice_discos = pools_api.indexar_discos_por_pool(snapshot["discos"])
+
+        pools_data = pools_api.extraer_datos_pools(snapshot["pools"], indice_discos)
+
+        # Enriquecimiento en paralelo, una petición por tipo para todos los discos:
+        # tasas de I/O (reporting/get_data, solo la ventana nueva desde el sondeo
+        # anterior) y temperaturas (disk/temperatures, con caché por TTL)
+        def enriquecer(modulo, estado):
+            try:
+                modulo.enriquecer_pools(estado, self.cliente, pools_data)
+            except requests.RequestException:
+                pass
+
+        ejecutar_en_paralelo({
+            "metricas": lambda: enriquecer(metricas_api, self.metricas),
+            "temperaturas": lambda: enriquecer(temperaturas_api, self.temperaturas),
+        })
+
+        return {
+            "pools": pools_data,
+            # GB redondeados para mostrar y bytes sin redondear para exportar
+            "espacio_app": espacio_gb(snapshot["espacio_app_bytes"]),
+            "espacio_app_bytes": snapshot["espacio_app_bytes"],
+            "datasets": snapshot.get("datasets"),
+            "alertas_nas": snapshot.get("alertas_nas"),
+            "error": self.error,
+        }
@@ -0,0 +1,288 @@
+import hashlib
+import json
+import os
+import pickle
+import re
+import tempfile
+import threading
+
+# Especificación OpenAPI de TrueNAS incluida en el repositorio
+RUTA_SPEC = os.getenv('TRUENAS_SPEC', os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "api-doc.json"))
+VERSION_INDICE = 1
+
+# Claves descriptivas que no afectan a la validación y no se guardan en el índice
+CLAVES_DESCRIPTIVAS = frozenset(("title", "_name_", "description", "_attrs_order_", "default", "format", "examples"))
+METODOS = ("get", "post", "put", "patch", "delete")
+
+TIPOS = {
+    "object": dict,
+    "array": (list, tuple),
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "null": type(None),
+}
+
+
+class ErrorValidacion(ValueError):
+    """El cuerpo de una petición no cumple el esquema de api-doc.json"""
+
+    def __init__(self, ruta, errores):
+        super().__init__(f"{ruta}: " + "; ".join(errores))
+        self.ruta = ruta
+        self.errores = errores
+
+
+def _resolver(nodo, schemas, visitados=()):
+    """Resuelve recursivamente los ``$ref`` y descarta las claves descriptivas"""
+    if isinstance(nodo, list):
+        return [_resolver(n, schemas, visitados) for n in nodo]
+    if not isinstance(nodo, dict):
+        return nodo
+    if "$ref" in nodo:
+        nombre = nodo["$ref"].rsplit("/", 1)[-1]
+        if nombre in visitados:
+            return {}
+        return _resolver(schemas.get(nombre, {}), schemas, visitados + (nombre,))
+    return {
+        clave: _resolver(valor, schemas, visitados) if clave not in ("enum", "const") else valor
+        for clave, valor in nodo.items()
+        if clave not in CLAVES_DESCRIPTIVAS
+    }
+
+
+def _esquema_cuerpo(operacion):
+    contenido = (operacion.get("requestBody") or {}).get("content", {}).get("application/json", {})
+    return contenido.get("schema")
+
+
+def _esquema_respuesta(operacion):
+    respuesta = (operacion.get("responses") or {}).get("200", {})
+    return (respuesta.get("content") or {}).get("application/json", {}).get("schema")
+
+
+def construir_indice(spec):
+    """Construye el índice compacto ``(ruta, método) -> operación`` con esquemas resueltos
+
+    Cada esquema se guarda serializado por separado para deserializarlo
+    solo la primera vez que se usa.
+    """
+    schemas = spec.get("components", {}).get("schemas", {})
+    operaciones = {}
+    esquemas = {}
+
+    def guardar(clave, esquema):
+        if esquema is None:
+            return None
+        esquemas[clave] = pickle.dumps(_resolver(esquema, schemas), protocol=pickle.HIGHEST_PROTOCOL)
+        return clave
+
+    for ruta, metodos in spec.get("paths", {}).items():
+        for metodo, operacion in metodos.items():
+            if metodo not in METODOS:
+                continue
+            clave = f"{metodo.upper()} {ruta}"
+            operaciones[(ruta, metodo.upper())] = {
+                "parametros": [
+                    {"name": p.get("name"), "in": p.get("in"), "required": p.get("required", False),
+                     "type": (p.get("schema") or {}).get("type")}
+                    for p in operacion.get("parameters") or []
+                ],
+                "tags": operacion.get("tags") or [],
+                "descripcion": (operacion.get("description") or "").strip().split("\n", 1)[0],
+                "cuerpo": guardar(clave + " cuerpo", _esquema_cuerpo(operacion)),
+                "respuesta": guardar(clave + " respuesta", _esquema_respuesta(operacion)),
+            }
+    return {"operaciones": operaciones, "esquemas": esquemas,
+            "servidores": [s.get("url") for s in spec.get("servers") or []]}
+
+
+def _sha256(ruta):
+    h = hashlib.sha256()
+    with open(ruta, "rb") as f:
+        for bloque in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+class Spec:
+    """Índice de api-doc.json cacheado en disco e invalidado por mtime y hash
+
+    La primera vez se parsea el JSON y se guarda un índice en pickle junto
+    al archivo; las siguientes se carga solo el índice. Si cambia el
+    mtime se recalcula el SHA-256 y solo se reconstruye si el contenido
+    cambió de verdad. Los esquemas se deserializan bajo demanda.
+    """
+
+    def __init__(self, ruta=None, ruta_indice=None):
+        self.ruta = ruta or RUTA_SPEC
+        directorio, nombre = os.path.split(os.path.abspath(self.ruta))
+        self.ruta_indice = ruta_indice or os.path.join(directorio, f".{nombre}.idx")
+        self._esquemas = {}
+        self._plantillas = None
+        indice = self._cargar()
+        self.operaciones = indice["operaciones"]
+        self._esquemas_serializados = indice["esquemas"]
+        self.servidores = indice["servidores"]
+
+    def _cargar(self):
+        stat = os.stat(self.ruta)
+        firma = (stat.st_mtime_ns, stat.st_size)
+        cabecera = None
+        try:
+            with open(self.ruta_indice, "rb") as f:
+                cabecera = pickle.load(f)
+                if cabecera.get("version") == VERSION_INDICE and cabecera.get("firma") == firma:
+                    return pickle.load(f)
+                sha256 = _sha256(self.ruta)
+                if cabecera.get("version") == VERSION_INDICE and cabecera.get("sha256") == sha256:
+                    indice = pickle.load(f)
+                    self._guardar(indice, firma, sha256)
+                    return indice
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+            sha256 = None
+
+        with open(self.ruta, "rb") as f:
+            indice = construir_indice(json.load(f))
+        self._guardar(indice, firma, sha256 or _sha256(self.ruta))
+        return indice
+
+    def _guardar(self, indice, firma, sha256):
+        # Temporal único en el mismo directorio: dos procesos que regeneran el
+        # índice a la vez no escriben en el mismo archivo y el rename es atómico
+        directorio = os.path.dirname(os.path.abspath(self.ruta_indice))
+        try:
+            fd, temporal = tempfile.mkstemp(prefix=os.path.basename(self.ruta_indice) + ".", suffix=".tmp",
+                                            dir=directorio)
+        except OSError:
+            # Sin permisos de escritura: se usa el índice en memoria
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump({"version": VERSION_INDICE, "firma": firma, "sha256": sha256}, f)
+                pickle.dump(indice, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporal, self.ruta_indice)
+        except OSError:
+            if os.path.exists(temporal):
+                os.unlink(temporal)
+
+    def esquema(self, clave):
+        """Devuelve un esquema resuelto, deserializándolo en el primer acceso"""
+        if clave is None:
+            return None
+        if clave not in self._esquemas:
+            self._esquemas[clave] = pickle.loads(self._esquemas_serializados[clave])
+        return self._esquemas[clave]
+
+    def operacion(self, ruta, metodo="GET"):
+        """Busca la operación de una ruta concreta (``pool/id/3/scrub``) o plantilla"""
+        ruta = "/" + ruta.strip("/")
+        metodo = metodo.upper()
+        operacion = self.operaciones.get((ruta, metodo))
+        if operacion is not None:
+            return operacion
+        if self._plantillas is None:
+            self._plantillas = [
+                (re.compile("^" + re.sub(r"\\\{[^/]+?\\\}", "[^/]+", re.escape(plantilla)) + "$"), plantilla, m)
+                for plantilla, m in self.operaciones if "{" in plantilla
+            ]
+        for patron, plantilla, m in self._plantillas:
+            if m == metodo and patron.match(ruta):
+                return self.operaciones[(plantilla, m)]
+        return None
+
+    def esquema_cuerpo(self, ruta, metodo="POST"):
+        operacion = self.operacion(ruta, metodo)
+        return self.esquema(operacion["cuerpo"]) if operacion else None
+
+    def esquema_respuesta(self, ruta, metodo="GET"):
+        operacion = self.operacion(ruta, metodo)
+        return self.esquema(operacion["respuesta"]) if operacion else None
+
+    def validar_cuerpo(self, ruta, metodo, cuerpo):
+        """Valida el cuerpo de una petición; lanza ErrorValidacion si no es válido"""
+        esquema = self.esquema_cuerpo(ruta, metodo)
+        if esquema is None:
+            return
+        errores = validar(cuerpo, esquema)
+        if errores:
+            raise ErrorValidacion(f"{metodo.upper()} {ruta}", errores)
+
+
+def _tipo_valido(valor, tipo):
+    if tipo == "integer" or tipo == "number":
+        if isinstance(valor, bool):
+            return False
+    return isinstance(valor, TIPOS.get(tipo, object))
+
+
+def validar(valor, esquema, camino="$"):
+    """Valida un valor contra un esquema resuelto y devuelve la lista de errores"""
+    if not esquema:
+        return []
+    if valor is None and esquema.get("nullable"):
+        return []
+    if "anyOf" in esquema:
+        opciones = esquema["anyOf"]
+        if not any(not validar(valor, opcion, camino) for opcion in opciones):
+            return [f"{camino}: no coincide con ninguna alternativa"]
+        return []
+
+    tipo = esquema.get("type")
+    if tipo is not None:
+        tipos = tipo if isinstance(tipo, list) else [tipo]
+        if not any(_tipo_valido(valor, t) for t in tipos):
+            return [f"{camino}: se esperaba {'/'.join(tipos)}, se recibió {type(valor).__name__}"]
+
+    errores = []
+    if "enum" in esquema and valor not in esquema["enum"]:
+        errores.append(f"{camino}: {valor!r} no está en {esquema['enum']}")
+    if "const" in esquema and valor != esquema["const"]:
+        errores.append(f"{camino}: se esperaba {esquema['const']!r}")
+    if isinstance(valor, str) and len(valor) < esquema.get("minLength", 0):
+        errores.append(f"{camino}: longitud mínima {esquema['minLength']}")
+    if isinstance(valor, (int, float)) and not isinstance(valor, bool):
+        if "minimum" in esquema and valor < esquema["minimum"]:
+            errores.append(f"{camino}: mínimo {esquema['minimum']}")
+        if "maximum" in esquema and valor > esquema["maximum"]:
+            errores.append(f"{camino}: máximo {esquema['maximum']}")
+        if "exclusiveMinimum" in esquema and valor <= esquema["exclusiveMinimum"]:
+            errores.append(f"{camino}: debe ser mayor que {esquema['exclusiveMinimum']}")
+
+    if isinstance(valor, dict):
+        propiedades = esquema.get("properties") or {}
+        for nombre in esquema.get("required") or ():
+            if nombre not in valor:
+                errores.append(f"{camino}.{nombre}: campo obligatorio")
+        for nombre, subvalor in valor.items():
+            if nombre in propiedades:
+                errores.extend(validar(subvalor, propiedades[nombre], f"{camino}.{nombre}"))
+            elif esquema.get("additionalProperties") is False:
+                errores.append(f"{camino}.{nombre}: campo no permitido")
+    elif isinstance(valor, (list, tuple)):
+        if len(valor) < esquema.get("minItems", 0):
+            errores.append(f"{camino}: mínimo {esquema['minItems']} elementos")
+        items = esquema.get("items")
+        if isinstance(items, list):
+            items = {"anyOf": items} if len(items) > 1 else (items[0] if items else None)
+        if items:
+            for i, elemento in enumerate(valor):
+                errores.extend(validar(elemento, items, f"{camino}[{i}]"))
+    return errores
+
+
+_spec = None
+_lock_spec = threading.Lock()
+
+
+def cargar_spec(ruta=None):
+    """Devuelve el índice de la especificación, cargado una sola vez por proceso"""
+    global _spec
+    spec = _spec
+    if spec is not None and (not ruta or ruta == spec.ruta):
+        return spec
+    with _lock_spec:
+        if _spec is None or (ruta and ruta != _spec.ruta):
+            _spec = Spec(ruta)
+        return _spec
@@ -0,0 +1,104 @@
+import os
+import time
+
+from truenas.concurrencia import ejecutar_en_paralelo
+
+# Vigencia (segundos) de las temperaturas; consultar SMART despierta los discos
+TTL_TEMPERATURAS = float(os.getenv('TRUENAS_TTL_TEMPERATURAS', '60'))
+# Vigencia de los agregados min/max/media y ventana en días
+TTL_AGREGADOS = float(os.getenv('TRUENAS_TTL_TEMPERATURAS_AGG', '600'))
+DIAS_AGREGADOS = 1
+# Espera (segundos) antes de repetir una consulta que ha fallado
+ESPERA_FALLO = 15
+# No consultar discos en standby para no hacerlos girar
+POWERMODE = "STANDBY"
+
+
+class CacheTemperaturas:
+    """Temperaturas de todos los discos con caché por TTL
+
+    Se piden todas las temperaturas en una sola llamada a
+    ``POST /disk/temperatures`` y los agregados en otra a
+    ``/disk/temperature_agg``, ambas en paralelo y solo cuando la copia
+    en caché ha caducado o faltan discos. Si una de las dos falla se
+    conserva la otra y la fallida se reintenta tras ``ESPERA_FALLO``.
+    """
+
+    def __init__(self, ttl=TTL_TEMPERATURAS, ttl_agregados=TTL_AGREGADOS, dias=DIAS_AGREGADOS):
+        self.ttl = ttl
+        self.ttl_agregados = ttl_agregados
+        self.dias = dias
+        self.temperaturas = {}
+        self.agregados = {}
+        self._caduca = 0.0
+        self._caduca_agregados = 0.0
+        self._nombres = frozenset()
+
+    def _consultar_temperaturas(self, cliente, nombres):
+        response = cliente.post("disk/temperatures", json={
+            "names": nombres,
+            "options": {"cache": int(self.ttl), "powermode": POWERMODE},
+        })
+        response.raise_for_status()
+        return response.json() or {}
+
+    def _consultar_agregados(self, cliente, nombres):
+        response = cliente.post("disk/temperature_agg", json={"names": nombres, "days": self.dias})
+        response.raise_for_status()
+        return response.json() or {}
+
+    def actualizar(self, cliente, nombres):
+        """Refresca desde la API lo que haya caducado para la lista de discos"""
+        nombres = sorted({nombre for nombre in nombres if nombre})
+        if not nombres:
+            return
+        ahora = time.monotonic()
+        nuevos = not self._nombres.issuperset(nombres)
+        tareas = {}
+        if nuevos or ahora >= self._caduca:
+            tareas["temperaturas"] = lambda: self._consultar_temperaturas(cliente, nombres)
+        if nuevos or ahora >= self._caduca_agregados:
+            tareas["agregados"] = lambda: self._consultar_agregados(cliente, nombres)
+        if not tareas:
+            return
+
+        def protegida(funcion):
+            def tarea():
+                try:
+                    return funcion(), None
+                except Exception as e:
+                    return None, e
+            return tarea
+
+        resultados = ejecutar_en_paralelo({nombre: protegida(funcion) for nombre, funcion in tareas.items()})
+        if "temperaturas" in resultados:
+            temperaturas, error = resultados["temperaturas"]
+            if error is None:
+                self.temperaturas = temperaturas
+            self._caduca = ahora + (self.ttl if error is None else ESPERA_FALLO)
+        if "agregados" in resultados:
+            agregados, error = resultados["agregados"]
+            if error is None:
+                self.agregados = agregados
+            self._caduca_agregados = ahora + (self.ttl_agregados if error is None else ESPERA_FALLO)
+        self._nombres = frozenset(nombres)
+
+    def aplicar(self, pools_data):
+        """Incorpora las temperaturas al índice de discos de cada pool"""
+        for pool in pools_data:
+            for disco in pool.get("disks", []):
+                nombre = disco.get("name")
+                if nombre in self.temperaturas:
+                    disco["temperature"] = self.temperaturas[nombre]
+                agregado = self.agregados.get(nombre)
+                if agregado:
+                    disco["temperature_min"] = agregado.get("min")
+                    disco["temperature_max"] = agregado.get("max")
+                    disco["temperature_avg"] = agregado.get("avg")
+        return pools_data
+
+
+def enriquecer_pools(temperaturas, cliente, pools_data):
+    """Actualiza la caché con los discos de los pools y les añade las temperaturas"""
+    temperaturas.actualizar(cliente, [d.get("name") for pool in pools_data for d in pool.get("disks", [])])
+    return temperaturas.aplicar(pools_data)